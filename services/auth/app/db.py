@@ -3,17 +3,20 @@ import uuid
 import logging
 
 from tortoise.contrib.fastapi import register_tortoise
+from tortoise.exceptions import DBConnectionError
 from aerich import Command
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 
 from app import settings
+from app.utils.db_pool import pooled_connection
 
 logger = logging.getLogger(__name__)
 
 def get_tortoise_config() -> dict:
     app_list = ["app.models", "aerich.models"]
     config = {
-        "connections": settings.DB_CONNECTIONS,
+        "connections": {name: pooled_connection(url) for name, url in settings.DB_CONNECTIONS.items()},
         "apps": {
             "models": {
                 "models": app_list,
@@ -34,6 +37,11 @@ def register_db(app: FastAPI, db_url: str = None) -> None:
         add_exception_handlers=True
     )
 
+    @app.exception_handler(DBConnectionError)
+    async def db_unavailable_handler(request: Request, exc: DBConnectionError):
+        # Пул исчерпан или БД недоступна: клиенту стоит повторить запрос, а не считать это ошибкой сервиса
+        return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"})
+
 async def upgrade_db(app: FastAPI, db_url: str = None):
     command = Command(tortoise_config=TORTOISE_ORM, app="models", location="./migrations")
     print(TORTOISE_ORM)
@@ -1,5 +1,5 @@
 # services/auth/app/metrics.py
-from prometheus_client import Counter
+from prometheus_client import Counter, Gauge, Histogram
 
 # --- Auth Metrics ---
 auth_logins_total = Counter(
@@ -26,4 +26,54 @@ auth_refresh_token_logins_total = Counter(
     "auth_refresh_token_logins_total",
     "Total number of logins requesting only refresh token",
     ["status"] # Метки: "success", "failure"
-)
\ No newline at end of file
+)
+
+auth_token_revocations_total = Counter(
+    "auth_token_revocations_total",
+    "Total number of revoked tokens",
+    ["kind"] # "access", "refresh"
+)
+
+# --- Database Pool Metrics ---
+auth_db_pool_connections = Gauge(
+    "auth_db_pool_connections",
+    "Database pool connections by state",
+    ["connection", "state"] # "in_use", "idle", "max"
+)
+
+auth_db_pool_acquire_seconds = Histogram(
+    "auth_db_pool_acquire_seconds",
+    "Time spent waiting for a free database pool connection",
+    ["connection"],
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5]
+)
+
+auth_db_pool_acquire_timeouts_total = Counter(
+    "auth_db_pool_acquire_timeouts_total",
+    "Total number of requests that gave up waiting for a database pool connection",
+    ["connection"]
+)
+
+# --- Password Hashing ---
+auth_password_hash_seconds = Histogram(
+    "auth_password_hash_seconds",
+    "Time spent hashing or verifying a password in the hashing pool",
+    ["operation"], # "hash", "verify"
+    buckets=[0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1, 2.5]
+)
+
+auth_password_hash_wait_seconds = Histogram(
+    "auth_password_hash_wait_seconds",
+    "Time a password operation waited for a free hashing slot",
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5]
+)
+
+auth_password_hash_queued = Gauge(
+    "auth_password_hash_queued",
+    "Number of password operations waiting for a free hashing slot"
+)
+
+auth_password_hash_rejected_total = Counter(
+    "auth_password_hash_rejected_total",
+    "Total number of password operations rejected because the hashing queue was full"
+)
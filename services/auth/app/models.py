@@ -72,3 +72,19 @@ class User(TimestampMixin, BaseModel):
     class Meta:
         table = "users"
         ordering = ["username"]
+
+
+class RevokedToken(BaseModel):
+    """ Токены, отозванные до истечения срока (по claim jti); строка нужна только до expires_at токена """
+    jti = fields.CharField(max_length=64, pk=True)
+    user_uuid = fields.UUIDField(null=True)
+    expires_at = fields.DatetimeField()
+    revoked_at = fields.DatetimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Revoked token {self.jti} of User {self.user_uuid} until {self.expires_at}"
+
+    class Meta:
+        table = "revoked_tokens"
+        # Дочитывание новых отзывов в backend и очистка истекших
+        indexes = (("revoked_at",), ("expires_at",))
\ No newline at end of file
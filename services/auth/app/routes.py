@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, Security
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.servises import get_access_token, login_refresh_token, refresh_token, validate_access_token, validate_refresh_token
+from app.servises import get_access_token, login_refresh_token, refresh_token, revoke_tokens, validate_access_token, validate_refresh_token
 from app.utils.contrib import reusable_oauth2
 from app.schemas import JWTToken, JWTRefreshToken, JWTAccessToken, RefreshToken
 
@@ -27,4 +27,12 @@ async def route_refresh(token: RefreshToken):
 async def validate_assess_token(
     token: str = Security(reusable_oauth2)
 ):
-    return await validate_access_token(token=token)
\ No newline at end of file
+    return await validate_access_token(token=token)
+
+
+@router.post("/revoke", status_code=204)
+async def route_revoke(
+    refresh: RefreshToken | None = None,
+    token: str = Security(reusable_oauth2)
+):
+    await revoke_tokens(token=token, refresh=refresh)
\ No newline at end of file
@@ -32,6 +32,7 @@ class JWTTokenData(BaseModel):
 class JWTTokenPayload(BaseModel):
     user_uuid: UUID4 = None
     token_kind: str = None
+    jti: str | None = None
 
 
 class RefreshToken(BaseModel):
@@ -1,17 +1,27 @@
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
+
+import jwt
 
 from fastapi import Depends, HTTPException, Security
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.schemas import JWTAccessToken, JWTRefreshToken, JWTToken, CredentialsSchema, RefreshToken
-from app.models import User
+from app.models import RevokedToken, User
 from app.utils.contrib import authenticate, validate_refresh_token, reusable_oauth2, refresh_oauth2, get_current_user
-from app.utils.jwt import create_access_token, create_refresh_token
+from app.utils.jwt import ALGORITHM, create_access_token, create_refresh_token
 from app import settings
 from app.logger import log_calls
 from app import metrics
 
 
+def _access_token_data(user: User) -> dict:
+    """ Claims access-токена; роль и имя позволяют backend не читать пользователя из БД """
+    data = {"user_uuid": str(user.uuid)}
+    if settings.ACCESS_TOKEN_IDENTITY_CLAIMS:
+        data.update(role=user.role, username=user.username)
+    return data
+
+
 @log_calls
 async def get_access_token(credentials: OAuth2PasswordRequestForm = Depends()):
     credentials = CredentialsSchema(email=credentials.username, password=credentials.password)
@@ -30,7 +40,7 @@ async def get_access_token(credentials: OAuth2PasswordRequestForm = Depends()):
     metrics.auth_logins_total.labels(status="success").inc()
 
     return {
-        "access_token": create_access_token(data={"user_uuid": str(user.uuid)}, expires_delta=access_token_expires),
+        "access_token": create_access_token(data=_access_token_data(user), expires_delta=access_token_expires),
         "refresh_token": create_refresh_token(data={"user_uuid": str(user.uuid)}, expires_delta=refresh_token_expires),
         "token_type": "bearer"
     }
@@ -71,7 +81,7 @@ async def refresh_token(
             detail="The user with uuid in token does not exist"
         )
 
-    new_access_token = create_access_token(data={"user_uuid": str(user.uuid), "expires_delta": access_token_expires})
+    new_access_token = create_access_token(data=_access_token_data(user), expires_delta=access_token_expires)
 
     metrics.auth_token_refreshes_total.labels(status="success").inc()
 
@@ -91,4 +101,40 @@ async def validate_access_token(
         return user
     except HTTPException as e:
         metrics.auth_token_validations_total.labels(status="failure").inc()
-        raise e 
\ No newline at end of file
+        raise e 
+
+
+def _revoked_token(token: str, kind: str) -> RevokedToken:
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=403, detail=f"Could not validate {kind} token")
+    if not payload.get("jti"):
+        raise HTTPException(status_code=400, detail=f"The {kind} token was issued without jti and cannot be revoked")
+    return RevokedToken(
+        jti=payload["jti"],
+        user_uuid=payload.get("user_uuid"),
+        expires_at=datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+    )
+
+
+@log_calls
+async def revoke_tokens(
+    token: str = Security(reusable_oauth2),
+    refresh: RefreshToken | None = None
+):
+    """
+    Отзывает access-токен (и refresh-токен того же пользователя, если передан) до истечения срока.
+    Backend узнает об отзыве при ближайшем дочитывании revoked_tokens (TOKEN_REVOCATION_REFRESH_SECONDS).
+    """
+    user = await get_current_user(token=token)
+    revoked = [_revoked_token(token, "access")]
+    if refresh is not None:
+        revoked.append(_revoked_token(refresh.refresh_token, "refresh"))
+        if str(revoked[-1].user_uuid) != str(user.uuid):
+            raise HTTPException(status_code=403, detail="The refresh token belongs to another user")
+
+    await RevokedToken.bulk_create(revoked, ignore_conflicts=True)
+    metrics.auth_token_revocations_total.labels(kind="access").inc()
+    if refresh is not None:
+        metrics.auth_token_revocations_total.labels(kind="refresh").inc()
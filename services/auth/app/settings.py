@@ -15,6 +15,17 @@ DB_URL = f"postgres://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 DB_CONNECTIONS = {
         "default": DB_URL,
     }
+# Пул соединений asyncpg: размеры, ожидание свободного соединения (с),
+# время жизни простаивающего соединения (с) и размер кэша подготовленных выражений на соединение
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", default=1))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", default=5))
+DB_POOL_ACQUIRE_TIMEOUT = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT", default=5))
+DB_POOL_MAX_INACTIVE_LIFETIME = float(os.getenv("DB_POOL_MAX_INACTIVE_LIFETIME", default=300))
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", default=100))
+# Пул для bcrypt: thread или process, число одновременных хэширований и максимум ожидающих своей очереди
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", default="thread")
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", default=2))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", default=100))
 
 SECRET_KEY = os.getenv("SECRET_KEY", default="".join([random.choice(string.ascii_letters) for _ in range(32)]))
 CLIENT_ID = os.getenv("CLIENT_ID", default="".join([random.choice(string.ascii_letters) for _ in range(32)]))
@@ -25,6 +36,8 @@ REFRESH_URL = "/login/refresh-token"
 # ACCESS_TOKEN_EXPIRE_MINUTES = 15 
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 14 # change in release to 15 minutes
 REFRESH_TOKEN_EXPIRE_MINUTES = 60 * 24 * 14 # 2 weeks
+# Добавлять в access-токен claims role и username (backend с JWT_TRUST_IDENTITY_CLAIMS не читает по ним пользователя из БД)
+ACCESS_TOKEN_IDENTITY_CLAIMS = os.getenv("ACCESS_TOKEN_IDENTITY_CLAIMS", default="false").lower() == "true"
 
 CORS_ORIGINS = ["*"]
 CORS_ALLOW_CREDENTIALS = True
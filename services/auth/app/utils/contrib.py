@@ -6,7 +6,7 @@ from fastapi.security import OAuth2PasswordBearer
 from starlette.status import HTTP_403_FORBIDDEN
 from pydantic import ValidationError
 
-from app.models import User
+from app.models import RevokedToken, User
 from app.schemas import JWTTokenPayload, CredentialsSchema
 from app.utils import password
 from app.utils.jwt import ALGORITHM
@@ -20,12 +20,19 @@ refresh_oauth2 = OAuth2PasswordBearer(
     tokenUrl=settings.LOGIN_URL
 )
 
+async def check_not_revoked(token_data: JWTTokenPayload) -> None:
+    """ Проверка по БД: запросы к auth редкие, фильтр в памяти нужен только backend """
+    if token_data.jti and await RevokedToken.exists(jti=token_data.jti):
+        raise HTTPException(status_code=HTTP_403_FORBIDDEN, detail="Token has been revoked")
+
+
 async def get_current_user(token: str = Security(reusable_oauth2)) -> Optional[User]:
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
         token_data = JWTTokenPayload(**payload)
     except jwt.PyJWTError:
         raise HTTPException(status_code=HTTP_403_FORBIDDEN, detail="Could not validate credentials")
+    await check_not_revoked(token_data)
     
     user = await User.filter(uuid=token_data.user_uuid).first()
     if not user:
@@ -47,6 +54,7 @@ async def validate_refresh_token(token: str = Security(refresh_oauth2)) -> User
         token_data = JWTTokenPayload(**payload)
     except (jwt.PyJWTError, ValidationError):
         raise HTTPException(status_code=HTTP_403_FORBIDDEN, detail="Could not validate credentials")
+    await check_not_revoked(token_data)
     
     user = await User.filter(uuid=token_data.user_uuid).first()
     if not user:
@@ -75,7 +83,7 @@ async def authenticate(credentials: CredentialsSchema) -> User | None:
             detail="The user with this email does not exist"
         )
     
-    verified, updated_password_hash = password.verify_and_update_password(credentials.password, user.password_hash)
+    verified, updated_password_hash = await password.verify_and_update_password_async(credentials.password, user.password_hash)
 
     if not verified:
         return None
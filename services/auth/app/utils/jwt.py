@@ -1,3 +1,4 @@
+import uuid
 from datetime import datetime, timedelta
 
 import jwt
@@ -16,7 +17,8 @@ def create_access_token(*, data: dict, expires_delta: timedelta = None):
         expire = datetime.now() + expires_delta
     else:
         expire = datetime.now() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire.timestamp(), "sub": access_token_jwt_subject})
+    # jti — идентификатор токена, по которому его можно отозвать до истечения срока
+    to_encode.update({"exp": expire.timestamp(), "sub": access_token_jwt_subject, "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(jsonable_encoder(to_encode), settings.SECRET_KEY, algorithm=ALGORITHM)
     
     return encoded_jwt
@@ -28,7 +30,7 @@ def create_refresh_token(*, data: dict, expires_delta: timedelta = None):
         expire = datetime.now() + expires_delta
     else:
         expire = datetime.now() + timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire.timestamp(), "sub": refresh_token_jwt_subject})
+    to_encode.update({"exp": expire.timestamp(), "sub": refresh_token_jwt_subject, "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(jsonable_encoder(to_encode), settings.SECRET_KEY, algorithm=ALGORITHM)
 
     return encoded_jwt
\ No newline at end of file
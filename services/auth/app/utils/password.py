@@ -1,8 +1,14 @@
-from typing import Tuple
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
 
+from fastapi import HTTPException
 from passlib import pwd
 from passlib.context import CryptContext
 
+from app import metrics, settings
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
@@ -13,4 +19,69 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 def generate_password() -> str:
-    return pwd.genword()
\ No newline at end of file
+    return pwd.genword()
+
+_executor: Optional[Executor] = None
+_limiter: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+_queued = 0
+
+
+def _get_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        pool = ProcessPoolExecutor if settings.PASSWORD_HASH_EXECUTOR == "process" else ThreadPoolExecutor
+        _executor = pool(max_workers=settings.PASSWORD_HASH_WORKERS)
+    return _executor
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _limiter
+    loop = asyncio.get_running_loop()
+    if _limiter is None or _limiter[0] is not loop:
+        _limiter = (loop, asyncio.Semaphore(settings.PASSWORD_HASH_WORKERS))
+    return _limiter[1]
+
+
+async def _offload(operation: str, func: Callable, *args):
+    """
+    Выполняет bcrypt в пуле потоков (или процессов при PASSWORD_HASH_EXECUTOR=process), не блокируя цикл событий.
+    Одновременно идет не больше PASSWORD_HASH_WORKERS хэширований, остальные ждут своей очереди;
+    если очередь длиннее PASSWORD_HASH_MAX_QUEUE, запрос сразу получает 503, а не копит задержку.
+    """
+    global _queued
+    semaphore = _get_semaphore()
+    if semaphore.locked() and _queued >= settings.PASSWORD_HASH_MAX_QUEUE:
+        metrics.auth_password_hash_rejected_total.inc()
+        raise HTTPException(status_code=503, detail="Too many password operations in progress", headers={"Retry-After": "1"})
+
+    queued_at = time.perf_counter()
+    _queued += 1
+    metrics.auth_password_hash_queued.set(_queued)
+    try:
+        await semaphore.acquire()
+    finally:
+        _queued -= 1
+        metrics.auth_password_hash_queued.set(_queued)
+
+    started_at = time.perf_counter()
+    metrics.auth_password_hash_wait_seconds.observe(started_at - queued_at)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_executor(), func, *args)
+    finally:
+        semaphore.release()
+        metrics.auth_password_hash_seconds.labels(operation=operation).observe(time.perf_counter() - started_at)
+
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, str]:
+    return await _offload("verify", verify_and_update_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await _offload("hash", get_password_hash, password)
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
\ No newline at end of file
@@ -8,6 +8,7 @@ from contextlib import asynccontextmanager
 from app.db import init
 from app import settings
 from app.routes import router as login_router
+from app.utils.password import shutdown_executor
 from app.logger import setup_logging, LoggingMiddleware
 
 
@@ -33,6 +34,7 @@ async def lifespan_wrapper(app):
     instrumentator.expose(app)
     async with main_app_lifespan(app) as maybe_state:
         yield maybe_state
+    shutdown_executor()
 app.router.lifespan_context = lifespan_wrapper
 
 init_middlewares(app)
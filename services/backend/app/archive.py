@@ -0,0 +1,21 @@
+import asyncio
+
+from tortoise import Tortoise
+
+from app.db import TORTOISE_ORM
+from app.services.archive import archive_bookings
+
+
+async def run_archive():
+    """ Переносит прошедшие бронирования старше BOOKING_ARCHIVE_AFTER_DAYS дней в bookings_archive """
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        archived = await archive_bookings()
+        print(f"Перенесено в архив: {archived} бронирований.")
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    # python -m app.archive (например, раз в сутки по cron)
+    asyncio.run(run_archive())
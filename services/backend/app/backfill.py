@@ -0,0 +1,21 @@
+import asyncio
+
+from tortoise import Tortoise
+
+from app.db import TORTOISE_ORM
+from app.services.utilization import rebuild_utilization
+
+
+async def run_backfill():
+    """ Первичное заполнение (или пересчет) сводной таблицы загрузки аудиторий daily_utilization """
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        rows = await rebuild_utilization()
+        print(f"Сводка загрузки пересчитана: {rows} строк.")
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    # python -m app.backfill
+    asyncio.run(run_backfill())
@@ -4,13 +4,16 @@ import logging
 import errno
 
 from tortoise.contrib.fastapi import register_tortoise
+from tortoise.exceptions import DBConnectionError
 from aerich import Command, exceptions as aerich_exceptions
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 
 from app import settings
 from app.enums import UserRole
 from app.models import User
 from app.schemas import UserCreate
+from app.utils.db_pool import pooled_connection
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -21,7 +24,7 @@ logging.basicConfig(
 def get_tortoise_config() -> dict:
     app_list = ["app.models", "aerich.models"]
     config = {
-        "connections": settings.DB_CONNECTIONS,
+        "connections": {name: pooled_connection(url) for name, url in settings.DB_CONNECTIONS.items()},
         "apps": {
             "models": {
                 "models": app_list,
@@ -29,6 +32,8 @@ def get_tortoise_config() -> dict:
             }
         }
     }   
+    if settings.DB_REPLICAS:
+        config["routers"] = ["app.utils.replicas.ReplicaRouter"]
     return config
 
 TORTOISE_ORM = get_tortoise_config()
@@ -46,6 +51,11 @@ def register_db(app: FastAPI, db_url: str = None) -> None:
         add_exception_handlers=True
     )
 
+    @app.exception_handler(DBConnectionError)
+    async def db_unavailable_handler(request: Request, exc: DBConnectionError):
+        # Пул исчерпан или БД недоступна: клиенту стоит повторить запрос, а не считать это ошибкой сервиса
+        return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"})
+
 async def upgrade_db(app: FastAPI, db_url: str = None):
     """
     Initializes Aerich and applies any pending migrations.
@@ -69,6 +79,8 @@ async def upgrade_db(app: FastAPI, db_url: str = None):
         try:
             await AERICH_COMMAND.init_db(safe=True) # safe=True prevents error if table already exists
             logger.info("'aerich init-db' finished.")
+        except FileExistsError:
+            logger.info("Database is already initialized, skipping 'aerich init-db'.")
         except Exception as init_db_exc:
             logger.critical(f"Failed during 'aerich init-db': {init_db_exc}", exc_info=True)
             raise # If we can't even ensure the table, stop here.
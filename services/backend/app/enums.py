@@ -7,4 +7,15 @@ class UserRole(str, enum.Enum):
 
     """ Defines the roles a user can have """
     BOOKER = "booker"
-    MODERATOR = "moderator"
\ No newline at end of file
+    MODERATOR = "moderator"
+
+class BookingBatchMode(str, enum.Enum):
+    """ Режим пакетного создания бронирований """
+    ALL_OR_NOTHING = "all_or_nothing"
+    BEST_EFFORT = "best_effort"
+
+
+class BookingExportFormat(str, enum.Enum):
+    """ Формат потоковой выгрузки бронирований """
+    NDJSON = "ndjson"
+    CSV = "csv"
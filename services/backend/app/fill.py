@@ -47,7 +47,7 @@ async def seed_users():
                 uuid=uuid.uuid4(),
                 username=username,
                 email=email,
-                password_hash=password.get_password_hash(raw_password), # Хешируем пароль
+                password_hash=await password.get_password_hash_async(raw_password), # Хешируем пароль
                 role=UserRole.BOOKER,
                 registration_date=fake.date_this_decade()
             )
@@ -71,7 +71,7 @@ async def seed_users():
                 uuid=uuid.uuid4(),
                 username=username,
                 email=email,
-                password_hash=password.get_password_hash(raw_password),
+                password_hash=await password.get_password_hash_async(raw_password),
                 role=UserRole.MODERATOR, # Устанавливаем роль модератора
                 registration_date=fake.date_this_decade()
             )
@@ -19,6 +19,23 @@ backend_user_role_changes_total = Counter(
     ["target_role"] # "booker", "moderator"
 )
 
+backend_auth_user_cache_requests_total = Counter(
+    "backend_auth_user_cache_requests_total",
+    "Total number of authenticated requests by how the current user was resolved",
+    ["result"] # "hit", "miss", "claims"
+)
+
+backend_token_revocation_checks_total = Counter(
+    "backend_token_revocation_checks_total",
+    "Total number of token revocation checks by how they were answered",
+    ["result"] # "filter" (no DB access), "db" (not revoked), "revoked"
+)
+
+backend_token_revocation_filter_entries = Gauge(
+    "backend_token_revocation_filter_entries",
+    "Number of revoked tokens in the in-memory revocation filter of this worker"
+)
+
 # --- Booking Metrics ---
 backend_bookings_created_total = Counter(
     "backend_bookings_created_total",
@@ -47,6 +64,49 @@ backend_booking_duration_hours = Histogram(
     buckets=[0.5, 1, 2, 3, 4, 6, 8, 12, 24, 48, 72, 168]
 )
 
+backend_booking_index_lookups_total = Counter(
+    "backend_booking_index_lookups_total",
+    "Total number of overlap lookups answered by the in-memory booking index",
+    ["result"] # "conflict" (confirmed by the DB), "stale" (refuted by the DB), "clear"
+)
+
+backend_booking_exports_total = Counter(
+    "backend_booking_exports_total",
+    "Total number of streamed booking exports",
+    ["format"] # "ndjson", "csv"
+)
+
+backend_booking_export_rows_total = Counter(
+    "backend_booking_export_rows_total",
+    "Total number of booking rows written by streamed exports"
+)
+
+backend_booking_lock_wait_seconds = Histogram(
+    "backend_booking_lock_wait_seconds",
+    "Time spent waiting for per-auditorium booking write locks",
+    ["scope"], # "local", "database"
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5]
+)
+
+backend_db_pool_connections = Gauge(
+    "backend_db_pool_connections",
+    "Database pool connections by state",
+    ["connection", "state"] # "in_use", "idle", "max"
+)
+
+backend_db_pool_acquire_seconds = Histogram(
+    "backend_db_pool_acquire_seconds",
+    "Time spent waiting for a free database pool connection",
+    ["connection"],
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5]
+)
+
+backend_db_pool_acquire_timeouts_total = Counter(
+    "backend_db_pool_acquire_timeouts_total",
+    "Total number of requests that gave up waiting for a database pool connection",
+    ["connection"]
+)
+
 # --- Resource Management ---
 backend_auditoriums_managed_total = Counter(
     "backend_auditoriums_managed_total",
@@ -72,8 +132,97 @@ backend_calendar_views_total = Counter(
     "Total number of auditorium calendar views"
 )
 
+backend_calendar_cache_requests_total = Counter(
+    "backend_calendar_cache_requests_total",
+    "Total number of auditorium calendar requests served from / missing the response cache",
+    ["result"] # "hit", "miss"
+)
+
+backend_calendar_feed_requests_total = Counter(
+    "backend_calendar_feed_requests_total",
+    "Total number of ICS feed requests",
+    ["feed", "result"] # feed: "auditorium", "user"; result: "full", "not_modified"
+)
+
 backend_auditorium_searches_total = Counter(
     "backend_auditorium_searches_total",
     "Total number of auditorium searches/list views",
     ["filtered_by"] # "capacity", "equipment", "both", "none"
-)
\ No newline at end of file
+)
+
+backend_free_auditorium_searches_total = Counter(
+    "backend_free_auditorium_searches_total",
+    "Total number of free auditorium searches"
+)
+
+backend_freebusy_requests_total = Counter(
+    "backend_freebusy_requests_total",
+    "Total number of multi-auditorium free/busy matrix requests"
+)
+backend_booking_holds_total = Counter(
+    "backend_booking_holds_total",
+    "Total number of tentative booking holds by outcome",
+    ["outcome"]  # created, confirmed, released, expired
+)
+
+backend_waitlist_entries_total = Counter(
+    "backend_waitlist_entries_total",
+    "Total number of booking waitlist entries by outcome",
+    ["outcome"]  # joined, left, promoted
+)
+
+backend_db_reads_total = Counter(
+    "backend_db_reads_total",
+    "Total number of read-only service calls by the database they were routed to",
+    ["target"]  # replica, primary_sticky
+)
+
+backend_calendar_events_total = Counter(
+    "backend_calendar_events_total",
+    "Total number of booking events broadcast to live calendar subscribers",
+    ["event"]  # booking.created, booking.updated, booking.deleted
+)
+
+backend_calendar_event_subscribers = Gauge(
+    "backend_calendar_event_subscribers",
+    "Number of open live calendar event streams in this worker"
+)
+
+backend_calendar_event_subscribers_dropped_total = Counter(
+    "backend_calendar_event_subscribers_dropped_total",
+    "Total number of live calendar subscribers disconnected because their queue overflowed"
+)
+
+backend_bookings_archived_total = Counter(
+    "backend_bookings_archived_total",
+    "Total number of past bookings moved to the archive table"
+)
+
+backend_utilization_reports_total = Counter(
+    "backend_utilization_reports_total",
+    "Total number of auditorium utilization reports served from the daily rollup"
+)
+
+# --- Password Hashing ---
+backend_password_hash_seconds = Histogram(
+    "backend_password_hash_seconds",
+    "Time spent hashing or verifying a password in the hashing pool",
+    ["operation"], # "hash", "verify"
+    buckets=[0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1, 2.5]
+)
+
+backend_password_hash_wait_seconds = Histogram(
+    "backend_password_hash_wait_seconds",
+    "Time a password operation waited for a free hashing slot",
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5]
+)
+
+backend_password_hash_queued = Gauge(
+    "backend_password_hash_queued",
+    "Number of password operations waiting for a free hashing slot"
+)
+
+backend_password_hash_rejected_total = Counter(
+    "backend_password_hash_rejected_total",
+    "Total number of password operations rejected because the hashing queue was full"
+)
@@ -40,11 +40,14 @@ class User(TimestampMixin, BaseModel):
     registration_date = fields.DateField(auto_now_add=True)
     telegram_id = fields.CharField(max_length=255, null=True)
     role = fields.CharEnumField(UserRole, default=UserRole.BOOKER, description="User role")
+    bookings_version = fields.IntField(default=0, description="Bumped on every change of the user's bookings")
+    bookings_changed_at = fields.DatetimeField(null=True, description="Last change of the user's bookings")
+    feed_token_hash = fields.CharField(max_length=64, unique=True, null=True, description="sha256 of the calendar feed secret")
 
     @classmethod
     async def create(cls, user: UserCreate) -> "User":
         user_dict = user.model_dump(exclude=["password"])
-        password_hash = password.get_password_hash(password=user.password)
+        password_hash = await password.get_password_hash_async(password=user.password)
         model = cls(**user_dict, password_hash=password_hash, registration_date=date.today())
         return model
     
@@ -127,6 +130,7 @@ class AvailabilitySlot(BaseModel):
     day_of_week = fields.IntField(description="Day of the week (0=Monday, 6=Sunday)")
     start_time = fields.TimeField(description="Start time of the slot")
     end_time = fields.TimeField(description="End time of the slot")
+    version = fields.IntField(default=1, description="Optimistic concurrency version")
 
     @classmethod
     async def create(cls, model: CreateAvailability) -> "AvailabilitySlot":
@@ -155,7 +159,10 @@ class AvailabilitySlot(BaseModel):
 
     class Meta:
         table = "availability_slots"
+        # Поиск слотов аудитории по (auditorium_id, day_of_week, start_time) обслуживает индекс первого ограничения уникальности
         unique_together = (("auditorium", "day_of_week", "start_time"), ("auditorium", "day_of_week", "end_time"))
+        # Поиск свободных аудиторий: аудитории, открытые в заданный день недели (index-only scan)
+        indexes = (("day_of_week", "auditorium_id"),)
 
     def __str__(self):
         days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
@@ -167,6 +174,10 @@ class Auditorium(BaseModel):
     identifier = fields.CharField(max_length=100, unique=True)
     capacity = fields.IntField()
     desctiption = fields.TextField(null=True)
+    version = fields.IntField(default=1, description="Optimistic concurrency version")
+    bookings_version = fields.IntField(default=0, description="Bumped on every change of the auditorium's bookings")
+    bookings_changed_at = fields.DatetimeField(null=True, description="Last change of the auditorium's bookings")
+    availability_version = fields.IntField(default=0, description="Bumped on every change of the auditorium's availability slots")
     equipment: fields.ManyToManyRelation["Equipment"] = fields.ManyToManyField(
         "models.Equipment", related_name="auditoriums_equipment", through="auditorium_equipment"
     )
@@ -197,6 +208,134 @@ class Auditorium(BaseModel):
         table = "auditoriums"
 
 
+class BookingSeries(TimestampMixin, BaseModel):
+    uuid = fields.UUIDField(pk=True)
+    broker: fields.ForeignKeyRelation["User"] = fields.ForeignKeyField(
+        "models.User", related_name="booking_series", on_delete=fields.CASCADE
+    )
+    auditorium: fields.ForeignKeyRelation["Auditorium"] = fields.ForeignKeyField(
+        "models.Auditorium", related_name="booking_series", on_delete=fields.CASCADE
+    )
+    title = fields.CharField(max_length=200, null=True)
+    start_time = fields.DatetimeField(description="Start of the first occurrence")
+    end_time = fields.DatetimeField(description="End of the first occurrence")
+    interval_weeks = fields.IntField(default=1, description="Repeat every N weeks")
+    until = fields.DateField(description="Last date an occurrence may start on")
+    exceptions = fields.JSONField(default=list, description="ISO dates without an occurrence")
+
+    occurrences: fields.ReverseRelation["Booking"]
+
+    def __str__(self):
+        return f"Series {self.uuid}: Aud. {self.auditorium_id} every {self.interval_weeks} week(s) until {self.until}"
+
+    class Meta:
+        table = "booking_series"
+
+
+class BookingHold(BaseModel):
+    uuid = fields.UUIDField(pk=True)
+    broker: fields.ForeignKeyRelation["User"] = fields.ForeignKeyField(
+        "models.User", related_name="booking_holds", on_delete=fields.CASCADE
+    )
+    auditorium: fields.ForeignKeyRelation["Auditorium"] = fields.ForeignKeyField(
+        "models.Auditorium", related_name="booking_holds", on_delete=fields.CASCADE
+    )
+    start_time = fields.DatetimeField()
+    end_time = fields.DatetimeField()
+    title = fields.CharField(max_length=200, null=True, blank=True)
+    expires_at = fields.DatetimeField(description="The hold stops blocking the interval after this moment")
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Hold {self.uuid}: Aud. {self.auditorium_id} ({self.start_time} - {self.end_time}) until {self.expires_at}"
+
+    class Meta:
+        table = "booking_holds"
+        # Проверка пересечений с действующими удержаниями и очистка истекших
+        indexes = (("auditorium_id", "start_time", "end_time"), ("expires_at",))
+
+
+class WaitlistEntry(BaseModel):
+    uuid = fields.UUIDField(pk=True)
+    broker: fields.ForeignKeyRelation["User"] = fields.ForeignKeyField(
+        "models.User", related_name="waitlist_entries", on_delete=fields.CASCADE
+    )
+    auditorium: fields.ForeignKeyRelation["Auditorium"] = fields.ForeignKeyField(
+        "models.Auditorium", related_name="waitlist_entries", on_delete=fields.CASCADE
+    )
+    start_time = fields.DatetimeField()
+    end_time = fields.DatetimeField()
+    title = fields.CharField(max_length=200, null=True, blank=True)
+    created_at = fields.DatetimeField(auto_now_add=True, description="Queue order")
+
+    def __str__(self):
+        return f"Waitlist {self.uuid}: Aud. {self.auditorium_id} ({self.start_time} - {self.end_time}) for User {self.broker_id}"
+
+    class Meta:
+        table = "booking_waitlist"
+        # Кандидаты на освободившийся интервал — диапазонный запрос по аудитории и времени; заявки пользователя
+        indexes = (("auditorium_id", "start_time", "end_time"), ("broker_id", "created_at"))
+
+
+class BookingArchive(BaseModel):
+    """
+    Прошедшие бронирования, перенесенные из bookings задачей архивации.
+    Ссылки хранятся как UUID без внешних ключей, чтобы архив не мешал удалению аудиторий и пользователей;
+    в Postgres таблица секционирована по месяцам start_time.
+    """
+    uuid = fields.UUIDField(pk=True)
+    auditorium_id = fields.UUIDField()
+    broker_id = fields.UUIDField()
+    series_id = fields.UUIDField(null=True)
+    start_time = fields.DatetimeField()
+    end_time = fields.DatetimeField()
+    title = fields.CharField(max_length=200, null=True, blank=True)
+    version = fields.IntField(default=1)
+    archived_at = fields.DatetimeField(auto_now_add=True)
+
+    archived = True
+
+    def __str__(self):
+        return f"Archived booking {self.uuid}: Aud. {self.auditorium_id} by User {self.broker_id} ({self.start_time} - {self.end_time})"
+
+    class Meta:
+        table = "bookings_archive"
+        indexes = (("start_time", "uuid"), ("broker_id", "start_time", "uuid"), ("auditorium_id", "start_time"))
+
+
+class DailyUtilization(BaseModel):
+    id = fields.IntField(pk=True)
+    auditorium: fields.ForeignKeyRelation["Auditorium"] = fields.ForeignKeyField(
+        "models.Auditorium", related_name="daily_utilization", on_delete=fields.CASCADE
+    )
+    day = fields.DateField(description="UTC day")
+    booked_seconds = fields.IntField(default=0, description="Booked time within the day")
+    bookings_count = fields.IntField(default=0, description="Bookings touching the day")
+
+    def __str__(self):
+        return f"Aud. {self.auditorium_id} {self.day}: {self.booked_seconds}s in {self.bookings_count} booking(s)"
+
+    class Meta:
+        table = "daily_utilization"
+        unique_together = (("auditorium", "day"),)
+
+
+class RevokedToken(BaseModel):
+    """ Токены, отозванные до истечения срока (по claim jti); строка нужна только до expires_at токена """
+    jti = fields.CharField(max_length=64, pk=True)
+    user_uuid = fields.UUIDField(null=True)
+    expires_at = fields.DatetimeField()
+    revoked_at = fields.DatetimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Revoked token {self.jti} of User {self.user_uuid} until {self.expires_at}"
+
+    class Meta:
+        table = "revoked_tokens"
+        # Дочитывание новых отзывов в backend и очистка истекших
+        indexes = (("revoked_at",), ("expires_at",))
+
+
 class Booking(BaseModel):
     uuid = fields.UUIDField(pk=True)
     broker: fields.ForeignKeyRelation["User"] = fields.ForeignKeyField(
@@ -208,12 +347,25 @@ class Booking(BaseModel):
     start_time = fields.DatetimeField()
     end_time = fields.DatetimeField()
     title = fields.CharField(max_length=200, null=True, blank=True)
+    series: fields.ForeignKeyNullableRelation["BookingSeries"] = fields.ForeignKeyField(
+        "models.BookingSeries", related_name="occurrences", null=True, on_delete=fields.CASCADE
+    )
+    version = fields.IntField(default=1, description="Optimistic concurrency version")
 
     def __str__(self):
-        return f"Booking {self.id}: Aud. {self.auditorium_id} by User {self.booker_id} ({self.start_time} - {self.end_time})"
+        return f"Booking {self.uuid}: Aud. {self.auditorium_id} by User {self.broker_id} ({self.start_time} - {self.end_time})"
 
     class Meta:
         table = "bookings"
+        # Ключи keyset-пагинации списков бронирований: (start_time, uuid) и он же в разрезе брокера;
+        # проверка пересечений и календари: auditorium_id = ? AND start_time < ? AND end_time > ? ORDER BY start_time
+        # (uuid в конце ключа, чтобы выборка конфликтов обходилась одним индексом); занятия серии по порядку
+        indexes = (
+            ("start_time", "uuid"),
+            ("broker_id", "start_time", "uuid"),
+            ("auditorium_id", "start_time", "end_time", "uuid"),
+            ("series_id", "start_time"),
+        )
     
     @classmethod
     async def create(cls, booking_model: CreateBooking, user: User) -> "Booking":
@@ -0,0 +1,28 @@
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import UUID4
+
+from app.schemas import AuditoriumUtilization
+from app.utils.contrib import get_current_moderator
+from app.services.utilization import get_utilization
+from app.models import User
+
+router = APIRouter()
+
+
+@router.get(
+    "/utilization",
+    response_model=List[AuditoriumUtilization],
+    summary="Получить отчет о загрузке аудиторий",
+    description="Забронированные и доступные по расписанию часы по аудиториям и дням в диапазоне дат. "
+                "Строится по сводной таблице daily_utilization. Только для модераторов."
+)
+async def route_get_utilization(
+    start_date: date = Query(..., alias="startDate", description="Начальная дата диапазона (YYYY-MM-DD)"),
+    end_date: date = Query(..., alias="endDate", description="Конечная дата диапазона (YYYY-MM-DD)"),
+    auditorium_ids: Optional[List[UUID4]] = Query(None, alias="auditoriumId", description="UUID аудитории (можно указать несколько раз)"),
+    current_user: User = Depends(get_current_moderator)
+):
+    return await get_utilization(start_date=start_date, end_date=end_date, auditorium_uuids=auditorium_ids)
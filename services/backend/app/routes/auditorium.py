@@ -1,13 +1,17 @@
-from datetime import date
+from datetime import date, datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
 
-from app.schemas import CreateAuditorium, UpdateAuditorium, GetAuditorium, DeleteAuditorium, CalendarBookingEntry
+from app.schemas import CreateAuditorium, UpdateAuditorium, GetAuditorium, DeleteAuditorium, CalendarBookingEntry, AuditoriumCalendar, FreeBusy
 from app.utils.contrib import get_current_moderator
-from app.services.auditorium import get_auditorium_by_uuid, get_auditoriums, create_auditorium, delete_auditorium, update_auditorium
-from app.services.booking import get_bookings_for_calendar
+from app.utils.versioning import resolve_expected_version, version_etag
+from app.services.auditorium import get_auditorium_by_uuid, get_auditoriums, get_free_auditoriums, create_auditorium, delete_auditorium, update_auditorium
+from app.services.events import open_auditorium_events
+from app.services.calendar import ICS_MEDIA_TYPE, get_auditorium_feed, get_auditoriums_calendar, get_calendar_json, get_freebusy, render_feed
+from app.utils.conditional import is_not_modified, validator_headers
 from app.models import User
 
 from app import metrics
@@ -24,14 +28,138 @@ async def route_create_auditorium(
     return await create_auditorium(auditorium_data)
 
 
+@router.get(
+    "/free",
+    response_model=List[GetAuditorium],
+    status_code=200,
+    summary="Найти свободные аудитории",
+    description="Возвращает аудитории, доступные по расписанию и не занятые бронированиями "
+                "в интервале [start, end), с фильтрами по вместимости и оборудованию."
+)
+async def route_get_free_auditoriums(
+    start: datetime = Query(..., description="Начало интервала (ISO 8601)"),
+    end: datetime = Query(..., description="Окончание интервала (ISO 8601)"),
+    min_capacity: Optional[int] = Query(None, alias="minCapacity", description="Минимальная требуемая вместимость", ge=1),
+    equipment_ids: Optional[List[UUID4]] = Query(None, alias="equipmentId", description="UUID оборудования (можно указать несколько раз)"),
+    limit: int = Query(20, ge=1, le=100, description="Количество аудиторий в ответе"),
+    offset: int = Query(0, ge=0, description="Сколько подходящих аудиторий пропустить")
+):
+    metrics.backend_free_auditorium_searches_total.inc()
+    return await get_free_auditoriums(
+        start=start,
+        end=end,
+        min_capacity=min_capacity,
+        equipment_ids=equipment_ids,
+        limit=limit,
+        offset=offset
+    )
+
+
+@router.get(
+    "/calendar",
+    response_model=List[AuditoriumCalendar],
+    summary="Получить календарь нескольких аудиторий",
+    description="Возвращает бронирования нескольких аудиторий (по списку UUID и/или фильтру по вместимости "
+                "и оборудованию) в диапазоне дат, сгруппированные по аудиториям."
+)
+async def route_get_auditoriums_calendar(
+    start_date: date = Query(..., alias="startDate", description="Начальная дата диапазона (YYYY-MM-DD)"),
+    end_date: date = Query(..., alias="endDate", description="Конечная дата диапазона (YYYY-MM-DD)"),
+    auditorium_ids: Optional[List[UUID4]] = Query(None, alias="auditoriumId", description="UUID аудитории (можно указать несколько раз)"),
+    min_capacity: Optional[int] = Query(None, alias="minCapacity", description="Минимальная требуемая вместимость", ge=1),
+    equipment_ids: Optional[List[UUID4]] = Query(None, alias="equipmentId", description="UUID оборудования (можно указать несколько раз)")
+):
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="Дата начала не может быть позже даты окончания.")
+    metrics.backend_calendar_views_total.inc()
+    return await get_auditoriums_calendar(
+        start_date=start_date,
+        end_date=end_date,
+        auditorium_uuids=auditorium_ids,
+        min_capacity=min_capacity,
+        equipment_ids=equipment_ids
+    )
+
+
+@router.get(
+    "/freebusy",
+    response_model=FreeBusy,
+    summary="Получить матрицу занятости аудиторий",
+    description="Сетка аудиторий × ячеек по bucketMinutes минут от start до end. Каждая аудитория закодирована "
+                "run-length строкой runs: число ячеек и состояние (o — свободна, b — занята бронью или удержанием, "
+                "c — закрыта по расписанию), например \"36c8o4b\"."
+)
+async def route_get_freebusy(
+    start: datetime = Query(..., description="Начало сетки (ISO 8601)"),
+    end: datetime = Query(..., description="Конец сетки (ISO 8601)"),
+    bucket_minutes: int = Query(15, alias="bucketMinutes", description="Размер ячейки в минутах", ge=5, le=1440),
+    auditorium_ids: Optional[List[UUID4]] = Query(None, alias="auditoriumId", description="UUID аудитории (можно указать несколько раз)"),
+    min_capacity: Optional[int] = Query(None, alias="minCapacity", description="Минимальная требуемая вместимость", ge=1),
+    equipment_ids: Optional[List[UUID4]] = Query(None, alias="equipmentId", description="UUID оборудования (можно указать несколько раз)")
+):
+    metrics.backend_freebusy_requests_total.inc()
+    return await get_freebusy(
+        start=start,
+        end=end,
+        bucket_minutes=bucket_minutes,
+        auditorium_uuids=auditorium_ids,
+        min_capacity=min_capacity,
+        equipment_ids=equipment_ids
+    )
+
+
+@router.get(
+    "/{auditorium_uuid}/calendar.ics",
+    response_class=Response,
+    summary="ICS-лента бронирований аудитории",
+    description="Лента iCalendar для подписки календарных клиентов. Поддерживает условный GET "
+                "(If-None-Match / If-Modified-Since): 304 отдается без запроса к таблице бронирований."
+)
+async def route_get_auditorium_ics(
+    request: Request,
+    auditorium_uuid: UUID4 = Path(..., title="UUID аудитории")
+):
+    feed = await get_auditorium_feed(auditorium_uuid)
+    headers = validator_headers(feed.etag, feed.last_modified)
+    if is_not_modified(request, feed.etag, feed.last_modified):
+        metrics.backend_calendar_feed_requests_total.labels(feed="auditorium", result="not_modified").inc()
+        return Response(status_code=304, headers=headers)
+    metrics.backend_calendar_feed_requests_total.labels(feed="auditorium", result="full").inc()
+    return Response(content=await render_feed(feed), media_type=ICS_MEDIA_TYPE, headers=headers)
+
+
+@router.get(
+    "/{auditorium_uuid}/events",
+    response_class=StreamingResponse,
+    summary="Подписаться на изменения бронирований аудитории",
+    description="Поток Server-Sent Events: booking.created, booking.updated (данные в формате календаря) "
+                "и booking.deleted (uuid). После подписки приходит событие ready — клиенту нужно перечитать календарь."
+)
+async def route_get_auditorium_events(
+    auditorium_uuid: UUID4 = Path(..., title="UUID аудитории")
+):
+    """
+    Заменяет периодический опрос календаря: события рассылаются из памяти воркера,
+    сериализуются один раз на всех подписчиков и в БД не обращаются.
+    """
+    events = await open_auditorium_events(auditorium_uuid)
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/{auditorium_uuid}", response_model=GetAuditorium, status_code=200)
 async def route_get_auditorium(
+    response: Response,
     auditorium_uuid: UUID4 = Path(..., title="UUID of the auditorium"),
 ):
     metrics.backend_auditorium_searches_total.labels(filtered_by="none").inc()
     auditorium = await get_auditorium_by_uuid(auditorium_uuid)
     if not auditorium:
         raise HTTPException(status_code=404, detail="Auditorium not found")
+    response.headers["ETag"] = version_etag(auditorium.version)
     return auditorium
 
 @router.get("/", response_model=List[GetAuditorium], status_code=200)
@@ -41,13 +169,18 @@ async def route_get_auditoriums():
 @router.patch("/{auditorium_uuid}", response_model=GetAuditorium, status_code=200)
 async def route_update_auditorium(
     update_data: UpdateAuditorium,
+    response: Response,
     auditorium_uuid: UUID4 = Path(..., title="UUID of the auditorium to update"),
+    if_match: Optional[str] = Header(None, alias="If-Match", description="Expected auditorium version"),
     current_user: User = CurrentModerator
 ):
-    return await update_auditorium(
+    auditorium = await update_auditorium(
         auditorium_uuid=auditorium_uuid,
-        auditorium_update_data=update_data
+        auditorium_update_data=update_data,
+        expected_version=resolve_expected_version(if_match, update_data.version)
     )
+    response.headers["ETag"] = version_etag(auditorium.version)
+    return auditorium
 
 @router.delete("/{auditorium_uuid}", status_code=204)
 async def route_delete_auditorium(
@@ -78,12 +211,12 @@ async def route_get_auditorium_calendar(
     if start_date > end_date:
         raise HTTPException(status_code=400, detail="Дата начала не может быть позже даты окончания.")
     metrics.backend_calendar_views_total.inc()
-    bookings = await get_bookings_for_calendar(
+    payload = await get_calendar_json(
         auditorium_uuid=auditorium_uuid,
         start_date=start_date,
         end_date=end_date
     )
-    return bookings
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get(
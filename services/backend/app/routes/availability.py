@@ -1,10 +1,11 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Body, Depends, Path
+from fastapi import APIRouter, Body, Depends, Header, Path, Response
 from pydantic import UUID4
 
 from app.schemas import GetAvailability, UpdateAvailability, CreateAvailability, DeleteAvailability
 from app.utils.contrib import get_current_moderator
+from app.utils.versioning import resolve_expected_version, version_etag
 from app.services.availability import get_availability, get_all_availabilities, create_availability, update_availability, delete_availability
 from app.models import User
 
@@ -29,14 +30,18 @@ async def route_get_availability(uuid: UUID4):
 
 @router.patch("/{availability_uuid}", response_model=GetAvailability, status_code=200)
 async def route_update_availability(
+    response: Response,
     availability_uuid: UUID4 = Path(..., title="UUID слота доступности для обновления"),
     availability_update_data: UpdateAvailability = Body(...),
+    if_match: Optional[str] = Header(None, alias="If-Match", description="Ожидаемая версия слота"),
     current_user: User = Depends(get_current_moderator)
 ):
     updated_availability = await update_availability(
          availability_uuid=availability_uuid,
-         availability_update_data=availability_update_data
+         availability_update_data=availability_update_data,
+         expected_version=resolve_expected_version(if_match, availability_update_data.version)
     )
+    response.headers["ETag"] = version_etag(updated_availability.version)
     return updated_availability
 
 
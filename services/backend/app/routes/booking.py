@@ -1,13 +1,20 @@
 from datetime import datetime, date
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
 
-from app.schemas import CreateBooking, DeleteBooking, UpdateBooking, GetBooking
-from app.utils.contrib import get_current_moderator, get_current_user
-from app.services.booking import get_booking_by_uuid, get_bookings, create_booking, delete_booking, get_my_bookings, update_booking
+from app.schemas import CreateBooking, DeleteBooking, UpdateBooking, GetBooking, CreateBookingBatch, BookingBatchResult
+from app.utils.contrib import get_current_moderator, get_current_user, get_current_feed_user
+from app.utils.conditional import is_not_modified, validator_headers
+from app.services.booking import get_booking_by_uuid, get_bookings, create_booking, create_bookings_batch, delete_booking, get_my_bookings, update_booking
+from app.services.export import export_bookings, EXPORT_MEDIA_TYPES
+from app.services.calendar import ICS_MEDIA_TYPE, get_user_feed, render_feed
+from app.enums import BookingExportFormat
+from app.utils.versioning import resolve_expected_version, version_etag
 from app.models import User
+from app import metrics, settings
 
 
 router = APIRouter()
@@ -22,28 +29,130 @@ async def handle_create_booking(
     new_booking = await create_booking(booking_model=booking_data, current_user=current_user)
     return new_booking
 
+@router.post("/batch", response_model=BookingBatchResult, status_code=200)
+async def handle_create_bookings_batch(
+    batch_data: CreateBookingBatch,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Создает пакет бронирований одной транзакцией.
+    Возвращает результат по каждому элементу; в режиме all_or_nothing при любой ошибке ничего не создается.
+    """
+    return await create_bookings_batch(batch=batch_data, current_user=current_user)
+
+
 @router.get("/", response_model=List[GetBooking])
 async def handle_read_bookings(
+    response: Response,
     current_user: User = Depends(get_current_user),
     # Используем Query для параметров фильтрации
     auditorium_id: Optional[UUID4] = Query(None, alias="auditoriumId", description="Фильтр по UUID аудитории"),
     user_id: Optional[UUID4] = Query(None, alias="userId", description="Фильтр по UUID пользователя (только для модераторов)"),
     start_date: Optional[date] = Query(None, alias="startDate", description="Начальная дата для фильтрации (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, alias="endDate", description="Конечная дата для фильтрации (YYYY-MM-DD)"),
+    limit: int = Query(settings.BOOKING_PAGE_SIZE, ge=1, le=settings.BOOKING_PAGE_SIZE_MAX, description="Размер страницы"),
+    cursor: Optional[str] = Query(None, description="Курсор следующей страницы из заголовка X-Next-Cursor"),
+    include_archived: bool = Query(False, alias="includeArchived", description="Включить архивные (давно прошедшие) бронирования")
+):
+    """
+    Возвращает страницу бронирований с возможностью фильтрации.
+    Если есть следующая страница, ее курсор возвращается в заголовке X-Next-Cursor.
+    """
+    bookings_list, next_cursor = await get_bookings(
+        current_user=current_user,
+        auditorium_uuid=auditorium_id,
+        user_uuid=user_id,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+        cursor=cursor,
+        include_archived=include_archived
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return bookings_list
+
+
+@router.get("/export", response_class=StreamingResponse, summary="Выгрузить бронирования")
+async def handle_export_bookings(
+    current_user: User = Depends(get_current_user),
+    export_format: BookingExportFormat = Query(BookingExportFormat.NDJSON, alias="format", description="Формат выгрузки: ndjson или csv"),
+    auditorium_id: Optional[UUID4] = Query(None, alias="auditoriumId", description="Фильтр по UUID аудитории"),
+    user_id: Optional[UUID4] = Query(None, alias="userId", description="Фильтр по UUID пользователя (только для модераторов)"),
+    start_date: Optional[date] = Query(None, alias="startDate", description="Начальная дата для фильтрации (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, alias="endDate", description="Конечная дата для фильтрации (YYYY-MM-DD)")
 ):
-    """ Возвращает список бронирований с возможностью фильтрации. """
-    bookings_list = await get_bookings(
+    """
+    Потоково выгружает бронирования в NDJSON или CSV с теми же фильтрами, что и список бронирований.
+    Строки читаются из БД порциями и отправляются клиенту по мере чтения.
+    """
+    rows = export_bookings(
         current_user=current_user,
+        export_format=export_format,
         auditorium_uuid=auditorium_id,
         user_uuid=user_id,
         start_date=start_date,
         end_date=end_date
     )
-    return bookings_list
+    return StreamingResponse(
+        rows,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="bookings.{export_format.value}"'}
+    )
+
+
+@router.get("/me", response_model=List[GetBooking], summary="Получить мои бронирования")
+async def handle_read_my_bookings(
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    auditorium_id: Optional[UUID4] = Query(None, alias="auditoriumId", description="Фильтр по UUID аудитории"),
+    start_date: Optional[date] = Query(None, alias="startDate", description="Начальная дата для фильтрации (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, alias="endDate", description="Конечная дата для фильтрации (YYYY-MM-DD)"),
+    limit: int = Query(settings.BOOKING_PAGE_SIZE, ge=1, le=settings.BOOKING_PAGE_SIZE_MAX, description="Размер страницы"),
+    cursor: Optional[str] = Query(None, description="Курсор следующей страницы из заголовка X-Next-Cursor"),
+    include_archived: bool = Query(False, alias="includeArchived", description="Включить архивные (давно прошедшие) бронирования")
+):
+    """
+    Возвращает страницу бронирований, сделанных ТЕКУЩИМ аутентифицированным пользователем.
+    Поддерживает фильтрацию по аудитории и диапазону дат.
+    """
+    my_bookings, next_cursor = await get_my_bookings(
+        current_user=current_user,
+        auditorium_uuid=auditorium_id,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+        cursor=cursor,
+        include_archived=include_archived
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return my_bookings
+
+
+@router.get("/me/calendar.ics", response_class=Response, summary="ICS-лента моих бронирований")
+async def handle_read_my_bookings_ics(
+    request: Request,
+    current_user: User = Depends(get_current_feed_user)
+):
+    """
+    Лента iCalendar с бронированиями текущего пользователя.
+    Access-токен передается заголовком Authorization; календарные клиенты подписываются по URL с параметром token —
+    секретом ленты из POST /users/me/feed-token (он открывает только ленту и отзывается отдельно).
+    ETag/Last-Modified строятся по счетчику изменений пользователя, 304 отдается без запроса к бронированиям.
+    """
+    feed = await get_user_feed(current_user)
+    headers = validator_headers(feed.etag, feed.last_modified)
+    if is_not_modified(request, feed.etag, feed.last_modified):
+        metrics.backend_calendar_feed_requests_total.labels(feed="user", result="not_modified").inc()
+        return Response(status_code=304, headers=headers)
+    metrics.backend_calendar_feed_requests_total.labels(feed="user", result="full").inc()
+    return Response(content=await render_feed(feed), media_type=ICS_MEDIA_TYPE, headers=headers)
 
 
 @router.get("/{booking_uuid}", response_model=GetBooking)
 async def handle_read_booking(
+    response: Response,
     booking_uuid: UUID4 = Path(..., title="UUID бронирования"),
     current_user: User = Depends(get_current_user)
 ):
@@ -51,24 +160,30 @@ async def handle_read_booking(
     booking = await get_booking_by_uuid(booking_uuid=booking_uuid, current_user=current_user)
     if booking is None:
         raise HTTPException(status_code=404, detail="Бронирование не найдено")
+    response.headers["ETag"] = version_etag(booking.version)
     return booking
 
 
 @router.patch("/{booking_uuid}", response_model=GetBooking)
 async def handle_update_booking(
     booking_update_data: UpdateBooking,
+    response: Response,
     booking_uuid: UUID4 = Path(..., title="UUID бронирования для обновления"),
+    if_match: Optional[str] = Header(None, alias="If-Match", description="Ожидаемая версия бронирования"),
     current_user: User = Depends(get_current_user)
 ):
     """
     Обновляет существующее бронирование (частично).
     Доступно создателю брони или модератору.
+    Если версия из If-Match (или поля version) устарела, возвращается 412.
     """
     updated_booking = await update_booking(
         booking_uuid=booking_uuid,
         booking_update_data=booking_update_data,
-        current_user=current_user
+        current_user=current_user,
+        expected_version=resolve_expected_version(if_match, booking_update_data.version)
     )
+    response.headers["ETag"] = version_etag(updated_booking.version)
     return updated_booking
 
 
@@ -84,23 +199,3 @@ async def handle_delete_booking(
     if not deleted:
         raise HTTPException(status_code=404, detail="Бронирование не найдено")
     return None
-
-
-@router.get("/me", response_model=List[GetBooking], summary="Получить мои бронирования")
-async def handle_read_my_bookings(
-    current_user: User = Depends(get_current_user),
-    auditorium_id: Optional[UUID4] = Query(None, alias="auditoriumId", description="Фильтр по UUID аудитории"),
-    start_date: Optional[date] = Query(None, alias="startDate", description="Начальная дата для фильтрации (YYYY-MM-DD)"),
-    end_date: Optional[date] = Query(None, alias="endDate", description="Конечная дата для фильтрации (YYYY-MM-DD)")
-):
-    """
-    Возвращает список бронирований, сделанных ТЕКУЩИМ аутентифицированным пользователем.
-    Поддерживает фильтрацию по аудитории и диапазону дат.
-    """
-    my_bookings = await get_my_bookings(
-        current_user=current_user,
-        auditorium_uuid=auditorium_id,
-        start_date=start_date,
-        end_date=end_date
-    )
-    return my_bookings
\ No newline at end of file
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, Path
+from pydantic import UUID4
+
+from app.schemas import CreateBookingHold, GetBookingHold, GetBooking
+from app.utils.contrib import get_current_user
+from app.services.holds import create_booking_hold, confirm_booking_hold, release_booking_hold
+from app.models import User
+
+
+router = APIRouter()
+
+
+@router.post("/", response_model=GetBookingHold, status_code=201)
+async def handle_create_booking_hold(
+    hold_data: CreateBookingHold,
+    current_user: User = Depends(get_current_user)
+):
+    """ Временно удерживает интервал в аудитории (на ttlMinutes минут), пока пользователь заполняет бронирование. """
+    return await create_booking_hold(hold_model=hold_data, current_user=current_user)
+
+
+@router.post("/{hold_uuid}/confirm", response_model=GetBooking, status_code=201)
+async def handle_confirm_booking_hold(
+    hold_uuid: UUID4 = Path(..., title="UUID удержания"),
+    current_user: User = Depends(get_current_user)
+):
+    """ Подтверждает удержание: создает бронирование на удержанный интервал. Истекшее удержание — 410. """
+    return await confirm_booking_hold(hold_uuid=hold_uuid, current_user=current_user)
+
+
+@router.delete("/{hold_uuid}", status_code=204)
+async def handle_release_booking_hold(
+    hold_uuid: UUID4 = Path(..., title="UUID удержания"),
+    current_user: User = Depends(get_current_user)
+):
+    """ Снимает удержание досрочно. """
+    await release_booking_hold(hold_uuid=hold_uuid, current_user=current_user)
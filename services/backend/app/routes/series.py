@@ -0,0 +1,61 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from pydantic import UUID4
+
+from app.schemas import CreateBookingSeries, GetBookingSeries, UpdateBookingSeries
+from app.utils.contrib import get_current_user
+from app.services.series import create_booking_series, get_booking_series, update_booking_series, cancel_booking_series
+from app.models import User
+
+
+router = APIRouter()
+
+
+@router.post("/", response_model=GetBookingSeries, status_code=201)
+async def handle_create_booking_series(
+    series_data: CreateBookingSeries,
+    current_user: User = Depends(get_current_user)
+):
+    """ Создает серию повторяющихся бронирований (каждые N недель до даты until, с исключениями). """
+    return await create_booking_series(series_model=series_data, current_user=current_user)
+
+
+@router.get("/{series_uuid}", response_model=GetBookingSeries)
+async def handle_read_booking_series(
+    series_uuid: UUID4 = Path(..., title="UUID серии бронирований"),
+    current_user: User = Depends(get_current_user)
+):
+    """ Возвращает серию бронирований вместе с ее занятиями. """
+    series = await get_booking_series(series_uuid=series_uuid, current_user=current_user)
+    if series is None:
+        raise HTTPException(status_code=404, detail="Серия бронирований не найдена")
+    return series
+
+
+@router.patch("/{series_uuid}", response_model=GetBookingSeries)
+async def handle_update_booking_series(
+    series_update_data: UpdateBookingSeries,
+    series_uuid: UUID4 = Path(..., title="UUID серии бронирований для обновления"),
+    current_user: User = Depends(get_current_user)
+):
+    """ Обновляет серию и все ее занятия одним запросом. Доступно создателю серии или модератору. """
+    return await update_booking_series(
+        series_uuid=series_uuid,
+        series_update_data=series_update_data,
+        current_user=current_user
+    )
+
+
+@router.delete("/{series_uuid}", status_code=204)
+async def handle_cancel_booking_series(
+    series_uuid: UUID4 = Path(..., title="UUID серии бронирований для отмены"),
+    from_date: Optional[date] = Query(None, alias="fromDate", description="Отменить только занятия начиная с этой даты (YYYY-MM-DD)"),
+    current_user: User = Depends(get_current_user)
+):
+    """ Отменяет серию целиком или начиная с указанной даты. Доступно создателю серии или модератору. """
+    cancelled = await cancel_booking_series(series_uuid=series_uuid, current_user=current_user, from_date=from_date)
+    if not cancelled:
+        raise HTTPException(status_code=404, detail="Серия бронирований не найдена")
+    return None
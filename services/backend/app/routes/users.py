@@ -2,10 +2,10 @@ from fastapi import APIRouter, Body, Depends, HTTPException, Path
 from pydantic import UUID4
 from typing import List
 
-from app.schemas import UserCreate, UserCreated, UserGet, UserChangePasswordIn, UserGrantPrivileges, UserUpdateProfile
+from app.schemas import FeedToken, UserCreate, UserCreated, UserGet, UserChangePasswordIn, UserGrantPrivileges, UserUpdateProfile
 from app.models import User
-from app.services.users import create_user, change_password, grant_user, update_profile
-from app.utils.contrib import get_current_user, get_current_moderator
+from app.services.users import create_user, change_password, grant_user, update_profile, revoke_feed_token, rotate_feed_token
+from app.utils.contrib import get_current_user, get_current_user_record, get_current_moderator
 from app.utils import password
 
 
@@ -21,14 +21,14 @@ async def route_create_user(user: UserCreate):
 
 
 @router.get("/me", response_model=UserGet, status_code=200)
-async def route_get_user(user: User = Depends(get_current_user)):
+async def route_get_user(user: User = Depends(get_current_user_record)):
     return user
 
 
 @router.patch("/me", response_model=UserGet, status_code=200)
 async def route_update_user_me(
     profile_data: UserUpdateProfile,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_record)
 ):
     """
     Обновляет профиль текущего пользователя (например, telegram_id).
@@ -44,11 +44,26 @@ async def route_update_user_me(
 @router.post("/me/change_password", status_code=200)
 async def route_change_password(
     change_password_in: UserChangePasswordIn,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_record)
 ):
     return await change_password(change_password_in=change_password_in, current_user=current_user)
 
 
+@router.post("/me/feed-token", response_model=FeedToken, status_code=201)
+async def route_rotate_feed_token(current_user: User = Depends(get_current_user)):
+    """
+    Выпускает секрет для подписки на ленту /bookings/me/calendar.ics?token=...
+    Повторный вызов заменяет секрет, старые URL подписки перестают работать.
+    """
+    return FeedToken(token=await rotate_feed_token(current_user))
+
+
+@router.delete("/me/feed-token", status_code=204)
+async def route_revoke_feed_token(current_user: User = Depends(get_current_user)):
+    """ Отзывает секрет календарной ленты """
+    await revoke_feed_token(current_user)
+
+
 @router.post("/{user_uuid}/grant", response_model=UserGet, status_code=200)
 async def route_grant_user_privileges(
     user_uuid: UUID4 = Path(..., title="UUID пользователя для изменения роли"),
@@ -0,0 +1,37 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Path
+from pydantic import UUID4
+
+from app.schemas import CreateBooking, GetWaitlistEntry
+from app.utils.contrib import get_current_user
+from app.services.waitlist import join_waitlist, get_my_waitlist, leave_waitlist
+from app.models import User
+
+
+router = APIRouter()
+
+
+@router.post("/", response_model=GetWaitlistEntry, status_code=201)
+async def handle_join_waitlist(
+    entry_data: CreateBooking,
+    current_user: User = Depends(get_current_user)
+):
+    """ Встает в лист ожидания на занятый интервал: при освобождении бронь будет создана автоматически. """
+    return await join_waitlist(entry_model=entry_data, current_user=current_user)
+
+
+@router.get("/", response_model=List[GetWaitlistEntry])
+async def handle_read_my_waitlist(current_user: User = Depends(get_current_user)):
+    """ Возвращает действующие заявки текущего пользователя с местом в очереди. """
+    return await get_my_waitlist(current_user=current_user)
+
+
+@router.delete("/{entry_uuid}", status_code=204)
+async def handle_leave_waitlist(
+    entry_uuid: UUID4 = Path(..., title="UUID заявки в листе ожидания"),
+    current_user: User = Depends(get_current_user)
+):
+    """ Удаляет заявку из листа ожидания. """
+    if not await leave_waitlist(entry_uuid=entry_uuid, current_user=current_user):
+        raise HTTPException(status_code=404, detail="Заявка в листе ожидания не найдена")
@@ -1,10 +1,10 @@
 import uuid
 from typing import List, Optional, TYPE_CHECKING
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timedelta
 
-from app.enums import UserRole
+from app.enums import UserRole, BookingBatchMode
 
-from pydantic import BaseModel, UUID4, ConfigDict, EmailStr, Field, field_validator
+from pydantic import AliasChoices, BaseModel, UUID4, ConfigDict, EmailStr, Field, field_validator
 
 
 class BaseSchema(BaseModel):
@@ -53,6 +53,10 @@ class UserUpdateProfile(BaseModel): # Схема для PATCH /users/me
     telegram_id: Optional[str] = None
 
 
+class FeedToken(BaseModel):
+    token: str
+
+
 class UserChangePasswordIn(BaseModel):
     current_password: str
     new_password: str
@@ -105,6 +109,7 @@ class GetAuditorium(BaseSchema):
     description: Optional[str] = None
     # Если нужно возвращать связанное оборудование
     equipment: List[GetEquipment] = [] # Потребует prefetch_related в сервисе
+    version: int
 
 
 class UpdateAuditorium(BaseModel):
@@ -112,6 +117,7 @@ class UpdateAuditorium(BaseModel):
     capacity: Optional[int] = Field(None, gt=0)
     description: Optional[str] = None
     equipment_uuids: Optional[List[UUID4]] = Field(None, description="List of equipment UUIDs to set (replaces existing)")
+    version: Optional[int] = Field(None, ge=1, description="Expected version (alternative to the If-Match header)")
 
 
 class DeleteAuditorium(BaseModel):
@@ -139,6 +145,7 @@ class GetAvailability(BaseSchema):
     day_of_week: int
     start_time: time # time
     end_time: time   # time
+    version: int
 
 
 class CalendarBookingEntry(BaseSchema):
@@ -148,14 +155,53 @@ class CalendarBookingEntry(BaseSchema):
     """
     uuid: UUID4 = Field(..., description="Уникальный идентификатор бронирования")
     title: Optional[str] = Field(None, description="Название/описание бронирования (может быть пустым)")
-    start: datetime = Field(..., description="Время начала бронирования")
-    end: datetime = Field(..., description="Время окончания бронирования")
+    # Модель хранит start_time/end_time, наружу отдаются start/end
+    start: datetime = Field(..., validation_alias=AliasChoices("start", "start_time"), description="Время начала бронирования")
+    end: datetime = Field(..., validation_alias=AliasChoices("end", "end_time"), description="Время окончания бронирования")
+
+
+class AuditoriumCalendar(BaseModel):
+    auditorium: UUID4
+    identifier: str
+    bookings: List[CalendarBookingEntry] = []
+
+
+class AuditoriumFreeBusy(BaseModel):
+    auditorium: UUID4
+    identifier: str
+    runs: str
+
+
+class FreeBusy(BaseModel):
+    start: datetime
+    end: datetime
+    bucket_minutes: int
+    buckets: int
+    auditoriums: List[AuditoriumFreeBusy] = []
+
+
+class UtilizationDay(BaseModel):
+    day: date
+    booked_hours: float
+    available_hours: float
+    utilization: Optional[float] = None
+    bookings_count: int
+
+
+class AuditoriumUtilization(BaseModel):
+    auditorium: UUID4
+    identifier: str
+    booked_hours: float
+    available_hours: float
+    utilization: Optional[float] = None
+    days: List[UtilizationDay] = []
 
 
 class UpdateAvailability(BaseModel):
     day_of_week: Optional[int] = Field(None, ge=0, le=6)
     start_time: Optional[time] = None # time
     end_time: Optional[time] = None   # time
+    version: Optional[int] = Field(None, ge=1, description="Ожидаемая версия слота (альтернатива заголовку If-Match)")
 
 
 class DeleteAvailability(BaseModel):
@@ -179,11 +225,39 @@ class CreateBooking(BaseModel):
 
 class GetBooking(BaseSchema):
     uuid: UUID4
-    auditorium_id: UUID4 = Field(..., alias="auditorium") # Указываем alias для поля auditorium модели
-    broker_id: UUID4 = Field(..., alias="broker") # Указываем alias для поля broker модели
+    # Читаем *_id модели (связанный объект может быть не загружен), наружу отдаем под именами auditorium/broker
+    auditorium_id: UUID4 = Field(..., validation_alias=AliasChoices("auditorium_id", "auditorium"), serialization_alias="auditorium")
+    broker_id: UUID4 = Field(..., validation_alias=AliasChoices("broker_id", "broker"), serialization_alias="broker")
     start_time: datetime
     end_time: datetime
     title: Optional[str] = None
+    version: int
+    archived: bool = False
+
+
+class CreateBookingHold(CreateBooking):
+    ttl_minutes: Optional[int] = Field(None, ge=1, description="Срок удержания в минутах (по умолчанию BOOKING_HOLD_TTL_MINUTES)")
+
+
+class GetBookingHold(BaseSchema):
+    uuid: UUID4
+    auditorium_id: UUID4 = Field(..., validation_alias=AliasChoices("auditorium_id", "auditorium"), serialization_alias="auditorium")
+    broker_id: UUID4 = Field(..., validation_alias=AliasChoices("broker_id", "broker"), serialization_alias="broker")
+    start_time: datetime
+    end_time: datetime
+    title: Optional[str] = None
+    expires_at: datetime
+
+
+class GetWaitlistEntry(BaseSchema):
+    uuid: UUID4
+    auditorium_id: UUID4 = Field(..., validation_alias=AliasChoices("auditorium_id", "auditorium"), serialization_alias="auditorium")
+    broker_id: UUID4 = Field(..., validation_alias=AliasChoices("broker_id", "broker"), serialization_alias="broker")
+    start_time: datetime
+    end_time: datetime
+    title: Optional[str] = None
+    created_at: datetime
+    position: Optional[int] = Field(None, description="Место в очереди среди заявок, пересекающихся с этим интервалом")
 
 
 class UpdateBooking(BaseModel):
@@ -191,12 +265,82 @@ class UpdateBooking(BaseModel):
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     title: Optional[str] = None
+    version: Optional[int] = Field(None, ge=1, description="Ожидаемая версия бронирования (альтернатива заголовку If-Match)")
 
 
 class DeleteBooking(BaseModel):
     uuid: UUID4
 
 
+class CreateBookingSeries(BaseModel):
+    auditorium: UUID4
+    start_time: datetime = Field(..., description="Начало первого занятия серии")
+    end_time: datetime = Field(..., description="Окончание первого занятия серии")
+    title: Optional[str] = None
+    interval_weeks: int = Field(1, ge=1, le=52, description="Повторять каждые N недель")
+    until: date = Field(..., description="Последняя дата, на которую может прийтись занятие")
+    exceptions: List[date] = Field([], description="Даты, на которые занятие не проводится")
+
+    @field_validator('end_time')
+    def check_series_end_time(cls, v, values):
+        if 'start_time' in values.data and v <= values.data['start_time']:
+            raise ValueError('Series end time must be after start time')
+        return v
+
+    @field_validator('interval_weeks')
+    def check_series_interval(cls, v, values):
+        if 'start_time' in values.data and 'end_time' in values.data:
+            if values.data['end_time'] - values.data['start_time'] >= timedelta(weeks=v):
+                raise ValueError('Occurrence duration must be shorter than the repeat interval')
+        return v
+
+    @field_validator('until')
+    def check_series_until(cls, v, values):
+        if 'start_time' in values.data and v < values.data['start_time'].date():
+            raise ValueError('Series until date must not be before the first occurrence')
+        return v
+
+
+class GetBookingSeries(BaseSchema):
+    uuid: UUID4
+    auditorium_id: UUID4 = Field(..., validation_alias=AliasChoices("auditorium_id", "auditorium"), serialization_alias="auditorium")
+    broker_id: UUID4 = Field(..., validation_alias=AliasChoices("broker_id", "broker"), serialization_alias="broker")
+    title: Optional[str] = None
+    start_time: datetime
+    end_time: datetime
+    interval_weeks: int
+    until: date
+    exceptions: List[date] = []
+    # Занятия серии сервис кладет в occurrences_list: обратная связь occurrences без prefetch не сериализуется
+    occurrences: List[GetBooking] = Field([], validation_alias="occurrences_list")
+
+
+class UpdateBookingSeries(BaseModel):
+    title: Optional[str] = None
+
+
+class CreateBookingBatch(BaseModel):
+    items: List[CreateBooking] = Field(..., min_length=1)
+    mode: BookingBatchMode = BookingBatchMode.ALL_OR_NOTHING
+
+
+class BookingBatchItemResult(BaseSchema):
+    index: int
+    status_code: int
+    detail: Optional[str] = None
+    booking: Optional[GetBooking] = None
+
+
+class BookingBatchResult(BaseSchema):
+    mode: BookingBatchMode
+    created: int
+    failed: int
+    results: List[BookingBatchItemResult]
+
+
 class JWTTokenPayload(BaseModel):
     user_uuid: UUID4 = None
-    token_kind: str = None
\ No newline at end of file
+    token_kind: str = None
+    role: Optional[UserRole] = None
+    username: Optional[str] = None
+    jti: Optional[str] = None
\ No newline at end of file
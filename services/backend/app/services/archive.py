@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from tortoise import connections
+
+from app.models import Booking, BookingArchive
+from app.logger import log_calls
+from app.services.booking import touch_booking_calendars, _unindex_booking
+from app.utils.booking_index import normalize_dt
+from app.utils.locks import auditorium_write_lock
+from app.utils.pagination import after_keyset
+
+from app import metrics, settings
+
+ARCHIVE_COLUMNS = ('uuid', 'auditorium_id', 'broker_id', 'series_id', 'start_time', 'end_time', 'title', 'version')
+
+
+def _month_bounds(year: int, month: int):
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return datetime(year, month, 1), datetime(next_year, next_month, 1)
+
+
+async def ensure_archive_partitions(start_times: Iterable[datetime]) -> None:
+    """ В Postgres создает недостающие месячные секции bookings_archive (UTC) под переносимые брони """
+    connection = connections.get("default")
+    if connection.capabilities.dialect != "postgres":
+        return
+    months = sorted({(value.year, value.month) for value in map(normalize_dt, start_times)})
+    for year, month in months:
+        lower, upper = _month_bounds(year, month)
+        await connection.execute_script(
+            f'CREATE TABLE IF NOT EXISTS "bookings_archive_{year:04d}_{month:02d}" PARTITION OF "bookings_archive" '
+            f"FOR VALUES FROM ('{lower.isoformat(' ')}+00') TO ('{upper.isoformat(' ')}+00')"
+        )
+
+
+@log_calls
+async def archive_bookings(cutoff: Optional[datetime] = None) -> int:
+    """
+    Переносит брони, закончившиеся раньше cutoff (по умолчанию BOOKING_ARCHIVE_AFTER_DAYS дней назад), в bookings_archive.
+    Каждая порция из BOOKING_ARCHIVE_CHUNK_SIZE броней переносится отдельной транзакцией под блокировками своих аудиторий.
+    Сводка загрузки не меняется: перенос не занимает и не освобождает время.
+    """
+    if cutoff is None:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=settings.BOOKING_ARCHIVE_AFTER_DAYS)
+    chunk_size = settings.BOOKING_ARCHIVE_CHUNK_SIZE
+
+    query = Booking.filter(end_time__lt=cutoff)
+    chunk_query = query
+    archived = 0
+    while True:
+        candidates = await chunk_query.order_by('start_time', 'uuid').limit(chunk_size).values('uuid', 'auditorium_id', 'start_time')
+        if not candidates:
+            break
+        await ensure_archive_partitions(row['start_time'] for row in candidates)
+
+        async with auditorium_write_lock(*{row['auditorium_id'] for row in candidates}):
+            # Повторная выборка под блокировкой: бронь могли перенести или удалить после чтения кандидатов
+            rows = await Booking.filter(uuid__in=[row['uuid'] for row in candidates], end_time__lt=cutoff).values(*ARCHIVE_COLUMNS)
+            if rows:
+                await BookingArchive.bulk_create([BookingArchive(**row) for row in rows])
+                await Booking.filter(uuid__in=[row['uuid'] for row in rows]).delete()
+                await touch_booking_calendars({row['auditorium_id'] for row in rows}, {row['broker_id'] for row in rows})
+
+        for row in rows:
+            _unindex_booking(row['uuid'])
+        archived += len(rows)
+        metrics.backend_bookings_archived_total.inc(len(rows))
+        if len(candidates) < chunk_size:
+            break
+        chunk_query = after_keyset(query, candidates[-1]['start_time'], candidates[-1]['uuid'])
+    return archived
@@ -1,10 +1,16 @@
+from datetime import datetime
 from typing import List, Optional
 from fastapi import HTTPException, Depends
+from tortoise.expressions import Subquery
 from pydantic import UUID4
 
 from app.schemas import CreateAuditorium, UpdateAuditorium, DeleteAuditorium
-from app.models import Auditorium, Equipment
+from app.models import Auditorium, AvailabilitySlot, Booking, Equipment
 from app.logger import log_calls
+from app.services.availability import get_weekly_schedules
+from app.services.booking import active_holds
+from app.utils.versioning import save_versioned
+from app.utils.replicas import read_only
 
 from app import metrics
 
@@ -52,12 +58,17 @@ async def create_auditorium(auditorium_model: CreateAuditorium) -> Auditorium:
 
 
 @log_calls
-async def update_auditorium(auditorium_uuid: UUID4, auditorium_update_data: UpdateAuditorium) -> Auditorium:
+async def update_auditorium(
+    auditorium_uuid: UUID4,
+    auditorium_update_data: UpdateAuditorium,
+    expected_version: Optional[int] = None
+) -> Auditorium:
     auditorium = await Auditorium.get_or_none(uuid=auditorium_uuid)
     if not auditorium:
         raise HTTPException(status_code=404, detail="Auditorium not found")
 
     update_data = auditorium_update_data.model_dump(exclude_unset=True)
+    update_data.pop('version', None)
 
     if 'identifier' in update_data and update_data['identifier'] != auditorium.identifier:
         existing = await Auditorium.get_or_none(identifier=update_data['identifier'])
@@ -67,7 +78,7 @@ async def update_auditorium(auditorium_uuid: UUID4, auditorium_update_data: Upda
                 detail=f"Auditorium with identifier '{update_data['identifier']}' already exists."
             )
 
-    await auditorium.update_from_dict(update_data).save()
+    await save_versioned(auditorium, update_data, expected_version)
     await auditorium.fetch_related('equipment')
 
     metrics.backend_auditoriums_managed_total.labels(operation="update").inc()
@@ -94,6 +105,7 @@ async def get_auditorium_by_uuid(auditorium_uuid: UUID4) -> Optional[Auditorium]
 
 
 @log_calls
+@read_only
 async def get_auditoriums(
     min_capacity: Optional[int] = None,
     equipment_id: Optional[UUID4] = None
@@ -112,4 +124,67 @@ async def get_auditoriums(
     query = query.prefetch_related('equipment')
     auditoriums = await query.order_by('identifier')
 
-    return auditoriums
\ No newline at end of file
+    return auditoriums
+
+
+def filter_auditoriums(
+    query,
+    min_capacity: Optional[int] = None,
+    equipment_ids: Optional[List[UUID4]] = None
+):
+    """ Фильтры по вместимости и наличию всего перечисленного оборудования (подзапросами, без отдельных запросов) """
+    if min_capacity is not None:
+        query = query.filter(capacity__gte=min_capacity)
+    for equipment_id in set(equipment_ids or []):
+        query = query.filter(uuid__in=Subquery(Auditorium.filter(equipment__uuid=equipment_id).values('uuid')))
+    return query
+
+
+@log_calls
+@read_only
+async def get_free_auditoriums(
+    start: datetime,
+    end: datetime,
+    min_capacity: Optional[int] = None,
+    equipment_ids: Optional[List[UUID4]] = None,
+    limit: int = 20,
+    offset: int = 0
+) -> List[Auditorium]:
+    """
+    Ищет аудитории, свободные в интервале [start, end).
+    Вместимость, оборудование, отсутствие пересекающихся броней и действующих удержаний и наличие расписания в день начала
+    отбираются одним SQL-запросом; покрытие интервала расписанием проверяется по скомпилированным
+    недельным расписаниям. Кандидаты читаются порциями, поиск останавливается, как только набрано
+    offset + limit подходящих аудиторий.
+    """
+    if end <= start:
+        raise HTTPException(status_code=400, detail="Время окончания должно быть после времени начала.")
+
+    busy_auditoriums = Booking.filter(start_time__lt=end, end_time__gt=start).values('auditorium_id')
+    held_auditoriums = active_holds().filter(start_time__lt=end, end_time__gt=start).values('auditorium_id')
+    open_auditoriums = AvailabilitySlot.filter(day_of_week=start.weekday()).values('auditorium_id')
+    query = Auditorium.filter(uuid__in=Subquery(open_auditoriums)).exclude(uuid__in=Subquery(busy_auditoriums))
+    query = query.exclude(uuid__in=Subquery(held_auditoriums))
+    query = filter_auditoriums(query, min_capacity=min_capacity, equipment_ids=equipment_ids)
+
+    chunk_size = max(2 * (offset + limit), 50)
+    chunk_offset = 0
+    matched = []
+    while len(matched) < offset + limit:
+        candidates = await query.order_by('identifier').offset(chunk_offset).limit(chunk_size).values_list('uuid', flat=True)
+        if not candidates:
+            break
+        schedules = await get_weekly_schedules(candidates)
+        matched.extend(uuid for uuid in candidates if schedules[uuid].covers(start, end))
+        if len(candidates) < chunk_size:
+            break
+        chunk_offset += chunk_size
+
+    page = matched[offset:offset + limit]
+    if not page:
+        return []
+    auditoriums = {
+        auditorium.uuid: auditorium
+        for auditorium in await Auditorium.filter(uuid__in=page).prefetch_related('equipment')
+    }
+    return [auditoriums[uuid] for uuid in page]
\ No newline at end of file
@@ -1,14 +1,80 @@
 from datetime import time
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from fastapi import HTTPException, Depends
-from tortoise.expressions import Q
+from tortoise.expressions import F, Q
 from pydantic import UUID4
 
 from app.schemas import CreateAvailability, GetAvailability, UpdateAvailability, DeleteAvailability
 from app.models import Auditorium, AvailabilitySlot
 from app.logger import log_calls
-
-from app import metrics
+from app.utils.cache import LRUCache
+from app.utils.locks import auditorium_write_lock
+from app.utils.schedule import WeeklySchedule
+from app.utils.versioning import save_versioned
+from app.utils.replicas import primary_reads, read_only
+
+from app import metrics, settings
+
+
+# Ключ — (UUID аудитории, availability_version): изменение слотов увеличивает счетчик в той же транзакции,
+# и старые записи становятся недостижимыми во всех воркерах. Счетчик читается при каждой проверке одним запросом по ключу
+schedule_cache = LRUCache(
+    maxsize=settings.AVAILABILITY_SCHEDULE_CACHE_SIZE,
+    ttl=settings.AVAILABILITY_SCHEDULE_CACHE_TTL
+)
+
+
+async def get_weekly_schedule(auditorium_uuid: UUID4) -> WeeklySchedule:
+    """
+    Возвращает скомпилированное недельное расписание аудитории: счетчик изменений читается всегда,
+    слоты — только при промахе кэша. Кэш общий с проверками записи, поэтому заполняется только из основной БД.
+    """
+    with primary_reads():
+        version = await Auditorium.filter(uuid=auditorium_uuid).first().values_list('availability_version', flat=True)
+    key = (auditorium_uuid, version)
+    schedule = schedule_cache.get(key)
+    if schedule is None:
+        with primary_reads():
+            slots = await AvailabilitySlot.filter(auditorium_id=auditorium_uuid).values_list(
+                'day_of_week', 'start_time', 'end_time'
+            )
+        schedule = WeeklySchedule.compile(slots)
+        schedule_cache.set(key, schedule)
+    return schedule
+
+
+async def get_weekly_schedules(auditorium_uuids: Iterable[UUID4]) -> Dict[UUID4, WeeklySchedule]:
+    """ Возвращает расписания нескольких аудиторий: счетчики изменений читаются одним запросом, отсутствующие в кэше слоты — другим """
+    auditorium_uuids = set(auditorium_uuids)
+    with primary_reads():
+        versions = dict(await Auditorium.filter(uuid__in=list(auditorium_uuids)).values_list('uuid', 'availability_version'))
+    schedules = {}
+    missing = []
+    for auditorium_uuid in auditorium_uuids:
+        schedule = schedule_cache.get((auditorium_uuid, versions.get(auditorium_uuid)))
+        if schedule is None:
+            missing.append(auditorium_uuid)
+        else:
+            schedules[auditorium_uuid] = schedule
+
+    if missing:
+        slots_by_auditorium = {auditorium_uuid: [] for auditorium_uuid in missing}
+        with primary_reads():
+            rows = await AvailabilitySlot.filter(auditorium_id__in=missing).values_list(
+                'auditorium_id', 'day_of_week', 'start_time', 'end_time'
+            )
+        for auditorium_uuid, day_of_week, start_time, end_time in rows:
+            slots_by_auditorium[auditorium_uuid].append((day_of_week, start_time, end_time))
+        for auditorium_uuid, slots in slots_by_auditorium.items():
+            schedule = WeeklySchedule.compile(slots)
+            schedule_cache.set((auditorium_uuid, versions.get(auditorium_uuid)), schedule)
+            schedules[auditorium_uuid] = schedule
+    return schedules
+
+
+async def bump_availability_version(auditorium_uuid: UUID4) -> None:
+    """ Делает закэшированные расписания аудитории устаревшими во всех воркерах; вызывается в транзакции изменения слотов """
+    await Auditorium.filter(uuid=auditorium_uuid).update(availability_version=F('availability_version') + 1)
 
 
 @log_calls
@@ -84,7 +150,9 @@ async def create_availability(availability_model: CreateAvailability) -> Availab
         auditorium_id=auditorium.uuid,
         **slot_data_dict
     )
-    await availability.save()
+    async with auditorium_write_lock(auditorium.uuid):
+        await availability.save()
+        await bump_availability_version(auditorium.uuid)
     await availability.fetch_related('auditorium')
 
     metrics.backend_availability_slots_managed_total.labels(operation="create").inc()
@@ -99,6 +167,7 @@ async def get_availability(uuid: UUID4) -> Optional[AvailabilitySlot]:
 
 
 @log_calls
+@read_only
 async def get_all_availabilities() -> List[AvailabilitySlot]: 
     availabilities = await AvailabilitySlot.all()
     return availabilities
@@ -107,13 +176,15 @@ async def get_all_availabilities() -> List[AvailabilitySlot]:
 @log_calls
 async def update_availability( 
     availability_uuid: UUID4,
-    availability_update_data: UpdateAvailability
+    availability_update_data: UpdateAvailability,
+    expected_version: Optional[int] = None
 ) -> AvailabilitySlot:
     availability = await AvailabilitySlot.get_or_none(uuid=availability_uuid)
     if not availability:
         raise HTTPException(status_code=404, detail="Availability slot not found")
 
     update_data = availability_update_data.model_dump(exclude_unset=True)
+    update_data.pop('version', None)
 
     final_day = update_data.get('day_of_week', availability.day_of_week)
     final_start = update_data.get('start_time', availability.start_time)
@@ -127,7 +198,9 @@ async def update_availability(
         exclude_slot_uuid=availability_uuid 
     )
 
-    await availability.update_from_dict(update_data).save() 
+    async with auditorium_write_lock(availability.auditorium_id):
+        await save_versioned(availability, update_data, expected_version)
+        await bump_availability_version(availability.auditorium_id)
 
     metrics.backend_availability_slots_managed_total.labels(operation="update").inc()
 
@@ -139,6 +212,8 @@ async def delete_availability(availability_uuid: UUID4) -> None:
     availability = await AvailabilitySlot.get_or_none(uuid=availability_uuid)
     if not availability:
         raise HTTPException(status_code=404, detail="Availability slot not found")
-    await availability.delete()
+    async with auditorium_write_lock(availability.auditorium_id):
+        await availability.delete()
+        await bump_availability_version(availability.auditorium_id)
 
     metrics.backend_availability_slots_managed_total.labels(operation="delete").inc()
\ No newline at end of file
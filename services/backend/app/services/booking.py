@@ -1,17 +1,57 @@
-from datetime import date, datetime, timedelta, time
+from datetime import date, datetime, timedelta, time, timezone
 from builtins import min as builtin_min
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
+from uuid import uuid4
 
 from fastapi import HTTPException, Depends, Query
 from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F, Q
+from tortoise import connections
 from pydantic import UUID4
 
-from app.schemas import CreateBooking, GetBooking, UpdateBooking, DeleteBooking
-from app.models import Auditorium, AvailabilitySlot, User, Booking
-from app.enums import UserRole
+from app.schemas import CreateBooking, GetBooking, UpdateBooking, DeleteBooking, CreateBookingBatch
+from app.models import Auditorium, AvailabilitySlot, User, Booking, BookingArchive, BookingHold, WaitlistEntry
+from app.enums import UserRole, BookingBatchMode
 from app.logger import log_calls
+from app.services.availability import get_weekly_schedule, get_weekly_schedules
+from app.services.events import BOOKING_CREATED, BOOKING_UPDATED, publish_booking_event, publish_booking_deleted
+from app.services.utilization import record_utilization
+from app.utils.booking_index import BookingIntervalIndex, booking_index
+from app.utils.locks import auditorium_write_lock
+from app.utils.pagination import paginate_by_start_time, paginate_merged
+from app.utils.versioning import save_versioned
+from app.utils.schedule import WeeklySchedule
+from app.utils.replicas import read_only
 
-from app import metrics
+from app import metrics, settings
+
+
+def describe_unavailability(
+    schedule: WeeklySchedule,
+    start_dt: datetime,
+    end_dt: datetime,
+    identifier: str
+) -> Optional[str]:
+    """ Возвращает описание первой проблемы с доступностью интервала или None, если интервал доступен """
+    gap = schedule.first_gap(start_dt, end_dt)
+    if gap is None:
+        return None
+
+    gap_date = gap.date()
+    if not schedule.has_day(gap_date.weekday()):
+        return (f"Аудитория недоступна в указанный интервал. "
+                f"Нет расписания доступности на {gap_date.strftime('%A, %Y-%m-%d')}.")
+
+    day_start = datetime.combine(gap_date, time(0, 0), tzinfo=gap.tzinfo)
+    next_day_start = day_start + timedelta(days=1)
+    check_start_time = max(start_dt, day_start).time()
+    segment_end = min(end_dt, next_day_start)
+    check_end_time = segment_end.time() if segment_end < next_day_start else time(23, 59, 59)
+
+    return (f"Аудитория '{identifier}' недоступна в запрошенный временной интервал. "
+            f"Проблема в {gap_date.strftime('%A, %Y-%m-%d')} "
+            f"между {check_start_time.strftime('%H:%M:%S')} и {check_end_time.strftime('%H:%M:%S')}. "
+            f"Проверьте расписание доступности.")
 
 
 @log_calls
@@ -20,77 +60,27 @@ async def check_auditorium_availability(
     start_dt: datetime,
     end_dt: datetime
 ) -> bool:
+    """
+    Проверяет, что интервал целиком покрыт недельным расписанием доступности аудитории.
+    Расписание компилируется один раз и берется из кэша, поэтому проверка многодневного
+    интервала не требует запросов к БД на каждый день.
+    """
     if end_dt <= start_dt:
         raise HTTPException(status_code=400, detail="Время окончания должно быть после времени начала.")
-    
-    availability_slots_cache = {}
-    current_check_dt = start_dt
-    
-    while current_check_dt < end_dt:
-        current_date = current_check_dt.date()
-        day_of_week = current_date.weekday()
-        next_day_start = datetime.combine(current_date + timedelta(days=1), time(0, 0, 0), tzinfo=start_dt.tzinfo)
-        segment_end_for_date = min(end_dt, next_day_start)
-        check_start_time = current_check_dt.time()
-        check_end_time = segment_end_for_date.time() if segment_end_for_date.date() == current_date else datetime.time(23, 59, 59, 999999)
-
-        if segment_end_for_date.time() == datetime.time(0, 0) and segment_end_for_date > current_check_dt:
-            check_end_time = datetime.time(23, 59, 59, 999999)
-
-        if day_of_week not in availability_slots_cache:
-            slots_for_day = await AvailabilitySlot.filter(
-                auditorium_id=auditorium_uuid,
-                day_of_week=day_of_week
-            ).order_by('start_time').all()
-            availability_slots_cache[day_of_week] = slots_for_day
-        else:
-            slots_for_day = availability_slots_cache[day_of_week]
-
-        if not slots_for_day:
-            metrics.backend_bookings_creation_failures_total.labels(reason="unavailable").inc()
-            raise HTTPException(
-                status_code=400,
-                detail=(f"Аудитория недоступна в указанный интервал. "
-                        f"Нет расписания доступности на {current_date.strftime('%A, %Y-%m-%d')}.")
-            )
-
-        time_covered_until = check_start_time
-        segment_fully_covered = False
-
-        if check_start_time == check_end_time and check_start_time == datetime.time(0, 0):
-             segment_fully_covered = True
-        else:
-            sorted_slots = sorted(slots_for_day, key=lambda s: s.start_time)
-            for slot in sorted_slots:
-                effective_slot_end = slot.end_time if slot.end_time != datetime.time(0, 0) else datetime.time(23, 59, 59, 999999)
 
-                if slot.start_time <= time_covered_until and effective_slot_end > time_covered_until:
-                    time_covered_until = max(time_covered_until, effective_slot_end)
-
-                if slot.start_time > check_end_time:
-                    break
-
-                if time_covered_until >= check_end_time:
-                    segment_fully_covered = True
-                    break
-
-        if not segment_fully_covered:
-            auditorium = await Auditorium.get_or_none(uuid=auditorium_uuid)
-            identifier = auditorium.identifier if auditorium else str(auditorium_uuid)
-
-            metrics.backend_bookings_creation_failures_total.labels(reason="unavailable").inc()
+    schedule = await get_weekly_schedule(auditorium_uuid)
+    if schedule.covers(start_dt, end_dt):
+        return True
 
-            raise HTTPException(
-                status_code=400,
-                detail=(f"Аудитория '{identifier}' недоступна в запрошенный временной интервал. "
-                        f"Проблема в {current_date.strftime('%A, %Y-%m-%d')} "
-                        f"между {check_start_time.strftime('%H:%M:%S')} и {check_end_time.strftime('%H:%M:%S')}. "
-                        f"Проверьте расписание доступности.")
-            )
+    auditorium = await Auditorium.get_or_none(uuid=auditorium_uuid)
+    identifier = auditorium.identifier if auditorium else str(auditorium_uuid)
 
-        current_check_dt = segment_end_for_date
+    metrics.backend_bookings_creation_failures_total.labels(reason="unavailable").inc()
 
-    return True
+    raise HTTPException(
+        status_code=400,
+        detail=describe_unavailability(schedule, start_dt, end_dt, identifier)
+    )
 
 
 @log_calls
@@ -109,17 +99,78 @@ async def get_booking_by_uuid(booking_uuid: UUID4, current_user: User) -> Option
     return booking
 
 
-@log_calls
-async def check_booking_overlap(
+def _raise_booking_overlap(auditorium_uuid: UUID4, identifier: Optional[str], conflicts: List[dict]) -> None:
+    identifier = identifier or str(auditorium_uuid)
+    conflicts_description = ", ".join(
+        f"{conflict['uuid']} ({conflict['start_time'].isoformat()} – {conflict['end_time'].isoformat()})"
+        for conflict in conflicts
+    )
+
+    metrics.backend_bookings_creation_failures_total.labels(reason="overlap").inc()
+
+    raise HTTPException(
+        status_code=409,
+        detail=(f"Запрошенный временной слот для аудитории '{identifier}' конфликтует с существующим бронированием. "
+                f"Конфликтующие бронирования: {conflicts_description}.")
+    )
+
+
+async def touch_booking_calendars(auditorium_uuids: Iterable[UUID4], broker_uuids: Iterable[UUID4]) -> None:
+    """
+    Увеличивает счетчики изменений бронирований аудиторий и пользователей.
+    По ним строятся ETag/Last-Modified календарных лент, поэтому вызывается в той же транзакции, что и запись брони.
+    """
+    changed_at = datetime.now(timezone.utc)
+    auditorium_uuids, broker_uuids = set(auditorium_uuids), set(broker_uuids)
+    if auditorium_uuids:
+        await Auditorium.filter(uuid__in=auditorium_uuids).update(
+            bookings_version=F('bookings_version') + 1, bookings_changed_at=changed_at
+        )
+    if broker_uuids:
+        await User.filter(uuid__in=broker_uuids).update(
+            bookings_version=F('bookings_version') + 1, bookings_changed_at=changed_at
+        )
+
+
+def _index_booking(booking: Booking, identifier: Optional[str] = None) -> None:
+    if settings.BOOKING_INDEX_ENABLED:
+        booking_index.add(booking.auditorium_id, booking.uuid, booking.start_time, booking.end_time, identifier)
+
+
+def _unindex_booking(booking_uuid: UUID4) -> None:
+    if settings.BOOKING_INDEX_ENABLED:
+        booking_index.remove(booking_uuid)
+
+
+async def load_booking_index() -> int:
+    """ Загружает предстоящие бронирования в in-memory индекс пересечений (вызывается при старте) """
+    booking_index.clear()
+    rows = await Booking.filter(end_time__gt=datetime.now(timezone.utc)).values(
+        'uuid', 'auditorium_id', 'start_time', 'end_time', 'auditorium__identifier'
+    )
+    for row in rows:
+        booking_index.add(row['auditorium_id'], row['uuid'], row['start_time'], row['end_time'], row['auditorium__identifier'])
+    booking_index.loaded = True
+    return len(rows)
+
+
+def booking_exclusion_enforced() -> bool:
+    """ Пересечения броней отсекает ограничение bookings_no_overlap в БД (только Postgres) """
+    return settings.BOOKING_EXCLUSION_CONSTRAINT and connections.get("default").capabilities.dialect == "postgres"
+
+
+def _is_overlap_violation(exc: IntegrityError) -> bool:
+    """ Отличает нарушение ограничения bookings_no_overlap (SQLSTATE 23P01) от прочих ошибок целостности """
+    causes = [exc, exc.__cause__, *exc.args]
+    return any(getattr(cause, "sqlstate", None) == "23P01" for cause in causes) or "bookings_no_overlap" in str(exc)
+
+
+async def _find_booking_conflicts(
     auditorium_uuid: UUID4,
     start: datetime,
     end: datetime,
     exclude_booking_uuid: Optional[UUID4] = None
-) -> bool:
-    """
-    Проверяет, пересекается ли запрошенное время с существующими бронированиями.
-    (Без изменений, должна работать корректно с пересечением полуночи).
-    """
+) -> List[dict]:
     query = Booking.filter(
         auditorium_id=auditorium_uuid,
         start_time__lt=end,
@@ -128,24 +179,158 @@ async def check_booking_overlap(
     if exclude_booking_uuid:
         query = query.exclude(uuid=exclude_booking_uuid)
 
-    overlapping_booking_exists = await query.exists()
+    return await query.order_by('start_time').limit(settings.BOOKING_OVERLAP_REPORT_LIMIT).values(
+        'uuid', 'start_time', 'end_time', 'auditorium__identifier'
+    )
+
 
-    if overlapping_booking_exists:
-        auditorium = await Auditorium.get_or_none(uuid=auditorium_uuid)
-        identifier = auditorium.identifier if auditorium else str(auditorium_uuid)
+def active_holds():
+    """ Удержания, которые еще блокируют свои интервалы (истекшие не учитываются, даже если их еще не удалили) """
+    return BookingHold.filter(expires_at__gt=datetime.now(timezone.utc))
 
-        metrics.backend_bookings_creation_failures_total.labels(reason="overlap").inc()
 
+async def check_hold_overlap(auditorium_uuid: UUID4, start: datetime, end: datetime) -> None:
+    """ Отклоняет интервал, пересекающийся с действующим временным удержанием """
+    held = await active_holds().filter(
+        auditorium_id=auditorium_uuid,
+        start_time__lt=end,
+        end_time__gt=start
+    ).order_by('expires_at').first().values('expires_at', 'auditorium__identifier')
+    if held:
+        metrics.backend_bookings_creation_failures_total.labels(reason="held").inc()
         raise HTTPException(
             status_code=409,
-            detail=f"Запрошенный временной слот для аудитории '{identifier}' конфликтует с существующим бронированием."
+            detail=(f"Запрошенный временной слот для аудитории '{held['auditorium__identifier']}' временно удерживается "
+                    f"до {held['expires_at']}. Выберите другое время или повторите попытку позже.")
         )
+
+
+async def promote_waitlist(auditorium_uuid: UUID4, freed_start: datetime, freed_end: datetime) -> List[Booking]:
+    """
+    Продвигает заявки из листа ожидания на освободившийся интервал аудитории.
+    Вызывается в транзакции записи под блокировкой аудитории, поэтому бронь ожидающему создается атомарно
+    с освобождением. Кандидаты — заявки, пересекающиеся с освобожденным интервалом (диапазонный запрос по индексу),
+    в порядке очереди; занятость для всех кандидатов читается одной выборкой броней и удержаний.
+    Заявка продвигается, если ее интервал целиком свободен и доступен по расписанию.
+    """
+    candidates = await WaitlistEntry.filter(
+        auditorium_id=auditorium_uuid,
+        start_time__lt=freed_end,
+        end_time__gt=freed_start
+    ).filter(end_time__gt=datetime.now(timezone.utc)).order_by('created_at').limit(settings.WAITLIST_PROMOTION_CANDIDATES)
+    if not candidates:
+        return []
+
+    window = dict(
+        auditorium_id=auditorium_uuid,
+        start_time__lt=max(entry.end_time for entry in candidates),
+        end_time__gt=min(entry.start_time for entry in candidates)
+    )
+    occupied = BookingIntervalIndex()
+    existing = await Booking.filter(**window).values('uuid', 'start_time', 'end_time')
+    held = await active_holds().filter(**window).values('uuid', 'start_time', 'end_time')
+    for row in existing + held:
+        occupied.add(auditorium_uuid, row['uuid'], row['start_time'], row['end_time'])
+    schedule = await get_weekly_schedule(auditorium_uuid)
+
+    promoted, promoted_entries = [], []
+    for entry in candidates:
+        if occupied.find_overlaps(auditorium_uuid, entry.start_time, entry.end_time):
+            continue
+        if not schedule.covers(entry.start_time, entry.end_time):
+            continue
+        booking = Booking(
+            uuid=uuid4(),
+            auditorium_id=auditorium_uuid,
+            broker_id=entry.broker_id,
+            start_time=entry.start_time,
+            end_time=entry.end_time,
+            title=entry.title
+        )
+        occupied.add(auditorium_uuid, booking.uuid, booking.start_time, booking.end_time)
+        promoted.append(booking)
+        promoted_entries.append(entry.uuid)
+
+    if promoted:
+        await Booking.bulk_create(promoted)
+        await WaitlistEntry.filter(uuid__in=promoted_entries).delete()
+        await touch_booking_calendars([auditorium_uuid], {booking.broker_id for booking in promoted})
+        await record_utilization(added=[(auditorium_uuid, booking.start_time, booking.end_time) for booking in promoted])
+    return promoted
+
+
+def _index_promoted(promoted: List[Booking]) -> None:
+    for booking in promoted:
+        _index_booking(booking)
+        publish_booking_event(BOOKING_CREATED, booking)
+    metrics.backend_bookings_created_total.inc(len(promoted))
+    metrics.backend_waitlist_entries_total.labels(outcome="promoted").inc(len(promoted))
+
+
+async def _raise_constraint_overlap(
+    auditorium_uuid: UUID4,
+    identifier: Optional[str],
+    start: datetime,
+    end: datetime,
+    exclude_booking_uuid: Optional[UUID4] = None
+) -> None:
+    """ Превращает нарушение ограничения bookings_no_overlap в 409 со списком конфликтующих броней """
+    conflicts = await _find_booking_conflicts(auditorium_uuid, start, end, exclude_booking_uuid)
+    _raise_booking_overlap(auditorium_uuid, identifier, conflicts)
+
+
+@log_calls
+async def check_booking_overlap(
+    auditorium_uuid: UUID4,
+    start: datetime,
+    end: datetime,
+    exclude_booking_uuid: Optional[UUID4] = None
+) -> bool:
+    """
+    Проверяет, пересекается ли запрошенное время с существующими бронированиями.
+    Если включен in-memory индекс, свободный по нему интервал проверяется как обычно, а найденный конфликт
+    подтверждается запросом к БД: индекс локален для воркера и не видит удалений и переносов
+    в других воркерах и архивации. Опровергнутые БД записи из индекса удаляются.
+    Если пересечения отсекает ограничение bookings_no_overlap, запрос к БД пропускается:
+    конфликт будет обнаружен при вставке. Иначе финальная проверка выполняется запросом к БД.
+    Действующие временные удержания проверяются всегда: ограничение БД их не видит.
+    """
+    if settings.BOOKING_INDEX_ENABLED and booking_index.loaded:
+        indexed_conflicts = booking_index.find_overlaps(auditorium_uuid, start, end, exclude_booking_uuid)
+        if indexed_conflicts:
+            conflicts = await _find_booking_conflicts(auditorium_uuid, start, end, exclude_booking_uuid)
+            if conflicts:
+                metrics.backend_booking_index_lookups_total.labels(result="conflict").inc()
+                _raise_booking_overlap(auditorium_uuid, conflicts[0]['auditorium__identifier'], conflicts)
+            metrics.backend_booking_index_lookups_total.labels(result="stale").inc()
+            for item in indexed_conflicts:
+                booking_index.remove(item.uuid)
+            await check_hold_overlap(auditorium_uuid, start, end)
+            return True
+        metrics.backend_booking_index_lookups_total.labels(result="clear").inc()
+
+    await check_hold_overlap(auditorium_uuid, start, end)
+
+    if booking_exclusion_enforced():
+        return True
+
+    conflicts = await _find_booking_conflicts(auditorium_uuid, start, end, exclude_booking_uuid)
+
+    if conflicts:
+        identifier = conflicts[0]['auditorium__identifier']
+        if settings.BOOKING_INDEX_ENABLED and booking_index.loaded:
+            for conflict in conflicts:
+                booking_index.add(auditorium_uuid, conflict['uuid'], conflict['start_time'], conflict['end_time'], identifier)
+        _raise_booking_overlap(auditorium_uuid, identifier, conflicts)
     return True
 
 
 @log_calls
 async def create_booking(booking_model: CreateBooking, current_user: User) -> Booking:
-    """ Создает новое бронирование """
+    """
+    Создает новое бронирование.
+    Проверки доступности и пересечений и вставка выполняются под блокировкой аудитории.
+    """
     auditorium = await Auditorium.get_or_none(uuid=booking_model.auditorium)
     if not auditorium:
         metrics.backend_bookings_creation_failures_total.labels(reason="not_found").inc()
@@ -157,29 +342,38 @@ async def create_booking(booking_model: CreateBooking, current_user: User) -> Bo
     start = booking_model.start_time
     end = booking_model.end_time
 
-    await check_auditorium_availability(auditorium_uuid=booking_model.auditorium, start_dt=start, end_dt=end)
-    await check_booking_overlap(auditorium_uuid=booking_model.auditorium, start=start, end=end)
-
     try:
-        new_booking = Booking(
-            auditorium=auditorium,
-            broker=current_user,
-            start_time=start,
-            end_time=end,
-            title=booking_model.title
-        )
-        await new_booking.save()
+        async with auditorium_write_lock(auditorium.uuid):
+            await check_auditorium_availability(auditorium_uuid=booking_model.auditorium, start_dt=start, end_dt=end)
+            await check_booking_overlap(auditorium_uuid=booking_model.auditorium, start=start, end=end)
+
+            new_booking = Booking(
+                auditorium=auditorium,
+                broker=current_user,
+                start_time=start,
+                end_time=end,
+                title=booking_model.title
+            )
+            await new_booking.save()
+            await touch_booking_calendars([auditorium.uuid], [current_user.uuid])
+            await record_utilization(added=[(auditorium.uuid, start, end)])
         await new_booking.fetch_related('broker', 'auditorium')
+        _index_booking(new_booking, auditorium.identifier)
+        publish_booking_event(BOOKING_CREATED, new_booking)
 
         metrics.backend_bookings_created_total.inc()
 
         return new_booking
     except IntegrityError as e:
+        if _is_overlap_violation(e):
+            await _raise_constraint_overlap(auditorium.uuid, auditorium.identifier, start, end)
         metrics.backend_bookings_creation_failures_total.labels(reason="other").inc()
         raise HTTPException(
             status_code=409,
             detail=f"Ошибка целостности данных при создании бронирования: {e}"
         )
+    except HTTPException:
+        raise
     except Exception as e:
         metrics.backend_bookings_creation_failures_total.labels(reason="other").inc()
         print(f"Unexpected error creating booking: {e}")
@@ -189,13 +383,137 @@ async def create_booking(booking_model: CreateBooking, current_user: User) -> Bo
         )
     
     
+@log_calls
+async def create_bookings_batch(batch: CreateBookingBatch, current_user: User) -> dict:
+    """
+    Создает пакет бронирований за один проход.
+    Доступность проверяется по скомпилированным расписаниям, пересечения — по одной выборке
+    существующих броней и между элементами пакета; проверки и вставка одним bulk_create выполняются
+    в одной транзакции под блокировкой аудиторий пакета.
+    """
+    items = batch.items
+    if len(items) > settings.BOOKING_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Слишком большой пакет: максимум {settings.BOOKING_BATCH_MAX_SIZE} бронирований за запрос."
+        )
+
+    auditoriums = {
+        auditorium.uuid: auditorium
+        for auditorium in await Auditorium.filter(uuid__in={item.auditorium for item in items})
+    }
+    try:
+        # Расписания, брони и удержания читаются под блокировкой всех аудиторий пакета, чтобы между проверкой
+        # и вставкой никто не занял проверенные интервалы
+        async with auditorium_write_lock(*auditoriums.keys()):
+            schedules = await get_weekly_schedules(auditoriums.keys())
+
+            windows = {}
+            for item in items:
+                if item.auditorium in auditoriums:
+                    window_start, window_end = windows.get(item.auditorium, (item.start_time, item.end_time))
+                    windows[item.auditorium] = (min(window_start, item.start_time), max(window_end, item.end_time))
+
+            batch_index = BookingIntervalIndex()
+            if windows:
+                window_filter = Q(*[
+                    Q(auditorium_id=auditorium_uuid, start_time__lt=window_end, end_time__gt=window_start)
+                    for auditorium_uuid, (window_start, window_end) in windows.items()
+                ], join_type=Q.OR)
+                existing = await Booking.filter(window_filter).values('uuid', 'auditorium_id', 'start_time', 'end_time')
+                held = await active_holds().filter(window_filter).values('uuid', 'auditorium_id', 'start_time', 'end_time')
+                for row in existing + held:
+                    batch_index.add(row['auditorium_id'], row['uuid'], row['start_time'], row['end_time'])
+
+            results = []
+            new_bookings = []
+            batch_positions = {}
+            for index, item in enumerate(items):
+                auditorium = auditoriums.get(item.auditorium)
+                if auditorium is None:
+                    metrics.backend_bookings_creation_failures_total.labels(reason="not_found").inc()
+                    results.append({"index": index, "status_code": 404, "detail": f"Аудитория с UUID {item.auditorium} не найдена."})
+                    continue
+
+                unavailability = describe_unavailability(schedules[auditorium.uuid], item.start_time, item.end_time, auditorium.identifier)
+                if unavailability:
+                    metrics.backend_bookings_creation_failures_total.labels(reason="unavailable").inc()
+                    results.append({"index": index, "status_code": 400, "detail": unavailability})
+                    continue
+
+                conflicts = batch_index.find_overlaps(auditorium.uuid, item.start_time, item.end_time)
+                if conflicts:
+                    metrics.backend_bookings_creation_failures_total.labels(reason="overlap").inc()
+                    batch_conflicts = [f"#{batch_positions[c.uuid]}" for c in conflicts if c.uuid in batch_positions]
+                    existing_conflicts = [str(c.uuid) for c in conflicts if c.uuid not in batch_positions]
+                    results.append({
+                        "index": index,
+                        "status_code": 409,
+                        "detail": (f"Запрошенный временной слот для аудитории '{auditorium.identifier}' конфликтует "
+                                   f"с существующими бронированиями: {', '.join(existing_conflicts) or '—'}; "
+                                   f"с элементами пакета: {', '.join(batch_conflicts) or '—'}.")
+                    })
+                    continue
+
+                booking = Booking(
+                    uuid=uuid4(),
+                    auditorium=auditorium,
+                    broker=current_user,
+                    start_time=item.start_time,
+                    end_time=item.end_time,
+                    title=item.title
+                )
+                batch_index.add(auditorium.uuid, booking.uuid, booking.start_time, booking.end_time)
+                batch_positions[booking.uuid] = index
+                new_bookings.append(booking)
+                results.append({"index": index, "status_code": 201, "booking": booking})
+
+            failed = len(items) - len(new_bookings)
+            if failed and batch.mode == BookingBatchMode.ALL_OR_NOTHING:
+                for result in results:
+                    if result["status_code"] == 201:
+                        result.update(status_code=424, booking=None, detail="Пакет отклонен: другие элементы не прошли проверку.")
+                new_bookings = []
+
+            if new_bookings:
+                await Booking.bulk_create(new_bookings)
+                await touch_booking_calendars({booking.auditorium_id for booking in new_bookings}, [current_user.uuid])
+                await record_utilization(
+                    added=[(booking.auditorium_id, booking.start_time, booking.end_time) for booking in new_bookings]
+                )
+    except IntegrityError as e:
+        reason = "overlap" if _is_overlap_violation(e) else "other"
+        metrics.backend_bookings_creation_failures_total.labels(reason=reason).inc()
+        raise HTTPException(
+            status_code=409,
+            detail=f"Ошибка целостности данных при создании пакета бронирований: {e}"
+        )
+
+    if new_bookings:
+        for booking in new_bookings:
+            _index_booking(booking, booking.auditorium.identifier)
+            publish_booking_event(BOOKING_CREATED, booking)
+        metrics.backend_bookings_created_total.inc(len(new_bookings))
+
+    return {
+        "mode": batch.mode,
+        "created": len(new_bookings),
+        "failed": len(items) - len(new_bookings),
+        "results": results
+    }
+
+
 @log_calls
 async def update_booking(
     booking_uuid: UUID4,
     booking_update_data: UpdateBooking,
-    current_user: User
+    current_user: User,
+    expected_version: Optional[int] = None
 ) -> Booking:
-    """ Обновляет существующее бронирование """
+    """
+    Обновляет существующее бронирование.
+    Запись выполняется условным UPDATE по версии: если бронь успела измениться, возвращается 412.
+    """
     booking = await Booking.filter(uuid=booking_uuid).prefetch_related('broker', 'auditorium').first()
 
     if not booking:
@@ -208,6 +526,7 @@ async def update_booking(
         )
 
     update_data = booking_update_data.model_dump(exclude_unset=True)
+    update_data.pop('version', None)
 
     final_start_time = update_data.get('start_time', booking.start_time)
     final_end_time = update_data.get('end_time', booking.end_time)
@@ -228,36 +547,73 @@ async def update_booking(
         del update_data['auditorium']
 
 
-    await check_auditorium_availability(
-        auditorium_uuid=final_auditorium_uuid,
-        start_dt=final_start_time,
-        end_dt=final_end_time
-    )
-    await check_booking_overlap(
-        auditorium_uuid=final_auditorium_uuid,
-        start=final_start_time,
-        end=final_end_time,
-        exclude_booking_uuid=booking_uuid
-    )
-    await booking.update_from_dict(update_data).save()
+    try:
+        async with auditorium_write_lock(booking.auditorium_id, final_auditorium_uuid):
+            await check_auditorium_availability(
+                auditorium_uuid=final_auditorium_uuid,
+                start_dt=final_start_time,
+                end_dt=final_end_time
+            )
+            await check_booking_overlap(
+                auditorium_uuid=final_auditorium_uuid,
+                start=final_start_time,
+                end=final_end_time,
+                exclude_booking_uuid=booking_uuid
+            )
+            previous_interval = (booking.auditorium_id, booking.start_time, booking.end_time)
+            await save_versioned(booking, update_data, expected_version)
+            await touch_booking_calendars({previous_interval[0], booking.auditorium_id}, [booking.broker_id])
+            await record_utilization(
+                added=[(booking.auditorium_id, booking.start_time, booking.end_time)],
+                removed=[previous_interval]
+            )
+            promoted = []
+            if previous_interval != (booking.auditorium_id, booking.start_time, booking.end_time):
+                promoted = await promote_waitlist(*previous_interval)
+    except IntegrityError as e:
+        if _is_overlap_violation(e):
+            await _raise_constraint_overlap(
+                final_auditorium_uuid, final_auditorium.identifier, final_start_time, final_end_time, booking_uuid
+            )
+        raise HTTPException(status_code=409, detail=f"Ошибка целостности данных при изменении бронирования: {e}")
 
     await booking.fetch_related('broker', 'auditorium')
+    _index_booking(booking, final_auditorium.identifier)
+    if previous_interval[0] != booking.auditorium_id:
+        publish_booking_deleted(previous_interval[0], booking.uuid)
+    publish_booking_event(BOOKING_UPDATED, booking)
+    _index_promoted(promoted)
 
     metrics.backend_bookings_updated_total.inc()
 
     return booking
 
 
-@log_calls
-async def get_bookings(
+def _filter_bookings(
+    query,
+    auditorium_uuid: Optional[UUID4] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+):
+    if auditorium_uuid:
+        query = query.filter(auditorium_id=auditorium_uuid)
+    if start_date:
+        query = query.filter(start_time__gte=datetime.combine(start_date, time.min))
+    if end_date:
+        query = query.filter(end_time__lte=datetime.combine(end_date, time.max))
+    return query
+
+
+def bookings_query(
     current_user: User,
     auditorium_uuid: Optional[UUID4] = None,
     user_uuid: Optional[UUID4] = None,
-    start_date: Optional[datetime.date] = None,
-    end_date: Optional[datetime.date] = None
-) -> List[Booking]:
-    """ Получает список бронирований с фильтрацией и проверкой прав """
-    query = Booking.all().prefetch_related('broker', 'auditorium')
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    source=Booking
+):
+    """ Запрос бронирований (source — bookings или архив) с фильтрами и проверкой прав, без сортировки и выборки """
+    query = source.all()
 
     if current_user.role != UserRole.MODERATOR:
         query = query.filter(broker_id=current_user.uuid)
@@ -266,23 +622,36 @@ async def get_bookings(
     elif user_uuid is not None:
         query = query.filter(broker_id=user_uuid)
 
-    if auditorium_uuid:
-        query = query.filter(auditorium_id=auditorium_uuid)
+    return _filter_bookings(query, auditorium_uuid, start_date, end_date)
 
-    if start_date:
-        start_datetime = datetime.combine(start_date, datetime.time.min)
-        query = query.filter(start_time__gte=start_datetime)
-    if end_date:
-        end_datetime = datetime.combine(end_date, datetime.time.max)
-        query = query.filter(end_time__lte=end_datetime)
 
-    bookings = await query.order_by('start_time')
-    return bookings
+@log_calls
+@read_only
+async def get_bookings(
+    current_user: User,
+    auditorium_uuid: Optional[UUID4] = None,
+    user_uuid: Optional[UUID4] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    limit: int = settings.BOOKING_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_archived: bool = False
+) -> Tuple[List[Booking], Optional[str]]:
+    """
+    Получает страницу бронирований с фильтрацией и проверкой прав.
+    Пагинация keyset по (start_time, uuid): возвращает брони и курсор следующей страницы.
+    Архив читается только при include_archived.
+    """
+    query = bookings_query(current_user, auditorium_uuid, user_uuid, start_date, end_date).prefetch_related('broker', 'auditorium')
+    if not include_archived:
+        return await paginate_by_start_time(query, limit, cursor)
+    archived = bookings_query(current_user, auditorium_uuid, user_uuid, start_date, end_date, source=BookingArchive)
+    return await paginate_merged([query, archived], limit, cursor)
 
 
 @log_calls
 async def delete_booking(booking_uuid: UUID4, current_user: User) -> bool:
-    """ Удаляет бронирование по UUID с проверкой прав """
+    """ Удаляет бронирование по UUID с проверкой прав; освободившееся время получает лист ожидания """
     booking = await Booking.get_or_none(uuid=booking_uuid)
     if not booking:
         return False
@@ -290,7 +659,14 @@ async def delete_booking(booking_uuid: UUID4, current_user: User) -> bool:
     if booking.broker_id != current_user.uuid and current_user.role != UserRole.MODERATOR:
         raise HTTPException(status_code=403, detail="Недостаточно прав для удаления этого бронирования.")
     try:
-        await booking.delete()
+        async with auditorium_write_lock(booking.auditorium_id):
+            await booking.delete()
+            await touch_booking_calendars([booking.auditorium_id], [booking.broker_id])
+            await record_utilization(removed=[(booking.auditorium_id, booking.start_time, booking.end_time)])
+            promoted = await promote_waitlist(booking.auditorium_id, booking.start_time, booking.end_time)
+        _unindex_booking(booking_uuid)
+        publish_booking_deleted(booking.auditorium_id, booking_uuid)
+        _index_promoted(promoted)
 
         metrics.backend_bookings_cancelled_total.inc()
 
@@ -301,6 +677,7 @@ async def delete_booking(booking_uuid: UUID4, current_user: User) -> bool:
 
 
 @log_calls
+@read_only
 async def get_bookings_for_calendar(
     auditorium_uuid: UUID4,
     start_date: date,
@@ -324,26 +701,22 @@ async def get_bookings_for_calendar(
 
 
 @log_calls
+@read_only
 async def get_my_bookings(
     current_user: User,
     auditorium_uuid: Optional[UUID4] = None,
     start_date: Optional[date] = None,
-    end_date: Optional[date] = None
-) -> List[Booking]:
+    end_date: Optional[date] = None,
+    limit: int = settings.BOOKING_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_archived: bool = False
+) -> Tuple[List[Booking], Optional[str]]:
     """
-    Получает список бронирований ТЕКУЩЕГО пользователя с возможностью фильтрации.
+    Получает страницу бронирований ТЕКУЩЕГО пользователя с возможностью фильтрации (архив — только при include_archived).
     """
-    query = Booking.filter(broker_id=current_user.uuid)
-
-    if auditorium_uuid:
-        query = query.filter(auditorium_id=auditorium_uuid)
-
-    if start_date:
-        start_datetime = datetime.combine(start_date, datetime.min.time())
-        query = query.filter(start_time__gte=start_datetime)
-    if end_date:
-        end_datetime = datetime.combine(end_date, datetime.max.time())
-        query = query.filter(end_time__lte=end_datetime)
-
-    bookings = await query.prefetch_related('broker', 'auditorium').order_by('start_time')
-    return bookings
\ No newline at end of file
+    query = _filter_bookings(Booking.filter(broker_id=current_user.uuid), auditorium_uuid, start_date, end_date)
+    query = query.prefetch_related('broker', 'auditorium')
+    if not include_archived:
+        return await paginate_by_start_time(query, limit, cursor)
+    archived = _filter_bookings(BookingArchive.filter(broker_id=current_user.uuid), auditorium_uuid, start_date, end_date)
+    return await paginate_merged([query, archived], limit, cursor)
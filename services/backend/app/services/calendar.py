@@ -0,0 +1,240 @@
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, NamedTuple, Optional, Tuple
+
+from fastapi import HTTPException
+from pydantic import UUID4, TypeAdapter
+
+from app.schemas import CalendarBookingEntry
+from app.models import Auditorium, Booking, User
+from app.logger import log_calls
+from app.services.auditorium import filter_auditoriums
+from app.services.availability import get_weekly_schedules
+from app.services.booking import active_holds, get_bookings_for_calendar
+from app.utils.booking_index import normalize_dt
+from app.utils.cache import LRUCache
+from app.utils.freebusy import freebusy_runs
+from app.utils.ical import build_calendar
+from app.utils.replicas import read_only
+
+from app import metrics, settings
+
+ICS_MEDIA_TYPE = "text/calendar; charset=utf-8"
+
+calendar_entries_adapter = TypeAdapter(List[CalendarBookingEntry])
+# Ключ включает bookings_version аудитории: любая запись брони делает старые записи недостижимыми,
+# и они вытесняются по LRU. Счетчик хранится в БД, поэтому инвалидация работает между воркерами.
+calendar_cache = LRUCache(maxsize=settings.CALENDAR_CACHE_SIZE)
+
+
+class CalendarFeed(NamedTuple):
+    """ Состояние ленты: все, что нужно для ETag/Last-Modified, без обращения к таблице бронирований """
+    name: str
+    etag: str
+    last_modified: Optional[datetime]
+    filters: dict
+    window: Tuple[datetime, datetime]
+
+
+def _feed_window() -> Tuple[datetime, datetime]:
+    today = datetime.now(timezone.utc).date()
+    return (
+        datetime.combine(today - timedelta(days=settings.ICS_FEED_PAST_DAYS), time.min, tzinfo=timezone.utc),
+        datetime.combine(today + timedelta(days=settings.ICS_FEED_FUTURE_DAYS), time.min, tzinfo=timezone.utc),
+    )
+
+
+def _feed_etag(bookings_version: int, window: Tuple[datetime, datetime]) -> str:
+    # Окно ленты сдвигается раз в сутки, поэтому дата его начала входит в ETag вместе со счетчиком изменений
+    return f'"{bookings_version}-{window[0]:%Y%m%d}"'
+
+
+@log_calls
+async def get_auditorium_feed(auditorium_uuid: UUID4) -> CalendarFeed:
+    """ Читает только счетчик изменений аудитории (одна строка auditoriums) """
+    state = await Auditorium.filter(uuid=auditorium_uuid).first().values(
+        'identifier', 'bookings_version', 'bookings_changed_at'
+    )
+    if not state:
+        raise HTTPException(status_code=404, detail="Auditorium not found")
+    window = _feed_window()
+    return CalendarFeed(
+        name=state['identifier'],
+        etag=_feed_etag(state['bookings_version'], window),
+        last_modified=state['bookings_changed_at'],
+        filters={'auditorium_id': auditorium_uuid},
+        window=window
+    )
+
+
+@log_calls
+async def get_user_feed(current_user: User) -> CalendarFeed:
+    """ Читает только счетчик изменений пользователя: текущий пользователь берется из кэша и счетчиков не содержит """
+    state = await User.filter(uuid=current_user.uuid).first().values(
+        'username', 'email', 'bookings_version', 'bookings_changed_at'
+    )
+    if not state:
+        raise HTTPException(status_code=404, detail="User not found")
+    window = _feed_window()
+    return CalendarFeed(
+        name=f"Мои бронирования ({state['username'] or state['email'] or current_user.uuid})",
+        etag=_feed_etag(state['bookings_version'], window),
+        last_modified=state['bookings_changed_at'],
+        filters={'broker_id': current_user.uuid},
+        window=window
+    )
+
+
+@log_calls
+async def render_feed(feed: CalendarFeed) -> str:
+    window_start, window_end = feed.window
+    rows = await Booking.filter(
+        **feed.filters,
+        start_time__lt=window_end,
+        end_time__gt=window_start
+    ).order_by('start_time').values('uuid', 'title', 'start_time', 'end_time', location='auditorium__identifier')
+    return build_calendar(feed.name, rows, stamp=feed.last_modified)
+
+
+@log_calls
+@read_only
+async def get_calendar_json(auditorium_uuid: UUID4, start_date: date, end_date: date) -> bytes:
+    """
+    Возвращает сериализованный JSON календаря аудитории за диапазон дат.
+    На попадании в кэш выполняется один запрос к строке аудитории (за счетчиком изменений).
+    """
+    bookings_version = await Auditorium.filter(uuid=auditorium_uuid).first().values_list('bookings_version', flat=True)
+    if bookings_version is None:
+        return b"[]"
+
+    key = (auditorium_uuid, start_date, end_date, bookings_version)
+    cached = calendar_cache.get(key)
+    if cached is not None:
+        metrics.backend_calendar_cache_requests_total.labels(result="hit").inc()
+        return cached
+
+    metrics.backend_calendar_cache_requests_total.labels(result="miss").inc()
+    bookings = await get_bookings_for_calendar(auditorium_uuid=auditorium_uuid, start_date=start_date, end_date=end_date)
+    payload = calendar_entries_adapter.dump_json(calendar_entries_adapter.validate_python(bookings, from_attributes=True))
+    calendar_cache.set(key, payload)
+    return payload
+
+
+async def _select_auditoriums(
+    auditorium_uuids: Optional[List[UUID4]],
+    min_capacity: Optional[int],
+    equipment_ids: Optional[List[UUID4]]
+) -> List[dict]:
+    """ Аудитории по списку UUID и/или фильтру, не больше CALENDAR_MAX_AUDITORIUMS за запрос """
+    query = Auditorium.all()
+    if auditorium_uuids:
+        query = query.filter(uuid__in=set(auditorium_uuids))
+    query = filter_auditoriums(query, min_capacity=min_capacity, equipment_ids=equipment_ids)
+
+    auditoriums = await query.order_by('identifier').limit(settings.CALENDAR_MAX_AUDITORIUMS + 1).values('uuid', 'identifier')
+    if len(auditoriums) > settings.CALENDAR_MAX_AUDITORIUMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Слишком много аудиторий: максимум {settings.CALENDAR_MAX_AUDITORIUMS} за запрос. Уточните фильтр."
+        )
+    return auditoriums
+
+
+@log_calls
+@read_only
+async def get_auditoriums_calendar(
+    start_date: date,
+    end_date: date,
+    auditorium_uuids: Optional[List[UUID4]] = None,
+    min_capacity: Optional[int] = None,
+    equipment_ids: Optional[List[UUID4]] = None
+) -> List[dict]:
+    """
+    Календарь нескольких аудиторий сразу: один запрос за списком аудиторий и один запрос
+    auditorium_id__in за всеми их бронированиями в диапазоне, сгруппированными по аудитории.
+    """
+    auditoriums = await _select_auditoriums(auditorium_uuids, min_capacity, equipment_ids)
+    if not auditoriums:
+        return []
+
+    calendars = {
+        auditorium['uuid']: {"auditorium": auditorium['uuid'], "identifier": auditorium['identifier'], "bookings": []}
+        for auditorium in auditoriums
+    }
+    rows = await Booking.filter(
+        auditorium_id__in=list(calendars),
+        start_time__lt=datetime.combine(end_date, time.max),
+        end_time__gt=datetime.combine(start_date, time.min)
+    ).order_by('start_time').values('uuid', 'title', 'start_time', 'end_time', 'auditorium_id')
+    for row in rows:
+        calendars[row.pop('auditorium_id')]["bookings"].append(row)
+    return list(calendars.values())
+
+
+@log_calls
+@read_only
+async def get_freebusy(
+    start: datetime,
+    end: datetime,
+    bucket_minutes: int,
+    auditorium_uuids: Optional[List[UUID4]] = None,
+    min_capacity: Optional[int] = None,
+    equipment_ids: Optional[List[UUID4]] = None
+) -> dict:
+    """
+    Матрица занятости аудиторий × ячеек по bucket_minutes минут.
+    Расписания берутся из кэша скомпилированных недельных расписаний, брони и действующие удержания всех аудиторий —
+    по одному запросу auditorium_id__in (удержанный интервал так же занят: бронь на него получит 409);
+    каждая аудитория кодируется в run-length строку.
+    Расписание разворачивается в часовом поясе запроса, как при проверке брони; в наивный UTC интервалы
+    приводятся только для сравнения с бронями и удержаниями.
+    """
+    local_start = start
+    start, end = normalize_dt(start), normalize_dt(end)
+    if start >= end:
+        raise HTTPException(status_code=400, detail="Начало диапазона должно быть раньше его окончания.")
+    bucket_seconds = bucket_minutes * 60
+    buckets = -(-int((end - start).total_seconds()) // bucket_seconds)
+    if buckets > settings.FREEBUSY_MAX_BUCKETS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Слишком много ячеек: максимум {settings.FREEBUSY_MAX_BUCKETS} на аудиторию. Увеличьте размер ячейки или сократите диапазон."
+        )
+    grid_length = timedelta(seconds=buckets * bucket_seconds)
+    grid_end = start + grid_length
+
+    auditoriums = await _select_auditoriums(auditorium_uuids, min_capacity, equipment_ids)
+    busy = {auditorium['uuid']: [] for auditorium in auditoriums}
+    if auditoriums:
+        window = dict(auditorium_id__in=list(busy), start_time__lt=grid_end, end_time__gt=start)
+        rows = await Booking.filter(**window).order_by('start_time').values_list('auditorium_id', 'start_time', 'end_time')
+        rows += await active_holds().filter(**window).values_list('auditorium_id', 'start_time', 'end_time')
+        for auditorium_uuid, booking_start, booking_end in rows:
+            busy[auditorium_uuid].append((normalize_dt(booking_start), normalize_dt(booking_end)))
+    schedules = await get_weekly_schedules(busy.keys())
+
+    def open_intervals(auditorium_uuid) -> List[Tuple[datetime, datetime]]:
+        return [
+            (normalize_dt(open_start), normalize_dt(open_end))
+            for open_start, open_end in schedules[auditorium_uuid].open_intervals(local_start, local_start + grid_length)
+        ]
+
+    return {
+        "start": local_start,
+        "end": local_start + grid_length,
+        "bucket_minutes": bucket_minutes,
+        "buckets": buckets,
+        "auditoriums": [
+            {
+                "auditorium": auditorium['uuid'],
+                "identifier": auditorium['identifier'],
+                "runs": freebusy_runs(
+                    open_intervals(auditorium['uuid']),
+                    busy[auditorium['uuid']],
+                    start,
+                    bucket_seconds,
+                    buckets
+                )
+            }
+            for auditorium in auditoriums
+        ]
+    }
@@ -6,6 +6,7 @@ from pydantic import UUID4
 from app.schemas import CreateEquipment, GetEquipment, UpdateEquipment, DeleteEquipment
 from app.models import Equipment
 from app.logger import log_calls
+from app.utils.replicas import read_only
 
 from app import metrics
 
@@ -66,6 +67,7 @@ async def update_equipment(equipment_uuid: UUID4, equipment_update_data: UpdateE
 
 
 @log_calls
+@read_only
 async def get_all_equipments() -> List[Equipment]:
     equipments = await Equipment.all()
     return equipments
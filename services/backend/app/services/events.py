@@ -0,0 +1,81 @@
+import asyncio
+import json
+from typing import AsyncIterator
+
+from fastapi import HTTPException
+from pydantic import UUID4
+
+from app.schemas import CalendarBookingEntry
+from app.models import Auditorium, Booking
+from app.utils.broadcast import BroadcastHub
+
+from app import metrics, settings
+
+BOOKING_CREATED = "booking.created"
+BOOKING_UPDATED = "booking.updated"
+BOOKING_DELETED = "booking.deleted"
+
+calendar_hub = BroadcastHub(
+    queue_size=settings.CALENDAR_EVENTS_QUEUE_SIZE,
+    max_subscribers=settings.CALENDAR_EVENTS_MAX_SUBSCRIBERS
+)
+
+
+def sse_frame(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def _publish(auditorium_uuid: UUID4, event: str, data: str) -> None:
+    dropped = calendar_hub.publish(auditorium_uuid, sse_frame(event, data))
+    metrics.backend_calendar_events_total.labels(event=event).inc()
+    if dropped:
+        metrics.backend_calendar_event_subscribers_dropped_total.inc(dropped)
+        metrics.backend_calendar_event_subscribers.set(len(calendar_hub))
+
+
+def publish_booking_event(event: str, booking: Booking) -> None:
+    """
+    Публикует создание или изменение брони подписчикам ее аудитории.
+    Вызывается после фиксации транзакции; без подписчиков событие даже не сериализуется.
+    """
+    if calendar_hub.subscribers(booking.auditorium_id):
+        _publish(booking.auditorium_id, event, CalendarBookingEntry.model_validate(booking).model_dump_json())
+
+
+def publish_booking_deleted(auditorium_uuid: UUID4, booking_uuid: UUID4) -> None:
+    if calendar_hub.subscribers(auditorium_uuid):
+        _publish(auditorium_uuid, BOOKING_DELETED, json.dumps({"uuid": str(booking_uuid)}))
+
+
+async def _stream_events(auditorium_uuid: UUID4) -> AsyncIterator[str]:
+    subscription = calendar_hub.subscribe(auditorium_uuid)
+    if subscription is None:
+        return
+    metrics.backend_calendar_event_subscribers.set(len(calendar_hub))
+    try:
+        # ready отправляется уже после подписки: получив его, клиент перечитывает календарь и не теряет событий
+        yield f"retry: {settings.CALENDAR_EVENTS_RETRY_MS}\n" + sse_frame("ready", json.dumps({"auditorium": str(auditorium_uuid)}))
+        while True:
+            try:
+                frame = await asyncio.wait_for(subscription.queue.get(), settings.CALENDAR_EVENTS_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if frame is None:
+                break
+            yield frame
+    finally:
+        calendar_hub.unsubscribe(auditorium_uuid, subscription)
+        metrics.backend_calendar_event_subscribers.set(len(calendar_hub))
+
+
+async def open_auditorium_events(auditorium_uuid: UUID4) -> AsyncIterator[str]:
+    """
+    Открывает поток Server-Sent Events об изменениях бронирований аудитории.
+    Аудитория и лимит подписчиков проверяются до начала потока, чтобы ошибка вернулась обычным HTTP-ответом.
+    """
+    if not await Auditorium.exists(uuid=auditorium_uuid):
+        raise HTTPException(status_code=404, detail=f"Аудитория с UUID {auditorium_uuid} не найдена.")
+    if len(calendar_hub) >= settings.CALENDAR_EVENTS_MAX_SUBSCRIBERS:
+        raise HTTPException(status_code=503, detail="Слишком много подписчиков на обновления. Повторите попытку позже.")
+    return _stream_events(auditorium_uuid)
@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+from datetime import date
+from typing import AsyncIterator, Dict, List, Optional
+
+from pydantic import UUID4
+
+from app.models import User
+from app.enums import BookingExportFormat
+from app.services.booking import bookings_query
+from app.utils.pagination import after_keyset
+
+from app import metrics, settings
+
+EXPORT_COLUMNS = (
+    'uuid', 'auditorium_id', 'auditorium__identifier', 'broker_id', 'broker__username',
+    'start_time', 'end_time', 'title', 'series_id'
+)
+EXPORT_HEADER = (
+    'uuid', 'auditorium_id', 'auditorium', 'broker_id', 'broker',
+    'start_time', 'end_time', 'title', 'series_id'
+)
+
+EXPORT_MEDIA_TYPES = {
+    BookingExportFormat.NDJSON: "application/x-ndjson",
+    BookingExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _plain(value):
+    if value is None:
+        return None
+    if isinstance(value, (int, float, str)):
+        return value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _format_ndjson(rows: List[Dict]) -> str:
+    return "".join(
+        json.dumps({name: _plain(row[column]) for name, column in zip(EXPORT_HEADER, EXPORT_COLUMNS)}, ensure_ascii=False) + "\n"
+        for row in rows
+    )
+
+
+def _format_csv(rows: List[Dict]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(["" if row[column] is None else _plain(row[column]) for column in EXPORT_COLUMNS])
+    return buffer.getvalue()
+
+
+async def _stream_rows(query, export_format: BookingExportFormat) -> AsyncIterator[str]:
+    """
+    Читает брони порциями по BOOKING_EXPORT_CHUNK_SIZE (keyset по start_time, uuid) и сразу отдает их клиенту.
+    В памяти одновременно находится не больше одной порции словарей, ORM-объекты не создаются.
+    """
+    if export_format == BookingExportFormat.CSV:
+        yield ",".join(EXPORT_HEADER) + "\r\n"
+    formatter = _format_csv if export_format == BookingExportFormat.CSV else _format_ndjson
+
+    chunk_size = settings.BOOKING_EXPORT_CHUNK_SIZE
+    chunk_query = query
+    while True:
+        rows = await chunk_query.order_by('start_time', 'uuid').limit(chunk_size).values(*EXPORT_COLUMNS)
+        if not rows:
+            break
+        metrics.backend_booking_export_rows_total.inc(len(rows))
+        yield formatter(rows)
+        if len(rows) < chunk_size:
+            break
+        chunk_query = after_keyset(query, rows[-1]['start_time'], rows[-1]['uuid'])
+
+
+def export_bookings(
+    current_user: User,
+    export_format: BookingExportFormat = BookingExportFormat.NDJSON,
+    auditorium_uuid: Optional[UUID4] = None,
+    user_uuid: Optional[UUID4] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+) -> AsyncIterator[str]:
+    """
+    Возвращает асинхронный поток строк выгрузки с теми же фильтрами и правами, что и get_bookings.
+    Права проверяются сразу, до начала потока, чтобы ошибка вернулась обычным HTTP-ответом.
+    """
+    query = bookings_query(current_user, auditorium_uuid, user_uuid, start_date, end_date)
+    metrics.backend_booking_exports_total.labels(format=export_format.value).inc()
+    return _stream_rows(query, export_format)
@@ -0,0 +1,171 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from fastapi import HTTPException
+from tortoise.exceptions import IntegrityError
+from pydantic import UUID4
+
+from app.schemas import CreateBookingHold
+from app.models import Auditorium, Booking, BookingHold, User
+from app.enums import UserRole
+from app.logger import log_calls
+from app.services.booking import (
+    check_auditorium_availability, check_booking_overlap, check_hold_overlap, promote_waitlist, touch_booking_calendars,
+    _find_booking_conflicts, _index_booking, _index_promoted, _is_overlap_violation, _raise_booking_overlap,
+    _raise_constraint_overlap
+)
+from app.services.events import BOOKING_CREATED, publish_booking_event
+from app.services.utilization import record_utilization
+from app.utils.expiry import ExpirySweeper
+from app.utils.locks import auditorium_write_lock
+
+from app import metrics, settings
+
+
+async def _release_holds(auditorium_uuid: UUID4, query) -> int:
+    """
+    Удаляет удержания аудитории под ее блокировкой и отдает освободившиеся интервалы листу ожидания
+    в той же транзакции — так же, как при удалении брони. Удержания перечитываются под блокировкой:
+    подтвержденные или уже снятые другим воркером ничего не освобождают.
+    """
+    async with auditorium_write_lock(auditorium_uuid):
+        holds = await query.filter(auditorium_id=auditorium_uuid).values('uuid', 'start_time', 'end_time')
+        if not holds:
+            return 0
+        await BookingHold.filter(uuid__in=[hold['uuid'] for hold in holds]).delete()
+        promoted = []
+        for hold in holds:
+            promoted += await promote_waitlist(auditorium_uuid, hold['start_time'], hold['end_time'])
+    _index_promoted(promoted)
+    return len(holds)
+
+
+async def _purge_expired_holds(hold_uuids: Optional[List[UUID4]] = None) -> int:
+    """ Удаляет истекшие удержания (все или из hold_uuids) по аудиториям, продвигая лист ожидания """
+    expired = BookingHold.filter(expires_at__lte=datetime.now(timezone.utc))
+    if hold_uuids is not None:
+        expired = expired.filter(uuid__in=hold_uuids)
+    deleted = 0
+    for auditorium_uuid in await expired.distinct().values_list('auditorium_id', flat=True):
+        deleted += await _release_holds(auditorium_uuid, expired)
+    metrics.backend_booking_holds_total.labels(outcome="expired").inc(deleted)
+    return deleted
+
+
+hold_sweeper = ExpirySweeper(purge=_purge_expired_holds)
+
+
+async def start_hold_sweeper() -> None:
+    """
+    Удаляет удержания, истекшие пока сервис не работал, планирует очистку действующих и запускает фоновую задачу.
+    Каждый воркер следит за удержаниями, о которых знает; корректность от очистки не зависит —
+    истекшие удержания не учитываются в проверках пересечений, даже если строка еще не удалена.
+    """
+    await _purge_expired_holds()
+    now = datetime.now(timezone.utc)
+    for hold_uuid, expires_at in await BookingHold.filter(expires_at__gt=now).values_list('uuid', 'expires_at'):
+        hold_sweeper.schedule(expires_at, hold_uuid)
+    hold_sweeper.start()
+
+
+@log_calls
+async def create_booking_hold(hold_model: CreateBookingHold, current_user: User) -> BookingHold:
+    """
+    Временно удерживает интервал в аудитории на время заполнения формы бронирования.
+    Проверки те же, что при создании брони, и выполняются под той же блокировкой аудитории;
+    пересечения с бронями проверяются запросом даже при включенном ограничении bookings_no_overlap.
+    """
+    ttl_minutes = hold_model.ttl_minutes or settings.BOOKING_HOLD_TTL_MINUTES
+    if ttl_minutes > settings.BOOKING_HOLD_MAX_TTL_MINUTES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Слишком долгое удержание: максимум {settings.BOOKING_HOLD_MAX_TTL_MINUTES} минут."
+        )
+
+    auditorium = await Auditorium.get_or_none(uuid=hold_model.auditorium)
+    if not auditorium:
+        raise HTTPException(status_code=404, detail=f"Аудитория с UUID {hold_model.auditorium} не найдена.")
+
+    now = datetime.now(timezone.utc)
+    if await BookingHold.filter(broker_id=current_user.uuid, expires_at__gt=now).count() >= settings.BOOKING_HOLDS_PER_USER:
+        raise HTTPException(
+            status_code=429,
+            detail=f"Слишком много действующих удержаний: максимум {settings.BOOKING_HOLDS_PER_USER}. Подтвердите или снимите существующие."
+        )
+
+    async with auditorium_write_lock(auditorium.uuid):
+        await check_auditorium_availability(auditorium_uuid=auditorium.uuid, start_dt=hold_model.start_time, end_dt=hold_model.end_time)
+        await check_hold_overlap(auditorium.uuid, hold_model.start_time, hold_model.end_time)
+        # Ограничение bookings_no_overlap не видит вставку в booking_holds, поэтому брони проверяются запросом всегда
+        conflicts = await _find_booking_conflicts(auditorium.uuid, hold_model.start_time, hold_model.end_time)
+        if conflicts:
+            _raise_booking_overlap(auditorium.uuid, auditorium.identifier, conflicts)
+        hold = BookingHold(
+            auditorium=auditorium,
+            broker=current_user,
+            start_time=hold_model.start_time,
+            end_time=hold_model.end_time,
+            title=hold_model.title,
+            expires_at=now + timedelta(minutes=ttl_minutes)
+        )
+        await hold.save()
+
+    hold_sweeper.schedule(hold.expires_at, hold.uuid)
+    metrics.backend_booking_holds_total.labels(outcome="created").inc()
+    return hold
+
+
+async def _get_own_hold(hold_uuid: UUID4, current_user: User, action: str) -> BookingHold:
+    hold = await BookingHold.get_or_none(uuid=hold_uuid)
+    if not hold:
+        raise HTTPException(status_code=404, detail="Удержание не найдено.")
+    if hold.broker_id != current_user.uuid and current_user.role != UserRole.MODERATOR:
+        raise HTTPException(status_code=403, detail=f"Недостаточно прав для {action} этого удержания.")
+    return hold
+
+
+@log_calls
+async def confirm_booking_hold(hold_uuid: UUID4, current_user: User) -> Booking:
+    """
+    Превращает удержание в бронирование.
+    Удержание удаляется в той же транзакции, что и вставка брони, поэтому его интервал не конфликтует с самим собой,
+    а при любой ошибке удержание остается на месте.
+    """
+    hold = await _get_own_hold(hold_uuid, current_user, "подтверждения")
+    auditorium = await Auditorium.get(uuid=hold.auditorium_id)
+
+    try:
+        async with auditorium_write_lock(hold.auditorium_id):
+            if not await BookingHold.filter(uuid=hold.uuid, expires_at__gt=datetime.now(timezone.utc)).delete():
+                raise HTTPException(status_code=410, detail="Срок удержания истек. Создайте бронирование заново.")
+            await check_booking_overlap(auditorium_uuid=hold.auditorium_id, start=hold.start_time, end=hold.end_time)
+
+            booking = Booking(
+                auditorium=auditorium,
+                broker_id=hold.broker_id,
+                start_time=hold.start_time,
+                end_time=hold.end_time,
+                title=hold.title
+            )
+            await booking.save()
+            await touch_booking_calendars([hold.auditorium_id], [hold.broker_id])
+            await record_utilization(added=[(hold.auditorium_id, hold.start_time, hold.end_time)])
+    except IntegrityError as e:
+        if _is_overlap_violation(e):
+            await _raise_constraint_overlap(auditorium.uuid, auditorium.identifier, hold.start_time, hold.end_time)
+        raise HTTPException(status_code=409, detail=f"Ошибка целостности данных при подтверждении удержания: {e}")
+
+    await booking.fetch_related('broker', 'auditorium')
+    _index_booking(booking, auditorium.identifier)
+    publish_booking_event(BOOKING_CREATED, booking)
+    metrics.backend_bookings_created_total.inc()
+    metrics.backend_booking_holds_total.labels(outcome="confirmed").inc()
+    return booking
+
+
+@log_calls
+async def release_booking_hold(hold_uuid: UUID4, current_user: User) -> None:
+    """ Снимает удержание досрочно; освободившийся интервал получает лист ожидания """
+    hold = await _get_own_hold(hold_uuid, current_user, "снятия")
+    await _release_holds(hold.auditorium_id, BookingHold.filter(uuid=hold.uuid))
+    metrics.backend_booking_holds_total.labels(outcome="released").inc()
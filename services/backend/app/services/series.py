@@ -0,0 +1,240 @@
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+from pydantic import UUID4
+
+from app.schemas import CreateBookingSeries, UpdateBookingSeries
+from app.models import Auditorium, Booking, BookingSeries, User
+from app.enums import UserRole
+from app.logger import log_calls
+from app.services.availability import get_weekly_schedule
+from app.services.booking import (
+    active_holds, describe_unavailability, promote_waitlist, touch_booking_calendars,
+    _index_booking, _index_promoted, _unindex_booking, _is_overlap_violation
+)
+from app.services.events import BOOKING_CREATED, BOOKING_UPDATED, publish_booking_event, publish_booking_deleted
+from app.services.utilization import record_utilization
+from app.utils.booking_index import BookingIntervalIndex
+from app.utils.locks import auditorium_write_lock
+
+from app import metrics, settings
+
+
+def expand_occurrences(
+    start_time: datetime,
+    end_time: datetime,
+    interval_weeks: int,
+    until: date,
+    exceptions: List[date]
+) -> List[Tuple[datetime, datetime]]:
+    """ Разворачивает правило повторения в отсортированный список интервалов занятий """
+    step = timedelta(weeks=interval_weeks)
+    skipped = set(exceptions)
+    occurrences = []
+    occurrence_start, occurrence_end = start_time, end_time
+    while occurrence_start.date() <= until:
+        if occurrence_start.date() not in skipped:
+            occurrences.append((occurrence_start, occurrence_end))
+            if len(occurrences) > settings.BOOKING_SERIES_MAX_OCCURRENCES:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Серия слишком длинная: максимум {settings.BOOKING_SERIES_MAX_OCCURRENCES} занятий."
+                )
+        occurrence_start += step
+        occurrence_end += step
+    return occurrences
+
+
+def _check_series_access(series: BookingSeries, current_user: User, action: str) -> None:
+    if series.broker_id != current_user.uuid and current_user.role != UserRole.MODERATOR:
+        raise HTTPException(status_code=403, detail=f"Недостаточно прав для {action} этой серии бронирований.")
+
+
+@log_calls
+async def create_booking_series(series_model: CreateBookingSeries, current_user: User) -> BookingSeries:
+    """
+    Создает серию бронирований.
+    Все занятия проверяются за один проход: доступность — по скомпилированному расписанию,
+    пересечения — по одной выборке существующих броней, уложенной в отсортированный индекс.
+    Проверки и сохранение занятий одним bulk_create вместе с серией идут в одной транзакции под блокировкой аудитории.
+    """
+    auditorium = await Auditorium.get_or_none(uuid=series_model.auditorium)
+    if not auditorium:
+        metrics.backend_bookings_creation_failures_total.labels(reason="not_found").inc()
+        raise HTTPException(status_code=404, detail=f"Аудитория с UUID {series_model.auditorium} не найдена.")
+
+    occurrences = expand_occurrences(
+        series_model.start_time,
+        series_model.end_time,
+        series_model.interval_weeks,
+        series_model.until,
+        series_model.exceptions
+    )
+    if not occurrences:
+        raise HTTPException(status_code=400, detail="Правило повторения не дает ни одного занятия.")
+
+    try:
+        # Расписание, брони и удержания читаются под блокировкой аудитории: между проверкой и вставкой
+        # никто не займет проверенные интервалы
+        async with auditorium_write_lock(auditorium.uuid):
+            schedule = await get_weekly_schedule(auditorium.uuid)
+            unavailable = [
+                occurrence_start.date().isoformat()
+                for occurrence_start, occurrence_end in occurrences
+                if describe_unavailability(schedule, occurrence_start, occurrence_end, auditorium.identifier)
+            ]
+            if unavailable:
+                metrics.backend_bookings_creation_failures_total.labels(reason="unavailable").inc()
+                raise HTTPException(
+                    status_code=400,
+                    detail=(f"Аудитория '{auditorium.identifier}' недоступна по расписанию в даты: {', '.join(unavailable)}. "
+                            f"Добавьте их в исключения или измените время серии.")
+                )
+
+            existing_index = BookingIntervalIndex()
+            window = dict(auditorium_id=auditorium.uuid, start_time__lt=occurrences[-1][1], end_time__gt=occurrences[0][0])
+            existing = await Booking.filter(**window).values('uuid', 'start_time', 'end_time')
+            held = await active_holds().filter(**window).values('uuid', 'start_time', 'end_time')
+            for row in existing + held:
+                existing_index.add(auditorium.uuid, row['uuid'], row['start_time'], row['end_time'])
+
+            conflicting = [
+                occurrence_start.date().isoformat()
+                for occurrence_start, occurrence_end in occurrences
+                if existing_index.find_overlaps(auditorium.uuid, occurrence_start, occurrence_end)
+            ]
+            if conflicting:
+                metrics.backend_bookings_creation_failures_total.labels(reason="overlap").inc()
+                raise HTTPException(
+                    status_code=409,
+                    detail=(f"Серия для аудитории '{auditorium.identifier}' конфликтует с существующими бронированиями "
+                            f"в даты: {', '.join(conflicting)}.")
+                )
+
+            series = BookingSeries(
+                auditorium=auditorium,
+                broker=current_user,
+                title=series_model.title,
+                start_time=series_model.start_time,
+                end_time=series_model.end_time,
+                interval_weeks=series_model.interval_weeks,
+                until=series_model.until,
+                exceptions=[exception.isoformat() for exception in series_model.exceptions]
+            )
+            bookings = [
+                Booking(
+                    auditorium=auditorium,
+                    broker=current_user,
+                    series_id=series.uuid,
+                    start_time=occurrence_start,
+                    end_time=occurrence_end,
+                    title=series_model.title
+                )
+                for occurrence_start, occurrence_end in occurrences
+            ]
+            await series.save()
+            await Booking.bulk_create(bookings)
+            await touch_booking_calendars([auditorium.uuid], [current_user.uuid])
+            await record_utilization(added=[(auditorium.uuid, start, end) for start, end in occurrences])
+    except IntegrityError as e:
+        reason = "overlap" if _is_overlap_violation(e) else "other"
+        metrics.backend_bookings_creation_failures_total.labels(reason=reason).inc()
+        raise HTTPException(status_code=409, detail=f"Ошибка целостности данных при создании серии: {e}")
+
+    for booking in bookings:
+        _index_booking(booking, auditorium.identifier)
+        publish_booking_event(BOOKING_CREATED, booking)
+    metrics.backend_bookings_created_total.inc(len(bookings))
+
+    series.occurrences_list = bookings
+    return series
+
+
+@log_calls
+async def get_booking_series(series_uuid: UUID4, current_user: User) -> Optional[BookingSeries]:
+    series = await BookingSeries.get_or_none(uuid=series_uuid)
+    if not series:
+        return None
+    _check_series_access(series, current_user, "просмотра")
+    series.occurrences_list = await Booking.filter(series_id=series.uuid).order_by('start_time')
+    return series
+
+
+@log_calls
+async def update_booking_series(
+    series_uuid: UUID4,
+    series_update_data: UpdateBookingSeries,
+    current_user: User
+) -> BookingSeries:
+    """ Обновляет серию и все ее занятия одним UPDATE """
+    series = await BookingSeries.get_or_none(uuid=series_uuid)
+    if not series:
+        raise HTTPException(status_code=404, detail="Серия бронирований не найдена")
+    _check_series_access(series, current_user, "изменения")
+
+    update_data = series_update_data.model_dump(exclude_unset=True)
+    if update_data:
+        async with in_transaction():
+            await series.update_from_dict(update_data).save()
+            updated = await Booking.filter(series_id=series.uuid).update(**update_data, version=F("version") + 1)
+            await touch_booking_calendars([series.auditorium_id], [series.broker_id])
+        metrics.backend_bookings_updated_total.inc(updated)
+
+    series.occurrences_list = await Booking.filter(series_id=series.uuid).order_by('start_time')
+    if update_data:
+        for booking in series.occurrences_list:
+            publish_booking_event(BOOKING_UPDATED, booking)
+    return series
+
+
+@log_calls
+async def cancel_booking_series(
+    series_uuid: UUID4,
+    current_user: User,
+    from_date: Optional[date] = None
+) -> bool:
+    """
+    Отменяет серию одним DELETE: целиком (занятия удаляются каскадно)
+    или только занятия начиная с from_date.
+    Занятия читаются под блокировкой аудитории, поэтому утилизация, лист ожидания и индекс
+    получают именно удаленные строки, а не состояние до параллельного изменения.
+    """
+    series = await BookingSeries.get_or_none(uuid=series_uuid)
+    if not series:
+        return False
+    _check_series_access(series, current_user, "отмены")
+
+    occurrences = Booking.filter(series_id=series.uuid)
+    if from_date is not None:
+        occurrences = occurrences.filter(start_time__gte=datetime.combine(from_date, time.min))
+
+    async with auditorium_write_lock(series.auditorium_id):
+        cancelled = await occurrences.values('uuid', 'start_time', 'end_time')
+        if from_date is None:
+            await series.delete()
+        else:
+            await Booking.filter(uuid__in=[row['uuid'] for row in cancelled]).delete()
+            series.until = min(series.until, from_date - timedelta(days=1))
+            await series.save(update_fields=['until', 'updated_at'])
+        await touch_booking_calendars([series.auditorium_id], [series.broker_id])
+        await record_utilization(
+            removed=[(series.auditorium_id, row['start_time'], row['end_time']) for row in cancelled]
+        )
+        promoted = []
+        if cancelled:
+            promoted = await promote_waitlist(
+                series.auditorium_id,
+                min(row['start_time'] for row in cancelled),
+                max(row['end_time'] for row in cancelled)
+            )
+
+    for row in cancelled:
+        _unindex_booking(row['uuid'])
+        publish_booking_deleted(series.auditorium_id, row['uuid'])
+    _index_promoted(promoted)
+    metrics.backend_bookings_cancelled_total.inc(len(cancelled))
+    return True
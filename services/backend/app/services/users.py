@@ -1,3 +1,5 @@
+import secrets
+
 from fastapi import HTTPException, Depends
 from pydantic import UUID4
 from tortoise.exceptions import IntegrityError
@@ -6,7 +8,7 @@ from app.schemas import UserCreate, UserChangePasswordIn, UserGrantPrivileges, U
 from app.models import User
 from app.enums import UserRole
 from app.utils import password
-from app.utils.contrib import get_current_user
+from app.utils.contrib import feed_token_hash, get_current_user_record, invalidate_cached_user
 from app.logger import log_calls
 
 from app import metrics
@@ -40,10 +42,10 @@ async def create_user(user: UserCreate):
 @log_calls
 async def change_password(
     change_password_in: UserChangePasswordIn, 
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_record)
 ):
-    verified, updated_password_hash = password.verify_and_update_password(change_password_in.current_password, 
-                                                                          current_user.password_hash)
+    verified, updated_password_hash = await password.verify_and_update_password_async(change_password_in.current_password, 
+                                                                                      current_user.password_hash)
     if not verified:
         metrics.backend_user_password_changes_total.labels(status="failure").inc()
         raise HTTPException(
@@ -51,11 +53,12 @@ async def change_password(
             detail="Entered current password is incorrect"
         )
 
-    current_user.password_hash = password.get_password_hash(change_password_in.new_password)
+    current_user.password_hash = await password.get_password_hash_async(change_password_in.new_password)
 
     metrics.backend_user_password_changes_total.labels(status="success").inc()
 
-    await current_user.save()
+    await current_user.save(update_fields=['password_hash'])
+    invalidate_cached_user(current_user.uuid)
 
 
 @log_calls
@@ -79,6 +82,7 @@ async def grant_user(user_uuid: UUID4, user_grant: UserGrantPrivileges):
     user.role = target_role
     try:
         await user.save(update_fields=['role'])
+        invalidate_cached_user(user.uuid)
         metrics.backend_user_role_changes_total.labels(target_role=target_role.value).inc()
     except Exception as e:
          print(f"Error saving new role for user {user.username}: {e}")
@@ -102,6 +106,7 @@ async def update_profile(current_user: User, profile_data: UserUpdateProfile) ->
 
     try:
         await current_user.save(update_fields=list(update_data.keys()))
+        invalidate_cached_user(current_user.uuid)
         print(f"Профиль пользователя {current_user.username} обновлен: {update_data}")
     except IntegrityError as e:
         print(f"Ошибка целостности при обновлении профиля {current_user.username}: {e}")
@@ -110,4 +115,21 @@ async def update_profile(current_user: User, profile_data: UserUpdateProfile) ->
         print(f"Неожиданная ошибка при обновлении профиля {current_user.username}: {e}")
         raise HTTPException(status_code=500, detail="Не удалось обновить профиль.")
 
-    return current_user
\ No newline at end of file
+    return current_user
+
+
+@log_calls
+async def rotate_feed_token(current_user: User) -> str:
+    """
+    Выпускает новый секрет календарной ленты; предыдущий сразу перестает действовать.
+    В БД хранится только sha256 секрета, сам секрет возвращается один раз.
+    """
+    token = secrets.token_urlsafe(32)
+    await User.filter(uuid=current_user.uuid).update(feed_token_hash=feed_token_hash(token))
+    return token
+
+
+@log_calls
+async def revoke_feed_token(current_user: User) -> None:
+    """ Отзывает секрет календарной ленты: подписки по старому URL получают 403 """
+    await User.filter(uuid=current_user.uuid).update(feed_token_hash=None)
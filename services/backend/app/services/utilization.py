@@ -0,0 +1,191 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException
+from tortoise.expressions import F
+from pydantic import UUID4
+
+from app.models import Auditorium, Booking, BookingArchive, DailyUtilization
+from app.logger import log_calls
+from app.services.availability import get_weekly_schedules
+from app.utils.booking_index import normalize_dt
+from app.utils.locks import auditorium_write_lock
+from app.utils.pagination import after_keyset
+from app.utils.replicas import read_only
+
+from app import metrics, settings
+
+# Интервал брони: (UUID аудитории, начало, конец)
+BookingInterval = Tuple[UUID4, datetime, datetime]
+
+
+def split_by_day(start: datetime, end: datetime) -> Dict[date, int]:
+    """ Раскладывает интервал по UTC-суткам: {день: секунд брони в этот день} """
+    start, end = normalize_dt(start), normalize_dt(end)
+    days = {}
+    day = start.date()
+    while datetime.combine(day, datetime.min.time()) < end:
+        day_start = datetime.combine(day, datetime.min.time())
+        seconds = int((min(end, day_start + timedelta(days=1)) - max(start, day_start)).total_seconds())
+        if seconds > 0:
+            days[day] = seconds
+        day += timedelta(days=1)
+    return days
+
+
+def utilization_deltas(
+    added: Iterable[BookingInterval] = (),
+    removed: Iterable[BookingInterval] = ()
+) -> Dict[Tuple[UUID4, date], List[int]]:
+    """ Изменения строк сводки {(аудитория, день): [секунды, брони]}; взаимно гасящиеся изменения отбрасываются """
+    deltas = defaultdict(lambda: [0, 0])
+    for sign, intervals in ((1, added), (-1, removed)):
+        for auditorium_uuid, start, end in intervals:
+            for day, seconds in split_by_day(start, end).items():
+                delta = deltas[(auditorium_uuid, day)]
+                delta[0] += sign * seconds
+                delta[1] += sign
+    return {key: delta for key, delta in deltas.items() if delta != [0, 0]}
+
+
+async def record_utilization(
+    added: Iterable[BookingInterval] = (),
+    removed: Iterable[BookingInterval] = ()
+) -> None:
+    """
+    Применяет изменения броней к сводке daily_utilization.
+    Вызывается в транзакции записи брони под auditorium_write_lock, поэтому строки одной аудитории
+    не изменяются параллельно: существующие строки увеличиваются через F-выражения, новые создаются одним bulk_create.
+    Уменьшение отсутствующей строки пропускается (бронь старше сводки — ее учтет rebuild_utilization).
+    """
+    deltas = utilization_deltas(added, removed)
+    if not deltas:
+        return
+
+    existing = set(await DailyUtilization.filter(
+        auditorium_id__in={auditorium_uuid for auditorium_uuid, _ in deltas},
+        day__in={day for _, day in deltas}
+    ).values_list('auditorium_id', 'day'))
+
+    new_rows = []
+    for (auditorium_uuid, day), (seconds, count) in deltas.items():
+        if (auditorium_uuid, day) in existing:
+            await DailyUtilization.filter(auditorium_id=auditorium_uuid, day=day).update(
+                booked_seconds=F('booked_seconds') + seconds, bookings_count=F('bookings_count') + count
+            )
+        elif seconds > 0:
+            new_rows.append(DailyUtilization(auditorium_id=auditorium_uuid, day=day, booked_seconds=seconds, bookings_count=count))
+    if new_rows:
+        await DailyUtilization.bulk_create(new_rows)
+
+
+@log_calls
+async def rebuild_utilization() -> int:
+    """
+    Пересчитывает сводку целиком по бронированиям и их архиву (первичное заполнение и восстановление).
+    Брони читаются порциями keyset-запросами; на время пересчета берутся блокировки записи всех аудиторий.
+    Возвращает количество строк сводки.
+    """
+    auditorium_uuids = await Auditorium.all().values_list('uuid', flat=True)
+    chunk_size = settings.BOOKING_EXPORT_CHUNK_SIZE
+    async with auditorium_write_lock(*auditorium_uuids):
+        await DailyUtilization.all().delete()
+
+        totals = defaultdict(lambda: [0, 0])
+        for query in (Booking.all(), BookingArchive.filter(auditorium_id__in=auditorium_uuids)):
+            chunk_query = query
+            while True:
+                rows = await chunk_query.order_by('start_time', 'uuid').limit(chunk_size).values(
+                    'uuid', 'auditorium_id', 'start_time', 'end_time'
+                )
+                for key, (seconds, count) in utilization_deltas(
+                    (row['auditorium_id'], row['start_time'], row['end_time']) for row in rows
+                ).items():
+                    totals[key][0] += seconds
+                    totals[key][1] += count
+                if len(rows) < chunk_size:
+                    break
+                chunk_query = after_keyset(query, rows[-1]['start_time'], rows[-1]['uuid'])
+
+        await DailyUtilization.bulk_create([
+            DailyUtilization(auditorium_id=auditorium_uuid, day=day, booked_seconds=seconds, bookings_count=count)
+            for (auditorium_uuid, day), (seconds, count) in totals.items()
+        ], batch_size=chunk_size)
+    return len(totals)
+
+
+def _hours(seconds: float) -> float:
+    return round(seconds / 3600, 2)
+
+
+def _ratio(booked: float, available: float) -> Optional[float]:
+    return round(booked / available, 4) if available else None
+
+
+@log_calls
+@read_only
+async def get_utilization(
+    start_date: date,
+    end_date: date,
+    auditorium_uuids: Optional[List[UUID4]] = None
+) -> List[dict]:
+    """
+    Отчет о загрузке аудиторий по дням: забронированные часы из сводки daily_utilization,
+    доступные часы — из скомпилированных недельных расписаний. Таблица бронирований не читается.
+    """
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="Дата начала не может быть позже даты окончания.")
+    days_count = (end_date - start_date).days + 1
+    if days_count > settings.UTILIZATION_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"Слишком длинный диапазон: максимум {settings.UTILIZATION_MAX_DAYS} дней.")
+
+    query = Auditorium.all()
+    if auditorium_uuids:
+        query = query.filter(uuid__in=set(auditorium_uuids))
+    auditoriums = await query.order_by('identifier').values('uuid', 'identifier')
+    if not auditoriums:
+        return []
+
+    auditorium_ids = [auditorium['uuid'] for auditorium in auditoriums]
+    rollup = {
+        (row['auditorium_id'], row['day']): row
+        for row in await DailyUtilization.filter(
+            auditorium_id__in=auditorium_ids, day__gte=start_date, day__lte=end_date
+        ).values('auditorium_id', 'day', 'booked_seconds', 'bookings_count')
+    }
+    schedules = await get_weekly_schedules(auditorium_ids)
+    days = [start_date + timedelta(days=offset) for offset in range(days_count)]
+
+    report = []
+    for auditorium in auditoriums:
+        schedule = schedules[auditorium['uuid']]
+        available_by_weekday = [schedule.day_seconds(day_of_week) for day_of_week in range(7)]
+        entries = []
+        booked_total = available_total = 0
+        for day in days:
+            row = rollup.get((auditorium['uuid'], day))
+            booked = row['booked_seconds'] if row else 0
+            available = available_by_weekday[day.weekday()]
+            if not booked and not available:
+                continue
+            booked_total += booked
+            available_total += available
+            entries.append({
+                "day": day,
+                "booked_hours": _hours(booked),
+                "available_hours": _hours(available),
+                "utilization": _ratio(booked, available),
+                "bookings_count": row['bookings_count'] if row else 0
+            })
+        report.append({
+            "auditorium": auditorium['uuid'],
+            "identifier": auditorium['identifier'],
+            "booked_hours": _hours(booked_total),
+            "available_hours": _hours(available_total),
+            "utilization": _ratio(booked_total, available_total),
+            "days": entries
+        })
+
+    metrics.backend_utilization_reports_total.inc()
+    return report
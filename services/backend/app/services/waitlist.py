@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+from typing import List
+
+from fastapi import HTTPException
+from tortoise.expressions import Q
+from pydantic import UUID4
+
+from app.schemas import CreateBooking
+from app.models import Auditorium, Booking, User, WaitlistEntry
+from app.enums import UserRole
+from app.logger import log_calls
+from app.services.booking import active_holds, check_auditorium_availability
+
+from app import metrics, settings
+
+
+def _overlapping(query, auditorium_uuid: UUID4, start: datetime, end: datetime):
+    return query.filter(auditorium_id=auditorium_uuid, start_time__lt=end, end_time__gt=start)
+
+
+@log_calls
+async def join_waitlist(entry_model: CreateBooking, current_user: User) -> WaitlistEntry:
+    """
+    Ставит пользователя в очередь на занятый интервал аудитории.
+    Когда интервал освобождается (удаление, перенос брони, отмена серии, снятие или истечение удержания),
+    бронь создается автоматически
+    в той же транзакции — опрашивать сервис повторными попытками не нужно.
+    """
+    auditorium = await Auditorium.get_or_none(uuid=entry_model.auditorium)
+    if not auditorium:
+        raise HTTPException(status_code=404, detail=f"Аудитория с UUID {entry_model.auditorium} не найдена.")
+    await check_auditorium_availability(
+        auditorium_uuid=auditorium.uuid, start_dt=entry_model.start_time, end_dt=entry_model.end_time
+    )
+
+    start, end = entry_model.start_time, entry_model.end_time
+    contested = (await _overlapping(Booking.all(), auditorium.uuid, start, end).exists()
+                 or await _overlapping(active_holds(), auditorium.uuid, start, end).exists())
+    if not contested:
+        raise HTTPException(status_code=400, detail="Интервал свободен — создайте бронирование вместо заявки в лист ожидания.")
+
+    own_entries = WaitlistEntry.filter(broker_id=current_user.uuid)
+    if await own_entries.filter(auditorium_id=auditorium.uuid, start_time=start, end_time=end).exists():
+        raise HTTPException(status_code=409, detail="Вы уже стоите в листе ожидания на этот интервал.")
+    if await own_entries.filter(end_time__gt=datetime.now(timezone.utc)).count() >= settings.WAITLIST_ENTRIES_PER_USER:
+        raise HTTPException(
+            status_code=429,
+            detail=f"Слишком много заявок в листе ожидания: максимум {settings.WAITLIST_ENTRIES_PER_USER}."
+        )
+
+    entry = WaitlistEntry(auditorium=auditorium, broker=current_user, start_time=start, end_time=end, title=entry_model.title)
+    await entry.save()
+    entry.position = await _overlapping(WaitlistEntry.all(), auditorium.uuid, start, end).filter(
+        created_at__lte=entry.created_at
+    ).count()
+    metrics.backend_waitlist_entries_total.labels(outcome="joined").inc()
+    return entry
+
+
+@log_calls
+async def get_my_waitlist(current_user: User) -> List[WaitlistEntry]:
+    """
+    Действующие заявки пользователя с местом в очереди.
+    Все заявки, стоящие впереди хотя бы одной из заявок пользователя, читаются одним запросом (OR условий по заявкам),
+    места считаются в памяти — число запросов не зависит от числа заявок.
+    """
+    entries = await WaitlistEntry.filter(
+        broker_id=current_user.uuid, end_time__gt=datetime.now(timezone.utc)
+    ).order_by('start_time')
+    if not entries:
+        return entries
+
+    ahead = await WaitlistEntry.filter(Q(*[
+        Q(auditorium_id=entry.auditorium_id, start_time__lt=entry.end_time, end_time__gt=entry.start_time,
+          created_at__lte=entry.created_at)
+        for entry in entries
+    ], join_type=Q.OR)).values_list('auditorium_id', 'start_time', 'end_time', 'created_at')
+    for entry in entries:
+        entry.position = sum(
+            auditorium_uuid == entry.auditorium_id and start < entry.end_time and end > entry.start_time
+            and created_at <= entry.created_at
+            for auditorium_uuid, start, end, created_at in ahead
+        )
+    return entries
+
+
+@log_calls
+async def leave_waitlist(entry_uuid: UUID4, current_user: User) -> bool:
+    entry = await WaitlistEntry.get_or_none(uuid=entry_uuid)
+    if not entry:
+        return False
+    if entry.broker_id != current_user.uuid and current_user.role != UserRole.MODERATOR:
+        raise HTTPException(status_code=403, detail="Недостаточно прав для удаления этой заявки.")
+    await entry.delete()
+    metrics.backend_waitlist_entries_total.labels(outcome="left").inc()
+    return True
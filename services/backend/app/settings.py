@@ -12,9 +12,28 @@ DB_NAME = os.getenv("DB_NAME")
 
 DB_URL = f"postgres://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
+# Реплики только для чтения: строки подключения через запятую (пусто — все запросы идут в основную БД)
+DB_REPLICA_URLS = [url.strip() for url in os.getenv("DB_REPLICA_URLS", default="").split(",") if url.strip()]
+DB_REPLICAS = [f"replica_{index}" for index in range(len(DB_REPLICA_URLS))]
+# Окно read-your-writes: столько секунд после своей записи пользователь читает из основной БД
+# (между воркерами — по cookie, которую ставит ответ на пишущий запрос)
+DB_REPLICA_STICKY_SECONDS = float(os.getenv("DB_REPLICA_STICKY_SECONDS", default=5))
+
 DB_CONNECTIONS = {
         "default": DB_URL,
+        **dict(zip(DB_REPLICAS, DB_REPLICA_URLS)),
     }
+# Пул соединений asyncpg (на каждое подключение): размеры, ожидание свободного соединения (с),
+# время жизни простаивающего соединения (с) и размер кэша подготовленных выражений на соединение
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", default=1))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", default=10))
+DB_POOL_ACQUIRE_TIMEOUT = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT", default=5))
+DB_POOL_MAX_INACTIVE_LIFETIME = float(os.getenv("DB_POOL_MAX_INACTIVE_LIFETIME", default=300))
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", default=100))
+# Пул для bcrypt: thread или process, число одновременных хэширований и максимум ожидающих своей очереди
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", default="thread")
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", default=2))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", default=100))
 
 SECRET_KEY = os.getenv("SECRET_KEY", default="".join([random.choice(string.ascii_letters) for _ in range(32)]))
 CLIENT_ID = os.getenv("CLIENT_ID", default="".join([random.choice(string.ascii_letters) for _ in range(32)]))
@@ -23,6 +42,7 @@ CORS_ORIGINS = ["*"]
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOW_METHODS = ["*"]
 CORS_ALLOW_HEADERS = ["*"]
+CORS_EXPOSE_HEADERS = ["ETag", "Last-Modified", "X-Next-Cursor"]
 
 DEFAULT_MODERATOR_USERNAME = os.getenv("DEFAULT_MODERATOR_USERNAME", default="moderator")
 DEFAULT_MODERATOR_EMAIL = os.getenv("DEFAULT_MODERATOR_EMAIL", default="moderator@example.com")
@@ -30,4 +50,74 @@ DEFAULT_MODERATOR_PASSWORD = os.getenv("DEFAULT_MODERATOR_PASSWORD", default="pa
 
 LOGIN_URL = f"http://0.0.0.0:8080/login/access-token"
 
-MODE = os.getenv("MODE", default="DEBUG")
\ No newline at end of file
+# Кэш аутентификации в воркере: разобранные токены и личность/роль пользователей (TTL в секундах); размер 0 отключает кэш
+AUTH_TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", default=10000))
+AUTH_USER_CACHE_SIZE = int(os.getenv("AUTH_USER_CACHE_SIZE", default=10000))
+AUTH_USER_CACHE_TTL = float(os.getenv("AUTH_USER_CACHE_TTL", default=30))
+# Брать роль и имя пользователя из claims access-токена без обращения к БД (смена роли действует с новым токеном)
+JWT_TRUST_IDENTITY_CLAIMS = os.getenv("JWT_TRUST_IDENTITY_CLAIMS", default="false").lower() == "true"
+# Отзыв токенов: период дочитывания revoked_tokens (с) и запас на незафиксированные записи (с), период полной перестройки
+# фильтра (с), отставание, после которого токены проверяются по БД (с), начальная емкость и доля ложных срабатываний фильтра
+TOKEN_REVOCATION_REFRESH_SECONDS = float(os.getenv("TOKEN_REVOCATION_REFRESH_SECONDS", default=5))
+TOKEN_REVOCATION_OVERLAP_SECONDS = float(os.getenv("TOKEN_REVOCATION_OVERLAP_SECONDS", default=60))
+TOKEN_REVOCATION_REBUILD_SECONDS = float(os.getenv("TOKEN_REVOCATION_REBUILD_SECONDS", default=3600))
+TOKEN_REVOCATION_MAX_STALENESS_SECONDS = float(os.getenv("TOKEN_REVOCATION_MAX_STALENESS_SECONDS", default=60))
+TOKEN_REVOCATION_FILTER_CAPACITY = int(os.getenv("TOKEN_REVOCATION_FILTER_CAPACITY", default=10000))
+TOKEN_REVOCATION_FILTER_ERROR_RATE = float(os.getenv("TOKEN_REVOCATION_FILTER_ERROR_RATE", default=0.001))
+
+MODE = os.getenv("MODE", default="DEBUG")
+
+# In-process индекс бронирований для быстрой проверки пересечений.
+# Индекс локален для воркера и служит подсказкой: найденный им конфликт подтверждается запросом к БД.
+BOOKING_INDEX_ENABLED = os.getenv("BOOKING_INDEX_ENABLED", default="false").lower() == "true"
+BOOKING_OVERLAP_REPORT_LIMIT = int(os.getenv("BOOKING_OVERLAP_REPORT_LIMIT", default=5))
+
+# Запись броней сериализуется по аудитории: asyncio-блокировка в воркере + pg_advisory_xact_lock между воркерами.
+BOOKING_WRITE_LOCKS_ENABLED = os.getenv("BOOKING_WRITE_LOCKS_ENABLED", default="true").lower() == "true"
+
+# Скомпилированные недельные расписания доступности аудиторий (LRU в памяти воркера).
+# Ключ включает availability_version аудитории, поэтому изменение слотов видно всем воркерам сразу; TTL лишь освобождает память
+AVAILABILITY_SCHEDULE_CACHE_SIZE = int(os.getenv("AVAILABILITY_SCHEDULE_CACHE_SIZE", default=1024))
+AVAILABILITY_SCHEDULE_CACHE_TTL = float(os.getenv("AVAILABILITY_SCHEDULE_CACHE_TTL", default=60))
+
+# Keyset-пагинация списков бронирований
+BOOKING_PAGE_SIZE = int(os.getenv("BOOKING_PAGE_SIZE", default=100))
+BOOKING_PAGE_SIZE_MAX = int(os.getenv("BOOKING_PAGE_SIZE_MAX", default=500))
+# Потоковая выгрузка читает брони порциями такого размера
+BOOKING_EXPORT_CHUNK_SIZE = int(os.getenv("BOOKING_EXPORT_CHUNK_SIZE", default=1000))
+
+# Кэш сериализованных ответов календаря аудитории (записей на воркер)
+CALENDAR_CACHE_SIZE = int(os.getenv("CALENDAR_CACHE_SIZE", default=512))
+# Временные удержания слотов перед подтверждением брони: срок по умолчанию, максимальный срок
+# и число одновременно действующих удержаний у одного пользователя
+BOOKING_HOLD_TTL_MINUTES = int(os.getenv("BOOKING_HOLD_TTL_MINUTES", default=10))
+BOOKING_HOLD_MAX_TTL_MINUTES = int(os.getenv("BOOKING_HOLD_MAX_TTL_MINUTES", default=30))
+BOOKING_HOLDS_PER_USER = int(os.getenv("BOOKING_HOLDS_PER_USER", default=5))
+# Лист ожидания: заявок у одного пользователя и кандидатов, рассматриваемых при освобождении интервала
+WAITLIST_ENTRIES_PER_USER = int(os.getenv("WAITLIST_ENTRIES_PER_USER", default=10))
+WAITLIST_PROMOTION_CANDIDATES = int(os.getenv("WAITLIST_PROMOTION_CANDIDATES", default=20))
+# Архивация: брони, закончившиеся раньше чем N дней назад, переносятся в bookings_archive порциями
+BOOKING_ARCHIVE_AFTER_DAYS = int(os.getenv("BOOKING_ARCHIVE_AFTER_DAYS", default=365))
+BOOKING_ARCHIVE_CHUNK_SIZE = int(os.getenv("BOOKING_ARCHIVE_CHUNK_SIZE", default=1000))
+# Live-обновления календаря (SSE): очередь кадров подписчика, лимит подписчиков на воркер, keepalive и retry клиента
+CALENDAR_EVENTS_QUEUE_SIZE = int(os.getenv("CALENDAR_EVENTS_QUEUE_SIZE", default=100))
+CALENDAR_EVENTS_MAX_SUBSCRIBERS = int(os.getenv("CALENDAR_EVENTS_MAX_SUBSCRIBERS", default=2000))
+CALENDAR_EVENTS_KEEPALIVE_SECONDS = float(os.getenv("CALENDAR_EVENTS_KEEPALIVE_SECONDS", default=15))
+CALENDAR_EVENTS_RETRY_MS = int(os.getenv("CALENDAR_EVENTS_RETRY_MS", default=3000))
+# Максимальная длина диапазона отчета о загрузке аудиторий (в днях)
+UTILIZATION_MAX_DAYS = int(os.getenv("UTILIZATION_MAX_DAYS", default=366))
+# Максимум ячеек матрицы занятости на одну аудиторию (неделя по 5 минут)
+FREEBUSY_MAX_BUCKETS = int(os.getenv("FREEBUSY_MAX_BUCKETS", default=2016))
+# Максимум аудиторий в одном запросе календаря нескольких аудиторий
+CALENDAR_MAX_AUDITORIUMS = int(os.getenv("CALENDAR_MAX_AUDITORIUMS", default=100))
+
+# Окно ICS-лент: сколько дней назад и вперед от текущей даты попадает в ленту
+ICS_FEED_PAST_DAYS = int(os.getenv("ICS_FEED_PAST_DAYS", default=30))
+ICS_FEED_FUTURE_DAYS = int(os.getenv("ICS_FEED_FUTURE_DAYS", default=180))
+
+BOOKING_BATCH_MAX_SIZE = int(os.getenv("BOOKING_BATCH_MAX_SIZE", default=500))
+BOOKING_SERIES_MAX_OCCURRENCES = int(os.getenv("BOOKING_SERIES_MAX_OCCURRENCES", default=200))
+
+# Пересечения броней отсекает ограничение bookings_no_overlap (миграция booking_exclusion, только Postgres).
+# При включенном флаге бронь вставляется сразу, а нарушение ограничения превращается в 409.
+BOOKING_EXCLUSION_CONSTRAINT = os.getenv("BOOKING_EXCLUSION_CONSTRAINT", default="true").lower() == "true"
@@ -0,0 +1,38 @@
+import hashlib
+import math
+from typing import Iterator
+
+
+class BloomFilter:
+    """
+    Компактное множество строк с вероятностной проверкой принадлежности.
+    Ответ "нет" точен, ответ "да" ложен с вероятностью около error_rate, пока добавлено не больше capacity ключей.
+    Позиции битов считаются двойным хэшированием одного blake2b-дайджеста.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = max(capacity, 1)
+        self._size = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / self.capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first, step = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * step) % self._size for i in range(self._hashes))
+
+    def add(self, key: str) -> bool:
+        """ Добавляет ключ; возвращает False, если он (возможно) уже был в фильтре """
+        if key in self:
+            return False
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
@@ -0,0 +1,116 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from uuid import UUID
+
+
+def normalize_dt(value: datetime) -> datetime:
+    """ Приводит datetime к наивному UTC, чтобы aware и naive значения были сравнимы """
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+@dataclass(frozen=True, order=True)
+class IndexedBooking:
+    start_time: datetime
+    end_time: datetime
+    uuid: UUID
+
+
+class AuditoriumIntervals:
+    """
+    Бронирования одной аудитории, отсортированные по времени начала.
+    max_duration позволяет ограничить бинарный поиск слева: бронь, начавшаяся
+    раньше чем start - max_duration, гарантированно закончилась до start.
+    """
+    __slots__ = ("starts", "items", "max_duration")
+
+    def __init__(self):
+        self.starts: List[datetime] = []
+        self.items: List[IndexedBooking] = []
+        self.max_duration = timedelta(0)
+
+    def add(self, item: IndexedBooking) -> None:
+        position = bisect_left(self.items, item)
+        self.items.insert(position, item)
+        self.starts.insert(position, item.start_time)
+        self.max_duration = max(self.max_duration, item.end_time - item.start_time)
+
+    def remove(self, item: IndexedBooking) -> None:
+        position = bisect_left(self.items, item)
+        if position < len(self.items) and self.items[position] == item:
+            del self.items[position]
+            del self.starts[position]
+
+    def overlaps(self, start: datetime, end: datetime) -> List[IndexedBooking]:
+        lo = bisect_left(self.starts, start - self.max_duration)
+        hi = bisect_left(self.starts, end)
+        return [item for item in self.items[lo:hi] if item.end_time > start]
+
+
+class BookingIntervalIndex:
+    """
+    In-process индекс бронирований по аудиториям для быстрой проверки пересечений.
+    Индекс не является источником истины: он отсекает заведомо конфликтующие
+    запросы до похода в БД, а финальную проверку по-прежнему выполняет БД.
+    """
+
+    def __init__(self):
+        self._auditoriums: Dict[UUID, AuditoriumIntervals] = {}
+        self._bookings: Dict[UUID, tuple] = {}
+        self._identifiers: Dict[UUID, str] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._bookings)
+
+    def clear(self) -> None:
+        self._auditoriums.clear()
+        self._bookings.clear()
+        self._identifiers.clear()
+        self.loaded = False
+
+    def identifier(self, auditorium_uuid: UUID) -> Optional[str]:
+        return self._identifiers.get(auditorium_uuid)
+
+    def add(
+        self,
+        auditorium_uuid: UUID,
+        booking_uuid: UUID,
+        start: datetime,
+        end: datetime,
+        identifier: Optional[str] = None
+    ) -> None:
+        self.remove(booking_uuid)
+        item = IndexedBooking(normalize_dt(start), normalize_dt(end), booking_uuid)
+        self._auditoriums.setdefault(auditorium_uuid, AuditoriumIntervals()).add(item)
+        self._bookings[booking_uuid] = (auditorium_uuid, item)
+        if identifier is not None:
+            self._identifiers[auditorium_uuid] = identifier
+
+    def remove(self, booking_uuid: UUID) -> None:
+        entry = self._bookings.pop(booking_uuid, None)
+        if entry is None:
+            return
+        auditorium_uuid, item = entry
+        self._auditoriums[auditorium_uuid].remove(item)
+
+    def find_overlaps(
+        self,
+        auditorium_uuid: UUID,
+        start: datetime,
+        end: datetime,
+        exclude_booking_uuid: Optional[UUID] = None
+    ) -> List[IndexedBooking]:
+        intervals = self._auditoriums.get(auditorium_uuid)
+        if intervals is None:
+            return []
+        conflicts = intervals.overlaps(normalize_dt(start), normalize_dt(end))
+        if exclude_booking_uuid is not None:
+            conflicts = [item for item in conflicts if item.uuid != exclude_booking_uuid]
+        return conflicts
+
+
+booking_index = BookingIntervalIndex()
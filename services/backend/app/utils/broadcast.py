@@ -0,0 +1,73 @@
+import asyncio
+from typing import Dict, Hashable, Optional, Set
+
+
+class Subscription:
+    """ Очередь готовых кадров одного подписчика; None в очереди означает, что хаб отключил подписчика """
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def close(self) -> None:
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class BroadcastHub:
+    """
+    In-process рассылка событий подписчикам по ключу (одна на воркер).
+    Событие сериализуется один раз, готовый кадр кладется в очереди всех подписчиков ключа без ожидания.
+    Подписчик с переполненной очередью (медленный клиент) отключается, чтобы не задерживать остальных
+    и не копить память; клиент переподключается и перечитывает состояние.
+    """
+
+    def __init__(self, queue_size: int, max_subscribers: int):
+        self._queue_size = queue_size
+        self._max_subscribers = max_subscribers
+        self._subscribers: Dict[Hashable, Set[Subscription]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def subscribers(self, key: Hashable) -> int:
+        return len(self._subscribers.get(key, ()))
+
+    def subscribe(self, key: Hashable) -> Optional[Subscription]:
+        """ Возвращает новую подписку или None, если достигнут лимит подписчиков воркера """
+        if self._count >= self._max_subscribers:
+            return None
+        subscription = Subscription(self._queue_size)
+        self._subscribers.setdefault(key, set()).add(subscription)
+        self._count += 1
+        return subscription
+
+    def unsubscribe(self, key: Hashable, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(key)
+        if not subscribers or subscription not in subscribers:
+            return
+        subscribers.discard(subscription)
+        self._count -= 1
+        if not subscribers:
+            del self._subscribers[key]
+
+    def publish(self, key: Hashable, frame: str) -> int:
+        """ Раздает кадр подписчикам ключа; возвращает число отключенных из-за переполнения """
+        dropped = 0
+        for subscription in list(self._subscribers.get(key, ())):
+            try:
+                subscription.queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self.unsubscribe(key, subscription)
+                subscription.close()
+                dropped += 1
+        return dropped
+
+    def close(self) -> None:
+        """ Отключает всех подписчиков (при остановке сервиса) """
+        for subscribers in self._subscribers.values():
+            for subscription in subscribers:
+                subscription.close()
+        self._subscribers.clear()
+        self._count = 0
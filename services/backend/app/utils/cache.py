@@ -0,0 +1,45 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Ограниченный по размеру LRU-кэш с опциональным TTL записей.
+    Кэш локален для процесса, TTL ограничивает устаревание данных между воркерами.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    Проверка условного GET: If-None-Match имеет приоритет над If-Modified-Since (RFC 9110).
+    Сравнение If-None-Match слабое, время сравнивается с точностью до секунды.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or etag.removeprefix("W/") in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return _as_utc(last_modified).replace(microsecond=0) <= since
@@ -1,30 +1,110 @@
+import hashlib
+import math
+import time
 from typing import Optional
 
 import jwt
-from fastapi import HTTPException, Security
+from fastapi import HTTPException, Query, Security
 from fastapi.security import OAuth2PasswordBearer
+from pydantic import UUID4
 
 from app.models import User
 from app.enums import UserRole
 from app.schemas import JWTTokenPayload
-from app import settings
+from app.utils.cache import LRUCache
+from app.utils.replicas import bind_request_user
+from app.utils.revocation import revoked_tokens
+from app import metrics, settings
 
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=settings.LOGIN_URL,
 )
+optional_oauth2 = OAuth2PasswordBearer(
+    tokenUrl=settings.LOGIN_URL,
+    auto_error=False
+)
 
-async def get_current_user(token: str = Security(reusable_oauth2)) -> Optional[User]:
+# Поля пользователя, которых достаточно для авторизации запроса: личность и роль
+CACHED_USER_FIELDS = ('uuid', 'username', 'email', 'role')
+
+# Разобранные токены по sha256 токена (живут до exp) и пользователи по UUID; свои у каждого воркера
+token_cache = LRUCache(maxsize=settings.AUTH_TOKEN_CACHE_SIZE)
+user_cache = LRUCache(maxsize=settings.AUTH_USER_CACHE_SIZE, ttl=settings.AUTH_USER_CACHE_TTL)
+
+
+def invalidate_cached_user(user_uuid: UUID4) -> None:
+    """ Сбрасывает пользователя из кэша текущего воркера; в остальных запись устареет за AUTH_USER_CACHE_TTL """
+    user_cache.pop(user_uuid)
+
+
+def feed_token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _request_user(fields: dict) -> User:
+    # Каждый запрос получает свой экземпляр: изменения модели в одном запросе не попадают в кэш.
+    # Загружены только CACHED_USER_FIELDS, поэтому сохранять такой экземпляр можно лишь с update_fields
+    user = User(**fields)
+    user._saved_in_db = True
+    bind_request_user(user.uuid)
+    return user
+
+
+def _decode_token(token: str) -> JWTTokenPayload:
+    key = hashlib.sha256(token.encode()).digest()
+    cached = token_cache.get(key)
+    if cached is not None and cached[1] > time.time():
+        return cached[0]
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
         token_data = JWTTokenPayload(**payload)
     except jwt.PyJWTError:
         raise HTTPException(status_code=403, detail="Could not validate credentials")
-    
+    token_cache.set(key, (token_data, payload.get("exp") or math.inf))
+    return token_data
+
+
+async def _check_not_revoked(token_data: JWTTokenPayload) -> None:
+    # Токены без jti выпущены до появления отзыва и отозваны быть не могут
+    if token_data.jti and await revoked_tokens.is_revoked(token_data.jti):
+        raise HTTPException(status_code=403, detail="Token has been revoked")
+
+
+async def get_current_user(token: str = Security(reusable_oauth2)) -> Optional[User]:
+    """
+    Текущий пользователь без запроса к БД на каждый вызов: токен разбирается один раз, отзыв проверяется по фильтру в памяти,
+    личность и роль берутся из кэша по UUID, а при JWT_TRUST_IDENTITY_CLAIMS — прямо из claims токена.
+    Возвращается частичная модель (только CACHED_USER_FIELDS) — для изменения профиля есть get_current_user_record.
+    """
+    token_data = _decode_token(token)
+    await _check_not_revoked(token_data)
+
+    if settings.JWT_TRUST_IDENTITY_CLAIMS and token_data.role is not None and token_data.username is not None:
+        metrics.backend_auth_user_cache_requests_total.labels(result="claims").inc()
+        fields = {'uuid': token_data.user_uuid, 'username': token_data.username, 'role': token_data.role}
+    else:
+        fields = user_cache.get(token_data.user_uuid)
+        if fields is None:
+            metrics.backend_auth_user_cache_requests_total.labels(result="miss").inc()
+            fields = await User.filter(uuid=token_data.user_uuid).first().values(*CACHED_USER_FIELDS)
+            if not fields:
+                raise HTTPException(status_code=404, detail="User not found")
+            user_cache.set(token_data.user_uuid, fields)
+        else:
+            metrics.backend_auth_user_cache_requests_total.labels(result="hit").inc()
+
+    return _request_user(fields)
+
+
+async def get_current_user_record(token: str = Security(reusable_oauth2)) -> Optional[User]:
+    """ Полная и актуальная запись текущего пользователя из БД — для профиля и смены пароля """
+    token_data = _decode_token(token)
+    await _check_not_revoked(token_data)
     user = await User.filter(uuid=token_data.user_uuid).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    
+    bind_request_user(user.uuid)
     return user
 
 
@@ -33,4 +113,23 @@ async def get_current_moderator(token: str = Security(reusable_oauth2)) -> Optio
     if user.role != UserRole.MODERATOR:
         raise HTTPException(status_code=403, detail="You are not a moderator")
     
-    return user
\ No newline at end of file
+    return user
+
+
+async def get_current_feed_user(
+    token: Optional[str] = Query(None, description="Calendar feed secret from POST /users/me/feed-token"),
+    header_token: Optional[str] = Security(optional_oauth2)
+) -> Optional[User]:
+    """
+    Пользователь ленты: access-токен принимается только заголовком, а query-параметр token — это отдельный секрет ленты.
+    URL подписки попадает в логи и сторонние календари, поэтому в нем не может быть токена доступа ко всему API;
+    секрет ленты открывает только ленту, хранится в БД хэшем и отзывается перевыпуском или DELETE /users/me/feed-token.
+    """
+    if header_token:
+        return await get_current_user(header_token)
+    if not token:
+        raise HTTPException(status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"})
+    fields = await User.filter(feed_token_hash=feed_token_hash(token)).first().values(*CACHED_USER_FIELDS)
+    if not fields:
+        raise HTTPException(status_code=403, detail="Invalid feed token")
+    return _request_user(fields)
@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+import asyncpg
+from tortoise.backends.asyncpg.client import AsyncpgDBClient
+from tortoise.backends.base.config_generator import expand_db_url
+from tortoise.exceptions import DBConnectionError
+
+from app import metrics, settings
+
+
+class InstrumentedPool:
+    """
+    Обертка пула asyncpg: ограничивает ожидание свободного соединения DB_POOL_ACQUIRE_TIMEOUT и замеряет его.
+    Число занятых и свободных соединений считается в момент сбора метрик; остальные методы пула проксируются.
+    """
+
+    def __init__(self, pool: asyncpg.Pool, connection_name: str):
+        self._pool = pool
+        self._acquire_seconds = metrics.backend_db_pool_acquire_seconds.labels(connection=connection_name)
+        self._timeouts = metrics.backend_db_pool_acquire_timeouts_total.labels(connection=connection_name)
+        metrics.backend_db_pool_connections.labels(connection=connection_name, state="in_use").set_function(
+            lambda: pool.get_size() - pool.get_idle_size()
+        )
+        metrics.backend_db_pool_connections.labels(connection=connection_name, state="idle").set_function(pool.get_idle_size)
+        metrics.backend_db_pool_connections.labels(connection=connection_name, state="max").set(pool.get_max_size())
+
+    async def acquire(self, timeout=None):
+        started = time.perf_counter()
+        try:
+            return await self._pool.acquire(timeout=timeout or settings.DB_POOL_ACQUIRE_TIMEOUT)
+        except asyncio.TimeoutError as e:
+            self._timeouts.inc()
+            raise DBConnectionError(f"Нет свободного соединения с БД за {settings.DB_POOL_ACQUIRE_TIMEOUT} с") from e
+        finally:
+            self._acquire_seconds.observe(time.perf_counter() - started)
+
+    def __getattr__(self, name):
+        return getattr(self._pool, name)
+
+
+class InstrumentedAsyncpgDBClient(AsyncpgDBClient):
+    async def create_pool(self, **kwargs) -> InstrumentedPool:
+        return InstrumentedPool(await super().create_pool(**kwargs), self.connection_name)
+
+
+# Движок Tortoise: модуль указывается в "engine" конфигурации подключения
+client_class = InstrumentedAsyncpgDBClient
+
+
+def pooled_connection(db_url: str) -> dict:
+    """ Конфигурация подключения Tortoise с параметрами пула из настроек и движком, снимающим метрики пула """
+    config = expand_db_url(db_url)
+    config["engine"] = __name__
+    config["credentials"].update(
+        minsize=settings.DB_POOL_MIN_SIZE,
+        maxsize=settings.DB_POOL_MAX_SIZE,
+        max_inactive_connection_lifetime=settings.DB_POOL_MAX_INACTIVE_LIFETIME,
+        statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE
+    )
+    return config
@@ -0,0 +1,75 @@
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Hashable, List, Optional, Tuple
+
+from app.utils.booking_index import normalize_dt
+
+logger = logging.getLogger(__name__)
+
+
+class ExpirySweeper:
+    """
+    Фоновая очистка записей с TTL по min-куче сроков истечения.
+    Задача спит ровно до ближайшего срока (или до появления более раннего), забирает из кучи все истекшие
+    ключи и передает их в purge одним вызовом — без периодического сканирования таблицы.
+    Записи, снятые раньше срока, из кучи не удаляются: purge для них просто ничего не находит.
+    """
+
+    def __init__(self, purge: Callable[[List[Hashable]], Awaitable[int]], retry_delay: float = 5.0):
+        self._purge = purge
+        self._retry_delay = timedelta(seconds=retry_delay)
+        self._heap: List[Tuple[datetime, Hashable]] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, expires_at: datetime, key: Hashable) -> None:
+        entry = (normalize_dt(expires_at), key)
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] == entry:
+            self._wakeup.set()
+
+    def pop_expired(self, now: datetime) -> List[Hashable]:
+        now = normalize_dt(now)
+        expired = []
+        while self._heap and self._heap[0][0] <= now:
+            expired.append(heapq.heappop(self._heap)[1])
+        return expired
+
+    async def run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            now = normalize_dt(datetime.now(timezone.utc))
+            expired = self.pop_expired(now)
+            if expired:
+                try:
+                    await self._purge(expired)
+                except Exception:
+                    logger.exception("Failed to purge %d expired entries, retrying later", len(expired))
+                    for key in expired:
+                        heapq.heappush(self._heap, (now + self._retry_delay, key))
+                continue
+
+            timeout = (self._heap[0][0] - now).total_seconds() if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._heap.clear()
@@ -0,0 +1,56 @@
+from datetime import datetime
+from itertools import accumulate
+from math import ceil, floor
+from typing import Iterable, List, Tuple
+
+OPEN, BOOKED, CLOSED = "o", "b", "c"
+
+Interval = Tuple[datetime, datetime]
+
+
+def freebusy_runs(
+    open_intervals: Iterable[Interval],
+    busy_intervals: Iterable[Interval],
+    start: datetime,
+    bucket_seconds: int,
+    buckets: int
+) -> str:
+    """
+    Сетка занятости одной аудитории в run-length кодировке: "12c8o4b..." —
+    число подряд идущих ячеек и состояние (o — свободна, b — занята бронью или удержанием, c — закрыта по расписанию).
+    Ячейка занята, если ее пересекает хотя бы один занятый интервал (бронь или удержание); закрыта, если расписание не покрывает ее целиком.
+    Интервалы переводятся в границы ячеек и складываются разностными массивами,
+    после чего один проход по ячейкам сразу выдает серии — без сравнения каждой ячейки с каждым интервалом.
+    """
+    total = buckets * bucket_seconds
+    covered = [0] * (buckets + 1)
+    booked = [0] * (buckets + 1)
+
+    for open_start, open_end in open_intervals:
+        first = max(0, ceil((open_start - start).total_seconds() / bucket_seconds))
+        end_offset = (open_end - start).total_seconds()
+        last = buckets if end_offset >= total else min(buckets, floor(end_offset / bucket_seconds))
+        if first < last:
+            covered[first] += 1
+            covered[last] -= 1
+
+    for busy_start, busy_end in busy_intervals:
+        first = max(0, floor((busy_start - start).total_seconds() / bucket_seconds))
+        last = min(buckets, ceil((busy_end - start).total_seconds() / bucket_seconds))
+        if first < last:
+            booked[first] += 1
+            booked[last] -= 1
+
+    runs: List[str] = []
+    state, length = None, 0
+    for is_covered, is_booked in zip(accumulate(covered[:buckets]), accumulate(booked[:buckets])):
+        cell = BOOKED if is_booked else OPEN if is_covered else CLOSED
+        if cell == state:
+            length += 1
+            continue
+        if state is not None:
+            runs.append(f"{length}{state}")
+        state, length = cell, 1
+    if state is not None:
+        runs.append(f"{length}{state}")
+    return "".join(runs)
@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+
+from app.utils.booking_index import normalize_dt
+
+PRODID = "-//Booker//Auditorium calendar//RU"
+
+
+def _escape(value: str) -> str:
+    return (value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def _timestamp(value: datetime) -> str:
+    return normalize_dt(value).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _fold(line: str) -> str:
+    """ Переносит строку длиннее 75 октетов по RFC 5545 (продолжение начинается с пробела) """
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    while encoded:
+        limit = 75 if not parts else 74
+        cut = min(limit, len(encoded))
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+    return "\r\n ".join(parts)
+
+
+def build_calendar(name: str, events: Iterable[dict], stamp: Optional[datetime] = None) -> str:
+    """
+    Собирает iCalendar (RFC 5545) из словарей с ключами uuid, start_time, end_time, title, location.
+    DTSTAMP берется из stamp (время последнего изменения), чтобы одинаковые данные давали одинаковый текст.
+    """
+    dtstamp = _timestamp(stamp or datetime(1970, 1, 1, tzinfo=timezone.utc))
+    lines: List[str] = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(name)}",
+    ]
+    for event in events:
+        lines.extend([
+            "BEGIN:VEVENT",
+            f"UID:{event['uuid']}@booker",
+            f"DTSTAMP:{dtstamp}",
+            f"DTSTART:{_timestamp(event['start_time'])}",
+            f"DTEND:{_timestamp(event['end_time'])}",
+            f"SUMMARY:{_escape(event.get('title') or 'Бронирование')}",
+        ])
+        if event.get('location'):
+            lines.append(f"LOCATION:{_escape(event['location'])}")
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(_fold(line) for line in lines) + "\r\n"
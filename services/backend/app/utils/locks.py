@@ -0,0 +1,73 @@
+import asyncio
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator, Dict
+from uuid import UUID
+
+from tortoise.transactions import in_transaction
+
+from app import metrics, settings
+
+
+def advisory_lock_key(value: UUID) -> int:
+    """ 64-битный ключ advisory-блокировки Postgres из первых 8 байт UUID """
+    return int.from_bytes(value.bytes[:8], "big", signed=True)
+
+
+class KeyedLocks:
+    """
+    Набор asyncio-блокировок по ключу внутри одного воркера.
+    Блокировка удаляется, когда ее больше никто не держит и не ждет, поэтому словарь не растет.
+    """
+
+    def __init__(self):
+        self._locks: Dict[UUID, asyncio.Lock] = {}
+        self._holders: Dict[UUID, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    @asynccontextmanager
+    async def acquire(self, key: UUID) -> AsyncIterator[None]:
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._holders[key] = self._holders.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._holders[key] -= 1
+            if not self._holders[key]:
+                del self._holders[key]
+                del self._locks[key]
+
+
+auditorium_locks = KeyedLocks()
+
+
+@asynccontextmanager
+async def auditorium_write_lock(*auditorium_uuids: UUID) -> AsyncIterator[None]:
+    """
+    Сериализует запись бронирований по аудиториям.
+    Сначала берутся in-process блокировки (конкуренция внутри воркера не доходит до БД),
+    затем в открытой транзакции — pg_advisory_xact_lock на каждую аудиторию одним запросом.
+    Ключи берутся в отсортированном порядке, чтобы исключить взаимные блокировки;
+    advisory-блокировки снимаются вместе с фиксацией транзакции.
+    При выключенном BOOKING_WRITE_LOCKS_ENABLED остается только транзакция.
+    """
+    keys = sorted(set(auditorium_uuids))
+    async with AsyncExitStack() as stack:
+        started = time.monotonic()
+        if settings.BOOKING_WRITE_LOCKS_ENABLED:
+            for key in keys:
+                await stack.enter_async_context(auditorium_locks.acquire(key))
+            metrics.backend_booking_lock_wait_seconds.labels(scope="local").observe(time.monotonic() - started)
+
+        connection = await stack.enter_async_context(in_transaction())
+        if settings.BOOKING_WRITE_LOCKS_ENABLED and connection.capabilities.dialect == "postgres":
+            acquired = time.monotonic()
+            await connection.execute_query(
+                "SELECT pg_advisory_xact_lock(key) FROM unnest($1::bigint[]) AS key",
+                [sorted(advisory_lock_key(key) for key in keys)]
+            )
+            metrics.backend_booking_lock_wait_seconds.labels(scope="database").observe(time.monotonic() - acquired)
+        yield
@@ -0,0 +1,65 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException
+from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
+
+from app.utils.booking_index import normalize_dt
+
+
+def encode_cursor(start_time: datetime, uuid: UUID) -> str:
+    """ Непрозрачный курсор keyset-пагинации: base64url от (start_time, uuid) последней записи страницы """
+    raw = f"{start_time.isoformat()}|{uuid}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        start_time, uuid = raw.split("|", 1)
+        return datetime.fromisoformat(start_time), UUID(uuid)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Некорректный курсор пагинации.")
+
+
+def after_keyset(query: QuerySet, start_time: datetime, uuid: UUID) -> QuerySet:
+    """ Строки строго после (start_time, uuid) в порядке ORDER BY start_time, uuid """
+    return query.filter(Q(start_time__gt=start_time) | Q(start_time=start_time, uuid__gt=uuid))
+
+
+async def paginate_by_start_time(query: QuerySet, limit: int, cursor: Optional[str] = None) -> Tuple[List, Optional[str]]:
+    """
+    Возвращает страницу в порядке (start_time, uuid), начиная строго после курсора, и курсор следующей страницы.
+    Запрашивается limit + 1 строка: лишняя строка лишь сообщает, что следующая страница существует.
+    """
+    if cursor:
+        query = after_keyset(query, *decode_cursor(cursor))
+
+    items = await query.order_by('start_time', 'uuid').limit(limit + 1)
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, encode_cursor(items[-1].start_time, items[-1].uuid)
+
+
+async def paginate_merged(queries: List[QuerySet], limit: int, cursor: Optional[str] = None) -> Tuple[List, Optional[str]]:
+    """
+    Та же страница, что и paginate_by_start_time, но поверх нескольких источников (например, bookings и архива):
+    из каждого берется до limit + 1 строк после курсора, результат сливается по (start_time, uuid).
+    """
+    if cursor:
+        keyset = decode_cursor(cursor)
+        queries = [after_keyset(query, *keyset) for query in queries]
+
+    items = []
+    for query in queries:
+        items.extend(await query.order_by('start_time', 'uuid').limit(limit + 1))
+    items.sort(key=lambda item: (normalize_dt(item.start_time), item.uuid))
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, encode_cursor(items[-1].start_time, items[-1].uuid)
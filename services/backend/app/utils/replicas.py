@@ -0,0 +1,137 @@
+import functools
+import itertools
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+from uuid import UUID
+
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app import metrics, settings
+
+# Cookie read-your-writes: до указанного в ней момента (unix time) чтения клиента идут в основную БД
+STICKY_COOKIE = "primary_reads_until"
+
+_read_replica: ContextVar[Optional[str]] = ContextVar("read_replica", default=None)
+_request_user: ContextVar[Optional[UUID]] = ContextVar("request_user", default=None)
+_sticky_until: ContextVar[float] = ContextVar("sticky_until", default=0.0)
+_request_writes: ContextVar[Optional[list]] = ContextVar("request_writes", default=None)
+_replica_reads = itertools.count()
+
+
+class RecentWriters:
+    """
+    Пользователи, писавшие в БД за последние window секунд (в пределах воркера).
+    Их чтения идут в основную БД, пока реплики могут отставать; устаревшие записи вычищаются при добавлении.
+    """
+
+    def __init__(self, window: float):
+        self._window = window
+        self._deadlines: Dict[UUID, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def mark(self, user_uuid: UUID) -> None:
+        now = time.monotonic()
+        if len(self._deadlines) >= 1024:
+            self._deadlines = {key: deadline for key, deadline in self._deadlines.items() if deadline > now}
+        self._deadlines[user_uuid] = now + self._window
+
+    def __contains__(self, user_uuid: UUID) -> bool:
+        deadline = self._deadlines.get(user_uuid)
+        return deadline is not None and deadline > time.monotonic()
+
+
+recent_writers = RecentWriters(settings.DB_REPLICA_STICKY_SECONDS)
+
+
+def bind_request_user(user_uuid: UUID) -> None:
+    """ Запоминает автора запроса: его записи включают read-your-writes, его чтения проверяются на него """
+    _request_user.set(user_uuid)
+
+
+class ReplicaRouter:
+    """
+    Роутер Tortoise: чтения внутри функций с @read_only идут на выбранную для вызова реплику, все остальное — в основную БД.
+    Транзакции и проверки в путях записи читают из основной БД, потому что @read_only на них не ставится.
+    Любая запись от имени пользователя отмечает его в recent_writers, а любая запись в запросе — сам запрос,
+    чтобы ReadYourWritesMiddleware выставила клиенту cookie.
+    """
+
+    def db_for_read(self, model) -> Optional[str]:
+        return _read_replica.get()
+
+    def db_for_write(self, model) -> Optional[str]:
+        user_uuid = _request_user.get()
+        if user_uuid is not None:
+            recent_writers.mark(user_uuid)
+        writes = _request_writes.get()
+        if writes is not None and not writes:
+            writes.append(True)
+        return None
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """
+    Read-your-writes между воркерами без запросов к БД: ответ на запрос, который писал в БД,
+    ставит cookie со сроком DB_REPLICA_STICKY_SECONDS, и следующие запросы клиента с ней читают из основной БД,
+    какой бы воркер их ни принял. Подделанная cookie лишь отправляет чтения клиента в основную БД.
+    """
+
+    async def dispatch(self, request, call_next):
+        try:
+            _sticky_until.set(float(request.cookies.get(STICKY_COOKIE, 0)))
+        except ValueError:
+            _sticky_until.set(0.0)
+        writes = []
+        _request_writes.set(writes)
+        response = await call_next(request)
+        if writes:
+            window = settings.DB_REPLICA_STICKY_SECONDS
+            response.set_cookie(
+                STICKY_COOKIE, f"{time.time() + window:.3f}", max_age=math.ceil(window), httponly=True, samesite="lax"
+            )
+        return response
+
+
+def _wrote_recently(current_user) -> bool:
+    if _sticky_until.get() > time.time():
+        return True
+    user_uuid = _request_user.get() or getattr(current_user, "uuid", None)
+    return user_uuid is not None and user_uuid in recent_writers
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """ Чтения внутри блока идут в основную БД даже из @read_only (для заполнения общих кэшей, которыми пользуется запись) """
+    token = _read_replica.set(None)
+    try:
+        yield
+    finally:
+        _read_replica.reset(token)
+
+
+def read_only(func):
+    """
+    Помечает сервисную функцию как только читающую: ее запросы уходят на реплику (если они настроены).
+    Реплики выбираются по кругу, но все запросы одного вызова идут на одну, чтобы не смешивать разное отставание.
+    Пользователь, недавно писавший сам (в этом воркере или, по cookie, в любом другом), читает из основной БД,
+    чтобы видеть свои изменения.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if not settings.DB_REPLICAS or _read_replica.get():
+            return await func(*args, **kwargs)
+        if _wrote_recently(kwargs.get("current_user")):
+            metrics.backend_db_reads_total.labels(target="primary_sticky").inc()
+            return await func(*args, **kwargs)
+        metrics.backend_db_reads_total.labels(target="replica").inc()
+        token = _read_replica.set(settings.DB_REPLICAS[next(_replica_reads) % len(settings.DB_REPLICAS)])
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _read_replica.reset(token)
+    return wrapper
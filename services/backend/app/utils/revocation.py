@@ -0,0 +1,96 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from app.models import RevokedToken
+from app.utils.bloom import BloomFilter
+from app.utils.booking_index import normalize_dt
+
+from app import metrics, settings
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """
+    Отозванные токены в памяти воркера в виде фильтра Блума по jti.
+    Фильтр дочитывается из revoked_tokens инкрементально — строки с revoked_at не раньше последней прочитанной
+    (с запасом на еще не зафиксированные транзакции и разницу часов) — и периодически строится заново без истекших токенов.
+    Промах фильтра подтверждает, что токен не отозван, без обращения к БД; попадание проверяется запросом.
+    Пока фильтр не загружен или давно не обновлялся, все проверки идут в БД.
+    """
+
+    def __init__(self):
+        self._filter: Optional[BloomFilter] = None
+        self._seen_until: Optional[datetime] = None
+        self._refreshed_at = 0.0
+        self._rebuilt_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def _is_fresh(self) -> bool:
+        return (self._filter is not None
+                and time.monotonic() - self._refreshed_at <= settings.TOKEN_REVOCATION_MAX_STALENESS_SECONDS)
+
+    async def rebuild(self) -> None:
+        """ Читает все действующие отзывы, удаляет истекшие и заменяет фильтр новым по их числу """
+        now = datetime.now(timezone.utc)
+        await RevokedToken.filter(expires_at__lte=now).delete()
+        rows = await RevokedToken.filter(expires_at__gt=now).values_list('jti', 'revoked_at')
+        revoked = BloomFilter(
+            max(settings.TOKEN_REVOCATION_FILTER_CAPACITY, 2 * len(rows)),
+            settings.TOKEN_REVOCATION_FILTER_ERROR_RATE
+        )
+        for jti, _ in rows:
+            revoked.add(jti)
+        self._filter = revoked
+        self._seen_until = max([normalize_dt(now)] + [normalize_dt(revoked_at) for _, revoked_at in rows])
+        self._refreshed_at = self._rebuilt_at = time.monotonic()
+        metrics.backend_token_revocation_filter_entries.set(len(revoked))
+
+    async def refresh(self) -> None:
+        """ Дочитывает отзывы, появившиеся после прошлого чтения; переполненный фильтр строится заново """
+        if self._filter is None or time.monotonic() - self._rebuilt_at >= settings.TOKEN_REVOCATION_REBUILD_SECONDS:
+            return await self.rebuild()
+        since = (self._seen_until - timedelta(seconds=settings.TOKEN_REVOCATION_OVERLAP_SECONDS)).replace(tzinfo=timezone.utc)
+        rows = await RevokedToken.filter(revoked_at__gte=since).values_list('jti', 'revoked_at')
+        for jti, revoked_at in rows:
+            self._filter.add(jti)
+            self._seen_until = max(self._seen_until, normalize_dt(revoked_at))
+        if len(self._filter) > self._filter.capacity:
+            return await self.rebuild()
+        self._refreshed_at = time.monotonic()
+        metrics.backend_token_revocation_filter_entries.set(len(self._filter))
+
+    async def is_revoked(self, jti: str) -> bool:
+        if self._is_fresh() and jti not in self._filter:
+            metrics.backend_token_revocation_checks_total.labels(result="filter").inc()
+            return False
+        revoked = await RevokedToken.exists(jti=jti)
+        metrics.backend_token_revocation_checks_total.labels(result="revoked" if revoked else "db").inc()
+        return revoked
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Failed to refresh revoked tokens, checking tokens against the database meanwhile")
+            await asyncio.sleep(settings.TOKEN_REVOCATION_REFRESH_SECONDS)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+revoked_tokens = RevocationList()
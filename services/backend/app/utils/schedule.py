@@ -0,0 +1,115 @@
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+SECONDS_PER_DAY = 24 * 60 * 60
+SECONDS_PER_WEEK = 7 * SECONDS_PER_DAY
+
+
+def _seconds(value: time) -> float:
+    return value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1_000_000
+
+
+def week_offset(value: datetime) -> float:
+    """ Смещение в секундах от начала недели (понедельник 00:00) по локальному времени значения """
+    return value.weekday() * SECONDS_PER_DAY + _seconds(value.time())
+
+
+class WeeklySchedule:
+    """
+    Недельное расписание доступности аудитории, скомпилированное в отсортированный
+    массив непересекающихся интервалов [start, end) в секундах от начала недели.
+    Соседние и пересекающиеся слоты (в том числе через полночь) сливаются при компиляции,
+    поэтому проверка покрытия интервала сводится к бинарному поиску.
+    """
+    __slots__ = ("starts", "ends", "days")
+
+    def __init__(self, intervals: List[Tuple[float, float]], days: Iterable[int]):
+        self.starts = [start for start, _ in intervals]
+        self.ends = [end for _, end in intervals]
+        self.days = frozenset(days)
+
+    @classmethod
+    def compile(cls, slots: Iterable[Tuple[int, time, time]]) -> "WeeklySchedule":
+        raw = []
+        days = set()
+        for day_of_week, start_time, end_time in slots:
+            day_start = day_of_week * SECONDS_PER_DAY
+            start = day_start + _seconds(start_time)
+            end = day_start + (SECONDS_PER_DAY if _seconds(end_time) == 0 else _seconds(end_time))
+            if end <= start:
+                continue
+            raw.append((start, end))
+            days.add(day_of_week)
+
+        merged: List[Tuple[float, float]] = []
+        for start, end in sorted(raw):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return cls(merged, days)
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def has_day(self, day_of_week: int) -> bool:
+        return day_of_week in self.days
+
+    def day_seconds(self, day_of_week: int) -> float:
+        """ Доступное время (в секундах) в указанный день недели """
+        day_start = day_of_week * SECONDS_PER_DAY
+        day_end = day_start + SECONDS_PER_DAY
+        return sum(
+            max(0.0, min(end, day_end) - max(start, day_start))
+            for start, end in zip(self.starts, self.ends)
+        )
+
+    def _segment_gap(self, start: float, end: float) -> Optional[float]:
+        position = bisect_right(self.starts, start) - 1
+        if position < 0 or self.ends[position] <= start:
+            return start
+        if self.ends[position] < end:
+            return self.ends[position]
+        return None
+
+    def first_gap(self, start_dt: datetime, end_dt: datetime) -> Optional[datetime]:
+        """ Возвращает первый момент интервала, не покрытый расписанием, или None, если интервал покрыт целиком """
+        length = (end_dt - start_dt).total_seconds()
+        offset = week_offset(start_dt)
+        if length >= SECONDS_PER_WEEK:
+            if self.starts == [0] and self.ends == [SECONDS_PER_WEEK]:
+                return None
+            segments = [(offset, SECONDS_PER_WEEK), (0, offset)]
+        elif offset + length <= SECONDS_PER_WEEK:
+            segments = [(offset, offset + length)]
+        else:
+            segments = [(offset, SECONDS_PER_WEEK), (0, offset + length - SECONDS_PER_WEEK)]
+
+        elapsed = 0.0
+        for segment_start, segment_end in segments:
+            gap = self._segment_gap(segment_start, segment_end)
+            if gap is not None:
+                return start_dt + timedelta(seconds=elapsed + gap - segment_start)
+            elapsed += segment_end - segment_start
+        return None
+
+    def covers(self, start_dt: datetime, end_dt: datetime) -> bool:
+        return self.first_gap(start_dt, end_dt) is None
+
+    def open_intervals(self, start_dt: datetime, end_dt: datetime) -> List[Tuple[datetime, datetime]]:
+        """ Разворачивает расписание в отсортированные непересекающиеся интервалы доступности внутри [start_dt, end_dt) """
+        week_start = start_dt - timedelta(seconds=week_offset(start_dt))
+        intervals: List[Tuple[datetime, datetime]] = []
+        while week_start < end_dt:
+            for start, end in zip(self.starts, self.ends):
+                open_start = max(start_dt, week_start + timedelta(seconds=start))
+                open_end = min(end_dt, week_start + timedelta(seconds=end))
+                if open_start >= open_end:
+                    continue
+                if intervals and open_start <= intervals[-1][1]:
+                    intervals[-1] = (intervals[-1][0], max(intervals[-1][1], open_end))
+                else:
+                    intervals.append((open_start, open_end))
+            week_start += timedelta(seconds=SECONDS_PER_WEEK)
+        return intervals
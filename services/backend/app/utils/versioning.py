@@ -0,0 +1,58 @@
+from typing import Optional
+
+from fastapi import HTTPException
+from tortoise.expressions import F
+from tortoise.models import Model
+
+
+def parse_if_match(value: Optional[str]) -> Optional[int]:
+    """ Разбирает заголовок If-Match с версией ресурса: 3, "3" или W/"3" """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+    value = value.strip('"')
+    if not value.isdigit():
+        raise HTTPException(status_code=400, detail="Заголовок If-Match должен содержать версию ресурса (целое число).")
+    return int(value)
+
+
+def resolve_expected_version(if_match: Optional[str], body_version: Optional[int]) -> Optional[int]:
+    """ Ожидаемая версия из заголовка If-Match или поля version тела запроса """
+    header_version = parse_if_match(if_match)
+    if header_version is not None and body_version is not None and header_version != body_version:
+        raise HTTPException(status_code=400, detail="Версия в заголовке If-Match не совпадает с полем version.")
+    return header_version if header_version is not None else body_version
+
+
+def version_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def _raise_version_conflict(instance: Model, expected_version: int) -> None:
+    raise HTTPException(
+        status_code=412,
+        detail=(f"Ресурс {instance.pk} был изменен другим запросом (ожидалась версия {expected_version}). "
+                f"Получите актуальную версию и повторите изменение.")
+    )
+
+
+async def save_versioned(instance: Model, update_data: dict, expected_version: Optional[int] = None) -> None:
+    """
+    Сохраняет изменения условным UPDATE ... WHERE version = ? с увеличением версии, без блокировки строки.
+    Без явной ожидаемой версии сравнение идет с версией, прочитанной в текущем запросе.
+    """
+    expected = instance.version if expected_version is None else expected_version
+    if expected != instance.version:
+        _raise_version_conflict(instance, expected)
+    if not update_data:
+        return
+
+    instance.update_from_dict(update_data)
+    db_fields = instance._meta.fields_db_projection
+    changes = {field: getattr(instance, field) for field in update_data if field in db_fields}
+    updated = await type(instance).filter(pk=instance.pk, version=expected).update(**changes, version=F("version") + 1)
+    if not updated:
+        _raise_version_conflict(instance, expected)
+    instance.version = expected + 1
@@ -0,0 +1,178 @@
+"""
+Бенчмарк индексов горячих запросов бронирований на синтетических данных.
+
+Запуск из services/backend (нужен Postgres 13+ и права на CREATE SCHEMA; подключение — из переменных DB_*):
+    python -m benchmarks.booking_indexes --bookings 1000000
+
+Данные создаются в отдельной схеме и удаляются после прогона, таблицы приложения не затрагиваются.
+Каждый запрос выполняется --repeat раз со случайными параметрами: сначала с индексами,
+которые были до миграции hot_query_indexes (первичные ключи, уникальные ограничения слотов, ключи keyset-пагинации),
+затем после применения SQL самой миграции. Печатается медиана и p95 задержки.
+"""
+import argparse
+import asyncio
+import glob
+import importlib.util
+import os
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, time as dt_time, timedelta, timezone
+
+import asyncpg
+
+from app import settings
+
+SCHEMA = "bench_booking_indexes"
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "..", "migrations", "models")
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+BOOKING_STEP = timedelta(hours=2)
+
+TABLES = """
+    CREATE TABLE bookings (
+        uuid UUID PRIMARY KEY,
+        auditorium_id UUID NOT NULL,
+        broker_id UUID NOT NULL,
+        series_id UUID,
+        start_time TIMESTAMPTZ NOT NULL,
+        end_time TIMESTAMPTZ NOT NULL,
+        title VARCHAR(200)
+    );
+    CREATE TABLE availability_slots (
+        uuid UUID PRIMARY KEY,
+        auditorium_id UUID NOT NULL,
+        day_of_week INT NOT NULL,
+        start_time TIME NOT NULL,
+        end_time TIME NOT NULL,
+        UNIQUE (auditorium_id, day_of_week, start_time),
+        UNIQUE (auditorium_id, day_of_week, end_time)
+    );
+"""
+
+# Брони каждой аудитории идут подряд через BOOKING_STEP и длятся 90 минут, каждая четвертая входит в серию
+FILL_BOOKINGS = """
+    INSERT INTO bookings (uuid, auditorium_id, broker_id, series_id, start_time, end_time, title)
+    SELECT gen_random_uuid(),
+           ($2::uuid[])[1 + i % cardinality($2::uuid[])],
+           ($3::uuid[])[1 + (i * 7919) % cardinality($3::uuid[])],
+           CASE WHEN i % 4 = 0 THEN ($4::uuid[])[1 + (i / 40) % cardinality($4::uuid[])] END,
+           $5::timestamptz + (i / cardinality($2::uuid[])) * interval '2 hours',
+           $5::timestamptz + (i / cardinality($2::uuid[])) * interval '2 hours' + interval '90 minutes',
+           'bench'
+    FROM generate_series(0, $1 - 1) AS i
+"""
+
+FILL_SLOTS = """
+    INSERT INTO availability_slots (uuid, auditorium_id, day_of_week, start_time, end_time)
+    SELECT gen_random_uuid(), a.uuid, d, s.start_time, s.end_time
+    FROM unnest($1::uuid[]) AS a(uuid)
+    CROSS JOIN generate_series(0, 6) AS d
+    CROSS JOIN (VALUES (time '08:00', time '13:00'), (time '14:00', time '21:00')) AS s(start_time, end_time)
+"""
+
+QUERIES = {
+    "overlap check": (
+        "SELECT uuid, start_time, end_time FROM bookings "
+        "WHERE auditorium_id = $1 AND start_time < $3 AND end_time > $2 ORDER BY start_time LIMIT 5",
+        lambda data: (random.choice(data["auditoriums"]), *data["window"](timedelta(hours=3)))
+    ),
+    "auditorium calendar (week)": (
+        "SELECT uuid, title, start_time, end_time FROM bookings "
+        "WHERE auditorium_id = $1 AND start_time < $3 AND end_time > $2 ORDER BY start_time",
+        lambda data: (random.choice(data["auditoriums"]), *data["window"](timedelta(days=7)))
+    ),
+    "my bookings page": (
+        "SELECT uuid, auditorium_id, start_time, end_time, title FROM bookings "
+        "WHERE broker_id = $1 ORDER BY start_time, uuid LIMIT 100",
+        lambda data: (random.choice(data["brokers"]),)
+    ),
+    "series occurrences": (
+        "SELECT uuid, start_time, end_time FROM bookings WHERE series_id = $1 ORDER BY start_time",
+        lambda data: (random.choice(data["series"]),)
+    ),
+    "slot lookup": (
+        "SELECT uuid FROM availability_slots WHERE auditorium_id = $1 AND day_of_week = $2 AND start_time = $3",
+        lambda data: (random.choice(data["auditoriums"]), random.randrange(7), dt_time(8, 0))
+    ),
+    "rooms open on weekday": (
+        "SELECT auditorium_id FROM availability_slots WHERE day_of_week = $1",
+        lambda data: (random.randrange(7),)
+    ),
+}
+
+
+async def _apply_migration(connection: asyncpg.Connection, name: str) -> None:
+    """ Выполняет upgrade() миграции по суффиксу имени файла: индексы в бенчмарке те же, что в продакшене """
+    path, = glob.glob(os.path.join(MIGRATIONS_DIR, f"*_{name}.py"))
+    spec = importlib.util.spec_from_file_location(f"bench_migration_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    await connection.execute(await module.upgrade(None))
+    await connection.execute("ANALYZE")
+
+
+async def _measure(connection: asyncpg.Connection, data: dict, repeat: int) -> dict:
+    results = {}
+    for title, (sql, params) in QUERIES.items():
+        statement = await connection.prepare(sql)
+        for _ in range(min(repeat, 10)):
+            await statement.fetch(*params(data))
+        timings = []
+        for _ in range(repeat):
+            args = params(data)
+            started = time.perf_counter()
+            await statement.fetch(*args)
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        results[title] = (statistics.median(timings), timings[int(len(timings) * 0.95) - 1])
+    return results
+
+
+async def run(bookings: int, auditoriums: int, brokers: int, repeat: int) -> None:
+    connection = await asyncpg.connect(settings.DB_URL)
+    try:
+        await connection.execute(f'DROP SCHEMA IF EXISTS "{SCHEMA}" CASCADE; CREATE SCHEMA "{SCHEMA}"')
+        await connection.execute(f'SET search_path TO "{SCHEMA}", public')
+        await connection.execute(TABLES)
+
+        data = {
+            "auditoriums": [uuid.uuid4() for _ in range(auditoriums)],
+            "brokers": [uuid.uuid4() for _ in range(brokers)],
+            "series": [uuid.uuid4() for _ in range(max(1, bookings // 40))],
+        }
+        span = BOOKING_STEP * (bookings // auditoriums)
+
+        def window(length: timedelta):
+            start = EPOCH + timedelta(seconds=random.uniform(0, max(0.0, (span - length).total_seconds())))
+            return start, start + length
+        data["window"] = window
+
+        started = time.perf_counter()
+        await connection.execute(FILL_BOOKINGS, bookings, data["auditoriums"], data["brokers"], data["series"], EPOCH)
+        await connection.execute(FILL_SLOTS, data["auditoriums"])
+        await _apply_migration(connection, "booking_keyset_indexes")
+        print(f"Сгенерировано {bookings} броней в {auditoriums} аудиториях за {time.perf_counter() - started:.1f} c")
+
+        before = await _measure(connection, data, repeat)
+        await _apply_migration(connection, "hot_query_indexes")
+        after = await _measure(connection, data, repeat)
+
+        print(f"\n{'запрос':<28}{'до: p50 / p95, мс':>22}{'после: p50 / p95, мс':>24}{'ускорение p50':>16}")
+        for title in QUERIES:
+            (before_p50, before_p95), (after_p50, after_p95) = before[title], after[title]
+            print(f"{title:<28}{before_p50:>11.3f} / {before_p95:<8.3f}{after_p50:>13.3f} / {after_p95:<8.3f}"
+                  f"{before_p50 / after_p50:>14.1f}x")
+    finally:
+        await connection.execute(f'DROP SCHEMA IF EXISTS "{SCHEMA}" CASCADE')
+        await connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Бенчмарк индексов горячих запросов бронирований")
+    parser.add_argument("--bookings", type=int, default=1_000_000)
+    parser.add_argument("--auditoriums", type=int, default=200)
+    parser.add_argument("--brokers", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    arguments = parser.parse_args()
+    asyncio.run(run(arguments.bookings, arguments.auditoriums, arguments.brokers, arguments.repeat))
@@ -11,8 +11,18 @@ from app import settings
 from app.routes.auditorium import router as auditorium_router
 from app.routes.availability import router as availability_router
 from app.routes.booking import router as booking_router
+from app.routes.series import router as series_router
+from app.routes.holds import router as holds_router
+from app.routes.waitlist import router as waitlist_router
 from app.routes.equipment import router as equipment_router
 from app.routes.users import router as users_router
+from app.routes.analytics import router as analytics_router
+from app.services.booking import load_booking_index
+from app.services.holds import hold_sweeper, start_hold_sweeper
+from app.services.events import calendar_hub
+from app.utils.revocation import revoked_tokens
+from app.utils.password import shutdown_executor
+from app.utils.replicas import ReadYourWritesMiddleware
 from app.logger import setup_logging, LoggingMiddleware
 
 
@@ -22,9 +32,12 @@ def init_middlewares(app: FastAPI):
         allow_origins=settings.CORS_ORIGINS,
         allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
         allow_methods=settings.CORS_ALLOW_METHODS,
-        allow_headers=settings.CORS_ALLOW_HEADERS
+        allow_headers=settings.CORS_ALLOW_HEADERS,
+        expose_headers=settings.CORS_EXPOSE_HEADERS
     )
     app.add_middleware(LoggingMiddleware)
+    if settings.DB_REPLICAS:
+        app.add_middleware(ReadYourWritesMiddleware)
     
 
 setup_logging("backend-service")
@@ -37,18 +50,30 @@ main_app_lifespan = app.router.lifespan_context
 async def lifespan_wrapper(app):
     await init(app)
     instrumentator.expose(app)
+    if settings.BOOKING_INDEX_ENABLED:
+        await load_booking_index()
+    await start_hold_sweeper()
+    revoked_tokens.start()
     if settings.MODE == "DEBUG":
         await run_seeding()
     async with main_app_lifespan(app) as maybe_state:
         yield maybe_state
+    calendar_hub.close()
+    await hold_sweeper.stop()
+    await revoked_tokens.stop()
+    shutdown_executor()
 app.router.lifespan_context = lifespan_wrapper
 
 init_middlewares(app)
 app.include_router(auditorium_router, prefix="/auditoriums", tags=["auditorium"])
 app.include_router(availability_router, prefix="/availability", tags=["availability"])
+app.include_router(series_router, prefix="/bookings/series", tags=["booking"])
+app.include_router(holds_router, prefix="/bookings/holds", tags=["booking"])
+app.include_router(waitlist_router, prefix="/bookings/waitlist", tags=["booking"])
 app.include_router(booking_router, prefix="/bookings", tags=["booking"])
 app.include_router(equipment_router, prefix="/equipment", tags=["equipment"])
 app.include_router(users_router, prefix="/users", tags=["users"])
+app.include_router(analytics_router, prefix="/analytics", tags=["analytics"])
 
 # if __name__ == "__main__":
 #     uvicorn.run(app, host=settings.API_HOST, port=int(settings.API_PORT))
\ No newline at end of file
@@ -0,0 +1,125 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "auditoriums" (
+    "uuid" UUID NOT NULL PRIMARY KEY,
+    "identifier" VARCHAR(100) NOT NULL UNIQUE,
+    "capacity" INT NOT NULL,
+    "desctiption" TEXT
+);
+CREATE TABLE IF NOT EXISTS "availability_slots" (
+    "uuid" UUID NOT NULL PRIMARY KEY,
+    "day_of_week" INT NOT NULL,
+    "start_time" TIMETZ NOT NULL,
+    "end_time" TIMETZ NOT NULL,
+    "auditorium_id" UUID NOT NULL REFERENCES "auditoriums" ("uuid") ON DELETE CASCADE,
+    CONSTRAINT "uid_availabilit_auditor_3ebe7c" UNIQUE ("auditorium_id", "day_of_week", "start_time"),
+    CONSTRAINT "uid_availabilit_auditor_bcb566" UNIQUE ("auditorium_id", "day_of_week", "end_time")
+);
+COMMENT ON COLUMN "availability_slots"."day_of_week" IS 'Day of the week (0=Monday, 6=Sunday)';
+COMMENT ON COLUMN "availability_slots"."start_time" IS 'Start time of the slot';
+COMMENT ON COLUMN "availability_slots"."end_time" IS 'End time of the slot';
+CREATE TABLE IF NOT EXISTS "equipment" (
+    "uuid" UUID NOT NULL PRIMARY KEY,
+    "name" VARCHAR(100) NOT NULL UNIQUE,
+    "description" TEXT
+);
+CREATE TABLE IF NOT EXISTS "users" (
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "uuid" UUID NOT NULL PRIMARY KEY,
+    "username" VARCHAR(255) UNIQUE,
+    "email" VARCHAR(255) UNIQUE,
+    "password_hash" VARCHAR(255),
+    "registration_date" DATE NOT NULL,
+    "telegram_id" VARCHAR(255),
+    "role" VARCHAR(9) NOT NULL
+);
+COMMENT ON COLUMN "users"."role" IS 'User role';
+CREATE TABLE IF NOT EXISTS "booking_series" (
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "uuid" UUID NOT NULL PRIMARY KEY,
+    "title" VARCHAR(200),
+    "start_time" TIMESTAMPTZ NOT NULL,
+    "end_time" TIMESTAMPTZ NOT NULL,
+    "interval_weeks" INT NOT NULL,
+    "until" DATE NOT NULL,
+    "exceptions" JSONB NOT NULL,
+    "auditorium_id" UUID NOT NULL REFERENCES "auditoriums" ("uuid") ON DELETE CASCADE,
+    "broker_id" UUID NOT NULL REFERENCES "users" ("uuid") ON DELETE CASCADE
+);
+COMMENT ON COLUMN "booking_series"."start_time" IS 'Start of the first occurrence';
+COMMENT ON COLUMN "booking_series"."end_time" IS 'End of the first occurrence';
+COMMENT ON COLUMN "booking_series"."interval_weeks" IS 'Repeat every N weeks';
+COMMENT ON COLUMN "booking_series"."until" IS 'Last date an occurrence may start on';
+COMMENT ON COLUMN "booking_series"."exceptions" IS 'ISO dates without an occurrence';
+CREATE TABLE IF NOT EXISTS "bookings" (
+    "uuid" UUID NOT NULL PRIMARY KEY,
+    "start_time" TIMESTAMPTZ NOT NULL,
+    "end_time" TIMESTAMPTZ NOT NULL,
+    "title" VARCHAR(200),
+    "auditorium_id" UUID NOT NULL REFERENCES "auditoriums" ("uuid") ON DELETE CASCADE,
+    "broker_id" UUID NOT NULL REFERENCES "users" ("uuid") ON DELETE CASCADE,
+    "series_id" UUID REFERENCES "booking_series" ("uuid") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "aerich" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "version" VARCHAR(255) NOT NULL,
+    "app" VARCHAR(100) NOT NULL,
+    "content" JSONB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS "auditorium_equipment" (
+    "auditoriums_id" UUID NOT NULL REFERENCES "auditoriums" ("uuid") ON DELETE CASCADE,
+    "equipment_id" UUID NOT NULL REFERENCES "equipment" ("uuid") ON DELETE CASCADE
+);
+CREATE UNIQUE INDEX IF NOT EXISTS "uidx_auditorium__auditor_4bb1a1" ON "auditorium_equipment" ("auditoriums_id", "equipment_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
+
+
+MODELS_STATE = (
+    "eJztXFtv2zYU/iuCnlIgC1o3SdthHeAk7pq1sYfY3YoWg8BItE1YIh2JSmJ0+e8jqSslUv"
+    "G9sqOXxD7koajvkDw3Hv8wPeJANzhqhw6ixEehZ/5q/DAx8CD7oGg9NEwwnWZtnEDBjSu6"
+    "g7SfoIObgPrApqxpCNwAMpIDA9tHU4oIZlQcui4nEpt1RHiUkUKMbkNoUTKCdAx91vD9X0"
+    "ZG2IEPMEi+TifWEEHXkeYchsjhTxctFp1NBfXLl8uLD6Ivf+CNZRM39HC+/3RGxwSnDJx8"
+    "xLl42whi6AMKndyr8JnGL56QolkzAvVDmE7XyQgOHILQ5YCYvw1DbHMcDPEk/uf493hyuW"
+    "6W1e0NrH5nYFnmAvjZBHPsEaYcrB+P0bgZJIJq8gecf2xfH7w+fSEgIAEd+aJRAGY+CkZA"
+    "QcQqgM+QRg7EFLEWv4z3+Rj4arxlrgLqbNKbwTuBagPgmh54sFyIR3TMvr56+bIC7b/b1w"
+    "Jw1ksgTtj+iPZON25qRW0c+QxpG0yBjeisjPMlpmqY8ywFkNnElwE5IWQoZ7t6GzCP+CR+"
+    "ab06fnP89vXp8VvWRUw0pbypAP6yOyhgyqdB42mUYB3ABw2uBbal1m+8OuuCbAVsg87XAR"
+    "/ZC4JbN79MD67aX8UK9mZxy+de94+ke25Zn3/unTHk+XE9nOSOEU64AfbkHviOJbVkIgJ3"
+    "ADHMkMvWsRW4hAZlSZ3FY3z4dA1doBFLosdy4/XZcDu4Cx6T9ZhQ4+UkLe0bQiZskBXROo"
+    "tG2XOQrAD6CK4Hqn461L4AxncpaRHdvi03eS1PuZXhbYimHow0jwz0FcCzAeF/xYl7yeYA"
+    "sA31aHfyY+2UqaDD+TB+N6tgeEtv6vNlCJ20T87atmR4iS+kM4EzCXorMnRT6cXt+XGiHn"
+    "Tsk3A0lhvlZzCpsBlCGhl77f55+6LD6VZJHmINeQCDkaBxYB4P9Ueyyv1QHNsVTohSaazX"
+    "F/mew0UsBzCzyNC6h3DCv7IF7FOLIvYW7OWf6AyxE3dtPJyN2DAreDgFUc1pehe46mx9mx"
+    "dgZpChwRa2wedrHLx8f0Uwe4ND4/R9P+SfBHDbt89zm6hsnjOqGnuZqwA9kzPkTUdJe02E"
+    "0OeTNvikElkE8TG3mvF+edWRTHROODjVOp5vS1uEMwy+FQSTHlgLiCXPsyNC6WBnZ0SS09"
+    "KLqYYS4zp1RD2M2iVUQslZVSFdhvkD8SEa4U9wXkNWjqvuJrwqW9YH96nZUl5iStPxUR8P"
+    "WNEHqTQ/Ex9XYXXm3F+9sZn3tJtw934bg1UGyUWsxFYxSpIPu3sW6DRef9C++ksKI160Bx"
+    "3e0pKUYUItKcR0EOOfy8FHg381vvW6HZVyFP24huRbMqTEwuTeAk4ek4SckOY0b6qFPI+J"
+    "04i4FiKmiLoK+epzVinDPoT75XxVa658VasiX9Uq56sae3TNWikXtvbJBPoLwioxNZAWIw"
+    "0ibL8gpBLTCpDW7HDYiNMULb81OExfArjU/YB6gPqkqyRtU7WbpD5lG190rb5o+XBYA8CL"
+    "5gjreTA8CbF0LtbQ1Y/x1zv8mYCedPtzuePG+d9v59/2oUi+AkUCu9ovlDn30DM02Qs6Pe"
+    "zOzPSWxS54ivEyrXQUw6mzpNRlzkbqdZG6Ij5QuhnUhAc2HB54fpHUOMUbpxKHyA/YF9sO"
+    "fR/GRuPzisA9ryCryCU3sk/KBjCF/h1wxQUZhWelvVdTZtze1ZpXC0r8Gk6Z2WfAO+jPjK"
+    "6Rznj792hCTJGr3mca0yVhqNpgNdpcnwHbUHxOBsC5jWV4YGYE0bGLV95lfOcU78E82FBM"
+    "QrGG/+z3upoTTOIqQoxsavxnuCjY2ELOOWM3IXIpwsERf96i/ph52e8J1APjHrGXCKkM/8"
+    "qIcwilI61UelCsMiicVXyAsyYx0SQmdgrSJoz+FKhNGP1nA7zyla4M/ExhbK1aqWb+9qZq"
+    "byqD4VlhiSIQLlWd6IPgUj1IE//e7/i3+F9CWh8SS/o39d3z1HfnZ1YCuboWOce2D9HHmt"
+    "Uir63+UV+st1ot5Gr2xk4VQ8qvWqyGrKqALFc4FmsgizWS66qATBW5VhMLW1yhhBMbXa9/"
+    "Q9ajyT0/A93b5J71unk3s5BN7vk5Sn2e3DM/1Be1tfM8a7EBa2Rut05O5sk/n5zo88+8rR"
+    "C594AqJaJHOGVo4J0D3ikIgnvCjKsxCMaLwFxi3AePZguA+3CE+CP51KwkOzdvuk/JvBup"
+    "v3XYZYrEHmVm/cgH6hRRxS0gma1Zu/OtXaK7a9XBoVfyguWlS1a4drVc9pTf/I0cs0Vypd"
+    "yZM5LZLgr7uzlAf6eF/N2LZX99rfkVMU1gvvkVsRplMtoMLXtsqn42Kmo5rPyxqKzPTwmi"
+    "qDSM/v6TSq8o7jzFSqS2gb/13HDSx0vuoB8oI+l63Z1j2Z4y2W3FzTfVAgjH3fcQ3c384i"
+    "/BVJkh0N8sy7Fs/1rZzzHe13ZHbHspIYUye/wf2oJLIw=="
+)
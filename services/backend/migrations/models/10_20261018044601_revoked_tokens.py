@@ -0,0 +1,85 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "revoked_tokens" (
+    "jti" VARCHAR(64) NOT NULL PRIMARY KEY,
+    "user_uuid" UUID,
+    "expires_at" TIMESTAMPTZ NOT NULL,
+    "revoked_at" TIMESTAMPTZ NOT NULL
+);
+CREATE INDEX IF NOT EXISTS "idx_revoked_tok_revoked_e8fe06" ON "revoked_tokens" ("revoked_at");
+CREATE INDEX IF NOT EXISTS "idx_revoked_tok_expires_b3eec6" ON "revoked_tokens" ("expires_at");
+COMMENT ON TABLE "revoked_tokens" IS 'Токены, отозванные до истечения срока (по claim jti); строка нужна только до expires_at токена ';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "revoked_tokens";"""
+
+
+MODELS_STATE = (
+    "eJztXW1z2zYS/isYfmky48vYivyS6/VmnMS5+JrYbaxcOk07HIiEJJ4pUuFLHF3O/70ACI"
+    "oAAVKkREmkhC+0DGLB5bMgsLtYLL4bU99GbvjsMradyA+ceGr8HXw3PDhF+Ifi7hEw4GyW"
+    "3SMFERy6tDpc1KPlcBhGAbQifGsE3RDhIhuFVuDMIsf3cKkXuy4p9C1c0fHGWVHsOV9iZE"
+    "b+GEUTFOAbn//ExY5no28oTP+d3ZsjB7m2wHMcOzZ5Or1jRvMZLf348fr1G1qXPHBoWr4b"
+    "Tz2+/mweTXxvQUCKnxEqcm+MPBTACNncqxBO2YunRQnXuCAKYrRg184KbDSCsUsAMf4xij"
+    "2L4ADok8il/0/GHFfNNG9uB+bd1cA0jRr4Wb5HsHe8iID1/TFpN4OElhrkAa/eXn548vzs"
+    "KYXAD6NxQG9SwIxHSggjmJBS4DOkHRt5kYPvBDLeryYwUOMtUuVQx0xvBu8Uqg2Aa0zhN9"
+    "NF3jia4H9Pjo9L0P7P5QcKOK5FEffx95F8OzfsVi+5R5DPkLbgDFpONJdxvvYiNcw8SQ5k"
+    "zPgqIKcFGcrZV70NmMeEib/1Tvrn/YvnZ/0LXIUyuig5LwH++maQw5SwETE2JFgH6FsBrj"
+    "mylfov651tQbYEtsHVbwPS8jQMv7h8N33y/vI32oOnc3bn3e3Nv9LqXLd+9e72ZQ75rygI"
+    "lagXdmaOYnt9+aQe3MYt/jV1wsixAAbYioMAedYccLxvv5MPff8ePy8062OuIt0e+Mc1wX"
+    "8ZT2fIBng6RZjfObAm0Bsj4I8A1h9Appj8EIL0xXYskYRD24SRLJTXGE3cmdASyYhN5IRj"
+    "szaepT9aMzAZ72AYNSehsuHr+v3V3eDy/S/CGPb6cnBF7vSE8SstfXKWm5kXjYBP14O3gP"
+    "wLfr+9ucprTIt6g98NwhOMI9/0/AcT2jxyaXFa9Eg02dE9p2GRgiG07h9gYJvCnawbwa/Q"
+    "wVJzXDzFm6HrR6Hci16yNt78/AG5sGDGSlV8rr073FwHFYTH9DtJS1mHVn5+66H1Mmllz0"
+    "EyJz7pd00g9dZPxrF9RitEgYOagetu0dQ+AmbjoWZuxhEebP4H1fp3Hcxek+Y+iq3tI2wP"
+    "0IlcrF+a2H5ev6d9Yq1d4cbm+wQZmT39nl80n8q3pr2pcopFX2JnNkWeQj97D735wCdXqq"
+    "FdYx6gZ6FitK/4tjrl3SjC+Yi9m5nzFQpvGpBuiBXUhdaSOQhNEV4/oNK5R3MBejPxzS2k"
+    "x+7z7SQ1okngx+OJeFN8BpYK5hBFiX/q8u7V5Wuqw5mSPGgfmkIPjmkZAebxqFhVUnlMFe"
+    "pUid9Uqcw16z79zOFCuwOcm/7IfEDonvyLO3AQmdRMwC+/pDLybFY155T9nK/JyQLL6U/t"
+    "tN250zYnoIrOgBxVmx2K2Hiep1Yl4Rc8Of7pve/hNzgCZz/dxeTX093Y/txHJkE/KDT3Ra"
+    "oiK7+ihb8tIdwRpgFhKpVFyIbBtQ16wWpXWuyZL/1C+kQIATHQBcEsBrQaYuFpOiKUK8/u"
+    "jEi0k3hrw5I4SdeYhSXCJqfjdtgXK8y+kj9PhbQM8xs/QM7Y+xlVtSnEVfluwqsyKwL4sN"
+    "AQ5S6m1OIfi12ma5qDpZZA6gZUGACch7BY7+edkRsNlvicUyKo+kz1/GHg36OAYVtUSRKC"
+    "WJGfCTOixB0mE2gjYDvDUJkRUKaIlq89VVNGayw5tXRg6uxqUjW1tlzIVVRbLeJWiDhyIl"
+    "ch3+LwqwXBPkSuiKFXvUqhV72S0KueHHql7ZBi9LUd0mY7RFij5NW8qrAKRBrSvDOP12+r"
+    "QioQrQFpy8bhjRjLSfdrwFD+GKKVoorbAepSE1n4TNXmsXqU1T6IRn0Q8uDQAMB1A0LaOT"
+    "AshVgYF1vo4rkMrInzFRnFnp60xlEVh48JudrLHD/GH/Fx/2RErv1jcn2O6O8L+vuUXvtc"
+    "CSsH9M9Jnuy5nVUSynv0eizVGR0lLY2yxzG6U65uUn4ildNrf8izlPB3vojyTErPucf3s9"
+    "/9c67JF4C7kVxPuSa5N+ifceUXz/L6rIZ0bUj/8MiP3knGJGMpucKkGshaZG/IodFPBNDj"
+    "mhgBjjqpCgFRFTjoGefngOOQR+xCwvuUb5Xy10cyEolQkrKEKSZG9nZLkAI8I8k/lsRV8k"
+    "pJU/3neckw7E6lF0D8s3myizyzDOULXrgXfG9DHAgW102kHstaPZUYe/FjInv8yr8whQ5w"
+    "BMecpIYck0n3OQZSr4ZS76r7VR0LLyhjf8L1tjOO2gKZO5OOETv1pGvH+LaMuGLHuHZBaB"
+    "dEdyDVLojGEdULY4ewaqIXxvZexHphTC+MrbAwVh3hphe/Eo/QKvuBc6R7ODAZAYL2refO"
+    "jcW+qC4MVGxQWGfH7xZ8m3RvZrFjM926udSrmW0X3XAsW9VwNGpxo28zB0uLfBvawG5IGd"
+    "CRZ1r70gr2gYtYK9gbVrC5mavuVyRQduc7MgYTBIgWAcLIn4Vg6PoW0SzoZiWMPAq+QhfA"
+    "Ef6Bi5wQTP10c+9hfXsW1oejlWwFkbI7XeNQTQUdH6kXJ7oDqY7mWwaqjubbNcBd2FHIwv"
+    "2KnTJZPOByt0wWi6gTMu+3c0WrhYeoFsYze0Wpi5Ra6m2RusIGlLLBaffLht0vh+epZkl7"
+    "WHKYkROE+B+L7Q1Eh+dlOSwnNs0OpGWfnm3BvI005ZliI09hkINM2NpYB+MDmmG1j2VMvw"
+    "ELjrcf/RB7keOqv7MC1SUlKPvAWvRx0ZTnhCcAPe7DAlM4T4LQQdVd1yW4ki9HWkSwEGVC"
+    "0Yf/fXd7U7SAwFPlIXasCPwfkOSxmwKYM8aGseNGjhc+I8+ra48Z13e3FPUQPDj4JeJIhH"
+    "9txAmEwpAmnY+RPwojN1aRBvLnY2g/r/bzthtS7eddBqr28+4a4LX9vBn42YSxtXMjWmZv"
+    "F4G+brb1Ume4lNhf4Q9XJf8vdokrTx7YeJ5tKU12oatcNS8VWxqq+UhhXbCutJ57fJO+nE"
+    "ZsidKM13UsC1a9I3bFx8ErwDhu2nQg60fINkOEW1EdA1N6cphI2OJzwyivSVZkYiI4HnWA"
+    "VIZ0c8eD+bHq5Inlx7UtCNsNOk1TEPmxNUkDvHaGuba3tmUcaC12r6IVsrNeFJqZcBBMsU"
+    "omHNGiAxT2O0CB/pWQLl6zTOvrU6KrnBLNcyaBXH6iMUe2D8vDZStRTZ1ovL1NfKr5M39+"
+    "liDr2seTrTeVdup8MvFV8weUlR1KJh86lj+WLH9sWVOHki08LYUz8Qf0ldgxA3xRukmE+6"
+    "XzcZDUxBMprlotapBmU+vxGbNgPo9Vf8hSniEpu9Z5QVInRZqzPp/g6YJL7cSlqhJyeglJ"
+    "17jMU0I+KZZsDDwRkkhZLnSm4L+R8/RHkH+SkpxjOsnQdSZlqBLem0/BBfkXS98y28UjE0"
+    "sA4yfkjSctltaIpcqu5vTDIxuVK29cxkDU0adY9b1Tp876FbSps36hMkVulWuucYgCs7ah"
+    "wBPpVEuHvr2xEfW1a4FU3LBWU8wi5R6KuaPRyS3PakLjBhQqcBpPUKz6kuFa75M5ADeU3i"
+    "dzKGOS3iezz1Kvsk+GDOp13c48TSPu0BaZSr3T0yp7ZU5Pi/fKkHs5XX4KVeHbxQgvCDS8"
+    "FeCdwTB88LFiNIHhpA7MEuE+OPe3AHiAxg55JGHNTCN+qgYQKYm7EU7UhF6miCSKkIvGAV"
+    "SHV5TsWBTJdN+t1nf9on2hV148lRaExK7rr7FFdLWdHjRYLKhpPxjEmAMpt3Vhf1EB9BeF"
+    "kL/IA76IvKqfEVdF2uKwrXg6QzbAll+yY8yaQG+M0j2DRGn6IQT8mda7DJ+jvK2i7Bc00Y"
+    "DWv52xKNlq1oBsumsE1PZHyR1I7jWbifNv6cQuB/orvrIs4e/aSKVJhvcZraIzAVeAq/Jx"
+    "gJ0E7AE6EdntaSIvWh+yT6y1K9zYfJ8g26QTXQRN4U2XUF2ehyoV68Y97DUzhAs78TgHr0"
+    "4XvkI3bdhTf3hJWA5ykfiwMq0cpIh1vqoN56s6vEVN49cYxdjGDWzmQNrXdS6dHFonDek+"
+    "pDppyDJQddKQXQPc6u2WlyhwrImhsMbZnaMyMxxmdXYS3qZzW2wgt0XhklOxXl281LTBZb"
+    "5uL6mSj6oGwqz6HqK7kW2r+ImRchtjcX5CjmT7yQl3o1w1lmlwp2Haj38BEMH3ew=="
+)
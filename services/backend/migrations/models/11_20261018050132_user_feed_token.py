@@ -0,0 +1,80 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "users" ADD "feed_token_hash" VARCHAR(64) UNIQUE;
+        COMMENT ON COLUMN users."feed_token_hash" IS 'sha256 of the calendar feed secret';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "uid_users_feed_to_ecb8ff";
+        ALTER TABLE "users" DROP COLUMN "feed_token_hash";"""
+
+
+MODELS_STATE = (
+    "eJztXeFzmzgW/1c0fNl2JtdJHDtJb29vJm3Ta27bZLdxrjvb3WFkkG0uGFwQTX29/O8rCT"
+    "ASEhhsbGNbX4gj9MTj9yTx3tPT03dj4tvIDV9cRraD/cCJJsbfwXfDgxNEfijuHgEDTqfZ"
+    "PVqA4cBl1eG8HiuHgxAH0MLk1hC6ISJFNgqtwJlix/dIqRe5Li30LVLR8UZZUeQ5XyJkYn"
+    "+E8BgF5MbnP0mx49noGwrTf6cP5tBBri3wHEWOTZ/O7ph4NmWl9/fXb96yuvSBA9Py3Wji"
+    "8fWnMzz2vTkBLX5Bqei9EfJQADGyuVehnCYvnhbFXJMCHERozq6dFdhoCCOXAmL8Yxh5Fs"
+    "UBsCfRS/efCXNcNdO8ue2bd1d90zRq4Gf5HsXe8TAF6/tT3G4GCSs16ANev7v8+Oz07DmD"
+    "wA/xKGA3GWDGEyOEGMakDPgMacdGHnbInUDG+/UYBmq8Raoc6oTp9eCdQrUGcI0J/Ga6yB"
+    "vhMfn35Pi4BO3/XH5kgJNaDHGfjI947NwktzrxPYp8hrQFp9By8EzG+drDaph5khzIhPFl"
+    "QE4LMpSzUb0JmEeUib91Trrn3YvTs+4FqcIYnZeclwB/fdPPYUrZwAkbEqx99K0A1xzZUv"
+    "036Z1tQbYEtv7Vb33a8iQMv7h8N3324fI31oMns+TO+9ubf6XVuW79+v3tqxzyX1EQKlEv"
+    "7Mwcxeb68kk9uI1b8mvihNixAAHYioIAedYMcLxvvpMPfP+BPC8062OuIt0c+Mc1wX8VTa"
+    "bIBuRzigi/M2CNoTdCwB8Coj+ATDH5IQTpi21ZIjGHtgmxLJQ3BE3SmdACyYhN5IRjJ228"
+    "SH+0ZmIy3sMQNyehsunr+sPVXf/ywy/CHPbmsn9F73SE+SstfXaW+zLPGwGfrvvvAP0X/H"
+    "57c5XXmOb1+r8blCcYYd/0/EcT2jxyaXFa9EQ12eEDp2HRggG0Hh5hYJvCnawbwa/QIVJz"
+    "XPKJN0PXx6Hci14lbbz9+SNyYcEXK1XxufbuSHM7qCA8peMkLU06tHL4rYbWq7iVPQfJHP"
+    "u03zWB1Ds/nsf2Ga0QBQ5qBq67eVP7CJhNppqZGWEy2fwPqvXvOpi9oc3di63tI2yP0MEu"
+    "0S9NYj+v3tM+Ja1dkcZm+wQZ/Xr6Hb/oeyrfmnQmyk8s+hI50wnyFPrZB+jN+j69Mg3tmv"
+    "AAPQsVo33Ft7VT3o0inI+SdzNzvkLhTQPaDYmCOtdaMgehKcLrB0w6D2gmQG/Gvrm59JL7"
+    "fDtxDTwO/Gg0Fm+KzyBSIRwiHPunLu9eX75hOpwpyYP1oQn04IiVUWCejopVJZXHVKFOlf"
+    "hNlcpcs+7TzxwurDvAmekPzUeEHui/pAMH2GRmAnn5BZWRZydVc07Zz/manCyInP7UTtut"
+    "O21zAqroDMhRtdmhSIznWWpVUn7Bs+OfPvgeeYMjcPbTXUR/Pd+O7c8NMgn6fqG5L1IVWf"
+    "kVLfxNCeGOMg0oU6kswmQaXNmgF6x2pcWe+dIvpCFCCaiBLghmPqHVEAtPsyNCufLsnRGJ"
+    "dhJvbFoSP9I1vsISYZOf43bYF0t8fSV/ngppGea3foCckfczqmpTiKvyuwmvyqwI4ONcQ5"
+    "S7mFKLfyp2ma5oDpZaAqkbUGEAcB7CYr2fd0auNVjic06JYOoz0/MHgf+AggTbokqSEMSK"
+    "/JcwI4rdYTKBNgI2Mw2VGQFlimj52lM1ZbTGklNLJ6adXU2qptaWC7mKaqtF3AoRYwe7Cv"
+    "kWh1/NCfYhckUMvepUCr3qlIRedeTQK22HFKOv7ZA22yHCGiWv5lWFVSDSkOadebx+WxVS"
+    "gWgFSFs2D6/FWI67XwOG8n2IlooqbgeoC01kYZiqzWP1LKt9EI36IOTJoQGA6waEtHNiWA"
+    "ixMC+20MVzGVhj5ysyij09aY2jKg4fE3K1Fzl+jD+i4+7JkF67x/R6itjvC/a7x65driQp"
+    "B+zPSZ7s1M4qCeUddj2W6gyP4paG2eMSuh5XNy4/kcrZtTvgWYr5O59Hecal59zju9nv7j"
+    "nX5EvA3YivPa5J7g26Z1z5xYu8PqshXRnSPzz6o3OSMZmwFF9hXA1kLSZvyKHRjQXQ4ZoY"
+    "Ao46rgoBVRU46BPOzwHHIY/YhYR3j2+V8ddFMhKxUOKymKlEjMnbLUAK8IzE/1gSV/ErxU"
+    "11T/OSSbDrSS+A+GfzZBd5ZhOUL3jhXvC9DXEgWFw3kXps0mpPYuzlj7HsySv/kih0gCM4"
+    "5iQ14JiMu88xkHo1lHpX3VF1LLygjP0J19vOOGoLZO5MNkds1ZOuHeObMuKKHePaBaFdEL"
+    "sDqXZBNI6oXhg7hFUTvTC29yLWC2N6YWyJhbHqCDe9+BV7hJbZD5wj3cOJyQgQtG89d2bM"
+    "90XtwkSVTAqr7PjdgG+T7c0sdmymWzcXejWz7aJrjmWrGo7GLG70beoQadGxoQ3shpQBHX"
+    "mmtS+tYB+4iLWCvWYFm/ty1R1FAuXujCOjP0aAahEgxP40BAPXt6hmwTYrEeRR8BW6AA7J"
+    "D1LkhGDip5t7D2vsWUQfxkvZCiLl7nSNQzUVdHykXpzYHUh1NN8iUHU037YB3oUdhUm4X7"
+    "FTJosHXOyWyWIRdULm/XauaLXwENXCaGovKXWRUku9LVJX2IBSNjjtflmz++XwPNVJ0p4k"
+    "OczQCULyj5XsDUSH52U5LCc2yw6kZZ+ebZF4G1nKM8VGnsIgB5mwtbEOxkc0JWpfkjH9Bs"
+    "w53nz0Q+Rhx1WPswLVJSUoG2AtGlws5TnlCUCPG1hgAmdxEDqouuu6BFc6cqRFBAsxJhR9"
+    "+N93tzdFCwg8VR5ix8Lg/4Amj10XwJwxNogcFzte+II+r649Zlzf3TLUQ/DokJeIsAj/yo"
+    "hTCIUpTTofI38URm6uog3kz8fQfl7t5203pNrPuwhU7efdNsAr+3kz8LMPxsbOjWiZvV0E"
+    "+qrZ1kud4VJif4U/XJX8v9glrjx5YO15tqU02YWuctV3qdjSUH2PFNZF0pVWc4+v05fTiC"
+    "1RmvG6jmWRVN8Ru+K+/xokHDdtOtD1I2SbISKtqI6BKT05TCRs8blhjNc4KzI1ERyPOUAq"
+    "Q7q+48H8SHXyxOLj2uaE7QadpSnAfmSN0wCvrWGu7a1NGQdai92raIXsrBeFZiYcBFOskg"
+    "lHtOgAhf0OUGB/JaSL1yzT+vqU6CqnRPOcSSCXn2jMke3D8nDZSlRTJxpvbhOf6vuZPz9L"
+    "kHXt48lW+5Tu1Plk4qvmDygrO5RMPnQsfyxZ/tiypg4lm3taCr/EH9FXasf0yUXpJhHul3"
+    "6Pg7gm+ZCSqtWiBlk2tQ6fMQvm81h1B0nKMyRl1zovSOqkSHPW5RM8XXCpnbhUVUJOLyHp"
+    "Gpd5SsgnlSQbA8+EJFKWC50J+C92nv8I8k9SknNMxxm6zqQMVcJ78ym4IP9i6Vtmu3hkYg"
+    "lg8oS88aTF0hqxVNnVnA48ulG58sZlAkQdfSqpvnfq1Fm3gjZ11i1Upuitcs01ClFg1jYU"
+    "eCKdaunQtzc2or7uWiAVN63VFLNIuYdi3tHo5JZnNWFxAwoVOI0nKFZ96XSt98kcgBtK75"
+    "M5lDlJ75PZZ6lX2SdDJ/W6bmeephF3aItMpU6vV2WvTK9XvFeG3svp8hOoCt8uRnhOoOGt"
+    "AO8UhuGjTxSjMQzHdWCWCPfBub8BwAM0cugjKWtmGvFTNYBISbwb4URN6GWKSCKMXDQKoD"
+    "q8omTHokim+261vusX7Qu98qKJtCAkdl1/hS2iy+30YMFiQU37waDGHEi5rQv7ywqgvyyE"
+    "/GUe8HnkVf2MuCrSFodtRZMpsgGx/OIdY9YYeiOU7hmkStMPIeDPtN5m+BzjbRllv6CJBr"
+    "T+zcxF8VazBmSzu0aAbPsNUbqkWVuHUpC2Vmk1wjHs9M5SsVuQzHk2DAB9BxAiK0AVk+Wt"
+    "Y3mlhn9QHtCyxNaz76Klipa88UIx62UJmFdGKk36vM9oFZ3RuARclY9n3EnAHqGD6e5bE3"
+    "l4dcg+Ja1dkcZm+wTZOhc1RNAUqxsSqovzgqViXfuKR82M7cLOSM7hrtO3L9FNG145Obyk"
+    "OAe5aH9YmW8OUsQ6f9ia84cd3iKz8WuEIgT8wE4cevu67qiTdeskLrsPqU7isghUncRl2w"
+    "C3evvrJQoca2worPHkzlGZGQ6zOlsJN9S5RtaQa6RwCbBYry5e+lvjsutuL3HTQVUD4aT6"
+    "HqK7lm3E5IlYua20OF8kR7L5ZJHbUa4ay/y41bD5p78A0r14Ww=="
+)
@@ -0,0 +1,80 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "auditoriums" ADD "availability_version" INT NOT NULL DEFAULT 0;
+        COMMENT ON COLUMN auditoriums."availability_version" IS 'Bumped on every change of the auditorium''s availability slots';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "auditoriums" DROP COLUMN "availability_version";"""
+
+
+MODELS_STATE = (
+    "eJztXf9zmzgW/1c0/LLtTK6TuM6X3t7eTNqkt7ltk73Gve5sd4eRQba5YHBBNPX18r+fJM"
+    "BISGCwsY2xfiGO0BOPz5PEe09PT9+NqW8jN3xxGdkO9gMnmhp/Bd8ND04R+aG4ewQMOJtl"
+    "92gBhkOXVYeLeqwcDkMcQAuTWyPohogU2Si0AmeGHd8jpV7kurTQt0hFxxtnRZHnfImQif"
+    "0xwhMUkBuf/yTFjmejbyhM/509mCMHubbAcxQ5Nn06u2Pi+YyVfvx4c/WW1aUPHJqW70ZT"
+    "j68/m+OJ7y0IaPELSkXvjZGHAoiRzb0K5TR58bQo5poU4CBCC3btrMBGIxi5FBDjb6PIsy"
+    "gOgD2JXvp/T5jjqpnm7d3AvL8emKZRAz/L9yj2jocpWN+f4nYzSFipQR/w5ufLD89enj1n"
+    "EPghHgfsJgPMeGKEEMOYlAGfIe3YyMMOuRPIeL+ZwECNt0iVQ50wvRm8U6g2AK4xhd9MF3"
+    "ljPCH/nhwfl6D978sPDHBSiyHuk/ERj53b5FYvvkeRz5C24AxaDp7LON94WA0zT5IDmTC+"
+    "CshpQYZyNqq3AfOYMvGX3kn/vH/x8qx/QaowRhcl5yXA39wOcphSNnDChgTrAH0rwDVHtl"
+    "L/TXpnW5AtgW1w/duAtjwNwy8u302fvb/8jfXg6Ty58+7u9h9pda5bv3l39zqH/FcUhErU"
+    "CzszR7G9vnxSD27jjvyaOiF2LEAAtqIgQJ41Bxzv2+/kQ99/IM8LzfqYq0i3B/5xTfBfR9"
+    "MZsgH5nCLC7xxYE+iNEfBHgOgPIFNMfghB+mI7lkjMoW1CLAvliqBJOhNaIhmxiZxw7KSN"
+    "F+mP1kxMxjsY4uYkVDZ93by/vh9cvv9VmMOuLgfX9E5PmL/S0mdnuS/zohHw6WbwM6D/gt"
+    "/vbq/zGtOi3uB3g/IEI+ybnv9oQptHLi1Oi4TeAb9ChwjDccmXe4UxW0TeiXHLvxwIXR9v"
+    "cQRTa2P0wGnBtGAIrYdHGNimcKdAmAuGRVG+Ttp4+8sH5MICrSI1w7j27klze6jEPaU9Ni"
+    "1NJh3lFLkeWq/jVjoOkjnxab9rAqmf/XhG6TJaIQoc1Axc94umugiYTaaauRlhMtn8F6pt"
+    "pDqYXdHmPoqtdRG2R+hgl9gAJvLw+j3tU9LaNWls3iXI6NfT7/lF31P51rQ3VX5i0ZfImU"
+    "2Rp9Ch30NvPvDplelKN4QH6FmoGO1rvq298kAV4XyUvJuZ8+cKbxrQbkiMiIXWkjlxTRFe"
+    "P2DSeUBzAXoz9p8upJfc59uJa+BJ4EfjiXhTfAaRCuEQ4diHeHn/5vKK6dmmJA/Wh6bQg2"
+    "NWRoF5OipWlVRebYU6VeLbVipzzbq4P3O4sO4A56Y/Mh8ReqD/kg4cYJOZcuTll1RGnp1U"
+    "zTnOP+drcrIgcvpTO9Z37ljPCaii8ZejarPT17iC89TGo/yCZ8c/vfc98gZH4Oyn+4j+er"
+    "4b/ww3yCToB4UuGZGqyBNT0QuzLSHcU6YBZSqVRZhMg2s7XQTPitKrkq13XEhDhBJQJ4og"
+    "mMWEVkMsPM2eCOXas/dGJNqRv7VpSfxI1/gKS4RNfo7bYV+s8PWV/HkqpGWY3/oBcsbeL6"
+    "iqTSFGTuwnvCqzIoCPCw1R7mJKLf6p2GW6pjlYagmkbkCFAcB5CIv1ft4ZudGAls85JYKp"
+    "z0zPHwb+AwoSbIsqSUIQK/JfwowodofJBNoI2M40VGYElCmi5euD1ZTRGsuCLZ2YOrHiV6"
+    "zWlgu5imqrRdwKEWMHuwr5FofILQi6EF0khsf1KoXH9UrC43pyeJy2Q4rR13ZIm+0QYY2S"
+    "V/OqwioQaUjzzjxev60KqUC0BqQtm4c3YizH3a8BQ/ljiFaK/G4HqEtNZGGYqs1j9SyrfR"
+    "CN+iDkyaEBgOsGhLRzYlgKsTAvttDFcxlYE+crMoo9PWmNoyoOHxNytZc5fow/ouP+yYhe"
+    "+8f0+hKx3xfs9ym79rmSpBywPyd5spd2Vkko77HrsVRndBS3NMoel9CdcnXj8hOpnF37Q5"
+    "6lmL/zRSRuXHrOPb6f/e6fc02+AtyN+HrKNcm9Qf+MK794kddnNaRrQ/qHR3/0TjImE5bi"
+    "K4yrgazF5A05NPqxAHpcEyPAUcdVIaCqAgd9wvk54DjkEbuQ8D7lW2X89ZGMRCyUuCxmKh"
+    "Fj8nZLkAI8I/E/lsRV/EpxU/2Xeckk2J1KL4D4Z/NkF3lmE5QveOFe8L0NcSBYXDeRemzS"
+    "6qnE2KsfY9mTV/41UegAR3DMSWrIMRl3n2Mg9Woo9a66o+pYeEEZ+xOut51x1BbI3Jlsjt"
+    "ipJ107xrdlxBU7xrULQrsg9gdS7YJoHFG9MHYIqyZ6YazzItYLY3phbIWFseoIN734FXuE"
+    "VtmznSPt4MRkBAjad547Nxb7ovZhokomBWmeqrHjdwu+TbY3s9ixmW7dXOrVzLaLbjiWrW"
+    "o4GrO40beZQ6RFx4Y2sBtSBnTkmda+tIJ94CLWCvaGFWzuy1V3FAmU+zOOjMEEAapFgBD7"
+    "sxAMXd+imgXbrESQR8FX6AI4Ij9IkROCqZ9u7j2ssWcRfRivZCuIlPvTNQ7VVNDxkXpxYn"
+    "8g1dF8y0DV0Xy7BngfdhQm4X7FTpksHnC5WyaLRdRJs7vtXNFq4SGqhdHMXlHqIqWWeluk"
+    "rrABpWxw2v2yYffL4Xmqk6Q9SXKYkROE5B8r2RuIDs/LclhObJYdSMs+PX8k8TaylGeKjT"
+    "yFQQ4yYWtjHYwPaEbUviQ79i1YcLz96IfIw46rHmcFqktKUDbAWjS4WFp6yhOAHjewwBTO"
+    "4yB0UHXXdQmudORIiwgWYkwo+vA/7+9uixYQeKo8xI6Fwf8ATR67KYA5Y2wYOS52vPAFfV"
+    "5de8y4ub9jqIfg0SEvEWER/rURpxAKU5p0hkn+uJLcXEUbyJ9hov282s/bbki1n3cZqNrP"
+    "u2uA1/bzZuBnH4ytnRvRMnu7CPR1s62XOsOlxP4Kf7gq+X+xS1x58sDG82xLabILXeWq71"
+    "KxpaH6Himsi6Qrrece36QvpxFbojTjdR3LIqm+J3bFx8EbkHDctOlA14+QbYaItKI6Bqb0"
+    "dDeRsMVnRDFe46zI1ERwPOYAqQzp5o5w8yPVyRPLj9RbELYbdJamAPuRNUkDvHaGuba3tm"
+    "UcaC22U9EK2VkvCs1MOAimWCUTjmjRAQrdDlBgfyWki9cs0/r6JO8qJ3nznEkgl586zZF1"
+    "YXm4bCWqqVOnt7eJT/X9zJ+fJci69vFk631K9+p8MvFV8weUlR1KJh86lj+WLH9sWVOHki"
+    "08LYVf4g/oK7VjBuSidJMI90u/x0Fck3xISdVqUYMsm1qPz5gF83ms+sMk5RmSsmudFyR1"
+    "UqQ56/MJni641E5cqiohp5eQdI3LPCXkk0qSjYFnQhIpy4XOFPwHO89/BPknKck5puMMXW"
+    "dShirhvfkUXJB/sfQts108MrEEMHlC3njSYmmNWKrsak4HHt2oXHnjMgGijj6VVO+cOnXW"
+    "r6BNnfULlSl6q1xzjUIUmLUNBZ5Ip1o69O2Njaiv+xZIxU1rNcUsUnZQzHsandzyrCYsbk"
+    "ChAqfxBMWqL52u9T6ZA3BD6X0yhzIn6X0yXZZ6lX0ydFKv63bmaRpxh7bIVOqdnlbZK3N6"
+    "WrxXht7L6fJTqArfLkZ4QaDhrQDvDIbho08UowkMJ3Vglgi74NzfAuABGjv0kZQ1M434qR"
+    "pApCTej3CiJvQyRSQRRi4aB1AdXlGyY1Ek0323Wt/1i/aFXnvRVFoQEruuv8YW0dV2erBg"
+    "saCm/WBQYw6k3NaF/VUF0F8VQv4qD/gi8qp+RlwVaYvDtqLpDNmAWH7xjjFrAr0xSvcMUq"
+    "XphxDwZ1rvMnyO8baKsl/QRANa/3bmonirWQOy2V8jQLb9Rihd0qytQylIW6u0GuEE9k7P"
+    "UrFbkMx5NgwAfQcQIitAFZPlbWJ5pYZ/UB7QssQ2s++ipYqWvPFCMetlCZjXRipN+txltI"
+    "rOaFwBrsrHM+4lYI/QwXT3rYk8vD5kn5LWrklj8y5BtslFDRE0xeqGhOryvGCpWDe+4lEz"
+    "Y7uwM5JzuOv07St004ZXTg4vKc5BLtofVuabgxSxzh+24fxhh7fIbPwrQhECfmAnDr2urj"
+    "vqZN06icv+Q6qTuCwDVSdx2TXArd7+eokCx5oYCms8uXNUZobDrM5Owg11rpEN5BopXAIs"
+    "1quLl/42uOy630vcdFDVQDip3kF0N7KNmDwRK7eVFueL5Ei2nyxyN8pVY5kfdxo2//R/as"
+    "4BUA=="
+)
@@ -0,0 +1,58 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE EXTENSION IF NOT EXISTS btree_gist;
+        ALTER TABLE "bookings" ADD COLUMN IF NOT EXISTS "time_range" TSTZRANGE
+            GENERATED ALWAYS AS (tstzrange("start_time", "end_time", '[)')) STORED;
+        ALTER TABLE "bookings" ADD CONSTRAINT "bookings_no_overlap"
+            EXCLUDE USING gist ("auditorium_id" WITH =, "time_range" WITH &&);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "bookings" DROP CONSTRAINT IF EXISTS "bookings_no_overlap";
+        ALTER TABLE "bookings" DROP COLUMN IF EXISTS "time_range";"""
+
+
+MODELS_STATE = (
+    "eJztXFtv2zYU/iuCnlIgC1o3SdthHeAk7pq1sYfY3YoWg8BItE1YIh2JSmJ0+e8jqSslUv"
+    "G9sqOXxD7koajvkDw3Hv8wPeJANzhqhw6ixEehZ/5q/DAx8CD7oGg9NEwwnWZtnEDBjSu6"
+    "g7SfoIObgPrApqxpCNwAMpIDA9tHU4oIZlQcui4nEpt1RHiUkUKMbkNoUTKCdAx91vD9X0"
+    "ZG2IEPMEi+TifWEEHXkeYchsjhTxctFp1NBfXLl8uLD6Ivf+CNZRM39HC+/3RGxwSnDJx8"
+    "xLl42whi6AMKndyr8JnGL56QolkzAvVDmE7XyQgOHILQ5YCYvw1DbHMcDPEk/uf493hyuW"
+    "6W1e0NrH5nYFnmAvjZBHPsEaYcrB+P0bgZJIJq8gecf2xfH7w+fSEgIAEd+aJRAGY+CkZA"
+    "QcQqgM+QRg7EFLEWv4z3+Rj4arxlrgLqbNKbwTuBagPgmh54sFyIR3TMvr56+bIC7b/b1w"
+    "Jw1ksgTtj+iPZON25qRW0c+QxpG0yBjeisjPMlpmqY8ywFkNnElwE5IWQoZ7t6GzCP+CR+"
+    "ab06fnP89vXp8VvWRUw0pbypAP6yOyhgyqdB42mUYB3ABw2uBbal1m+8OuuCbAVsg87XAR"
+    "/ZC4JbN79MD67aX8UK9mZxy+de94+ke25Zn3/unTHk+XE9nOSOEU64AfbkHviOJbVkIgJ3"
+    "ADHMkMvWsRW4hAZlSZ3FY3z4dA1doBFLosdy4/XZcDu4Cx6T9ZhQ4+UkLe0bQiZskBXROo"
+    "tG2XOQrAD6CK4Hqn461L4AxncpaRHdvi03eS1PuZXhbYimHow0jwz0FcCzAeF/xYl7yeYA"
+    "sA31aHfyY+2UqaDD+TB+N6tgeEtv6vNlCJ20T87atmR4iS+kM4EzCXorMnRT6cXt+XGiHn"
+    "Tsk3A0lhvlZzCpsBlCGhl77f55+6LD6VZJHmINeQCDkaBxYB4P9Ueyyv1QHNsVTohSaazX"
+    "F/mew0UsBzCzyNC6h3DCv7IF7FOLIvYW7OWf6AyxE3dtPJyN2DAreDgFUc1pehe46mx9mx"
+    "dgZpChwRa2wedrHLx8f0Uwe4ND4/R9P+SfBHDbt89zm6hsnjOqGnuZqwA9kzPkTUdJe02E"
+    "0OeTNvikElkE8TG3mvF+edWRTHROODjVOp5vS1uEMwy+FQSTHlgLiCXPsyNC6WBnZ0SS09"
+    "KLqYYS4zp1RD2M2iVUQslZVSFdhvkD8SEa4U9wXkNWjqvuJrwqW9YH96nZUl5iStPxUR8P"
+    "WNEHqTQ/Ex9XYXXm3F+9sZn3tJtw934bg1UGyUWsxFYxSpIPu3sW6DRef9C++ksKI160Bx"
+    "3e0pKUYUItKcR0EOOfy8FHg381vvW6HZVyFP24huRbMqTEwuTeAk4ek4SckOY0b6qFPI+J"
+    "04i4FiKmiLoK+epzVinDPoT75XxVa658VasiX9Uq56sae3TNWikXtvbJBPoLwioxNZAWIw"
+    "0ibL8gpBLTCpDW7HDYiNMULb81OExfArjU/YB6gPqkqyRtU7WbpD5lG190rb5o+XBYA8CL"
+    "5gjreTA8CbF0LtbQ1Y/x1zv8mYCedPtzuePG+d9v59/2oUi+AkUCu9ovlDn30DM02Qs6Pe"
+    "zOzPSWxS54ivEyrXQUw6mzpNRlzkbqdZG6Ij5QuhnUhAc2HB54fpHUOMUbpxKHyA/YF9sO"
+    "fR/GRuPzisA9ryCryCU3sk/KBjCF/h1wxQUZhWelvVdTZtze1ZpXC0r8Gk6Z2WfAO+jPjK"
+    "6Rznj792hCTJGr3mca0yVhqNpgNdpcnwHbUHxOBsC5jWV4YGYE0bGLV95lfOcU78E82FBM"
+    "QrGG/+z3upoTTOIqQoxsavxnuCjY2ELOOWM3IXIpwsERf96i/ph52e8J1APjHrGXCKkM/8"
+    "qIcwilI61UelCsMiicVXyAsyYx0SQmdgrSJoz+FKhNGP1nA7zyla4M/ExhbK1aqWb+9qZq"
+    "byqD4VlhiSIQLlWd6IPgUj1IE//e7/i3+F9CWh8SS/o39d3z1HfnZ1YCuboWOce2D9HHmt"
+    "Uir63+UV+st1ot5Gr2xk4VQ8qvWqyGrKqALFc4FmsgizWS66qATBW5VhMLW1yhhBMbXa9/"
+    "Q9ajyT0/A93b5J71unk3s5BN7vk5Sn2e3DM/1Be1tfM8a7EBa2Rut05O5sk/n5zo88+8rR"
+    "C594AqJaJHOGVo4J0D3ikIgnvCjKsxCMaLwFxi3AePZguA+3CE+CP51KwkOzdvuk/JvBup"
+    "v3XYZYrEHmVm/cgH6hRRxS0gma1Zu/OtXaK7a9XBoVfyguWlS1a4drVc9pTf/I0cs0Vypd"
+    "yZM5LZLgr7uzlAf6eF/N2LZX99rfkVMU1gvvkVsRplMtoMLXtsqn42Kmo5rPyxqKzPTwmi"
+    "qDSM/v6TSq8o7jzFSqS2gb/13HDSx0vuoB8oI+l63Z1j2Z4y2W3FzTfVAgjH3fcQ3c384i"
+    "/BVJkh0N8sy7Fs/1rZzzHe13ZHbHspIYUye/wf2oJLIw=="
+)
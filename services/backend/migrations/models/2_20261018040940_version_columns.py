@@ -0,0 +1,61 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "auditoriums" ADD "version" INT NOT NULL DEFAULT 1;
+        ALTER TABLE "availability_slots" ADD "version" INT NOT NULL DEFAULT 1;
+        ALTER TABLE "bookings" ADD "version" INT NOT NULL DEFAULT 1;
+        COMMENT ON COLUMN auditoriums."version" IS 'Optimistic concurrency version';
+COMMENT ON COLUMN availability_slots."version" IS 'Optimistic concurrency version';
+COMMENT ON COLUMN bookings."version" IS 'Optimistic concurrency version';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "auditoriums" DROP COLUMN "version";
+        ALTER TABLE "availability_slots" DROP COLUMN "version";
+        ALTER TABLE "bookings" DROP COLUMN "version";"""
+
+
+MODELS_STATE = (
+    "eJztXP9vmzgU/1cQP3VSr9qytttOt5OyNrvltianJrubNp2QC05iBewMTNto1//9bAcIBp"
+    "tCvo2k/NKGZz94fN6z/b7Y/DA94kA3OGmHDqLER6Fn/mr8MDHwIPuhaD02TDCbLds4gYIb"
+    "V3QHST9BBzcB9YFNWdMIuAFkJAcGto9mFBHMqDh0XU4kNuuI8HhJCjH6HkKLkjGkE+izhm"
+    "//MjLCDryHQXw5m1ojBF1HkjkMkcOfLlosOp8J6ufP3cv3oi9/4I1lEzf0cLr/bE4nBCcM"
+    "nHzCuXjbGGLoAwqd1KtwSaMXj0kLqRmB+iFMxHWWBAeOQOhyQMzfRiG2OQ6GeBL/c/p7JF"
+    "yqm2X1+kNr0BlallkBP5tgjj3ClIP142Fx3yUkgmryB1x8aF8fvTx/JiAgAR37olEAZj4I"
+    "RkDBglUAv0QaORBTxFr8PN4XE+Cr8Za5MqgzobeDdwzVFsA1PXBvuRCP6YRdvnj+vADtv9"
+    "vXAnDWSyBO2PhYjJ1e1NRatHHkl0jbYAZsROd5nLuYqmFOs2RAZoKvAnJMWKK8HNW7gHnM"
+    "hfil9eL01enrl+enr1kXIWhCeVUAfLc3zGDKxaCRGDlYh/Beg2uGbSX7jayzLsgWwDbsfB"
+    "nyO3tB8N1Nm+nRVfuLsGBvHrV86vf+iLunzPriU/9dBvlb6AdK1LXGnOLYnS2/qAa32We/"
+    "PBRQZBsMYDv0fYjtuZGSfTdGzlfG0TQ1Y3PCDbCnd8B3LKllqRNwCxBDC7lsyrACl9Agr5"
+    "530T3ef7yGLtCMgNhlSN1vwG63hxPOQ2yFMTUauZIt3xAyZTdZE613i7scOEhWAH0ENwPV"
+    "ILnVoQDGRylpEd24zTd5LU85lOH3EM08uJgYZaCvAJ4PCf8r5tkukwFgG+rR7qTvtVdemQ"
+    "7n4+jdrEyMI72pz80QOkmfVGBjyfASX2hnCucS9NYipki0F7Wn77PoQSc+CccTuVF+BtMK"
+    "kxDShV/dHly0LzucbuX0IWzIAxiMBY0D83Csn5JVkZ5i2i6I95SLxmbDvm8pXIQ5gLlFRt"
+    "YdhFN+yQzYpxZbeKHJXv6RzhA7UdcmmNyKu7hGMJlRVUnHMMNV50DHvARzg4wMZtgGl9c4"
+    "ev72imD2BsfG+dtByH89252XmF6fU4MoB/2QUdXYy1wZ6JmeIW86idtrooQBF9rgQsW6CK"
+    "Jpbr04qXvVkaIhTjg618b4r3NDhDMMv2YUk0xYFdSS5tkTpXSwszcqaYLXnU1LKYeo2iqc"
+    "Y9zkclyP+GGF1TeXF1AhnYf5PfEhGuOPsGzMIFcL9hNeVdjgg7vEQ8ybmNJLf9CnXtYM9w"
+    "o9/TidoHDwU5kGvV+fTmo0RZzD9ruLfL/LyF9Yx/+Lf+zvXKBzLgbD9tVfUnL8sj3s8JaW"
+    "5HfE1JzvkdzE+Kc7/GDwS+Nrv9dR+SGiH3dG+JAMKbEwubOAk8YkJsekkp5ksZLLeJONim"
+    "uhYoqoq9CvvhKbMBxCEUuuwrZKVWFbBVXYVr4K27j+evQb17/Orr9UjPHJFPoVYZWYGkiz"
+    "+TNRjKoIqcS0BqQ1m4e3Ep8uzG8DsennAK60wageoD4alUrDVB2RqmfZJuzfaNifnxw2AH"
+    "DVync9J4ZHIZbmxRpmVSL89bmVpYIezbCkdkQ0eZbDzrPYPhRbCoBiW0ZxCC5zHmAQbrIX"
+    "dPrYnZvJ3qF9CMojMy2MycOZs6LWZc5G63XRuiIVk9vv1mRitpyJeXpJ62jjQlQgHyE/YB"
+    "d2lKyB5ZI0+zvCnno+W+yQaHQfnzvCFPq3wBXbvhSRlTYdm2esb1b2Gs6Y22fAW+jPjZ6R"
+    "SLz7XGyIKXLV40zjusQMRQOsRoPrE2ADistkAJwaWIYH5kawmHZLpsELcOUjJ7u7696GQg"
+    "iFDf856Pc0M5jElYUY2dT4z3BRsDVDTgVjNyFyKcLBCX9e1XjM7A76AvXAuEPsJUIqw782"
+    "4hxCaUrLnV3KHlPKzFX8BtmzS01hoilM1BvSJo3+GKhNGv1nA7z27rkl+MsFY2dn8GoWb2"
+    "/rRFlhMnx5XEqRCJfOUumT4NIppyb/fdj5b/E/h7Q+JRb3bz4QUeYDEWnJciAXf8wgxXYI"
+    "2cddfMygwgn7jZ3q1R9BlXRd+YTvev7GXh3xlV81e8a36Fxv/txu9mRv9uTvps71Jgu5di"
+    "UWvrhiEY59dP36G7IeTe35Cay9Te1ZvzbvZxWyqT0/Ra2XqT3zSb2qr53m2YgPWCN3u3V2"
+    "Vqb+fHamrz/ztkzm3gOqkoge4YShgbcEvDMQBHeEOVcTEEyqwJxjPISIZgeA+3CM+CO5aF"
+    "ZcnStb7lMy70fpbxN+maKwR5lbP/aBukRUsAtIZmtst5ztEt1eqw4OvVwULJsuWWPb1WrV"
+    "U77zdxGYVamV8mDOiKWtCvubEqC/0UL+5tmq3xRsvo2nScw338arUSWjzdCyJ6bqY2iLlu"
+    "PCT6At+/yUJIpqhdHvf1KtK4o9T9EiUtvE32Z2OOnzJdqDvvq1W3/Sd4uLyX4v3HxQVUA4"
+    "6n6A6G7nk+EEU2WFQL+zLMWy+21lP8d539gesd2VhBSL2cP/Lj6lQw=="
+)
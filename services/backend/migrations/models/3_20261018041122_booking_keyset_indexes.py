@@ -0,0 +1,57 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_bookings_start_t_4b5b67" ON "bookings" ("start_time", "uuid");
+        CREATE INDEX IF NOT EXISTS "idx_bookings_broker__4729c6" ON "bookings" ("broker_id", "start_time", "uuid");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_bookings_broker__4729c6";
+        DROP INDEX IF EXISTS "idx_bookings_start_t_4b5b67";"""
+
+
+MODELS_STATE = (
+    "eJztXG1v2zYQ/iuCPqVAFrRukrbDOsBN3DVrYw+xuxUtBoGRaJuIRDoSlcTo8t9H0pJMSq"
+    "Qixy+RHX1JrCNPOj13JO+F1E87IB70o4N27CFKQhQH9q/WTxuDALIfmtZ9ywaTybyNEyi4"
+    "9EV3kPUTdHAZ0RC4lDUNgR9BRvJg5IZoQhHBjIpj3+dE4rKOCI/mpBij6xg6lIwgHcOQNf"
+    "z4l5ER9uAdjNLLyZUzRND3FJnjGHn86aLFodOJoH79enb6UfTlD7x0XOLHAZb7T6Z0THDG"
+    "wMkHnIu3jSCGIaDQk16FS5q8eEqaSc0INIxhJq43J3hwCGKfA2L/Noyxy3GwxJP4n8PfE+"
+    "Gkbo7T7Q2cfmfgOPYC+LkEc+wRphysn/ez+84hEVSbP+DkU/ti7/XxCwEBiegoFI0CMPte"
+    "MAIKZqwC+DnSyIOYItYSFvE+GYNQj7fKlUOdCb0evFOo1gCuHYA7x4d4RMfs8tXLlyVo/9"
+    "2+EICzXgJxwsbHbOx0k6bWrI0jP0faBRPgIjot4nyGqR5mmSUHMhP8MSCnhDnK81G9CZhH"
+    "XIhfWq8O3xy+fX18+JZ1EYJmlDclwJ91BzlMuRg0EaMA6wDeGXDNsT3KfhPrrAuyJbANOt"
+    "8G/M5BFF37spnunbe/CQsOpknLl173j7S7ZNYnX3ofcsjfwDDSom40Zoljc7b8ajG47R77"
+    "FaCIItdiALtxGELsTi1J9s0YOV8Zh1fSjM0Jl8C9ugWh5ygtc52AG4AYWshnU4YT+YRGRf"
+    "V8SO7x8fMF9IFhBKQug3S/PrvdFk4496kVptRk5Cq2fEnIFbvJkmh9mN1lx0FyIhgiuBqo"
+    "+tmtdgUwPkpJi5jGbbEpaAXaoQyvYzQJ4GxiVIE+B3g6IPyvmGfPmAwAu9CMdke+11Z5ZS"
+    "ac95N3c3IxjvKmITdD6GV9pMDGUeElodDOFZwq0DuzmCLTXtIu32fWg45DEo/GaqP6DKYV"
+    "JiGkM7+63T9pn3Y43SnoQ9hQADAYCRoH5n7fPCXrIj3NtF0S72kXjdWGfT8kXIQ5gKlDhs"
+    "4thFf8khlwSB228EKbvfwDnSH2kq5NMLkWd3GJYDKnqoqOYY6rzoGOfQqmFhlazLAtLq+1"
+    "9/L9OcHsDfat4/f9mP96sTkvUV6fpUFUgH7AqHrsVa4c9EzPkDcdpO01UUKfC21xoVJdRM"
+    "k0t1ycdHbeUaIhTtg7Nsb4bwtDhDMMvucUk01YC6hF5tkSpXSwtzUqaYLXjU1LkkO02Cpc"
+    "YFzlclyP+OERq28hL6BDugjzRxJCNMKfYdWYQa0WbCe8urAhBLeZh1g0Ma2Xfm9OvSwZ7p"
+    "V6+mk6QePgS5kGs18vJzXWWsT5kXMihPss/PjLkFzBMMFW16lx2Z/cZS9zG08TV2MZ1zH9"
+    "sb3TiMkv6Q/a538pefXT9qDDW1qKy5JSC25LdhPrn7PBJ4tfWt973Y7OhRH9uB/DR3NMiY"
+    "PJrQM8GZOUnJIqOqHlSq7iiDYqroWKKaK+Rr/mIm7GsAv1L7WA26pUwG2VFHBbxQJuEzWY"
+    "0W+ihjpHDUodR3bKqsKqMDWQ5lNvoo61IKQK0xKQ1mweXktoOzO/FYS1XyP4qL1J9QD1wY"
+    "BWGab6YFY/yzYZg5VmDIqTwwoAXrRoXs+J4UGIlXmxhgmZBH9zWmauoAeTM9Jmimaf7W7n"
+    "WdwQit0IQLOjozwEVzl3MAi32Qt6PexP7Wzb0TYE5YmZlsbk8cR7pNZVzkbrddG6JhVT2C"
+    "rXZGLWnIl5fknrZM9DUlsfojBiF26SrIHVkjTbO8Keez5bbK5odJ8eWcIUhjfAFzvGNJGV"
+    "MR1bZKxvVvYCTpjbZ8EbGE6trpVJvPlcbIwp8vXjzOC6pAxlA6xGg+sLYAOKy2QBLA0sKw"
+    "BTK5pNuxXT4CW48pGT3xh250IhhMaG/+z3uoYZTOHKQ4xcav1n+ShamyFLwdhljHyKcHTA"
+    "n7doPGaf9XsC9ci6RewlYqrCvzTiHEJlSisce8qfcMrNVfwG+WNPTWGiKUzUG9Imjf4QqE"
+    "0a/akBXnrj3Rz8+YKxseN7NYu313UYrTQZPj9ppUmEK8ewzElw5YBUk//e7fy3+F9A2pwS"
+    "S/s335ao8m0JWbICyOXfQZDYdiH7uInvICxwOH9lB4LNp1cVXS98OHg5f2OrTgerr5o/Hl"
+    "x2JLh45Dd/KDh/aHhVR4Kzhdy4EgtfXLMIpz66ef2NWY+m9vwM1t6m9mxem7ezCtnUnp+j"
+    "1qvUnvmkvqivLfOsxAeskbvdOjqqUn8+OjLXn3lbLnMfAF1JxIxwxtDAWwHeCYiiW8Kcqz"
+    "GIxovAXGDchYhmA4CHcIT4I7loTlqdq1ru0zJvR+lvFX6ZprBHmVs/CoG+RFSyC0hla2y3"
+    "mu0S016rDo6DQhSsmi5ZYtvV46qnfOfvLDBbpFbKgzkrlXZR2N9VAP2dEfJ3Lx77OcLms3"
+    "qGxHzzWb0aVTLaDC13bOu+ozZr2S/9etq8z5MkUXQrjHn/k25d0ex5ShaR2ib+VrPDyZwv"
+    "MR70Na/d5pO+a1xMtnvh5oNqAYST7juI7nq+Nk4w1VYIzDvLJJbNbyt7Gud9ZXvENlcS0i"
+    "xm9/8DAhG4zg=="
+)
@@ -0,0 +1,66 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "auditoriums" ADD "bookings_changed_at" TIMESTAMPTZ;
+        ALTER TABLE "auditoriums" ADD "bookings_version" INT NOT NULL DEFAULT 0;
+        ALTER TABLE "users" ADD "bookings_changed_at" TIMESTAMPTZ;
+        ALTER TABLE "users" ADD "bookings_version" INT NOT NULL DEFAULT 0;
+        COMMENT ON COLUMN auditoriums."bookings_changed_at" IS 'Last change of the auditorium''s bookings';
+COMMENT ON COLUMN auditoriums."bookings_version" IS 'Bumped on every change of the auditorium''s bookings';
+COMMENT ON COLUMN users."bookings_changed_at" IS 'Last change of the user''s bookings';
+COMMENT ON COLUMN users."bookings_version" IS 'Bumped on every change of the user''s bookings';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "auditoriums" DROP COLUMN "bookings_changed_at";
+        ALTER TABLE "auditoriums" DROP COLUMN "bookings_version";
+        ALTER TABLE "users" DROP COLUMN "bookings_changed_at";
+        ALTER TABLE "users" DROP COLUMN "bookings_version";"""
+
+
+MODELS_STATE = (
+    "eJztXW1v2zYQ/iuCviwFsiB1k7Qd1gFO4m5ZG3uI3a1oMQiMRNtEJMqVqCZG5/8+knqlRC"
+    "pS/CY7+pJaJE+inuPL3XNH9YfuuBa0/aNuYCHieihw9F+0HzoGDqQ/JLWHmg5ms7SOFRBw"
+    "a/PmIGnHy8GtTzxgElo1BrYPaZEFfdNDM4JcTEtxYNus0DVpQ4QnaVGA0bcAGsSdQDKFHq"
+    "34+i8tRtiCD9CPL2d3xhhB2xL6HATIYk/nNQaZz3jpp09Xl+95W/bAW8N07cDB2fazOZm6"
+    "OBFgxUdMitVNIIYeINDKvArrafTicVHYa1pAvAAm3bXSAguOQWAzQPRfxwE2GQ4afxL7c/"
+    "Jb1LlMM8PoD0bGsDcyDL0GfqaLGfYIEwbWj0V43xQSXqqzB1z80b05eHX2gkPg+mTi8UoO"
+    "mL7ggoCAUJQDnyKNLIgJojVeEe+LKfDkeItSOdRpp9eDdwzVGsDVHfBg2BBPyJRevjw+Lk"
+    "H77+4NB5y24oi7dH6Ec6cfVXXCOoZ8irQJZsBEZF7E+QoTOcxZkRzItONPATkuSFFOZ/Um"
+    "YJ6wTvzceXny+uTNq7OTN7QJ72hS8roE+Kv+KIcp6waJulGAdQQfFLjmxJ40fqPR2RRkS2"
+    "Ab9T6P2J0d3/9mZ4fpwXX3Mx/Bzjyq+Tjo/x43zwzri4+D8xzy36HnS1FXDuaMxObG8st6"
+    "cOsD+stBPkGmRgE2A8+D2Jxrmb5vfpDfuu4dfZ5v1MdcJro58I9rgn8eODNoaXQ7hbS/c8"
+    "2cAjyBmjvWqP2gpYbJT74Wv9iWNRL20DIAKSrlkqJJBxN8RDPiLXLKsaJ7HMU/GrMw6R+B"
+    "T1anobLl6+q6Nxx1r/8S1rDL7qjHajrC+hWXHpzldubkJto/V6M/NHapfRn0e3mLKWk3+q"
+    "KzPoGAuAZ27w1gZZGLi+OiBbNkx3cZC4sV3ALz7h54liHUpMMIfAeIag3ZdIs3fNslfnEU"
+    "nUf3eP/hBtpAsWPFJn7mfkN6ux00EBbxPIlLowEtnX7LoXUe3mXPQTJ86CG4GqiGya32BT"
+    "A2S92Oq5q3xSqn40inMvwWoJkDsWQfuAZ4PnLZX74TXNE+AGxCNdq97L12yotS4XwYvZuR"
+    "4ySEN/XYMKQbYbI6pkSEIcLrelw7d3AuQG+EHECivag+e5+wBZl6bjCZipXiM6hWaA8hCf"
+    "3g7vCie8n3CqOgDz6GHIDBhJcxYBaH6iVZxsxIlu0Sfka6aayWpvmawYUPBzA33LFxD+Ed"
+    "u6QD2CMGN0foyz/SGGIratqSP0vPrBWTPzlVVXQqclJNJiaoET6PrVPWX+3g+N21i+kbHG"
+    "pn74YB+/ViOz5EZhIVoB8p3QZRSuUtVPQUNqWEIeu0xjoV68KPlrmlHQPB+pda/ikn96Yw"
+    "RZgAM/QFxSQLVg21ZGV2RCk9bO2MSlqyaWPLUsYgqrcLFwRXuR03w394wu5b4AVkSBdhfu"
+    "96EE3wB1jVZxCje7sJr8xt8MB9YiEWh5jUSl+oqZcl3b1SSz+mEyQGfoZpUNv1WVJjrUHX"
+    "rzkjgpvP3I6/9dw76EXYyhq1JvvWTfYys7Gcca5mOtYgmhu6jOwsh1zNCC1XchVDtFVxI1"
+    "RMELEl+lUnXSQC+xCvFhMuOpUSLjolCRedYsJF6zWo0W+9hiZ7DUIcJ2uUVYVVEGohzVNv"
+    "PI5VE1JBaAlIG7YOr8W1DYffCtzaTz58Ui5hM0B91KEVpqncmZWvsi1jsFLGoLg4rADguk"
+    "HzZi4Mj0IsrIsNJGQi/NW0TKqgR8mZTDJFmxe/3zyL6UGejVA/s0+U3EMnXKcvaA2wPdeT"
+    "tKNdcMqjYVrqkwcz64laFyVbrTdF6xIqppAq1zIxa2Zinh9pHeU8RLH1MfJ8emFGZA2sRt"
+    "Ls7gx77nw2T65odR8fMcQEet+BzTPGJJ6Vko4tCjaXlb2BM2r2RQdX+lrS481zsQEmyJbP"
+    "M4XpEguUTbAGTS5+8oT1SQM4M7E0B8w1P1x2K9LgJbiymZNPDHswIe+EZAz/ORz0FSuYIJ"
+    "WHGJlE+0+zkb+2gZxxxm4DZBOE/SP2vLr+mH41HHDUfe0e0ZcIiAj/0ogzCIUlrXBMMX8i"
+    "MbdWsRvkjym2gYk2MNFsSFsa/TFQWxp92wAvnXiXgp9uGBs7vtcwf3tdh9FKyfD0pJWECB"
+    "eOYalJcOGAVMt/7zf/zf8tIK2mxOL27bdgqnwLJtuzAsjl3y3JiO0D+7iJ75bUOJy/sgPB"
+    "6tOrgq5rHw5ezt7YqdPB4qvmjweXHQkuHvnNHwrOHxpe1ZHgZCNX7sTcFpdswrGNrt5/A9"
+    "qijT0/g723jT2r9+bdjEK2sefnqPUqsWe2qNe1tbMyK7EBG2Rud05Pq8SfT0/V8WdWl2Pu"
+    "HSALiagRTgRaeCvAOwO+f+9S42oK/GkdmAuC++DRbABwD04QeyTrmhFH56qG+6TCuxH6W4"
+    "VdJgnsEWrWTzwgDxGVZAGJYu3YrTZ2XVWuVQ8HTsELFoeuu0Ta1dOipyzzN3TM6sRKmTOn"
+    "xb2tC/vbCqC/VUL+Ng94+/lQnofDjKb2w6HbX4tkHw59km521wkIfb8arGT76cv205e7FG"
+    "3sUrTMqS771mFYc1j6hcO0zVaITpkVqM5RlNl+kk0xWlwbS86vZqdTc5pK40NtX6uNjjUa"
+    "fLttXLNJVQPhqPkeorue/8HDxUQaxVNnf2ZENp/6uR0He2V5nJsL20o2s8X/NI0WPQ=="
+)
@@ -0,0 +1,69 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "daily_utilization" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "day" DATE NOT NULL,
+    "booked_seconds" INT NOT NULL,
+    "bookings_count" INT NOT NULL,
+    "auditorium_id" UUID NOT NULL REFERENCES "auditoriums" ("uuid") ON DELETE CASCADE,
+    CONSTRAINT "uid_daily_utili_auditor_fa5643" UNIQUE ("auditorium_id", "day")
+);
+COMMENT ON COLUMN "daily_utilization"."day" IS 'UTC day';
+COMMENT ON COLUMN "daily_utilization"."booked_seconds" IS 'Booked time within the day';
+COMMENT ON COLUMN "daily_utilization"."bookings_count" IS 'Bookings touching the day';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "daily_utilization";"""
+
+
+MODELS_STATE = (
+    "eJztXW1v2zYQ/iuCviwFsiB1k7Qd1gFO4q5ZG3uIna1oMQiMRNtCJNKVqCZel/8+ktYbJV"
+    "KRYtmWHX1JLZJHnZ4jeS88sj90F1vQ8Q+6gWUT7NmBq/+i/dARcCH9Iand13QwmyV1rICA"
+    "G4c3B3E7Xg5ufOIBk9CqMXB8SIss6JuePSM2RrQUBY7DCrFJG9pokhQFyP4WQIPgCSRT6N"
+    "GKr//QYhtZ8B760ePs1hjb0LEEnoPAttjbeY1B5jNeen19cf6et2UvvDFM7AQuSrefzckU"
+    "o5iAFR8wKlY3gQh6gEAr9SmM0/DDo6IF17SAeAGM2bWSAguOQeAwQPRfxwEyGQ4afxP7c/"
+    "RbyFyqmWH0ByNj2BsZhl4BPxMjhr2NCAPrx8Oi3wQSXqqzF5x96F7tvTp5wSHAPpl4vJID"
+    "pj9wQkDAgpQDnyBtWxARm9Z4ebzPpsCT4y1SZVCnTK8G7wiqFYCru+DecCCakCl9fHl4WI"
+    "D2X90rDjhtxRHHdH4s5k4/rOos6hjyCdImmAHTJvM8zheIyGFOk2RApow/BeSoIEE5mdXr"
+    "gHnCmPi58/Lo9dGbVydHb2gTzmhc8roA+Iv+KIMpY4OEbORgHcF7Ba4ZsieN33B0NgXZAt"
+    "hGvc8j1rPr+9+c9DDdu+x+5iPYnYc1nwb936PmqWF99mlwmkH+O/R8KerKwZyiWN9YflkN"
+    "bn1Af7m2T2xTowCbgedBZM61FO/rH+Q3GN/S9/lGdcxlpOsD/7Ai+KeBO4OWRtUppPzONX"
+    "MK0ARqeKxR+0FLDJOffC36sA1LZMGhZQCSF8o5RZMOJviIZMQuMsKxwj4Ooh+NWZj0T8An"
+    "9UmoaPm6uOwNR93LP4U17Lw76rGajrB+RaV7JxnNHHei/X0x+qCxR+3LoN/LWkxxu9EXnf"
+    "EEAoINhO8MYKWRi4qjogdmyY5vUxYWK7gB5u0d8CxDqEmGEfgObCo126Eq3vAdTPz8KDoN"
+    "+3j/8Qo6QKGxIhM/1d+QdreFBsJDNE+i0nBAS6ffcmidLnrZcZAMH3o2rAeqYdzVLgJm0c"
+    "kzNwJCp8+/QG5RVsHsnHV3Lfa2K7CxxQ13sGq5y1e5HVe6AsJvgT1zIZKoz0uA5iPM/nIF"
+    "ekF5AMiEasB76b62yvlU4bwffpuRCeUIX+qxkUjth1ipJPEbQ4QXe1w6t3AuQG8sQiex9M"
+    "L6dD+LFmTq4WAyFSvFd1CpUA4hWYQPusOz7jlXsUZOHnwMuQCBCS9jwDzsqzWZLKAl0XYF"
+    "YS2prq03uvU1hQsfDmBu4LFxB+Ete6QD2CMGt+Loxz/SGCIrbNrGzJaeWTXHzDKiKumLZa"
+    "iaHM+hvss8MuoZv9re4btLjOgX7Gsn74YB+/ViM65XahLloB8pvS2RSuVklXSw1iWEIWNa"
+    "Y0xFsvDDZW5pf0pwmqQOUxLKfJObIoyA+UeCYOIFq4JY0jRbIpQesrZGJG2Mbm3LUsogqq"
+    "aFc4R1quNm+A9P0L65cIoM6TzM77EH7Qn6CMv6DOKm6HbCK3MbPHAXW4j5ISa10h/UEasl"
+    "3b1CSz+KwkgM/FSARm3Xp2NBK92r/poxIrj5zO34Gw/fQi/EVtaoNdk3brIXmY3Fgfpypm"
+    "OF+HxDl5GtDb2XM0KLhVzGEG1F3AgRE5s4Evmqc1Vigl3Y5hfzVDql8lQ6BXkqnXyeSus1"
+    "qNFvvYYmew3C9lfaKCsLq0DUQpoNvfHtv4qQCkRLQNqwdXglru1i+NXg1l778EkpmM0A9V"
+    "GHVpimcmdWvsq2EYNaIwb5xaEGgKvmGjRzYXgUYmFdbGBAJsRfHZZJBPRocCaVg9IeJ9jt"
+    "OIvpQZ6NUD0hUqTcQSdcpx9oDZAz1+Pko21wysNhWuiTBzPriVIXKVupN0XqklBMLmGujc"
+    "SsOBLz/ILWYc5DuLc+tj2fPphhsAaWC9Js7wx77vFsnlzRyj46mYkI9L4Dh2eMSTwrZTg2"
+    "T9jcqOwVnFGzLzzv09dijtcfiw0QsR35PFOYLhFB0QRr0OTiB3YYTxpAqYmluWCu+Ytlt2"
+    "QYvABXNnOyiWH3JuRMSMbwH8NBX7GCCVRZiG2TaP9pju2vbCCnnLGbwHaIjfwD9r6q/ph+"
+    "MRxw1H3tzqYfERAR/qURZxAKS1rudGf2IGdmrWIdZE93thsT7cZEsyFtw+iPgdqG0TcN8N"
+    "KJdwn4icJY26nHhvnbqzqMVhgMzx3ik8TDZQf91CFx6SnDlR9DKn+KSKaX1J6GTB9JvItw"
+    "KDX2AF49vkThgaEqnkXYfEv8iuvRmRZyXLfrwPaPoGX4kPZiVXGB84QNvvWC87o4VMJcBB"
+    "vxAEhpSFd3uQUOZAdzH79sJCZsNuiMV43gwKSQTzaLeetvtcdHmmJQ1W7FrtJAS47CSywz"
+    "4Zy82iQTTrC3CQq7naDA/80hrd6zjNq3dxyWueMwzVkO5OL7+FJku7A9XLQTVdd9fDk1t7"
+    "I1WKY/s9eLCLKufHvLcqp0q65vET81e39L0Z0t+TtZsre2ZG91qevOljjSotTEPFgqUcJR"
+    "EFWtfwPaok0OfAa6t00OVOvm7UwTa5MDn6PUyyQHskW9qq2dpqnFBmyQud05Pi6TIHh8rE"
+    "4QZHWZ1AoXyHJW1AjHBC28JeCdAd+/w9S4mgJ/WgXmHOEueDRrANyDE5u9krFmRNscZXdN"
+    "pMTbsYdSh10m2T4h1KyfeEAeUy5I0xbJ2rFbbuxiVTJ8DwVuzgsWhy5eIi/+aeltfIfMq+"
+    "g/6MyZ0yJuq8L+tgTob5WQv80C3l6Lz/esmNHUXoi/+bVIdiH+k2SzvU7AwverEJVsr3Rv"
+    "r3TfpnSwLkXLnOqyy6gXNfuFV1AnbTYS6GxTu1aQ2qU0PtT2tdroWKHBt93GNZtUFRAOm+"
+    "8guqv5n+kwItJdPPXxnBTJ+s/mbMbBru2gzfq2bSXK7OF/At2c6A=="
+)
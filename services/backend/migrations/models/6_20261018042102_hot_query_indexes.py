@@ -0,0 +1,64 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_availabilit_day_of__38c425" ON "availability_slots" ("day_of_week", "auditorium_id");
+        CREATE INDEX IF NOT EXISTS "idx_bookings_series__8fd3ef" ON "bookings" ("series_id", "start_time");
+        CREATE INDEX IF NOT EXISTS "idx_bookings_auditor_bbfebf" ON "bookings" ("auditorium_id", "start_time", "end_time", "uuid");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_bookings_auditor_bbfebf";
+        DROP INDEX IF EXISTS "idx_bookings_series__8fd3ef";
+        DROP INDEX IF EXISTS "idx_availabilit_day_of__38c425";"""
+
+
+MODELS_STATE = (
+    "eJztXVtv2zYU/iuCXpYCWZC6SdoO6wAncde0TTzEzlY0KARGom0hEulKVBOvy38fSV0pkY"
+    "oU32RHL6lF8lBH3yF5Ljxkf+outqDj73UDyybYswNX/037qSPgQvpDUrur6WA6TetYAQE3"
+    "Dm8Okna8HNz4xAMmoVUj4PiQFlnQNz17SmyMaCkKHIcVYpM2tNE4LQqQ/T2ABsFjSCbQox"
+    "XX32ixjSx4D/34cXprjGzoWALPQWBb7O28xiCzKS+9ujo7fc/bshfeGCZ2Ahdl209nZIJR"
+    "QsCK9xgVqxtDBD1AoJX5FMZp9OFxUcg1LSBeABN2rbTAgiMQOAwQ/fdRgEyGg8bfxP4c/B"
+    "Exl2lmGBf9oTHoDQ1Dr4GfiRHD3kaEgfXzIew3hYSX6uwFJx+6lzuvjl5wCLBPxh6v5IDp"
+    "D5wQEBCScuBTpG0LImLTGq+I98kEeHK8Raoc6pTp5eAdQ7UEcHUX3BsORGMyoY8v9/dL0P"
+    "67e8kBp6044pjOj3DuXERVnbCOIZ8ibYIpMG0yK+J8hogc5ixJDmTK+FNAjgtSlNNZvQqY"
+    "x4yJXzsvD14fvHl1dPCGNuGMJiWvS4A/uxjmMGVskIiNAqxDeK/ANUf2pPEbjc6mIFsC27"
+    "D3Zch6dn3/u5Mdpjvn3S98BLuzqOZz/+LPuHlmWJ987h/nkP8BPV+KunIwZyhWN5Zf1oNb"
+    "79Nfru0T29QowGbgeRCZMy3D++oH+Q3Gt/R9vlEfcxnp6sDfrwn+ceBOoaVRdQopvzPNnA"
+    "A0hhoeadR+0FLD5Bdfiz9szRIJObQMQIpCOaVo0sEEH5GM2EVOOFbUx178ozELk/4Z+GRx"
+    "Eipbvs7Oe4Nh9/wvYQ077Q57rKYjrF9x6c5RTjMnnWj/nA0/aOxR+9q/6OUtpqTd8KvOeA"
+    "IBwQbCdwawssjFxXHRA7NkR7cZC4sV3ADz9g54liHUpMMI/AA2lZrtUBVv+A4mfnEUHUd9"
+    "vP90CR2g0FixiZ/pb0C720AD4SGeJ3FpNKCl028+tI7DXrYcJMOHng0XA9Ug6WobAbPo5J"
+    "kZAaHT518gtyjrYHbKursSe9sW2NjihjtYtdwVq9yOK10B4ffAnroQSdTnOUCzIWZ/uQI9"
+    "ozwAZEI14L1sXxvlfKpw3o2+zciFcoQv9dhIpPZDolTS+I0hwos9Lp1bOBOgN8LQSSK9qD"
+    "7bT9iCTDwcjCdipfgOKhXKISRh+KA7OOmechVrFOTBx5ALEBjzMgbMw65ak8kCWhJtVxLW"
+    "kuraxUa3rjO48OEAZgYeGXcQ3rJHOoA9YnArjn78I40hsqKmuZjZdb5lRhZUTt/amNraY2"
+    "o5AVX01XJUTY73UN9mFhv9jF9tZ//dOUb0C3a1o3eDgP16sR7XLDPJCtAPld6YSKVywio6"
+    "YKsSwoAxrTGmYln40TI4t78lOFVShyoNdb4pTBFGwPwnQTDJglZDLFmaDRFKD1kbI5I2hr"
+    "eyZUlU0jW0cIFwkeq4Gf7FE7RvIdwiQ7oI83vsQXuMPsGqPoW4abqZ8MrcCg/cJRZicYhJ"
+    "rfgHdURrTnew1BOIozQSByATwFHb/dlY0VL3sq9zRgQ3n7mdf+PhW+hF2KoaFYQgNsxqwp"
+    "QojO0UCVonYDXLUJkTUGaIlm8NVDNGa+wINHRh2thgfzWztlzIVUzbVsSNEDGxiSORrzo7"
+    "JiHYhsQCMTOmUykzplOSGdMpZsa0foga/dYPabIfImy4Zc28qrAKRC2k+WBe1r6tCqlANA"
+    "ekDVuHl+Ish8NvAY7ylQ+flPTZDFAfdZGFaSp3j+WrbBuDWGgMorg4LADgutkNzVwYHoVY"
+    "WBcbGOKJ8FcHelIBPRruyWS9tAcYtjvOYnqQ5z/UT8EUKbfQCdfpB1p95Mz0JN1pE5zyaJ"
+    "iW+uTB1Hqi1EXKVupNkbokFFNI0WsjMUuOxDy/oHWURRHt1o9sz6cPZhSsgdWCNJs7w557"
+    "PJuna7Syj8+CIgK9H8DhOWgSz0oZji0SNjcqewmn1OyLThhdaAnHq4/FBojYjnyeKUyXmK"
+    "BsgjVocvEjQownDaDMxNJcMNP8cNmtGAYvwZXNnHyq2b0JOROSMfxx0L9QrGACVR5i2yTa"
+    "f5pj+0sbyBln7CawHWIjf4+9r64/pp8N+hx1X7uz6UcERIR/bsQZhMKSVjhPmj86mlurWA"
+    "f586TtxkS7MdFsSNsw+mOgtmH0dQM8dypfCn6qMFZ2zrJh/vayjr+VBsMLxwYl8XDZ0UJ1"
+    "SFx6rnHpB58K55aUoXKZXlJ7GjJ9JPEuoqHU2CN/i/ElSo8g1fEsouYb4ldcDU+0iONFuw"
+    "5s/whahg9pL1YdF7hI2OB7Njiv4TEV5iLYiAdAKkO6vOs0cCA7Cvz49SYJYbNBZ7xqBAcm"
+    "hXy8Xsxbf6s9kNIUg2rhVuwyDbT08L3EMhNO5qtNMuHMfJugsN0JCvzfAtLqPcu4fXurYp"
+    "VbFbOcFUAuvwEwQ7YN28NlO1GLugGwoOaWtgbL9Gf+QhNB1rXvi5lPlW7UhTHip+ZvjCm7"
+    "JaZ4C0z+npj8PTKLuiUmibQoNTEPlkqUcBxEVevfgLZokwOfge5tkwPVunkz08Ta5MDnKP"
+    "UqyYFsUa9ra2dpFmIDNsjc7hweVkkQPDxUJwiyulxqhQtkOStqhBOCFt4K8E6B799halxN"
+    "gD+pA3OBcBs8mhUA7sGxzV7JWDPibY6quyZS4s3YQ1mEXSbZPiHUrB97QB5TLknTFsnasV"
+    "tt7GJVMnwPBW7BCxaHLp4jL/5p6W18h8yr6T/ozJnTYm7rwv62AuhvlZC/zQPeXsTP96yY"
+    "0dRewb/+tUh2Bf+TZLO5TkDo+9WISraXyLeXyG9SOliXomVOdNn112HNbuml12mbtQQ629"
+    "SuJaR2KY0PtX2tNjqWaPBttnHNJlUNhKPmW4jucv4vPIyIdBdPfTwnQ7L6sznrcbAXdtBm"
+    "ddu2EmX28D9IIMPK"
+)
@@ -0,0 +1,75 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "booking_holds" (
+    "uuid" UUID NOT NULL PRIMARY KEY,
+    "start_time" TIMESTAMPTZ NOT NULL,
+    "end_time" TIMESTAMPTZ NOT NULL,
+    "title" VARCHAR(200),
+    "expires_at" TIMESTAMPTZ NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "auditorium_id" UUID NOT NULL REFERENCES "auditoriums" ("uuid") ON DELETE CASCADE,
+    "broker_id" UUID NOT NULL REFERENCES "users" ("uuid") ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS "idx_booking_hol_auditor_d7d9c0" ON "booking_holds" ("auditorium_id", "start_time", "end_time");
+CREATE INDEX IF NOT EXISTS "idx_booking_hol_expires_51099f" ON "booking_holds" ("expires_at");
+COMMENT ON COLUMN "booking_holds"."expires_at" IS 'The hold stops blocking the interval after this moment';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "booking_holds";"""
+
+
+MODELS_STATE = (
+    "eJztXVtv2zYU/iuCXpYCWZB6SS/DOsC5dM3axEPsbEWDQqAl2hYiia5ENfG6/PeRtG6USF"
+    "mKLVt2+JLYJI9EfYeXcz4eH/3QXWRBJzjohpaNkW+Hrv6r9kP3gAvJB0HtvqaD6TStowUY"
+    "DB3WHCTtWDkYBtgHJiZVI+AEkBRZMDB9e4pt5JFSL3QcWohM0tD2xmlR6NnfQmhgNIZ4An"
+    "1ScfuVFNueBR9gEH+d3hkjGzoW1+cwtC16d1Zj4NmUld7cXJy9Z23pDYeGiZzQ9bLtpzM8"
+    "QV4iQIsPqBStG0MP+gBDK/MotKfRg8dF816TAuyHMOmulRZYcARChwKi/zYKPZPioLE70T"
+    "9Hv0edyzQzjKvewOifDwxDr4GfiTyKve1hCtaPx/l1U0hYqU5vcPqhe733y6sXDAIU4LHP"
+    "Khlg+iMTBBjMRRnwKdK2BT1skxq/iPfpBPhivHmpHOqk083gHUPVALi6Cx4MB3pjPCFfXx"
+    "4elqD9d/eaAU5aMcQRmR/zuXMVVXXmdRT5FGkTTIFp41kR5wsPi2HOiuRAJh1/CshxQYpy"
+    "OqvXAfOYduLnzsuj10dvfnl19IY0YR1NSl6XAH9xNchhSruBo24UYB3ABwmuObEnjd9odL"
+    "YF2RLYBuefB/TKbhB8c7LDdO+y+5mNYHcW1XzqXf0RN88M69NPvZMc8t+hHwhRlw7mjMT6"
+    "xvLLenDrPfLJtQNsmxoB2Ax9H3rmTMv0ff2DfIjQHblfYNTHXCS6PvAPa4J/ErpTaGlkO4"
+    "WkvzPNnABvDDU00oj9oKWGyU+BFj/YhjUy76FlAFxUyhlBkwwmuEAz/CVyyrGiaxzEH1qz"
+    "MOmfQIBXp6Gy5evi8rw/6F7+xa1hZ93BOa3pcOtXXLr3KrczJxfR/rkYfNDoV+1L7+o8bz"
+    "El7QZfdNonEGJkeOjeAFYWubg4LnqkluzoLmNh0YIhMO/ugW8ZXE06jMB3YBOt2Q7Z4o3A"
+    "QTgojqKT6BrvP15DB0h2rNjEz1yvTy63hQbCYzxP4tJoQAun33JoncyvsuMgGRNEx90qkP"
+    "qA5uvYLqMVQN+Gq4Grn1xqFwGzyFIzM0JMFpt/gdj+roPZGb3cDX+1XYGNbgWog2SbQ7HK"
+    "7bjC/QJ+C+2pCz2BsXEJvNkA0b/M3LggfQCeCeWAn2evtVWuugzn/ejZjBzxxT2pT0cisb"
+    "aSLThluwweXuQz7dzBGQe9MSeaEu1F9dnrzFvgiY/C8YSv5O9BtEJ6CPGcbOn2T7tnzCAx"
+    "CvpgY8gFHhizMgrM47583xfRfwLboIQEFFomq+UCbzO4sOEAZgYaGfcQ3tGvZAD72GA2L3"
+    "n4BY2hZ0VNcwzjbb5lRhdET18VA7lxBjKnoIqebU6qzewY8QRnsYtE+6vtHb67RB55gn3t"
+    "1bt+SD+92Iwjm5lkBegHUt+Vl5K5rBXd1XUpoU87rdFOxboIomVwae+Uc0GF7mdKDL8pTB"
+    "EqQL1NTjHJglZDLVmZLVHKuWdtjUoU47m2ZYnfpGvswgXBVW7H7fAvnrD7FsgpEdJFmN8j"
+    "H9pj7yOs6lPwR8zbCa/IrfDBfWIhFoeY0Ip/lPN/S7qDpZ5AzGkJHIAM3SW3+7PMWqMn/7"
+    "c5I4KZz8zOH/roDvoRtrJGBSXwDbM7YSo053aKAsoJWM8yVOYElBmi5Qcp1YzRGucnLV2Y"
+    "tvZopJpZW67kKqatUnErVIxt7Aj0K48lSgR2IQyDjyPqVIoj6pTEEXWKcUTKD5Gjr/yQNv"
+    "sh3IFb1syrCisnpCDNk3lZ+7YqpJzQEpC2bB1uxFmeD78VOMo3AXxSiGw7QF3oInPTVOwe"
+    "i1dZxUGslIMoLg4rALhudEM7F4aFEHPrYgspHhaMI6d54lidhVRPGh/UMN9TlbJhVA18mN"
+    "pkWaZBkYqdWZclodiZZ+66K3Zm51Ws2JmG2ZnMzlV3FnGS2zOP9MEEatSK0AKMpoE2dJBJ"
+    "LQt2oE+Qh/534GhgRD6QIjvQXBQHwD2vuWf6kMUe1h8avOT2DI3qE5M8oNXznJmehBpvg9"
+    "qj5a1U64pDVBxiuyFVjNciUBXjtWmAtyHqJqLE5KRMypktpmVSvk5l4NhtckWZhc/RLAyn"
+    "1hO1zksqrbdF6wIfsPCrSUW/NEy/PD+mOvphS/QDipHtB+SLGcXPwOfHsjwvEpv9gkbpPk"
+    "5mFrGN7GeBgsNuaYRcUbC9gXLXcErMvihFzpWW9Hj94XGhh21HPM8kpkssUDbBWjS5WI4b"
+    "2icNeJmJpblgpgXzZbdiZGIJrnTmFA4RTMg6IRjDf/Z7V7IDhKxUHmLbxNp/mmMHjQ3kjD"
+    "M2DG0H215wQO9X1x/TL/o9hnqg3dvkIULMw7804hRCbkkrJETL5z7LrVX0AvmEaIrnVTxv"
+    "uyFVPO8iUBXPu2mAl+Z5U/DTDWNticJa5m83lZGolAwvZHIS8OGibE9ySlyYaqrxXDSFVD"
+    "JSqly0L8k9DdF+JPAuoqG0HD3eJJezEl+iNCtMHc8iar4lfsXN4FSLerxq14GeH0HLCCC5"
+    "iijvX2mqWF6wxYliWV/nmUOoi2B7jACpDGlz+WBRKMrOtjg/byLYbtBpXzWMQnMSB3htDH"
+    "Plb6kcIW0xqFZuxTZpoKX5EAWWGZcsUW6ScWkMVYDCbgcosP8FpOVnlnF79VqQKq8Fyfas"
+    "AHL5KywyYrtwPFx2ErWqV1gUtrnG1mDR/pnPMcvpunYK3+W20q3K4cs/aj6Jb1ni3mJi3n"
+    "zq3nxq31Ul7k2YFulOzMhSwSYck6jy/TckLVRw4DPYe1VwoHxv3s4wMRUc+By1XiU4kC7q"
+    "dW3trMxKbMAWmdud4+MqAYLHx/IAQVqXC61wgShmRY5wIqDgrQDvFATBPSLG1QQEkzowFw"
+    "R3waNZA+A+HNv0lrRrRnzMUfXURCi8HWcoq7DLBMcnmJj1Yx+IOeWSMG1eTI3damMXyYLh"
+    "z73QLXjB/NBFS8TFPy28jZ2Q+TX9B506c1rc27qwv60A+lsp5G/zgKs3SbIzK2o0qXdIbn"
+    "4tEr1D8km62V4nYO771WAl1VsQ1VsQ1VsQdzV4rkvQMie6gBOOavZL39qWttkILawC4RoI"
+    "hJOaanJvRG6iNWgeb7crQidVDYSj5juIbiNn3OSOWHjmKf8xU0Zk/b9k2gwdsbKfJa3vkF"
+    "uwmT3+Dzj3PJ4="
+)
@@ -0,0 +1,76 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "booking_waitlist" (
+    "uuid" UUID NOT NULL PRIMARY KEY,
+    "start_time" TIMESTAMPTZ NOT NULL,
+    "end_time" TIMESTAMPTZ NOT NULL,
+    "title" VARCHAR(200),
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "auditorium_id" UUID NOT NULL REFERENCES "auditoriums" ("uuid") ON DELETE CASCADE,
+    "broker_id" UUID NOT NULL REFERENCES "users" ("uuid") ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS "idx_booking_wai_auditor_9b8d0b" ON "booking_waitlist" ("auditorium_id", "start_time", "end_time");
+CREATE INDEX IF NOT EXISTS "idx_booking_wai_broker__4f3245" ON "booking_waitlist" ("broker_id", "created_at");
+COMMENT ON COLUMN "booking_waitlist"."created_at" IS 'Queue order';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "booking_waitlist";"""
+
+
+MODELS_STATE = (
+    "eJztXW2TmzYQ/isMX5rMXDOJm9dO0xnnzmmuyd21sa/JJJNhdCDbzAFyQOTipvffK8m8CS"
+    "QMZ7DB1pfkLLRCPKuX3UfL8kN3kQWd4MEwtGyMfDt09V+1H7oHXEj+EFw90nSwWKTXaAEG"
+    "Vw6rDpJ6rBxcBdgHJiaXpsAJICmyYGD69gLbyCOlXug4tBCZpKLtzdKi0LO/htDAaAbxHP"
+    "rkwucvpNj2LPgdBvHPxbUxtaFjcX0OQ9uid2dXDLxcsNLLy9OT16wuveGVYSIndL1s/cUS"
+    "z5GXCNDiB1SKXptBD/oAQyvzKLSn0YPHRatekwLshzDprpUWWHAKQocCov82DT2T4qCxO9"
+    "F/Hv8edS5TzTDOLybGeDQxDL0GfibyKPa2hylYP25X7aaQsFKd3uD4zfD9vV+e3mcQoADP"
+    "fHaRAabfMkGAwUqUAZ8ibVvQwza54hfxPp4DX4w3L5VDnXS6HbxjqFoAV3fBd8OB3gzPyc"
+    "9HDx+WoP3P8D0DnNRiiCMyP1Zz5zy6NFhdo8inSJtgAUwbL4s4n3pYDHNWJAcy6fhdQI4L"
+    "UpTTWb0NmGe0Ez8PHj1+9vj5L08fPydVWEeTkmclwJ+eT3KY0m7gqBsFWCfwuwTXnNidxm"
+    "80OruCbAlsk9HHCW3ZDYKvTnaY3jsbfmQj2F1GV95dnP8RV88M6+N3F69yyH+DfiBEXTqY"
+    "MxLbG8uP6sGtX5C/XDvAtqkRgM3Q96FnLrVM37c/yK8Quib3C4z6mItEtwf+w5rgvwrdBb"
+    "Q0sp1C0t+lZs6BN4MammrEftBSw+SnQIsfbMcaWfXQMgAuKuWEoEkGE1yjGb6JnHKsqI0H"
+    "8R+dWZj0dyDAzWmobPk6PRuNJ8Ozv7g17GQ4GdErA279ikvvPc3tzEkj2ofTyRuN/tQ+XZ"
+    "yP8hZTUm/ySad9AiFGhoduDGBlkYuL46JbaslOrzMWFi24Aub1DfAtg7uSDiPwDdhEa7ZD"
+    "tngjcBAOiqPoVdTG67fvoQMkO1Zs4mfaG5Pmemgg3MbzJC6NBrRw+m2G1qtVK3sOkjFHdN"
+    "w1gdQbtFrH9hmtAPo2bAaucdLUPgJmkaVmaYSYLDb/ArH9XQezE9rcJd/aPsJ2A2zsEPvS"
+    "IP7z5iPtQ9TaiDS23CfI6O6JBki2nxYvuQNXuMXCr6G9cKEnsM/OgLecIPovs9BOSR+AZ0"
+    "I52qNsW71iN2Q4H0XPZuS4Qu5JfToMiYGaWC0pQWjw8CKfaecaLjnojRU3l2gvup5tZ1UD"
+    "z30Uzub8Rf4eRCukhxCv+Knh+Hh4wmw4o6APNoZc4IEZK6PA3B7JTSURYyowp0p4U6Ex1y"
+    "x9+jmDCxsOYGmgqXED4TX9SQawjw3mJpCHX1MZelZUNUfKfs7XzOiC6OmLIm13TtrmFFSR"
+    "DMhJdZlQJM7zMvYqaX+1ew9fniGPPMGR9vTlOKR/3d+N75+ZZAXoJ1J3n5eSefkVPfxtKW"
+    "FMO63RTsW6CKJlcGOHnvPahR57yqU/L0wRKkAddE4xyYJWQy1ZmZ4oZeRZvVGJIom3tizx"
+    "m3SNXbgg2OR23A3/4g67b4HPEyFdhPk18qE9897Cqj4FfyrfT3hFboUPbhILsTjEhFb8rZ"
+    "wy3dAdLPUEYhpQ4ABkGEK53Z8lI1sNlvicMyKY+czs/CsfXUM/wlZWqaAEvmJ2J0yFVnRY"
+    "UUA5AdtZhsqcgDJDtPzsqZoxWuPIqaMLU29Pk6qZteVKrmLaKhV3QsXYxo5Av/Lwq0RgHy"
+    "JX+NCrQaXQq0FJ6NWgGHql/BA5+soP6bIfwp1RZs28qrByQgrSPJmXtW+rQsoJbQBpx9bh"
+    "Vpzl1fBrwFG+DOCdooq7AepaF5mbpmL3WLzKKg6iUQ6iuDg0AHDdgJBuLgxrIebWxQ5SPC"
+    "x+SU7zxOFNa6meNKSqZb6nKmXDqBr4fWGTZZnGkSp2ZluWhGJnDtx1V+zM3qtYsTMtszOZ"
+    "navuLOIk+zOP9MkcatSK0AKMFoF25SCTWhbsQJ8gD/1vwNHAlPxBiuxAc1EcAHdYc8/0IY"
+    "s9rD80eMn+DI3qE5M8oHXhOUs9CTPug9qj5a1U64pDVBxityFVjNc6UBXjtWuA+xB1E1Fi"
+    "clIm5czW0zIpX6eSluw3uaLMwkM0C8OFdUet85JK613RusAHLLwxqeiXlumXw2Oqoxdboh"
+    "coprYfkB9mFD8DD49lOSwSm71Bo3Qf53+L2Eb2WqDgsFsaIVcU7G6g3Hu4IGZflFXoXEt6"
+    "vP3wuNDDtiOeZxLTJRYom2AdmlwsLRDtkwa8zMTSXLDUgtWyWzEysQRXOnMKhwgmZJ0QjO"
+    "E/xxfnsgOErFQeYtvE2n8aTbDQFsAZZ+wqtB1se8EDer+6/ph+Or5gqAfajU0eIsQ8/Bsj"
+    "TiHklrRCDrl8urjcWkUbyOeQUzyv4nm7DaniedeBqnjeXQO8Mc+bgp9uGFvLrdYxf7utjE"
+    "SlZHgh+ZWADxclyJJT4sLsXK3noimkkpFS5aJ9Se5piPYjgXcRDaXN6PE2uZxGfInSrDB1"
+    "PIuoek/8isvJsRb1uGnXgZ4fQcsIIGlFlCqxNLsuL9jh3Lqsr6vMIdRFsD1GgFSGtL0Uui"
+    "gUZWdbn9I4Eew26LSvGkahOY8DvHaGufK3VI6QrhhUjVuxbRpoaT5EgWXGJUuUm2RcGkMV"
+    "oLDfAQrs/wLS8jPLuL76kkqVL6lke1YAufyrHxmxfTgeLjuJauqrH4VtrrU1WLR/5nPMcr"
+    "quncJ3s620Vzl8+UfNJ/EtS9xbTMybT92bT+3bVOLehGmR7sSMLBVswjGJKt9/Q1JDBQce"
+    "wN6rggPle3M/w8RUcOAhar1KcCBd1Ova2lmZRmzADpnbgydPqgQIPnkiDxCk13KhFS4Qxa"
+    "zIEU4EFLwV4F2AILhBxLiag2BeB+aC4D54NFsA3Iczm96Sds2IjzmqnpoIhftxhtKEXSY4"
+    "PsHErJ/5QMwpl4Rp82Jq7FYbu0gWDD/yQrfgBfNDF20QF3+38DZ2QubX9B906sxpcW/rwv"
+    "6iAugvpJC/yAOuPr7Jzqyo0aQ+u7n7tUj02c076aa/TsDK96vBSqoPR6oPR6oPR3YFMPUF"
+    "xJ3HG/KgCdj0AqrrX76P1do6w14zLSIXfpwheFWOxDsM04aZ+sN787SRg90+mGeH+3rpQa"
+    "pYvaTf8kv6h3eoqf8dwpD4uL4VEUj7es6lMuKpNyX7D6l6U3IdqOpNyV0D3OkY8yH0bXOu"
+    "C7zx6MpR6dfn0zo7CW9TL/S18EKf9MhJblfLj5paPObr95EqnVQ1EI6q7yG6rcTqkztiYe"
+    "y2PClLRmT7GVl2Y1w1ll5le8H6gs3s9n+9VRam"
+)
@@ -0,0 +1,91 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        -- Архив секционирован по месяцам start_time; секции создает задача архивации (app.archive) перед переносом.
+-- Первичный ключ секционированной таблицы обязан включать ключ секционирования, поэтому он составной.
+CREATE TABLE IF NOT EXISTS "bookings_archive" (
+    "uuid" UUID NOT NULL,
+    "auditorium_id" UUID NOT NULL,
+    "broker_id" UUID NOT NULL,
+    "series_id" UUID,
+    "start_time" TIMESTAMPTZ NOT NULL,
+    "end_time" TIMESTAMPTZ NOT NULL,
+    "title" VARCHAR(200),
+    "version" INT NOT NULL,
+    "archived_at" TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY ("uuid", "start_time")
+) PARTITION BY RANGE ("start_time");
+CREATE INDEX IF NOT EXISTS "idx_bookings_ar_start_t_abb2bf" ON "bookings_archive" ("start_time", "uuid");
+CREATE INDEX IF NOT EXISTS "idx_bookings_ar_broker__368443" ON "bookings_archive" ("broker_id", "start_time", "uuid");
+CREATE INDEX IF NOT EXISTS "idx_bookings_ar_auditor_820d75" ON "bookings_archive" ("auditorium_id", "start_time");
+COMMENT ON TABLE "bookings_archive" IS 'Прошедшие бронирования, перенесенные из bookings задачей архивации.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "bookings_archive";"""
+
+
+MODELS_STATE = (
+    "eJztXW1zozgS/isqvuxsVS7lOM7b3e1VeRLPTW4nye7Eudna2S1KBtmmYoMHxGR8c/nvKw"
+    "kwAgkMNrbB1hfiSGrRPK2X7lZL+q5NHRNNvOOub1rYcS1/qv0dfNdsOEXkhyT3CGhwNovz"
+    "aAKGgwkrDhflWDoceNiFBiZZQzjxEEkykWe41gxbjk1SbX8yoYmOQQpa9ihO8m3ri4907I"
+    "wQHiOXZHz+kyRbtom+IS/6d/asDy00MRM8+75l0rezHB3PZyz16en25h0rS1840A1n4k9t"
+    "vvxsjseOvSCgyceUiuaNkI1ciJHJfQrlNPzwKCngmiRg10cLds04wURD6E8oINo/h75tUB"
+    "wAexN9dP4VMscV0/X7h77+2OvrulYCP8OxKfaWjSlY31+DemNIWKpGX3D9vvvxzen5jwwC"
+    "x8Mjl2UywLRXRggxDEgZ8DHSlolsbJEcV8T7egxdOd5JqhTqhOnN4B1BtQFwtSn8pk+QPc"
+    "Jj8u9Jq5WD9n+7HxngpBRD3CH9I+g792FWO8ijyMdIG3AGDQvPRZxvbSyHmSdJgUwYXwXk"
+    "KCFGOe7V24B5RJn4W/ukc9G5PD3vXJIijNFFykUO8Lf3/RSmlA0csiHA2kffMnBNka3Ufs"
+    "PWWRdkc2Dr937r05qnnvdlwjfTN3fd31gLns7DnA8P9/+OinPN+vrDw9sU8l+R60lRz2zM"
+    "HMX22vJJObi1B/JrannYMgAB2PBdF9nGHHC8b7+RDxznmbzP08tjLiPdHvitkuC/9aczZA"
+    "IynSLC7xwYY2iPEHCGgOgPIFZMfvBA9GE7lkjAoalDLArlhqBJGhNaIplkFSnhmGEdx9GP"
+    "2gxM2gfo4eoklDd83d71Hvvdu18SY9hNt9+jOe3E+BWlvjlPzcyLSsCn2/57QP8Fvz/c99"
+    "Ia06Jc/3eN8gR97Oi286JDk0cuSo6SXqkmO3zmNCyaMIDG8wt0TT2REzcj+BVaRGrWhEzx"
+    "ujdxsCe2ordhHe9+/ogmMGPGilR8rr5HUl0DFYTXqJ9EqWGDlna/9dB6G9Sy5yDpY4e2uy"
+    "qQeu8E49g+o+Uh10LVwPW4qGofATPJUDPXfUwGm/9Buf5dBrMbWt1TsrZ9hO0FWnhC9Eud"
+    "2M/rt7RPYW09Utl8nyCjs6fTdrLmUzFr2p5Kp1j0xbdmU2RL9LM7aM/7Dn0yDe2W8ABtA2"
+    "Wj3ePrapR3Iwvno/Db9JSvMPGlLm2GREFdaC2xg1BPwuu4TDrPaJ6AXg98cwvphfl8PUEJ"
+    "PHYdfzROZibfQaRCOEQ48E91H6+7N0yH0wV5sDY0hTYcsTQKzOtRtqok85hK1Kkcv6lUma"
+    "vWffqZw4U1BzjXnaH+gtAz/Zc0YBfrzEwgH7+kMLLNsGjKKfs5XZKTBZHTn8ppu3OnbUpA"
+    "BZ0BKao6OxSJ8TyPrErKL3jT+unOsckXHIHznx59+uvH3dj+XCcToO9nmvtJqiwrv6CFvy"
+    "0hPFKmAWUqkoUXDoNrG/QJq11qsce+9Euhi1ACaqAnBLMY0EqIhadpiFB6ttkYkSgn8daG"
+    "peQkXWIWFgirnI7rYV+sMPsK/jwZ0iLM7xwXWSP7Z1TUpkiuyjcTXplZ4cKXhYYoNjGpFv"
+    "+a7TJd0xzMtQQiN6DEAOA8hNl6P++M3GiwxOeUEsHUZ6bnD1znGbkhtlmFBCEkC/IzYUwU"
+    "uMNEAmUEbGcYyjMC8hTR/LWnYspoiSWnmg5MjV1NKqbW5gu5iGqrRFwLEWMLTyTyzQ6/Wh"
+    "DsQ+RKMvSqXSj0qp0TetUWQ6+UHZKNvrJD6myHJNYoeTWvKKwJIgVp2pnH67dFIU0QrQFp"
+    "zcbhjRjLQfOrwFB+8tBKUcX1AHWpiZzopnLzWD7KKh9EpT4IcXCoAOCyASH1HBiWQpwYF2"
+    "vo4um6xtj6irRsT09U4qiIw0eHXOlljh/tD7/VORnSZ6dFn6eI/b5kv8/Ys8OlhOmA/TlJ"
+    "k52acaFEeps9W0KZ4VFQ0zB+XUh3xpUN0k+EdPbsDHiWAv4uFlGeQeoF9/pO/LtzwVV5Bb"
+    "iM4HnGVcl9QeecS788TuuzCtK1If3Dpj/aJzGTIUvBEwbFQFxj+IUcGp1AAG2uiiHgqIOi"
+    "EFBVgYM+5PwCcBzyiF0KeJ/xtTL+OkhEIhBKkBYwFYox/LolSAGekeAfQ+Aq+KSgqs5pWj"
+    "IhdmfCByD+3TzZZZrZEOVLXriXfGtDHAgG10yEFhvWeiYwdvWPQPbkk38JFTrAEbQ4SQ04"
+    "JoPm0wJCq4ZC6yrbq1qJDxSxP+Fa2zlHbYDYncnGiJ160pVjfFtGXLZjXLkglAuiOZAqF0"
+    "TliKqFsUNYNVELY3svYrUwphbGVlgYK45w1YtfgUdolf3AKdI9HJg0F0HzwZ7MtcW+qCYM"
+    "VOGgsM6O3y34NtnezGzHZrR1c6lXM94uuuFYtqLhaMziRt9mFpEW7RvKwK5IGVCRZ0r7Ug"
+    "r2gYtYKdgbVrC5matsL0pQNqcfaf0xAlSLAB52Zh4YTByDahZssxJBHrlf4QTAIflBkiwP"
+    "TJ1oc+9h9T2D6MN4JVshSdmcpnGopoKKj1SLE82BVEXzLQNVRfPtGuAm7CgMw/2ynTJxPO"
+    "Byt0wci6gOZN5v54pSCw9RLfRn5opST1IqqddF6hIbUDgNTrlfNux+OTxPdXhoT3g4zNBy"
+    "PfKPEe4NRIfnZTksJzY7HUjJPrrbIvQ2siPPJBt5MoMcRMLaxjpoH9GMqH3hien3YMHx9q"
+    "MffBtbE3k/y1BdIoK8DlajzsWOPKc8AWhzHQtM4TwIQgdFd13n4Ep7jrCIYCDGhKQN/+fx"
+    "4T5rAYGnSkNsGRj8H9DDYzcFMGeMDXxrgi3bO6bvK2uPabePDwx1D7xY5CN8nIR/bcQphI"
+    "khTbgfI30VRmqsohWk78dQfl7l5603pMrPuwxU5efdNcBr+3lj8OMJY2v3RtTM3s4Cfd3T"
+    "1nOd4cLB/hJ/uOzw/2yXuPTmgY2fsy0ck53pKpfNS9mWhmw+klgXYVNazz2+SV9OJbZE7o"
+    "nXZSyLsHhD7Iqn/jUIOa7adKDrR8jUPURqkV0Dk3tzWJKwxveGMV6DU5GpiWDZzAFSGNLN"
+    "XQ/m+LKbJ5Zf17YgrDfo7JgC7PjGOArw2hnmyt7alnGgtNi9ilaI73qRaGaJi2CyVbLEFS"
+    "0qQGG/AxTYXwHp7DXLqLy6JbrILdE8ZwLI+Tcac2T7sDyctxJV1Y3G29vEJ5s/0/dnJWRd"
+    "+nqy9abSRt1PlvzU9AVleZeSiZeOpa8lS19bVtWlZAtPS+ZMzJylkkk4cqJmz78+KaGCAw"
+    "9g7lXBgdlzczPDxFRw4CFKvUhwIB3Uy+raPE0lOmCN1O322VmRAMGzs+wAQZqXCq2YQlnM"
+    "SjbCCwIFbwF4Z9DzXhyiXI2hNy4Ds0C4DxbNFgB30ciir6Ss6dEyR9FVEylxM9ZQqtDLJM"
+    "snmKj1IxfKfco5YdpJMtV2i7VdJysYvmf7U8EKTjZdZ424+NXC29gKmVvSftCoMQcibsvC"
+    "flUA9KtMyK/SgC+Wm8ofAyYjrfFalT+dIRMQyy8IkzXG0B4tblClStMPHuAv8tvlmiHjbR"
+    "VlP6OKCrT+7YxFQXxtBbJprhEQ2H4lvJJiAxJbzWaCm2o6sYvRTZJeFp9ytjZS0clq+4xW"
+    "1kUoK8BV+A6URgL2Ai1MQ9x1ZOP1IfsU1tYjlc33CbJNLmcnQZN40wVUl2++j8S6cQ97yW"
+    "MRE+HHnINXnZG4QjOt2FN/eDtPK1nYbYJ6drjbSw9SxGqT/oY36R/eoqb2q498YuO6ZuhA"
+    "2td1LnUintop2XxI1U7JZaCqnZK7BrjWMeZd5FrGWJNY42HOUZ4ZDuMyOwlvUxv6NrChL3"
+    "PJKVuvzl5q2uAyX7OXVGmnKoFwWHwP0d1IrD55I5bGbmcfysKRbP9Elt0oV5Udr7K9YH3J"
+    "ZPb6F+guigY="
+)
@@ -0,0 +1,76 @@
+# --- Файл: tests/test_services_archive.py ---
+import pytest
+import pytest_asyncio
+from datetime import date, datetime, time, timedelta, timezone
+from unittest.mock import patch, AsyncMock
+
+from services.backend.app.services import archive as archive_service
+from services.backend.app.services import booking as booking_service
+from services.backend.app.services import utilization as utilization_service
+from app.models import User
+from app.utils.schedule import WeeklySchedule
+
+
+@pytest_asyncio.fixture
+async def archive_setup():
+    """ Две старые брони (два года назад) и одна завтрашняя в одной аудитории """
+    user = User(username="historian", email="historian@example.com", password_hash="x", registration_date=date.today())
+    await user.save()
+    auditorium = booking_service.Auditorium(identifier="Room 707", capacity=30)
+    await auditorium.save()
+    old_start = datetime.combine(date.today() - timedelta(days=730), time(9, 0), tzinfo=timezone.utc)
+    upcoming_start = datetime.combine(date.today() + timedelta(days=1), time(9, 0), tzinfo=timezone.utc)
+    bookings = []
+    for start in (old_start, old_start + timedelta(days=1), upcoming_start):
+        booking = booking_service.Booking(auditorium=auditorium, broker=user, start_time=start, end_time=start + timedelta(hours=2))
+        await booking.save()
+        bookings.append(booking)
+    return user, auditorium, bookings
+
+
+@pytest.mark.asyncio
+async def test_archive_moves_past_bookings(archive_setup):
+    """ Тест: прошедшие брони переносятся порциями в архив, предстоящие остаются в bookings """
+    user, auditorium, (first, second, upcoming) = archive_setup
+
+    with patch.object(archive_service.settings, 'BOOKING_ARCHIVE_CHUNK_SIZE', 1):
+        assert await archive_service.archive_bookings() == 2
+
+    assert await booking_service.Booking.all().values_list('uuid', flat=True) == [upcoming.uuid]
+    archived = await archive_service.BookingArchive.all().order_by('start_time')
+    assert [row.uuid for row in archived] == [first.uuid, second.uuid]
+    assert (archived[0].auditorium_id, archived[0].broker_id, archived[0].version) == (auditorium.uuid, user.uuid, first.version)
+    await auditorium.refresh_from_db()
+    assert auditorium.bookings_version > 0
+
+    assert await archive_service.archive_bookings() == 0
+
+
+@pytest.mark.asyncio
+async def test_bookings_page_includes_archive_on_request(archive_setup):
+    """ Тест: includeArchived сливает архив и bookings в один keyset-поток по start_time """
+    user, auditorium, (first, second, upcoming) = archive_setup
+    await archive_service.archive_bookings()
+
+    items, cursor = await booking_service.get_my_bookings(user)
+    assert [item.uuid for item in items] == [upcoming.uuid]
+
+    items, cursor = await booking_service.get_my_bookings(user, limit=2, include_archived=True)
+    assert [item.uuid for item in items] == [first.uuid, second.uuid]
+    assert all(item.archived for item in items)
+    items, cursor = await booking_service.get_my_bookings(user, limit=2, cursor=cursor, include_archived=True)
+    assert [item.uuid for item in items] == [upcoming.uuid]
+    assert cursor is None
+
+
+@pytest.mark.asyncio
+async def test_rebuild_utilization_counts_archive(archive_setup):
+    """ Тест: пересчет сводки загрузки учитывает архивные брони """
+    user, auditorium, (first, second, upcoming) = archive_setup
+    await archive_service.archive_bookings()
+
+    schedule = WeeklySchedule.compile([(day, time(0, 0), time(0, 0)) for day in range(7)])
+    with patch.object(utilization_service, 'get_weekly_schedules', new_callable=AsyncMock,
+                      return_value={auditorium.uuid: schedule}):
+        assert await utilization_service.rebuild_utilization() == 3
+    assert await utilization_service.DailyUtilization.filter(day=first.start_time.date()).values_list('booked_seconds', flat=True) == [7200]
@@ -36,19 +36,32 @@ async def test_create_auditorium_success():
             assert created_aud == mock_instance
 
 @pytest.mark.asyncio
-@patch('app.services.auditorium.Auditorium.get_or_none', new_callable=AsyncMock)
-async def test_update_auditorium_success(mock_get, mock_auditorium_model):
-    """ Тест успешного обновления """
-    mock_get.side_effect = [mock_auditorium_model, None]
-    aud_uuid = mock_auditorium_model.uuid
+async def test_update_auditorium_success():
+    """ Тест успешного обновления: условный UPDATE увеличивает версию """
+    auditorium = auditorium_service.Auditorium(identifier="Room A", capacity=50)
+    await auditorium.save()
     update_data = UpdateAuditorium(identifier="Updated Room A", capacity=60)
 
-    result = await auditorium_service.update_auditorium(auditorium_uuid=aud_uuid, auditorium_update_data=update_data)
+    result = await auditorium_service.update_auditorium(auditorium_uuid=auditorium.uuid, auditorium_update_data=update_data)
 
-    assert mock_get.call_count == 2
-    mock_auditorium_model.update_from_dict.assert_called_once_with(update_data.model_dump(exclude_unset=True))
-    mock_auditorium_model.save.assert_called_once()
-    assert result == mock_auditorium_model
+    assert result.identifier == "Updated Room A"
+    assert result.version == 2
+    stored = await auditorium_service.Auditorium.get(uuid=auditorium.uuid)
+    assert (stored.identifier, stored.capacity, stored.version) == ("Updated Room A", 60, 2)
+
+@pytest.mark.asyncio
+async def test_update_auditorium_stale_version():
+    """ Тест обновления: устаревшая версия (If-Match) дает 412, данные не меняются """
+    auditorium = auditorium_service.Auditorium(identifier="Room A", capacity=50)
+    await auditorium.save()
+    await auditorium_service.update_auditorium(auditorium.uuid, UpdateAuditorium(capacity=60), expected_version=1)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await auditorium_service.update_auditorium(auditorium.uuid, UpdateAuditorium(capacity=70), expected_version=1)
+
+    assert exc_info.value.status_code == 412
+    stored = await auditorium_service.Auditorium.get(uuid=auditorium.uuid)
+    assert (stored.capacity, stored.version) == (60, 2)
 
 @pytest.mark.asyncio
 @patch('app.services.auditorium.Auditorium.get_or_none', new_callable=AsyncMock, return_value=None)
@@ -93,4 +106,66 @@ async def test_delete_auditorium_not_found(mock_get):
     with pytest.raises(HTTPException) as exc_info:
         await auditorium_service.delete_auditorium(aud_uuid)
     assert exc_info.value.status_code == 404
-    mock_get.assert_called_once_with(uuid=aud_uuid)
\ No newline at end of file
+    mock_get.assert_called_once_with(uuid=aud_uuid)
+
+@pytest.mark.asyncio
+async def test_get_free_auditoriums_filters_and_pages():
+    """ Тест поиска свободных аудиторий: бронь, вместимость, оборудование и расписание """
+    from datetime import date, datetime, time, timedelta, timezone
+    from tortoise import connections
+    from app.enums import UserRole
+    from app.models import BookingHold, User
+    from app.utils.schedule import WeeklySchedule
+
+    projector = auditorium_service.Equipment(name="Projector")
+    await projector.save()
+    rooms = {}
+    for identifier, capacity in [("A-101", 30), ("A-102", 30), ("A-103", 30), ("A-104", 10), ("A-105", 30)]:
+        room = auditorium_service.Auditorium(identifier=identifier, capacity=capacity)
+        await room.save()
+        rooms[identifier] = room
+        if identifier != "A-105":
+            await room.equipment.add(projector)
+            await connections.get("default").execute_query(
+                "INSERT INTO availability_slots (uuid, auditorium_id, day_of_week, start_time, end_time, version) "
+                "VALUES (?, ?, 0, '08:00:00', '20:00:00', 1)",
+                [str(uuid4()), str(room.uuid)]
+            )
+
+    user = User(username="booker", email="booker@example.com", password_hash="x",
+                        registration_date=date.today(), role=UserRole.BOOKER)
+    await user.save()
+    await auditorium_service.Booking(auditorium=rooms["A-102"], broker=user, title="Busy",
+                                     start_time=datetime(2025, 9, 1, 10, 30),
+                                     end_time=datetime(2025, 9, 1, 11, 30)).save()
+
+    schedule = WeeklySchedule.compile([(0, time(8, 0), time(20, 0))])
+    with patch.object(auditorium_service, 'get_weekly_schedules', new_callable=AsyncMock,
+                      side_effect=lambda uuids: {uuid: schedule for uuid in uuids}):
+        found = await auditorium_service.get_free_auditoriums(
+            datetime(2025, 9, 1, 10, 0), datetime(2025, 9, 1, 11, 0),
+            min_capacity=20, equipment_ids=[projector.uuid]
+        )
+        assert [room.identifier for room in found] == ["A-101", "A-103"]
+
+        second_page = await auditorium_service.get_free_auditoriums(
+            datetime(2025, 9, 1, 10, 0), datetime(2025, 9, 1, 11, 0), min_capacity=20, limit=1, offset=1
+        )
+        assert [room.identifier for room in second_page] == ["A-103"]
+
+        with pytest.raises(HTTPException) as exc_info:
+            await auditorium_service.get_free_auditoriums(datetime(2025, 9, 1, 11, 0), datetime(2025, 9, 1, 10, 0))
+        assert exc_info.value.status_code == 400
+
+        # Действующее удержание занимает аудиторию так же, как бронь; истекшее — нет
+        now = datetime.now(timezone.utc)
+        await BookingHold(auditorium=rooms["A-101"], broker=user,
+                          start_time=datetime(2025, 9, 1, 10, 30), end_time=datetime(2025, 9, 1, 11, 0),
+                          expires_at=now + timedelta(minutes=5)).save()
+        await BookingHold(auditorium=rooms["A-103"], broker=user,
+                          start_time=datetime(2025, 9, 1, 10, 30), end_time=datetime(2025, 9, 1, 11, 0),
+                          expires_at=now - timedelta(minutes=5)).save()
+        found = await auditorium_service.get_free_auditoriums(
+            datetime(2025, 9, 1, 10, 0), datetime(2025, 9, 1, 11, 0), min_capacity=20, equipment_ids=[projector.uuid]
+        )
+        assert [room.identifier for room in found] == ["A-103"]
@@ -6,6 +6,7 @@ from uuid import uuid4
 from datetime import time
 
 from fastapi import HTTPException
+from tortoise import connections
 
 from services.backend.app.services import availability as availability_service
 from services.backend.app.models import Auditorium, AvailabilitySlot
@@ -96,4 +97,54 @@ async def test_create_availability_overlap_fails(mock_check_overlap):
         day_of_week=slot_data.day_of_week,
         start_time=slot_data.start_time,
         end_time=slot_data.end_time
-    )
\ No newline at end of file
+    )
+def test_weekly_schedule_merges_slots_across_midnight():
+    """ Тест: соседние слоты сливаются, в том числе через полночь и конец недели """
+    from datetime import datetime
+    from app.utils.schedule import WeeklySchedule
+
+    schedule = WeeklySchedule.compile([
+        (0, time(0, 0), time(12, 0)),
+        (0, time(12, 0), time(0, 0)),
+        (1, time(0, 0), time(2, 0)),
+        (2, time(9, 0), time(18, 0)),
+        (6, time(22, 0), time(0, 0)),
+    ])
+
+    assert len(schedule.starts) == 3
+    # 2025-09-01 — понедельник
+    assert schedule.covers(datetime(2025, 9, 1, 10, 0), datetime(2025, 9, 2, 1, 0))
+    assert schedule.first_gap(datetime(2025, 9, 3, 8, 0), datetime(2025, 9, 3, 10, 0)) == datetime(2025, 9, 3, 8, 0)
+    assert schedule.first_gap(datetime(2025, 9, 1, 23, 0), datetime(2025, 9, 2, 3, 0)) == datetime(2025, 9, 2, 2, 0)
+    assert schedule.covers(datetime(2025, 9, 7, 23, 0), datetime(2025, 9, 8, 1, 0))
+    assert not schedule.covers(datetime(2025, 9, 1, 9, 0), datetime(2025, 9, 9, 9, 0))
+    assert not schedule.has_day(3)
+
+@pytest.mark.asyncio
+async def test_weekly_schedule_cache_follows_availability_version():
+    """ Тест: изменение слотов увеличивает счетчик аудитории, и закэшированное расписание устаревает в любом воркере """
+    aud = availability_service.Auditorium(identifier="Cached Aud", capacity=10)
+    await aud.save()
+    availability_service.schedule_cache.clear()
+
+    schedule = await availability_service.get_weekly_schedule(aud.uuid)
+    assert not schedule
+    assert await availability_service.get_weekly_schedule(aud.uuid) is schedule
+
+    with patch.object(availability_service, 'check_availability_slot_overlap', new_callable=AsyncMock), \
+         patch.object(availability_service.AvailabilitySlot, 'save', new_callable=AsyncMock), \
+         patch.object(availability_service.AvailabilitySlot, 'fetch_related', new_callable=AsyncMock):
+        await availability_service.create_availability(
+            CreateAvailability(auditorium=aud.uuid, day_of_week=0, start_time=time(9, 0), end_time=time(18, 0))
+        )
+    assert (await availability_service.Auditorium.get(uuid=aud.uuid)).availability_version == 1
+    assert await availability_service.get_weekly_schedule(aud.uuid) is not schedule
+
+    # Слот, добавленный другим воркером: кэш этого воркера не трогается, но счетчик в БД уже другой
+    await connections.get("default").execute_query(
+        "INSERT INTO availability_slots (uuid, auditorium_id, day_of_week, start_time, end_time, version) "
+        "VALUES (?, ?, 1, '09:00:00', '18:00:00', 1)",
+        [str(uuid4()), str(aud.uuid)]
+    )
+    await availability_service.bump_availability_version(aud.uuid)
+    assert (await availability_service.get_weekly_schedules([aud.uuid]))[aud.uuid].has_day(1)
@@ -204,25 +204,34 @@ async def test_get_booking_by_uuid_not_found(mock_get, mock_user_booker):
     result = await booking_service.get_booking_by_uuid(booking_uuid=booking_uuid, current_user=mock_user_booker)
     assert result is None
 
-@pytest.mark.asyncio
-async def test_get_bookings_booker_own(mock_user_booker, mock_booking):
-    """ Тест: букер получает свой список броней """
-    mock_chain = MagicMock()
-    mock_prefetch_chain = MagicMock()
-    mock_filter_chain = MagicMock()
+@pytest_asyncio.fixture
+async def listing_setup():
+    """ Два пользователя и по три брони у каждого в одной аудитории """
+    users = []
+    for name in ("first", "second"):
+        user = booking_service.User(username=name, email=f"{name}@example.com", password_hash="x",
+                                    registration_date=date.today(), role=UserRole.BOOKER)
+        await user.save()
+        users.append(user)
+    auditorium = booking_service.Auditorium(identifier="Room 303", capacity=20)
+    await auditorium.save()
+    start = datetime(2025, 9, 1, 9, 0)
+    for hour in range(6):
+        await booking_service.Booking(auditorium=auditorium, broker=users[hour % 2], title=f"#{hour}",
+                                      start_time=start + timedelta(hours=hour),
+                                      end_time=start + timedelta(hours=hour, minutes=50)).save()
+    return users, auditorium
 
-    mock_chain.prefetch_related.return_value = mock_prefetch_chain
-    mock_prefetch_chain.filter.return_value = mock_filter_chain
-    mock_filter_chain.order_by = AsyncMock(return_value=[mock_booking])
+@pytest.mark.asyncio
+async def test_get_bookings_booker_own(listing_setup):
+    """ Тест: букер получает только свои брони, отсортированные по времени начала """
+    (first, _), _ = listing_setup
 
-    with patch('app.services.booking.Booking.all', return_value=mock_chain) as mock_all_call:
-        results = await booking_service.get_bookings(current_user=mock_user_booker)
+    results, next_cursor = await booking_service.get_bookings(current_user=first)
 
-    mock_all_call.assert_called_once()
-    mock_chain.prefetch_related.assert_called_once_with('broker', 'auditorium')
-    mock_prefetch_chain.filter.assert_called_once_with(broker_id=mock_user_booker.uuid)
-    mock_filter_chain.order_by.assert_called_once_with('start_time')
-    assert results == [mock_booking]
+    assert [booking.title for booking in results] == ["#0", "#2", "#4"]
+    assert all(booking.broker_id == first.uuid for booking in results)
+    assert next_cursor is None
 
 @pytest.mark.asyncio
 async def test_get_bookings_booker_forbidden_other_user(mock_user_booker):
@@ -232,27 +241,31 @@ async def test_get_bookings_booker_forbidden_other_user(mock_user_booker):
     assert exc_info.value.status_code == 403
 
 @pytest.mark.asyncio
-async def test_get_bookings_moderator_filter_user(mock_user_moderator, mock_booking):
+async def test_get_bookings_moderator_filter_user(listing_setup, mock_user_moderator):
     """ Тест: модератор фильтрует по ID пользователя """
-    target_user_uuid = uuid4()
+    (_, second), _ = listing_setup
 
-    mock_chain = MagicMock()
-    mock_prefetch_chain = MagicMock()
-    mock_filter_chain = MagicMock()
-    mock_final_filter_chain = MagicMock()
+    results, _ = await booking_service.get_bookings(current_user=mock_user_moderator, user_uuid=second.uuid)
 
-    mock_chain.prefetch_related.return_value = mock_prefetch_chain
-    mock_prefetch_chain.filter.return_value = mock_filter_chain
-    mock_filter_chain.filter.return_value = mock_final_filter_chain
-    mock_filter_chain.order_by = AsyncMock(return_value=[mock_booking])
+    assert [booking.title for booking in results] == ["#1", "#3", "#5"]
 
-    with patch('app.services.booking.Booking.all', return_value=mock_chain) as mock_all_call:
-        await booking_service.get_bookings(current_user=mock_user_moderator, user_uuid=target_user_uuid)
+@pytest.mark.asyncio
+async def test_get_bookings_keyset_pages(listing_setup, mock_user_moderator):
+    """ Тест: курсор (start_time, uuid) проходит все брони страницами без повторов и пропусков """
+    seen = []
+    cursor = None
+    for _ in range(3):
+        page, cursor = await booking_service.get_bookings(current_user=mock_user_moderator, limit=4, cursor=cursor)
+        seen.extend(booking.title for booking in page)
+        if cursor is None:
+            break
+
+    assert seen == [f"#{hour}" for hour in range(6)]
+    assert cursor is None
 
-    mock_all_call.assert_called_once()
-    mock_chain.prefetch_related.assert_called_once_with('broker', 'auditorium')
-    mock_prefetch_chain.filter.assert_called_once_with(broker_id=target_user_uuid)
-    mock_filter_chain.order_by.assert_called_once_with('start_time')
+    with pytest.raises(HTTPException) as exc_info:
+        await booking_service.get_bookings(current_user=mock_user_moderator, cursor="not-a-cursor")
+    assert exc_info.value.status_code == 400
 
 @pytest.mark.asyncio
 @patch('app.services.booking.check_auditorium_availability', new_callable=AsyncMock, return_value=True)
@@ -384,4 +397,248 @@ async def test_delete_booking_forbidden(mock_get, mock_booking, mock_user_booker
     with pytest.raises(HTTPException) as exc_info:
         await booking_service.delete_booking(mock_booking.uuid, mock_user_booker)
     assert exc_info.value.status_code == 403
-    mock_booking.delete.assert_not_called()
\ No newline at end of file
+    mock_booking.delete.assert_not_called()
+def test_booking_index_find_overlaps():
+    """ Тест: индекс находит только пересекающиеся брони нужной аудитории """
+    index = booking_service.booking_index.__class__()
+    auditorium_uuid = uuid4()
+    other_auditorium_uuid = uuid4()
+    base = datetime(2025, 9, 1, 9, 0)
+    long_booking, short_booking, other_booking = uuid4(), uuid4(), uuid4()
+    index.add(auditorium_uuid, long_booking, base, base + timedelta(hours=8))
+    index.add(auditorium_uuid, short_booking, base + timedelta(hours=9), base + timedelta(hours=10))
+    index.add(other_auditorium_uuid, other_booking, base, base + timedelta(hours=10))
+
+    conflicts = index.find_overlaps(auditorium_uuid, base + timedelta(hours=7), base + timedelta(hours=9, minutes=30))
+    assert [item.uuid for item in conflicts] == [long_booking, short_booking]
+    assert index.find_overlaps(auditorium_uuid, base + timedelta(hours=8), base + timedelta(hours=9)) == []
+    assert index.find_overlaps(auditorium_uuid, base, base + timedelta(hours=1), exclude_booking_uuid=long_booking) == []
+
+    index.remove(long_booking)
+    assert index.find_overlaps(auditorium_uuid, base, base + timedelta(hours=1)) == []
+    assert len(index) == 2
+
+@pytest.mark.asyncio
+async def test_check_booking_overlap_index_hit_confirmed_by_db():
+    """ Тест: конфликт из индекса подтверждается БД, а запись о брони, которой в БД уже нет, удаляется из индекса """
+    user = booking_service.User(username="indexed", email="indexed@example.com", password_hash="x", registration_date=date.today())
+    await user.save()
+    auditorium = booking_service.Auditorium(identifier="Room 101", capacity=10)
+    await auditorium.save()
+    start = datetime(2025, 9, 1, 10, 0)
+    existing = booking_service.Booking(auditorium=auditorium, broker=user, start_time=start, end_time=start + timedelta(hours=2))
+    await existing.save()
+    stale_uuid = uuid4()
+    index = booking_service.booking_index.__class__()
+    index.add(auditorium.uuid, existing.uuid, existing.start_time, existing.end_time, "Room 101")
+    index.add(auditorium.uuid, stale_uuid, start + timedelta(hours=4), start + timedelta(hours=5), "Room 101")
+    index.loaded = True
+
+    with patch.object(booking_service.settings, 'BOOKING_INDEX_ENABLED', True), \
+         patch.object(booking_service, 'booking_index', index):
+        with pytest.raises(HTTPException) as exc_info:
+            await booking_service.check_booking_overlap(auditorium.uuid, start + timedelta(hours=1), start + timedelta(hours=3))
+        assert exc_info.value.status_code == 409
+        assert str(existing.uuid) in exc_info.value.detail
+
+        # Бронь удалена другим воркером или архивацией: индекс ее еще помнит, но интервал свободен
+        assert await booking_service.check_booking_overlap(auditorium.uuid, start + timedelta(hours=4), start + timedelta(hours=5))
+    assert index.find_overlaps(auditorium.uuid, start + timedelta(hours=4), start + timedelta(hours=5)) == []
+    assert len(index) == 1
+
+@pytest.mark.asyncio
+async def test_check_booking_overlap_db_reports_conflicts():
+    """ Тест: авторитетная проверка в БД сообщает конфликтующие брони одним запросом """
+    user = booking_service.User(username="overlap", email="overlap@example.com", password_hash="x", registration_date=date.today())
+    await user.save()
+    auditorium = booking_service.Auditorium(identifier="Room 202", capacity=10)
+    await auditorium.save()
+    start = datetime(2025, 9, 1, 10, 0)
+    existing = booking_service.Booking(auditorium=auditorium, broker=user, start_time=start, end_time=start + timedelta(hours=2))
+    await existing.save()
+
+    assert await booking_service.check_booking_overlap(auditorium.uuid, start + timedelta(hours=2), start + timedelta(hours=3))
+    with pytest.raises(HTTPException) as exc_info:
+        await booking_service.check_booking_overlap(auditorium.uuid, start + timedelta(hours=1), start + timedelta(hours=3))
+    assert exc_info.value.status_code == 409
+    assert "Room 202" in exc_info.value.detail
+    assert str(existing.uuid) in exc_info.value.detail
+    assert await booking_service.check_booking_overlap(
+        auditorium.uuid, start, start + timedelta(hours=1), exclude_booking_uuid=existing.uuid
+    )
+
+@pytest.mark.asyncio
+async def test_check_auditorium_availability_uses_compiled_schedule():
+    """ Тест: многодневная проверка доступности по скомпилированному расписанию """
+    from app.utils.schedule import WeeklySchedule
+
+    auditorium_uuid = uuid4()
+    full_week = WeeklySchedule.compile([(day, time(0, 0), time(0, 0)) for day in range(7)])
+    without_wednesday = WeeklySchedule.compile([(day, time(0, 0), time(0, 0)) for day in range(7) if day != 2])
+    start = datetime(2025, 9, 1, 10, 0)
+
+    with patch.object(booking_service, 'get_weekly_schedule', new_callable=AsyncMock, return_value=full_week):
+        assert await booking_service.check_auditorium_availability(auditorium_uuid, start, start + timedelta(days=3))
+
+    with patch.object(booking_service, 'get_weekly_schedule', new_callable=AsyncMock, return_value=without_wednesday), \
+         patch.object(booking_service.Auditorium, 'get_or_none', new_callable=AsyncMock, return_value=None):
+        with pytest.raises(HTTPException) as exc_info:
+            await booking_service.check_auditorium_availability(auditorium_uuid, start, start + timedelta(days=3))
+    assert exc_info.value.status_code == 400
+    assert "2025-09-03" in exc_info.value.detail
+
+@pytest_asyncio.fixture
+async def batch_setup():
+    from app.utils.schedule import WeeklySchedule
+
+    user = booking_service.User(username="batch", email="batch@example.com", password_hash="x", registration_date=date.today())
+    await user.save()
+    auditorium = booking_service.Auditorium(identifier="Room 404", capacity=30)
+    await auditorium.save()
+    start = datetime(2025, 9, 1, 10, 0)
+    existing = booking_service.Booking(auditorium=auditorium, broker=user, start_time=start, end_time=start + timedelta(hours=1))
+    await existing.save()
+    schedule = WeeklySchedule.compile([(day, time(8, 0), time(20, 0)) for day in range(7)])
+    with patch.object(booking_service, 'get_weekly_schedules', new_callable=AsyncMock, return_value={auditorium.uuid: schedule}):
+        yield user, auditorium, start
+
+def _batch_items(auditorium, start):
+    return [
+        {"auditorium": auditorium.uuid, "start_time": start + timedelta(hours=1), "end_time": start + timedelta(hours=2)},
+        {"auditorium": auditorium.uuid, "start_time": start + timedelta(minutes=90), "end_time": start + timedelta(hours=3)},
+        {"auditorium": auditorium.uuid, "start_time": start + timedelta(minutes=30), "end_time": start + timedelta(hours=1)},
+        {"auditorium": auditorium.uuid, "start_time": start + timedelta(hours=9), "end_time": start + timedelta(hours=11)},
+        {"auditorium": uuid4(), "start_time": start, "end_time": start + timedelta(hours=1)},
+    ]
+
+@pytest.mark.asyncio
+async def test_create_bookings_batch_best_effort(batch_setup):
+    """ Тест: пакет в режиме best_effort создает только валидные элементы """
+    from app.schemas import CreateBookingBatch, BookingBatchResult
+
+    user, auditorium, start = batch_setup
+    batch = CreateBookingBatch(items=_batch_items(auditorium, start), mode="best_effort")
+
+    result = await booking_service.create_bookings_batch(batch=batch, current_user=user)
+
+    assert [item["status_code"] for item in result["results"]] == [201, 409, 409, 400, 404]
+    assert "#0" in result["results"][1]["detail"]
+    assert result["created"] == 1 and result["failed"] == 4
+    assert await booking_service.Booking.filter(auditorium_id=auditorium.uuid).count() == 2
+    assert BookingBatchResult.model_validate(result).results[0].booking.auditorium_id == auditorium.uuid
+
+@pytest.mark.asyncio
+async def test_create_bookings_batch_all_or_nothing(batch_setup):
+    """ Тест: пакет в режиме all_or_nothing ничего не создает при ошибке любого элемента """
+    from app.schemas import CreateBookingBatch
+
+    user, auditorium, start = batch_setup
+    batch = CreateBookingBatch(items=_batch_items(auditorium, start))
+
+    result = await booking_service.create_bookings_batch(batch=batch, current_user=user)
+
+    assert result["created"] == 0
+    assert result["results"][0]["status_code"] == 424
+    assert await booking_service.Booking.filter(auditorium_id=auditorium.uuid).count() == 1
+
+@pytest.mark.asyncio
+async def test_create_bookings_batch_checks_under_lock(batch_setup):
+    """ Тест: расписания и занятость пакета читаются уже под блокировкой аудиторий """
+    from app.schemas import CreateBookingBatch
+    from app.utils.locks import auditorium_locks
+
+    user, auditorium, start = batch_setup
+    schedules = booking_service.get_weekly_schedules.return_value
+    locked_during_checks = []
+
+    async def read_schedules(auditorium_uuids):
+        locked_during_checks.append(len(auditorium_locks))
+        return schedules
+
+    batch = CreateBookingBatch(items=_batch_items(auditorium, start)[:1])
+    with patch.object(booking_service, 'get_weekly_schedules', side_effect=read_schedules):
+        result = await booking_service.create_bookings_batch(batch=batch, current_user=user)
+
+    assert result["created"] == 1
+    assert locked_during_checks == [1]
+    assert len(auditorium_locks) == 0
+
+@pytest.mark.asyncio
+async def test_create_booking_exclusion_violation_returns_409(mock_user_booker, mock_auditorium):
+    """ Тест: при ограничении в БД бронь вставляется без пре-проверки, нарушение превращается в 409 """
+    class ExclusionViolation(Exception):
+        sqlstate = "23P01"
+
+    conflict_uuid = uuid4()
+    start = datetime(2025, 9, 1, 10, 0)
+    conflict = {"uuid": conflict_uuid, "start_time": start, "end_time": start + timedelta(hours=2),
+                "auditorium__identifier": mock_auditorium.identifier}
+    booking_data = {"auditorium": mock_auditorium.uuid, "start_time": start, "end_time": start + timedelta(hours=1)}
+    new_booking = MagicMock(spec=Booking, save=AsyncMock(side_effect=IntegrityError(ExclusionViolation())))
+
+    with patch.object(booking_service.Auditorium, 'get_or_none', new_callable=AsyncMock, return_value=mock_auditorium), \
+         patch.object(booking_service, 'check_auditorium_availability', new_callable=AsyncMock, return_value=True), \
+         patch.object(booking_service, 'booking_exclusion_enforced', return_value=True), \
+         patch.object(booking_service, '_find_booking_conflicts', new_callable=AsyncMock, return_value=[conflict]) as mock_find, \
+         patch.object(booking_service, 'Booking', return_value=new_booking):
+        with pytest.raises(HTTPException) as exc_info:
+            await booking_service.create_booking(booking_model=MagicMock(**booking_data), current_user=mock_user_booker)
+
+    assert exc_info.value.status_code == 409
+    assert str(conflict_uuid) in exc_info.value.detail
+    new_booking.save.assert_called_once()
+    mock_find.assert_called_once_with(mock_auditorium.uuid, start, start + timedelta(hours=1), None)
+
+@pytest.mark.asyncio
+async def test_auditorium_locks_serialize_same_auditorium():
+    """ Тест: запись в одну аудиторию сериализуется, разные аудитории не ждут друг друга """
+    import asyncio
+    from services.backend.app.utils import locks
+
+    room_a, room_b = uuid4(), uuid4()
+    keyed_locks = locks.KeyedLocks()
+    events = []
+
+    async def writer(name, auditorium_uuid, hold):
+        async with keyed_locks.acquire(auditorium_uuid):
+            events.append(f"{name}:start")
+            await asyncio.sleep(hold)
+            events.append(f"{name}:end")
+
+    await asyncio.gather(writer("a1", room_a, 0.05), writer("a2", room_a, 0), writer("b", room_b, 0))
+
+    assert events.index("a1:end") < events.index("a2:start")
+    assert events.index("b:end") < events.index("a1:end")
+    assert len(keyed_locks) == 0
+
+    async with locks.auditorium_write_lock(room_a, room_b):
+        assert len(locks.auditorium_locks) == 2
+    assert len(locks.auditorium_locks) == 0
+
+@pytest.mark.asyncio
+async def test_export_bookings_streams_chunks(listing_setup, mock_user_moderator):
+    """ Тест: выгрузка читает брони порциями и отдает все строки в порядке start_time """
+    import json
+    from services.backend.app.services import export as export_service
+    from app.enums import BookingExportFormat
+
+    (first, _), auditorium = listing_setup
+
+    with patch.object(export_service.settings, 'BOOKING_EXPORT_CHUNK_SIZE', 4):
+        ndjson_chunks = [chunk async for chunk in export_service.export_bookings(mock_user_moderator)]
+        csv_chunks = [chunk async for chunk in export_service.export_bookings(
+            first, export_format=BookingExportFormat.CSV
+        )]
+
+    assert len(ndjson_chunks) == 2
+    rows = [json.loads(line) for chunk in ndjson_chunks for line in chunk.splitlines()]
+    assert [row["title"] for row in rows] == [f"#{hour}" for hour in range(6)]
+    assert rows[0]["auditorium"] == auditorium.identifier
+
+    csv_lines = "".join(csv_chunks).splitlines()
+    assert csv_lines[0].startswith("uuid,auditorium_id,auditorium")
+    assert [line.split(",")[7] for line in csv_lines[1:]] == ["#0", "#2", "#4"]
+
+    with pytest.raises(HTTPException) as exc_info:
+        export_service.export_bookings(first, user_uuid=uuid4())
+    assert exc_info.value.status_code == 403
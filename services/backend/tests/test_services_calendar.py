@@ -0,0 +1,197 @@
+# --- Файл: tests/test_services_calendar.py ---
+import pytest
+import pytest_asyncio
+from datetime import date, datetime, time, timedelta, timezone
+from unittest.mock import patch, AsyncMock
+
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from services.backend.app.services import calendar as calendar_service
+from services.backend.app.services import booking as booking_service
+from app.enums import UserRole
+from app.models import BookingHold
+from app.utils.conditional import is_not_modified, validator_headers
+from app.utils.freebusy import freebusy_runs
+from app.utils.schedule import WeeklySchedule
+
+
+def _request(**headers):
+    return Request({"type": "http", "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()]})
+
+
+@pytest_asyncio.fixture
+async def feed_setup():
+    user = calendar_service.User(username="subscriber", email="subscriber@example.com", password_hash="x",
+                                 registration_date=date.today(), role=UserRole.BOOKER)
+    await user.save()
+    auditorium = calendar_service.Auditorium(identifier="Hall, 1", capacity=100)
+    await auditorium.save()
+    start = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=1)
+    await calendar_service.Booking(auditorium=auditorium, broker=user, title="Lecture; intro",
+                                   start_time=start, end_time=start + timedelta(hours=1)).save()
+    return user, auditorium
+
+
+@pytest.mark.asyncio
+async def test_auditorium_feed_etag_follows_change_counter(feed_setup):
+    """ Тест: ETag ленты меняется только после изменения бронирований аудитории """
+    user, auditorium = feed_setup
+
+    first = await calendar_service.get_auditorium_feed(auditorium.uuid)
+    assert first.last_modified is None
+    assert (await calendar_service.get_auditorium_feed(auditorium.uuid)).etag == first.etag
+
+    await booking_service.touch_booking_calendars([auditorium.uuid], [user.uuid])
+    second = await calendar_service.get_auditorium_feed(auditorium.uuid)
+    assert second.etag != first.etag
+    assert second.last_modified is not None
+
+    with pytest.raises(HTTPException) as exc_info:
+        await calendar_service.get_auditorium_feed(user.uuid)
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_render_feed_builds_ics(feed_setup):
+    """ Тест: лента содержит события окна с экранированными текстовыми полями """
+    user, auditorium = feed_setup
+    await user.refresh_from_db()
+
+    ics = await calendar_service.render_feed(await calendar_service.get_user_feed(user))
+
+    assert ics.startswith("BEGIN:VCALENDAR\r\n")
+    assert ics.count("BEGIN:VEVENT") == 1
+    assert "SUMMARY:Lecture\\; intro\r\n" in ics
+    assert "LOCATION:Hall\\, 1\r\n" in ics
+
+
+def test_is_not_modified():
+    """ Тест условного GET: If-None-Match важнее If-Modified-Since """
+    changed_at = datetime(2025, 9, 1, 10, 0, 30, 500000, tzinfo=timezone.utc)
+    headers = validator_headers('"3-20250901"', changed_at)
+
+    assert is_not_modified(_request(if_none_match='"3-20250901"'), '"3-20250901"', changed_at)
+    assert not is_not_modified(_request(if_none_match='"2-20250901"'), '"3-20250901"', changed_at)
+    assert is_not_modified(_request(if_modified_since=headers["Last-Modified"]), '"3-20250901"', changed_at)
+    assert not is_not_modified(
+        _request(if_none_match='"2-20250901"', if_modified_since=headers["Last-Modified"]), '"3-20250901"', changed_at
+    )
+    assert not is_not_modified(_request(), '"3-20250901"', changed_at)
+
+
+@pytest.mark.asyncio
+async def test_calendar_json_cached_until_bookings_change(feed_setup):
+    """ Тест: повторный запрос календаря отдается из кэша, изменение броней аудитории его инвалидирует """
+    import json
+    from unittest.mock import patch
+
+    user, auditorium = feed_setup
+    calendar_service.calendar_cache.clear()
+    start_date = date.today()
+    end_date = start_date + timedelta(days=7)
+    loader = calendar_service.get_bookings_for_calendar
+
+    with patch.object(calendar_service, 'get_bookings_for_calendar', side_effect=loader) as mock_loader:
+        first = await calendar_service.get_calendar_json(auditorium.uuid, start_date, end_date)
+        second = await calendar_service.get_calendar_json(auditorium.uuid, start_date, end_date)
+        assert mock_loader.call_count == 1
+        assert first == second
+        entries = json.loads(first)
+        assert [entry["title"] for entry in entries] == ["Lecture; intro"]
+        assert {"uuid", "title", "start", "end"} <= set(entries[0])
+
+        await booking_service.touch_booking_calendars([auditorium.uuid], [user.uuid])
+        await calendar_service.get_calendar_json(auditorium.uuid, start_date, end_date)
+        assert mock_loader.call_count == 2
+
+    assert await calendar_service.get_calendar_json(user.uuid, start_date, end_date) == b"[]"
+
+
+@pytest.mark.asyncio
+async def test_auditoriums_calendar_groups_by_room(feed_setup):
+    """ Тест: календарь нескольких аудиторий группирует брони по аудиториям, включая пустые """
+    user, auditorium = feed_setup
+    empty_room = calendar_service.Auditorium(identifier="Room 2", capacity=10)
+    await empty_room.save()
+    small_room = calendar_service.Auditorium(identifier="Room 3", capacity=5)
+    await small_room.save()
+    today = date.today()
+
+    calendars = await calendar_service.get_auditoriums_calendar(
+        today, today + timedelta(days=2), auditorium_uuids=[auditorium.uuid, empty_room.uuid]
+    )
+    assert [c["identifier"] for c in calendars] == ["Hall, 1", "Room 2"]
+    assert [b["title"] for b in calendars[0]["bookings"]] == ["Lecture; intro"]
+    assert calendars[1]["bookings"] == []
+
+    by_capacity = await calendar_service.get_auditoriums_calendar(today, today + timedelta(days=2), min_capacity=10)
+    assert {c["auditorium"] for c in by_capacity} == {auditorium.uuid, empty_room.uuid}
+
+    outside = await calendar_service.get_auditoriums_calendar(
+        today + timedelta(days=5), today + timedelta(days=6), auditorium_uuids=[auditorium.uuid]
+    )
+    assert outside[0]["bookings"] == []
+
+
+def test_freebusy_runs_encodes_cells():
+    """ Тест: ячейки, частично закрытые расписанием, закрыты; пересеченные бронью — заняты """
+    start = datetime(2025, 9, 1, 8, 0)
+    schedule = WeeklySchedule.compile([(0, time(8, 30), time(12, 0))])
+
+    runs = freebusy_runs(
+        schedule.open_intervals(start, start + timedelta(hours=6)),
+        [(datetime(2025, 9, 1, 10, 15), datetime(2025, 9, 1, 10, 45))],
+        start, 30 * 60, 12
+    )
+
+    assert runs == "1c3o2b2o4c"
+
+
+@pytest.mark.asyncio
+async def test_get_freebusy_groups_rooms(feed_setup):
+    """ Тест: матрица занятости строится для всех выбранных аудиторий одним проходом """
+    user, auditorium = feed_setup
+    other = calendar_service.Auditorium(identifier="Room 2", capacity=10)
+    await other.save()
+    start = datetime(2025, 9, 1, 8, 0, tzinfo=timezone.utc)
+    await calendar_service.Booking(auditorium=other, broker=user, start_time=start + timedelta(hours=2),
+                                   end_time=start + timedelta(hours=2, minutes=30)).save()
+    await BookingHold(auditorium=other, broker=user, start_time=start + timedelta(hours=3, minutes=15),
+                      end_time=start + timedelta(hours=3, minutes=30),
+                      expires_at=datetime.now(timezone.utc) + timedelta(minutes=5)).save()
+    schedule = WeeklySchedule.compile([(0, time(9, 0), time(17, 0))])
+
+    with patch.object(calendar_service, 'get_weekly_schedules', new_callable=AsyncMock,
+                      return_value={auditorium.uuid: schedule, other.uuid: schedule}):
+        grid = await calendar_service.get_freebusy(start, start + timedelta(hours=4), 60)
+
+    assert grid["buckets"] == 4
+    assert [(room["identifier"], room["runs"]) for room in grid["auditoriums"]] == [
+        ("Hall, 1", "1c3o"),
+        ("Room 2", "1c1o2b"),
+    ]
+
+    with pytest.raises(HTTPException) as exc_info:
+        await calendar_service.get_freebusy(start, start + timedelta(days=30), 5)
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_freebusy_uses_request_timezone(feed_setup):
+    """ Тест: расписание сверяется по местному времени запроса, как при создании брони, а смещение сохраняется в ответе """
+    user, auditorium = feed_setup
+    msk = timezone(timedelta(hours=3))
+    start = datetime(2025, 1, 6, 9, 0, tzinfo=msk)
+    await calendar_service.Booking(auditorium=auditorium, broker=user, start_time=start + timedelta(hours=1),
+                                   end_time=start + timedelta(hours=2)).save()
+    schedule = WeeklySchedule.compile([(0, time(9, 0), time(18, 0))])
+
+    with patch.object(calendar_service, 'get_weekly_schedules', new_callable=AsyncMock,
+                      return_value={auditorium.uuid: schedule}):
+        grid = await calendar_service.get_freebusy(start, start + timedelta(hours=10), 60,
+                                                   auditorium_uuids=[auditorium.uuid])
+
+    assert grid["start"] == start and grid["start"].utcoffset() == timedelta(hours=3)
+    assert grid["end"] == start + timedelta(hours=10)
+    assert grid["auditoriums"][0]["runs"] == "1o1b7o1c"
@@ -0,0 +1,91 @@
+# --- Файл: tests/test_services_current_user.py ---
+import pytest
+import pytest_asyncio
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import jwt
+from fastapi import HTTPException
+
+from app.models import User
+from app.enums import UserRole
+from app.schemas import UserGrantPrivileges
+from app.services import users as user_service
+from app.utils import contrib
+
+
+def _token(user_uuid, **claims):
+    exp = (datetime.now(timezone.utc) + timedelta(minutes=5)).timestamp()
+    return jwt.encode({"user_uuid": str(user_uuid), "exp": exp, **claims}, contrib.settings.SECRET_KEY, algorithm="HS256")
+
+
+@pytest_asyncio.fixture
+async def booker():
+    contrib.token_cache.clear()
+    contrib.user_cache.clear()
+    user = User(username="booker", email="booker@example.com", password_hash="x",
+                registration_date=date.today(), role=UserRole.BOOKER)
+    await user.save()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_current_user_is_cached_until_invalidated(booker):
+    """ Тест: повторный запрос не читает пользователя из БД, а grant_user сбрасывает кэш """
+    token = _token(booker.uuid)
+    first = await contrib.get_current_user(token)
+    first.role = UserRole.MODERATOR
+
+    with patch.object(contrib.User, 'filter', side_effect=AssertionError("unexpected query")):
+        second = await contrib.get_current_user(token)
+    assert second is not first
+    assert (second.uuid, second.username, second.role) == (booker.uuid, "booker", UserRole.BOOKER)
+
+    await user_service.grant_user(booker.uuid, UserGrantPrivileges(role=UserRole.MODERATOR.value))
+    assert (await contrib.get_current_moderator(token)).role == UserRole.MODERATOR
+
+    with pytest.raises(HTTPException) as exc_info:
+        await contrib.get_current_user(_token(uuid4()))
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_identity_claims_skip_lookup(booker):
+    """ Тест: при доверии к claims пользователь собирается из токена, без claims — читается из БД """
+    token = _token(uuid4(), role=UserRole.MODERATOR.value, username="ghost")
+
+    with patch.object(contrib.settings, 'JWT_TRUST_IDENTITY_CLAIMS', True):
+        user = await contrib.get_current_moderator(token)
+        assert (user.username, user.role) == ("ghost", UserRole.MODERATOR)
+
+        assert (await contrib.get_current_user(_token(booker.uuid))).username == "booker"
+
+    with pytest.raises(HTTPException) as exc_info:
+        await contrib.get_current_user(token)
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_feed_accepts_only_feed_secret_in_query(booker):
+    """ Тест: в query-параметре ленты работает только секрет ленты, access-токен — только заголовком; секрет отзывается """
+    access_token = _token(booker.uuid)
+    assert (await contrib.get_current_feed_user(token=None, header_token=access_token)).uuid == booker.uuid
+
+    with pytest.raises(HTTPException) as exc_info:
+        await contrib.get_current_feed_user(token=access_token, header_token=None)
+    assert exc_info.value.status_code == 403
+
+    first = await user_service.rotate_feed_token(booker)
+    assert (await contrib.get_current_feed_user(token=first, header_token=None)).username == "booker"
+    assert await User.filter(feed_token_hash=first).count() == 0
+
+    second = await user_service.rotate_feed_token(booker)
+    with pytest.raises(HTTPException):
+        await contrib.get_current_feed_user(token=first, header_token=None)
+    assert (await contrib.get_current_feed_user(token=second, header_token=None)).uuid == booker.uuid
+
+    await user_service.revoke_feed_token(booker)
+    with pytest.raises(HTTPException) as exc_info:
+        await contrib.get_current_feed_user(token=second, header_token=None)
+    assert exc_info.value.status_code == 403
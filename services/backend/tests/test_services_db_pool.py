@@ -0,0 +1,56 @@
+# --- Файл: tests/test_services_db_pool.py ---
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from prometheus_client import REGISTRY
+from tortoise.exceptions import DBConnectionError
+
+from app.utils import db_pool
+
+
+class FakePool:
+    """ Пул на одно соединение с интерфейсом asyncpg.Pool, нужным обертке """
+
+    def __init__(self):
+        self.slot = asyncio.Semaphore(1)
+
+    async def acquire(self, timeout=None):
+        await asyncio.wait_for(self.slot.acquire(), timeout)
+        return "connection"
+
+    async def release(self, connection):
+        self.slot.release()
+
+    def get_size(self):
+        return 1
+
+    def get_idle_size(self):
+        return 0 if self.slot.locked() else 1
+
+    def get_max_size(self):
+        return 1
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels)
+
+
+@pytest.mark.asyncio
+async def test_pool_acquire_timeout_and_saturation_metrics():
+    """ Тест: занятость пула видна в метриках, ожидание дольше таймаута превращается в DBConnectionError """
+    pool = db_pool.InstrumentedPool(FakePool(), "test_pool")
+    acquired_before = _sample("backend_db_pool_acquire_seconds_count", connection="test_pool") or 0
+
+    connection = await pool.acquire()
+    assert _sample("backend_db_pool_connections", connection="test_pool", state="in_use") == 1
+    assert _sample("backend_db_pool_connections", connection="test_pool", state="idle") == 0
+
+    with patch.object(db_pool.settings, 'DB_POOL_ACQUIRE_TIMEOUT', 0.01):
+        with pytest.raises(DBConnectionError):
+            await pool.acquire()
+    assert _sample("backend_db_pool_acquire_timeouts_total", connection="test_pool") == 1
+
+    await pool.release(connection)
+    assert _sample("backend_db_pool_connections", connection="test_pool", state="idle") == 1
+    assert _sample("backend_db_pool_acquire_seconds_count", connection="test_pool") == acquired_before + 2
@@ -0,0 +1,74 @@
+# --- Файл: tests/test_services_events.py ---
+import asyncio
+import json
+import pytest
+import pytest_asyncio
+from datetime import date, datetime, time, timedelta, timezone
+from unittest.mock import patch, AsyncMock
+
+from fastapi import HTTPException
+
+from app.services import events as events_service
+from services.backend.app.services import booking as booking_service
+from app.models import User
+from app.schemas import CreateBooking
+from app.utils.broadcast import BroadcastHub
+
+
+@pytest_asyncio.fixture
+async def events_setup():
+    """ Аудитория и пользователь; проверка расписания отключена """
+    user = User(username="viewer", email="viewer@example.com", password_hash="x", registration_date=date.today())
+    await user.save()
+    auditorium = booking_service.Auditorium(identifier="Room 808", capacity=20)
+    await auditorium.save()
+    hub = BroadcastHub(queue_size=10, max_subscribers=10)
+    with patch.object(events_service, 'calendar_hub', hub), \
+            patch.object(booking_service, 'check_auditorium_availability', new_callable=AsyncMock):
+        yield user, auditorium, hub
+
+
+def test_hub_drops_slow_subscriber():
+    """ Тест: переполненная очередь отключает только медленного подписчика """
+    hub = BroadcastHub(queue_size=2, max_subscribers=2)
+    slow, fast = hub.subscribe("room"), hub.subscribe("room")
+    assert hub.subscribe("room") is None
+
+    assert hub.publish("room", "a") == 0
+    fast.queue.get_nowait()
+    assert hub.publish("room", "b") == 0
+    assert hub.publish("room", "c") == 1
+
+    assert slow.queue.get_nowait() is None
+    assert [fast.queue.get_nowait(), fast.queue.get_nowait()] == ["b", "c"]
+    assert len(hub) == hub.subscribers("room") == 1
+
+
+@pytest.mark.asyncio
+async def test_booking_writes_stream_to_subscribers(events_setup):
+    """ Тест: создание и удаление брони приходят подписчику аудитории как SSE-кадры """
+    user, auditorium, hub = events_setup
+    with pytest.raises(HTTPException) as exc_info:
+        await events_service.open_auditorium_events(booking_service.uuid4())
+    assert exc_info.value.status_code == 404
+
+    stream = await events_service.open_auditorium_events(auditorium.uuid)
+    ready = await stream.__anext__()
+    assert ready.startswith("retry: ") and "event: ready" in ready
+    assert hub.subscribers(auditorium.uuid) == 1
+
+    start = datetime.combine(date.today() + timedelta(days=1), time(10, 0), tzinfo=timezone.utc)
+    booking = await booking_service.create_booking(
+        CreateBooking(auditorium=auditorium.uuid, start_time=start, end_time=start + timedelta(hours=1), title="live"), user
+    )
+    await booking_service.delete_booking(booking.uuid, user)
+
+    created = await asyncio.wait_for(stream.__anext__(), 1)
+    event, data = created.strip().split("\n")
+    assert event == "event: booking.created"
+    assert json.loads(data.removeprefix("data: "))["title"] == "live"
+    deleted = await asyncio.wait_for(stream.__anext__(), 1)
+    assert deleted == f'event: booking.deleted\ndata: {{"uuid": "{booking.uuid}"}}\n\n'
+
+    await stream.aclose()
+    assert len(hub) == 0
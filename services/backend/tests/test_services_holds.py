@@ -0,0 +1,108 @@
+# --- Файл: tests/test_services_holds.py ---
+import asyncio
+import pytest
+import pytest_asyncio
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch, AsyncMock
+
+from fastapi import HTTPException
+
+from services.backend.app.services import holds as holds_service
+from services.backend.app.services import booking as booking_service
+from app.models import User
+from app.schemas import CreateBookingHold
+from app.utils.expiry import ExpirySweeper
+
+
+@pytest_asyncio.fixture
+async def hold_setup():
+    users = []
+    for name in ("holder", "rival"):
+        user = User(username=name, email=f"{name}@example.com", password_hash="x", registration_date=date.today())
+        await user.save()
+        users.append(user)
+    auditorium = holds_service.Auditorium(identifier="Room 505", capacity=25)
+    await auditorium.save()
+    start = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=1)
+    with patch.object(holds_service, 'check_auditorium_availability', new_callable=AsyncMock), \
+            patch.object(holds_service, 'hold_sweeper', ExpirySweeper(purge=AsyncMock())):
+        yield users, auditorium, start
+
+
+def _hold(auditorium, start, **extra):
+    return CreateBookingHold(auditorium=auditorium.uuid, start_time=start, end_time=start + timedelta(hours=1), **extra)
+
+
+@pytest.mark.asyncio
+async def test_hold_blocks_others_until_confirmed(hold_setup):
+    """ Тест: удержание блокирует интервал для других, подтверждение превращает его в бронь """
+    (holder, rival), auditorium, start = hold_setup
+
+    hold = await holds_service.create_booking_hold(_hold(auditorium, start, title="Seminar"), holder)
+    assert len(holds_service.hold_sweeper) == 1
+
+    with pytest.raises(HTTPException) as exc_info:
+        await holds_service.create_booking_hold(_hold(auditorium, start + timedelta(minutes=30)), rival)
+    assert exc_info.value.status_code == 409
+    with pytest.raises(HTTPException) as exc_info:
+        await booking_service.check_booking_overlap(auditorium.uuid, start, start + timedelta(hours=1))
+    assert exc_info.value.status_code == 409
+
+    with pytest.raises(HTTPException) as exc_info:
+        await holds_service.confirm_booking_hold(hold.uuid, rival)
+    assert exc_info.value.status_code == 403
+
+    booking = await holds_service.confirm_booking_hold(hold.uuid, holder)
+    assert (booking.broker_id, booking.title) == (holder.uuid, "Seminar")
+    assert not await holds_service.BookingHold.exists(uuid=hold.uuid)
+
+
+@pytest.mark.asyncio
+async def test_hold_rejected_over_booking_with_exclusion_constraint(hold_setup):
+    """ Тест: удержание поверх брони отклоняется, даже когда пересечения броней отсекает ограничение БД """
+    (holder, rival), auditorium, start = hold_setup
+    await booking_service.Booking(auditorium=auditorium, broker=rival, start_time=start, end_time=start + timedelta(hours=1)).save()
+
+    with patch('app.services.booking.booking_exclusion_enforced', return_value=True):
+        with pytest.raises(HTTPException) as exc_info:
+            await holds_service.create_booking_hold(_hold(auditorium, start + timedelta(minutes=30)), holder)
+    assert exc_info.value.status_code == 409
+    assert not await holds_service.BookingHold.exists(broker_id=holder.uuid)
+
+
+@pytest.mark.asyncio
+async def test_expired_hold_neither_blocks_nor_confirms(hold_setup):
+    """ Тест: истекшее, но еще не удаленное удержание не блокирует интервал и не подтверждается """
+    (holder, rival), auditorium, start = hold_setup
+    hold = await holds_service.create_booking_hold(_hold(auditorium, start), holder)
+    await holds_service.BookingHold.filter(uuid=hold.uuid).update(expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+
+    assert await booking_service.check_booking_overlap(auditorium.uuid, start, start + timedelta(hours=1))
+    with pytest.raises(HTTPException) as exc_info:
+        await holds_service.confirm_booking_hold(hold.uuid, holder)
+    assert exc_info.value.status_code == 410
+
+    assert await holds_service._purge_expired_holds([hold.uuid]) == 1
+
+
+@pytest.mark.asyncio
+async def test_expiry_sweeper_purges_in_expiry_order():
+    """ Тест: очистка просыпается к ближайшему сроку, в том числе добавленному позже более дальнего """
+    purged = []
+
+    async def purge(keys):
+        purged.append(keys)
+        return len(keys)
+
+    sweeper = ExpirySweeper(purge=purge)
+    now = datetime.now(timezone.utc)
+    sweeper.schedule(now + timedelta(hours=1), "late")
+    sweeper.start()
+    await asyncio.sleep(0)
+    sweeper.schedule(now + timedelta(milliseconds=50), "soon")
+    sweeper.schedule(now + timedelta(milliseconds=20), "sooner")
+    await asyncio.sleep(0.2)
+
+    assert [key for keys in purged for key in keys] == ["sooner", "soon"]
+    assert len(sweeper) == 1
+    await sweeper.stop()
@@ -0,0 +1,54 @@
+# --- Файл: tests/test_services_password.py ---
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import patch
+
+from fastapi import HTTPException
+
+from app.utils import password
+
+
+@pytest.mark.asyncio
+async def test_hashing_does_not_block_event_loop():
+    """ Тест: пока bcrypt считает в пуле, цикл событий продолжает обслуживать другие задачи """
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticking = asyncio.create_task(ticker())
+    with patch.object(password, 'get_password_hash', side_effect=lambda raw: time.sleep(0.2) or f"hashed:{raw}"):
+        assert await password.get_password_hash_async("secret") == "hashed:secret"
+    ticking.cancel()
+
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_hashing_concurrency_limit_and_queue():
+    """ Тест: лишние операции ждут свободного слота, а при полной очереди сразу получают 503 """
+    release = threading.Event()
+
+    def slow_hash(raw):
+        release.wait(5)
+        return f"hashed:{raw}"
+
+    with patch.object(password.settings, 'PASSWORD_HASH_WORKERS', 1), \
+         patch.object(password.settings, 'PASSWORD_HASH_MAX_QUEUE', 1), \
+         patch.object(password, 'get_password_hash', side_effect=slow_hash):
+        running = asyncio.create_task(password.get_password_hash_async("first"))
+        queued = asyncio.create_task(password.get_password_hash_async("second"))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await password.get_password_hash_async("third")
+        assert exc_info.value.status_code == 503
+        assert not queued.done()
+
+        release.set()
+        assert await asyncio.gather(running, queued) == ["hashed:first", "hashed:second"]
@@ -0,0 +1,77 @@
+# --- Файл: tests/test_services_replicas.py ---
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.utils import replicas
+
+
+router = replicas.ReplicaRouter()
+
+
+@replicas.read_only
+async def _routed_reads(current_user=None):
+    """ Куда ушли бы два чтения подряд и чтение для заполнения общего кэша """
+    first, second = router.db_for_read(None), router.db_for_read(None)
+    with replicas.primary_reads():
+        cache_fill = router.db_for_read(None)
+    return first, second, cache_fill
+
+
+@pytest.mark.asyncio
+async def test_read_only_pins_one_replica_per_call():
+    """ Тест: все чтения вызова идут на одну реплику, вызовы чередуют реплики, вне @read_only — основная БД """
+    with patch.object(replicas.settings, 'DB_REPLICAS', ["replica_0", "replica_1"]):
+        first_call, second_call = await _routed_reads(), await _routed_reads()
+
+    assert first_call[0] == first_call[1] and first_call[2] is None
+    assert {first_call[0], second_call[0]} == {"replica_0", "replica_1"}
+    assert router.db_for_read(None) is None
+
+    with patch.object(replicas.settings, 'DB_REPLICAS', []):
+        assert await _routed_reads() == (None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_own_write_reads_from_primary():
+    """ Тест: после своей записи в этом воркере пользователь читает из основной БД, без запросов к ней за проверкой """
+    writer, reader = SimpleNamespace(uuid=uuid4()), SimpleNamespace(uuid=uuid4())
+    with patch.object(replicas.settings, 'DB_REPLICAS', ["replica_0"]):
+        assert (await _routed_reads(current_user=reader))[0] == "replica_0"
+
+        replicas.bind_request_user(writer.uuid)
+        assert router.db_for_write(None) is None
+        assert (await _routed_reads(current_user=writer))[0] is None
+
+
+@pytest.mark.asyncio
+async def test_sticky_cookie_routes_reads_to_primary_across_workers():
+    """ Тест: пишущий запрос ставит cookie, и по ней чтения клиента идут в основную БД в любом воркере """
+    middleware = replicas.ReadYourWritesMiddleware(app=None)
+
+    def request(cookie=""):
+        headers = [(b"cookie", cookie.encode())] if cookie else []
+        return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+    async def write(_):
+        router.db_for_write(None)
+        return Response()
+
+    async def read(_):
+        return Response(content=(await _routed_reads())[0] or "primary")
+
+    with patch.object(replicas.settings, 'DB_REPLICAS', ["replica_0"]):
+        assert (await middleware.dispatch(request(), read)).body == b"replica_0"
+        assert "set-cookie" not in (await middleware.dispatch(request(), read)).headers
+
+        cookie = (await middleware.dispatch(request(), write)).headers["set-cookie"].split(";")[0]
+        assert cookie.startswith(f"{replicas.STICKY_COOKIE}=")
+        assert (await middleware.dispatch(request(cookie), read)).body == b"primary"
+
+        expired = f"{replicas.STICKY_COOKIE}={time.time() - 1:.3f}"
+        assert (await middleware.dispatch(request(expired), read)).body == b"replica_0"
@@ -0,0 +1,66 @@
+# --- Файл: tests/test_services_revocation.py ---
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import jwt
+from fastapi import HTTPException
+
+from app.models import RevokedToken, User
+from app.enums import UserRole
+from app.utils import contrib
+from app.utils.bloom import BloomFilter
+from app.utils.revocation import RevocationList
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """ Тест: добавленные ключи всегда находятся, посторонние — лишь с заданной долей ложных срабатываний """
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    added = [uuid4().hex for _ in range(1000)]
+    for key in added:
+        bloom.add(key)
+
+    assert all(key in bloom for key in added)
+    assert not bloom.add(added[0]) and 980 < len(bloom) <= 1000
+    false_positives = sum(uuid4().hex in bloom for _ in range(10000))
+    assert false_positives < 300
+
+
+@pytest.mark.asyncio
+async def test_revocation_list_refresh_and_db_confirmation():
+    """ Тест: до загрузки проверка идет в БД, после — промах фильтра отвечает без БД, новые отзывы дочитываются """
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    await RevokedToken.create(jti="old", expires_at=expires_at)
+    await RevokedToken.create(jti="expired", expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+    revocations = RevocationList()
+
+    assert await revocations.is_revoked("old")
+
+    await revocations.refresh()
+    assert not await RevokedToken.exists(jti="expired")
+    with patch.object(RevokedToken, 'exists', side_effect=AssertionError("unexpected query")):
+        assert not await revocations.is_revoked("unknown")
+    assert await revocations.is_revoked("old")
+
+    await RevokedToken.create(jti="new", expires_at=expires_at)
+    await revocations.refresh()
+    assert await revocations.is_revoked("new")
+
+
+@pytest.mark.asyncio
+async def test_revoked_token_is_rejected():
+    """ Тест: отозванный токен не принимается даже из кэша разобранных токенов """
+    user = User(username="revoked", email="revoked@example.com", password_hash="x",
+                registration_date=date.today(), role=UserRole.BOOKER)
+    await user.save()
+    exp = datetime.now(timezone.utc) + timedelta(minutes=5)
+    token = jwt.encode({"user_uuid": str(user.uuid), "exp": exp.timestamp(), "jti": "session-1"},
+                       contrib.settings.SECRET_KEY, algorithm="HS256")
+
+    assert (await contrib.get_current_user(token)).uuid == user.uuid
+    await RevokedToken.create(jti="session-1", user_uuid=user.uuid, expires_at=exp)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await contrib.get_current_user(token)
+    assert exc_info.value.status_code == 403
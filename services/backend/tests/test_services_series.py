@@ -0,0 +1,139 @@
+# --- Файл: tests/test_services_series.py ---
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, patch
+from datetime import datetime, timedelta, date, time
+
+from fastapi import HTTPException
+
+from services.backend.app.services import series as series_service
+from app.enums import UserRole
+from app.utils.schedule import WeeklySchedule
+
+
+@pytest_asyncio.fixture
+async def series_setup():
+    user = series_service.User(username="lecturer", email="lecturer@example.com", password_hash="x",
+                               registration_date=date.today(), role=UserRole.BOOKER)
+    await user.save()
+    auditorium = series_service.Auditorium(identifier="Room 505", capacity=60)
+    await auditorium.save()
+    schedule = WeeklySchedule.compile([(day, time(8, 0), time(20, 0)) for day in range(5)])
+    with patch.object(series_service, 'get_weekly_schedule', new_callable=AsyncMock, return_value=schedule):
+        yield user, auditorium
+
+
+def _series_model(auditorium, **overrides):
+    from app.schemas import CreateBookingSeries
+
+    data = dict(
+        auditorium=auditorium.uuid,
+        start_time=datetime(2025, 9, 1, 10, 0),
+        end_time=datetime(2025, 9, 1, 11, 30),
+        title="Seminar",
+        interval_weeks=1,
+        until=date(2025, 12, 22),
+        exceptions=[date(2025, 11, 3)],
+    )
+    data.update(overrides)
+    return CreateBookingSeries(**data)
+
+
+def test_expand_occurrences_skips_exceptions():
+    """ Тест: правило повторения разворачивается с учетом интервала и исключений """
+    occurrences = series_service.expand_occurrences(
+        datetime(2025, 9, 1, 10, 0), datetime(2025, 9, 1, 11, 0), 2, date(2025, 10, 13), [date(2025, 9, 15)]
+    )
+    assert [start.date() for start, _ in occurrences] == [date(2025, 9, 1), date(2025, 9, 29), date(2025, 10, 13)]
+
+
+@pytest.mark.asyncio
+async def test_create_booking_series_success(series_setup):
+    """ Тест: серия создается одним пакетом занятий """
+    user, auditorium = series_setup
+
+    series = await series_service.create_booking_series(_series_model(auditorium), current_user=user)
+
+    assert len(series.occurrences_list) == 16
+    assert await series_service.Booking.filter(series_id=series.uuid).count() == 16
+    assert not await series_service.Booking.filter(series_id=series.uuid, start_time__gte=datetime(2025, 11, 3),
+                                                   start_time__lt=datetime(2025, 11, 4)).exists()
+
+
+@pytest.mark.asyncio
+async def test_create_booking_series_conflict(series_setup):
+    """ Тест: конфликт хотя бы одного занятия отклоняет всю серию """
+    user, auditorium = series_setup
+    await series_service.Booking(auditorium=auditorium, broker=user, start_time=datetime(2025, 10, 6, 11, 0),
+                                 end_time=datetime(2025, 10, 6, 12, 0)).save()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await series_service.create_booking_series(_series_model(auditorium), current_user=user)
+
+    assert exc_info.value.status_code == 409
+    assert "2025-10-06" in exc_info.value.detail
+    assert await series_service.BookingSeries.all().count() == 0
+
+
+@pytest.mark.asyncio
+async def test_create_booking_series_checks_under_lock(series_setup):
+    """ Тест: расписание и занятость серии читаются уже под блокировкой аудитории """
+    from app.utils.locks import auditorium_locks
+
+    user, auditorium = series_setup
+    schedule = series_service.get_weekly_schedule.return_value
+    locked_during_checks = []
+
+    async def read_schedule(auditorium_uuid):
+        locked_during_checks.append(len(auditorium_locks))
+        return schedule
+
+    with patch.object(series_service, 'get_weekly_schedule', side_effect=read_schedule):
+        await series_service.create_booking_series(_series_model(auditorium), current_user=user)
+
+    assert locked_during_checks == [1]
+    assert len(auditorium_locks) == 0
+
+
+@pytest.mark.asyncio
+async def test_update_and_cancel_booking_series(series_setup):
+    """ Тест: изменение и отмена серии затрагивают все ее занятия """
+    from app.schemas import UpdateBookingSeries
+
+    user, auditorium = series_setup
+    series = await series_service.create_booking_series(_series_model(auditorium), current_user=user)
+
+    updated = await series_service.update_booking_series(series.uuid, UpdateBookingSeries(title="Lab"), current_user=user)
+    assert {booking.title for booking in updated.occurrences_list} == {"Lab"}
+
+    assert await series_service.cancel_booking_series(series.uuid, current_user=user, from_date=date(2025, 12, 1))
+    assert await series_service.Booking.filter(series_id=series.uuid).count() == 12
+
+    assert await series_service.cancel_booking_series(series.uuid, current_user=user)
+    assert await series_service.Booking.filter(auditorium_id=auditorium.uuid).count() == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_booking_series_reads_occurrences_under_lock(series_setup):
+    """ Тест: занятие, удаленное до получения блокировки, не попадает в утилизацию и индекс отмены """
+    from contextlib import asynccontextmanager
+
+    user, auditorium = series_setup
+    series = await series_service.create_booking_series(_series_model(auditorium), current_user=user)
+    occurrences = await series_service.Booking.filter(series_id=series.uuid).order_by('start_time')
+    real_lock = series_service.auditorium_write_lock
+
+    @asynccontextmanager
+    async def lock_after_concurrent_delete(*auditorium_uuids):
+        await series_service.Booking.filter(uuid=occurrences[0].uuid).delete()
+        async with real_lock(*auditorium_uuids):
+            yield
+
+    with patch.object(series_service, 'auditorium_write_lock', lock_after_concurrent_delete), \
+            patch.object(series_service, 'record_utilization', new_callable=AsyncMock) as mock_utilization, \
+            patch.object(series_service, '_unindex_booking') as mock_unindex:
+        assert await series_service.cancel_booking_series(series.uuid, current_user=user)
+
+    removed = mock_utilization.call_args.kwargs['removed']
+    assert len(removed) == len(occurrences) - 1
+    assert occurrences[0].uuid not in {call.args[0] for call in mock_unindex.call_args_list}
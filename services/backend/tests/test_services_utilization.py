@@ -0,0 +1,74 @@
+# --- Файл: tests/test_services_utilization.py ---
+import pytest
+import pytest_asyncio
+from datetime import date, datetime, time, timedelta
+from unittest.mock import patch, AsyncMock
+
+from fastapi import HTTPException
+
+from services.backend.app.services import utilization as utilization_service
+from app.models import User
+from app.utils.schedule import WeeklySchedule
+
+
+@pytest_asyncio.fixture
+async def utilization_setup():
+    """ Аудитория, доступная по будням 09:00-17:00, и две брони 1 сентября 2025 (понедельник) """
+    user = User(username="analyst", email="analyst@example.com", password_hash="x", registration_date=date.today())
+    await user.save()
+    auditorium = utilization_service.Auditorium(identifier="Room 101", capacity=40)
+    await auditorium.save()
+    start = datetime(2025, 9, 1, 9, 0)
+    for hours in ((0, 2), (3, 4)):
+        await utilization_service.Booking(auditorium=auditorium, broker=user, start_time=start + timedelta(hours=hours[0]),
+                                          end_time=start + timedelta(hours=hours[1])).save()
+    schedule = WeeklySchedule.compile([(day, time(9, 0), time(17, 0)) for day in range(5)])
+    with patch.object(utilization_service, 'get_weekly_schedules', new_callable=AsyncMock,
+                      return_value={auditorium.uuid: schedule}):
+        yield auditorium, start
+
+
+def test_split_by_day_crosses_midnight():
+    """ Тест: интервал через полночь делится между сутками """
+    assert utilization_service.split_by_day(datetime(2025, 9, 1, 23, 0), datetime(2025, 9, 2, 1, 30)) == {
+        date(2025, 9, 1): 3600,
+        date(2025, 9, 2): 5400,
+    }
+
+
+@pytest.mark.asyncio
+async def test_record_utilization_matches_rebuild(utilization_setup):
+    """ Тест: инкрементальные изменения сводки совпадают с полным пересчетом """
+    auditorium, start = utilization_setup
+
+    assert await utilization_service.rebuild_utilization() == 1
+    row = await utilization_service.DailyUtilization.get(auditorium_id=auditorium.uuid, day=date(2025, 9, 1))
+    assert (row.booked_seconds, row.bookings_count) == (3 * 3600, 2)
+
+    moved = (auditorium.uuid, start + timedelta(hours=3), start + timedelta(hours=4))
+    await utilization_service.record_utilization(
+        added=[(auditorium.uuid, start + timedelta(days=1), start + timedelta(days=1, hours=1))],
+        removed=[moved]
+    )
+    await row.refresh_from_db()
+    assert (row.booked_seconds, row.bookings_count) == (2 * 3600, 1)
+    assert await utilization_service.DailyUtilization.filter(day=date(2025, 9, 2)).values_list('booked_seconds', flat=True) == [3600]
+
+
+@pytest.mark.asyncio
+async def test_get_utilization_report(utilization_setup):
+    """ Тест: отчет берет забронированные часы из сводки, доступные — из расписания """
+    auditorium, _ = utilization_setup
+    await utilization_service.rebuild_utilization()
+
+    report = await utilization_service.get_utilization(date(2025, 9, 1), date(2025, 9, 7))
+
+    assert len(report) == 1
+    assert report[0]["booked_hours"] == 3.0
+    assert report[0]["available_hours"] == 40.0
+    assert [day["day"] for day in report[0]["days"]] == [date(2025, 9, 1) + timedelta(days=offset) for offset in range(5)]
+    assert report[0]["days"][0]["utilization"] == 0.375
+
+    with pytest.raises(HTTPException) as exc_info:
+        await utilization_service.get_utilization(date(2025, 9, 7), date(2025, 9, 1))
+    assert exc_info.value.status_code == 400
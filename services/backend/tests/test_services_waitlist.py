@@ -0,0 +1,113 @@
+# --- Файл: tests/test_services_waitlist.py ---
+import pytest
+import pytest_asyncio
+from datetime import date, datetime, time, timedelta, timezone
+from unittest.mock import patch, AsyncMock
+
+from fastapi import HTTPException
+
+from services.backend.app.services import waitlist as waitlist_service
+from services.backend.app.services import booking as booking_service
+from app.models import BookingHold, User
+from app.services import holds as holds_service
+from app.schemas import CreateBooking, UpdateBooking
+from app.utils.schedule import WeeklySchedule
+
+
+@pytest_asyncio.fixture
+async def waitlist_setup():
+    """ Аудитория, открытая круглосуточно, и бронь первого пользователя на завтра 10:00-11:00 """
+    users = []
+    for name in ("owner", "waiter", "latecomer"):
+        user = User(username=name, email=f"{name}@example.com", password_hash="x", registration_date=date.today())
+        await user.save()
+        users.append(user)
+    auditorium = booking_service.Auditorium(identifier="Room 606", capacity=60)
+    await auditorium.save()
+    start = datetime.combine(date.today() + timedelta(days=1), time(10, 0), tzinfo=timezone.utc)
+    booking = booking_service.Booking(auditorium=auditorium, broker=users[0], start_time=start, end_time=start + timedelta(hours=1))
+    await booking.save()
+    always_open = WeeklySchedule.compile([(day, time(0, 0), time(0, 0)) for day in range(7)])
+    with patch.object(waitlist_service, 'check_auditorium_availability', new_callable=AsyncMock), \
+            patch.object(booking_service, 'check_auditorium_availability', new_callable=AsyncMock), \
+            patch.object(booking_service, 'get_weekly_schedule', new_callable=AsyncMock, return_value=always_open):
+        yield users, auditorium, booking
+
+
+def _request(auditorium, start, hours=1):
+    return CreateBooking(auditorium=auditorium.uuid, start_time=start, end_time=start + timedelta(hours=hours), title="waiting")
+
+
+@pytest.mark.asyncio
+async def test_delete_promotes_first_compatible_waiter(waitlist_setup):
+    """ Тест: удаление брони продвигает первую по очереди заявку, пересекающиеся с ней остаются ждать """
+    (owner, waiter, latecomer), auditorium, booking = waitlist_setup
+
+    with pytest.raises(HTTPException) as exc_info:
+        await waitlist_service.join_waitlist(_request(auditorium, booking.start_time + timedelta(hours=5)), waiter)
+    assert exc_info.value.status_code == 400
+
+    first = await waitlist_service.join_waitlist(_request(auditorium, booking.start_time), waiter)
+    second = await waitlist_service.join_waitlist(_request(auditorium, booking.start_time + timedelta(minutes=30)), latecomer)
+    assert (first.position, second.position) == (1, 2)
+
+    assert await booking_service.delete_booking(booking.uuid, owner)
+
+    promoted = await booking_service.Booking.get(broker_id=waiter.uuid)
+    assert (promoted.start_time, promoted.title) == (booking.start_time, "waiting")
+    assert not await booking_service.WaitlistEntry.exists(uuid=first.uuid)
+    assert [entry.uuid for entry in await waitlist_service.get_my_waitlist(latecomer)] == [second.uuid]
+
+
+@pytest.mark.asyncio
+async def test_update_promotes_waiter_into_freed_time(waitlist_setup):
+    """ Тест: перенос брони освобождает старый интервал для ожидающего """
+    (owner, waiter, _), auditorium, booking = waitlist_setup
+    await waitlist_service.join_waitlist(_request(auditorium, booking.start_time), waiter)
+
+    await booking_service.update_booking(
+        booking.uuid, UpdateBooking(start_time=booking.start_time + timedelta(hours=2), end_time=booking.end_time + timedelta(hours=2)), owner
+    )
+
+    assert await booking_service.Booking.filter(broker_id=waiter.uuid, start_time=booking.start_time).exists()
+    assert await booking_service.WaitlistEntry.all().count() == 0
+
+
+@pytest.mark.asyncio
+async def test_hold_release_and_expiry_promote_waiters(waitlist_setup):
+    """ Тест: интервал, занятый только удержанием, достается ожидающему при снятии и при истечении удержания """
+    (owner, waiter, latecomer), auditorium, booking = waitlist_setup
+    always_open = WeeklySchedule.compile([(day, time(0, 0), time(0, 0)) for day in range(7)])
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=10)
+    released = await BookingHold.create(auditorium=auditorium, broker=owner, expires_at=expires_at,
+                                        start_time=booking.start_time + timedelta(hours=2),
+                                        end_time=booking.start_time + timedelta(hours=3))
+    expiring = await BookingHold.create(auditorium=auditorium, broker=owner, expires_at=expires_at,
+                                        start_time=booking.start_time + timedelta(hours=4),
+                                        end_time=booking.start_time + timedelta(hours=5))
+    await waitlist_service.join_waitlist(_request(auditorium, released.start_time), waiter)
+    await waitlist_service.join_waitlist(_request(auditorium, expiring.start_time), latecomer)
+
+    with patch('app.services.booking.get_weekly_schedule', new_callable=AsyncMock, return_value=always_open):
+        await holds_service.release_booking_hold(released.uuid, owner)
+        assert await booking_service.Booking.filter(broker_id=waiter.uuid, start_time=released.start_time).exists()
+
+        await BookingHold.filter(uuid=expiring.uuid).update(expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+        assert await holds_service._purge_expired_holds([expiring.uuid]) == 1
+        assert await booking_service.Booking.filter(broker_id=latecomer.uuid, start_time=expiring.start_time).exists()
+
+    assert await booking_service.WaitlistEntry.all().count() == 0
+    assert await BookingHold.all().count() == 0
+
+
+@pytest.mark.asyncio
+async def test_my_waitlist_positions(waitlist_setup):
+    """ Тест: места в очереди для всех заявок пользователя считаются по одной выборке """
+    (owner, waiter, latecomer), auditorium, booking = waitlist_setup
+    await waitlist_service.join_waitlist(_request(auditorium, booking.start_time), waiter)
+    await waitlist_service.join_waitlist(_request(auditorium, booking.start_time, hours=0.5), latecomer)
+    await waitlist_service.join_waitlist(_request(auditorium, booking.start_time + timedelta(minutes=30), hours=0.5), owner)
+    await waitlist_service.join_waitlist(_request(auditorium, booking.start_time + timedelta(minutes=30), hours=0.5), latecomer)
+
+    entries = await waitlist_service.get_my_waitlist(latecomer)
+    assert [entry.position for entry in entries] == [2, 3]